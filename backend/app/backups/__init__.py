@@ -0,0 +1 @@
+"""Backups module making online copies of the board databases"""
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from app.shared.domain.boards import BOARD_ID_PATTERN
+
+
+class BackupDTO(BaseModel):
+    """DTO for a backup file"""
+
+    board_id: str | None = None
+    name: str
+    size: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class BackupCreateDTO(BaseModel):
+    """DTO for requesting a backup; no board_id backs up the default board"""
+
+    board_id: str | None = Field(None, pattern=BOARD_ID_PATTERN)
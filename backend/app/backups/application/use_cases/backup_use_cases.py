@@ -0,0 +1,24 @@
+from app.backups.application.dtos.backup_dto import BackupCreateDTO, BackupDTO
+from app.backups.domain.interfaces.backup_store import BackupStore
+
+
+class ListBackupsUseCase:
+    """Use case to list the backups of a board"""
+
+    def __init__(self, store: BackupStore):
+        self.store = store
+
+    async def execute(self, board_id: str | None = None) -> list[BackupDTO]:
+        """Get the board's backups, oldest first"""
+        return [BackupDTO.model_validate(backup) for backup in await self.store.list(board_id)]
+
+
+class CreateBackupUseCase:
+    """Use case to back up a board's database without stopping the app"""
+
+    def __init__(self, store: BackupStore):
+        self.store = store
+
+    async def execute(self, request: BackupCreateDTO) -> BackupDTO:
+        """Make the backup; raises KeyError for an unknown board, ValueError if it cannot be made"""
+        return BackupDTO.model_validate(await self.store.create(request.board_id))
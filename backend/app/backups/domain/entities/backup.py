@@ -0,0 +1,12 @@
+from datetime import datetime
+
+
+class Backup:
+    """A backup file of one board's database"""
+
+    def __init__(self, board_id: str | None, name: str, size: int, created_at: datetime):
+        # None for the default board
+        self.board_id = board_id
+        self.name = name
+        self.size = size
+        self.created_at = created_at
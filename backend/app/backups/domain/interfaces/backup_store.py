@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+
+from app.backups.domain.entities.backup import Backup
+
+
+class BackupStore(ABC):
+    """The backups of the board databases"""
+
+    @abstractmethod
+    async def list(self, board_id: str | None = None) -> list[Backup]:
+        """Get a board's backups, oldest first"""
+        pass
+
+    @abstractmethod
+    async def create(self, board_id: str | None = None) -> Backup:
+        """Back up a board's database while it stays in use, dropping the oldest backups.
+
+        Raises KeyError for an unknown board and ValueError if there is no
+        database file to back up.
+        """
+        pass
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.backups.application.dtos.backup_dto import BackupCreateDTO, BackupDTO
+from app.backups.application.use_cases.backup_use_cases import (
+    CreateBackupUseCase,
+    ListBackupsUseCase,
+)
+from app.backups.infrastructure.database.backup_store_impl import BackupStoreImpl
+from app.shared.domain.boards import BOARD_ID_PATTERN
+from app.shared.infrastructure.database import shards
+from app.shared.infrastructure.database.database import settings
+
+router = APIRouter(prefix="/admin/backups", tags=["admin"])
+
+
+def get_backup_store() -> BackupStoreImpl:
+    """Dependency injection for the backup store"""
+    return BackupStoreImpl(shards, settings)
+
+
+@router.get("", response_model=list[BackupDTO])
+async def get_backups(
+    board_id: str | None = Query(None, pattern=BOARD_ID_PATTERN),
+    store: BackupStoreImpl = Depends(get_backup_store),
+):
+    """Get the backups of a board (the default one without board_id), oldest first"""
+    use_case = ListBackupsUseCase(store)
+    return await use_case.execute(board_id)
+
+
+@router.post("", response_model=BackupDTO, status_code=201)
+async def create_backup(
+    request: BackupCreateDTO,
+    store: BackupStoreImpl = Depends(get_backup_store),
+):
+    """Back up a board's database while the API keeps serving it.
+
+    Pages are copied from a pinned read snapshot in paced steps, so writes carry
+    on during the copy. The oldest backups beyond DATABASE_BACKUP_KEEP are deleted.
+    """
+    use_case = CreateBackupUseCase(store)
+    try:
+        return await use_case.execute(request)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail="Board not found") from e
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
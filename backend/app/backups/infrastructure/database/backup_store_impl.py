@@ -0,0 +1,69 @@
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+from app.backups.domain.entities.backup import Backup
+from app.backups.domain.interfaces.backup_store import BackupStore
+from app.shared.infrastructure.database import DatabaseSettings, ShardRouter
+from app.shared.infrastructure.database.backup import (
+    STAMP_FORMAT,
+    backup_directory,
+    create_backup,
+    list_backups,
+)
+
+
+def _read_backups(directory: Path, board_id: str | None) -> list[Backup]:
+    """Backups in a board's directory, oldest first; other files in it are skipped"""
+    backups = []
+    for path in list_backups(directory):
+        try:
+            created_at = datetime.strptime(path.stem, STAMP_FORMAT)
+            size = path.stat().st_size
+        except (ValueError, FileNotFoundError):
+            # Not named by a backup (e.g. copied in by hand), or rotated away meanwhile
+            continue
+        backups.append(Backup(board_id=board_id, name=path.name, size=size, created_at=created_at))
+    return backups
+
+
+class BackupStoreImpl(BackupStore):
+    """BackupStore over the backup directories of the SQLite databases.
+
+    Backups run in a worker thread, so the event loop keeps serving requests
+    while the pages are copied.
+    """
+
+    def __init__(self, shards: ShardRouter, settings: DatabaseSettings):
+        self.shards = shards
+        self.settings = settings
+
+    async def list(self, board_id: str | None = None) -> list[Backup]:
+        """Get a board's backups, oldest first, reading the directory in a worker thread"""
+        directory = backup_directory(self.settings, board_id)
+        return await asyncio.to_thread(_read_backups, directory, board_id)
+
+    async def create(self, board_id: str | None = None) -> Backup:
+        """Back up a board's database, then drop all but the newest backup_keep backups"""
+        if self.settings.backend != "sqlite":
+            raise ValueError("Backups need the SQLite backend")
+        if board_id is None:
+            settings = self.settings
+        elif self.shards.exists(board_id):
+            settings = self.shards.board_settings(board_id)
+        else:
+            raise KeyError(board_id)
+        result = await asyncio.to_thread(create_backup, settings, board_id)
+        return Backup(
+            board_id=board_id,
+            name=result.path.name,
+            size=result.path.stat().st_size,
+            created_at=datetime.strptime(result.path.stem, STAMP_FORMAT),
+        )
+
+    async def create_all(self) -> int:
+        """Back up the default board and every other board, one after the other"""
+        board_ids = [None, *self.shards.board_ids()]
+        for board_id in board_ids:
+            await self.create(board_id)
+        return len(board_ids)
@@ -0,0 +1 @@
+"""Board module serving the first screen of the Kanban board in one call"""
@@ -0,0 +1,44 @@
+from pydantic import BaseModel, Field
+
+from app.items.application.dtos.item_dto import ItemDTO
+from app.items.domain.entities.item import ItemStatus
+from app.shared.domain.boards import BOARD_ID_PATTERN
+from app.tags.application.dtos.tag_dto import TagDTO
+
+
+class BoardColumnDTO(BaseModel):
+    """DTO for the first page of a board column.
+
+    ``next_cursor`` continues the column through
+    ``GET /items/?status=<status>&sort=position&after=<next_cursor>``.
+    """
+
+    status: ItemStatus
+    items: list[ItemDTO]
+    next_cursor: str | None = None
+    total: int
+
+
+class BoardDTO(BaseModel):
+    """DTO for the board snapshot: tags, columns and the version they were read at.
+
+    ``tags_next_cursor`` continues the tags through ``GET /tags/?sort=name``.
+    """
+
+    version: int
+    tags: list[TagDTO]
+    tags_next_cursor: str | None = None
+    tag_total: int
+    columns: list[BoardColumnDTO]
+
+
+class BoardInfoDTO(BaseModel):
+    """DTO for a board, served under /boards/{id}"""
+
+    id: str
+
+
+class BoardCreateDTO(BaseModel):
+    """DTO for creating boards"""
+
+    id: str = Field(..., pattern=BOARD_ID_PATTERN)
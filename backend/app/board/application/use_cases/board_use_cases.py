@@ -0,0 +1,61 @@
+from app.board.application.dtos.board_dto import (
+    BoardColumnDTO,
+    BoardCreateDTO,
+    BoardDTO,
+    BoardInfoDTO,
+)
+from app.board.domain.interfaces.board_query_service import BoardQueryService
+from app.board.domain.interfaces.board_registry import BoardRegistry
+from app.items.application.dtos.item_dto import ItemDTO
+from app.tags.application.dtos.tag_dto import TagDTO
+
+
+class GetBoardUseCase:
+    """Use case to load the first screen of the board in one call"""
+
+    def __init__(self, query_service: BoardQueryService):
+        self.query_service = query_service
+
+    async def execute(self, limit: int = 50, tag_limit: int = 100) -> BoardDTO:
+        """Get the board snapshot with its cursors encoded as opaque tokens"""
+        snapshot = await self.query_service.get_snapshot(limit=limit, tag_limit=tag_limit)
+        return BoardDTO(
+            version=snapshot.version,
+            tags=[TagDTO.model_validate(tag) for tag in snapshot.tags.items],
+            tags_next_cursor=(
+                snapshot.tags.next_cursor.encode() if snapshot.tags.next_cursor else None
+            ),
+            tag_total=snapshot.tag_count,
+            columns=[
+                BoardColumnDTO(
+                    status=status,
+                    items=[ItemDTO.model_validate(item) for item in page.items],
+                    next_cursor=page.next_cursor.encode() if page.next_cursor else None,
+                    total=snapshot.column_counts[status],
+                )
+                for status, page in snapshot.columns.items()
+            ],
+        )
+
+
+class ListBoardsUseCase:
+    """Use case to list the boards"""
+
+    def __init__(self, registry: BoardRegistry):
+        self.registry = registry
+
+    async def execute(self) -> list[BoardInfoDTO]:
+        """Get every board"""
+        return [BoardInfoDTO(id=board_id) for board_id in self.registry.list_ids()]
+
+
+class CreateBoardUseCase:
+    """Use case to create a board with a database of its own"""
+
+    def __init__(self, registry: BoardRegistry):
+        self.registry = registry
+
+    async def execute(self, board: BoardCreateDTO) -> BoardInfoDTO:
+        """Create a board; raises ValueError if the ID is taken"""
+        await self.registry.create(board.id)
+        return BoardInfoDTO(id=board.id)
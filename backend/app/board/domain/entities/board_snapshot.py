@@ -0,0 +1,23 @@
+from typing import Any
+
+from app.items.domain.entities.item import ItemStatus
+from app.shared.domain.pagination import Page
+
+
+class BoardSnapshot:
+    """The first screen of the board, as read from one consistent database snapshot"""
+
+    def __init__(
+        self,
+        version: int,
+        tags: Page[dict[str, Any]],
+        tag_count: int,
+        columns: dict[ItemStatus, Page[dict[str, Any]]],
+        column_counts: dict[ItemStatus, int],
+    ):
+        # Grows with every write to items, tags or their links
+        self.version = version
+        self.tags = tags
+        self.tag_count = tag_count
+        self.columns = columns
+        self.column_counts = column_counts
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from app.board.domain.entities.board_snapshot import BoardSnapshot
+
+
+class BoardQueryService(ABC):
+    """Read model for the board snapshot"""
+
+    @abstractmethod
+    async def get_snapshot(self, limit: int = 50, tag_limit: int = 100) -> BoardSnapshot:
+        """Get the first ``limit`` cards of every column and the first ``tag_limit`` tags"""
+        pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class BoardRegistry(ABC):
+    """The boards that have a database of their own"""
+
+    @abstractmethod
+    def list_ids(self) -> list[str]:
+        """Get the IDs of every board, sorted"""
+        pass
+
+    @abstractmethod
+    async def create(self, board_id: str) -> None:
+        """Create an empty board; raises ValueError if the ID is taken"""
+        pass
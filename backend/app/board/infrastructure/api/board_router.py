@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.board.application.dtos.board_dto import BoardDTO
+from app.board.application.use_cases.board_use_cases import GetBoardUseCase
+from app.board.domain.interfaces.board_query_service import BoardQueryService
+from app.board.infrastructure.database.board_query_service_impl import BoardQueryServiceImpl
+from app.board.infrastructure.memory.in_memory_board_query_service import (
+    InMemoryBoardQueryService,
+)
+from app.shared.domain.data_version import ITEM_TABLES
+from app.shared.infrastructure import get_db
+from app.shared.infrastructure.api.conditional import conditional_get
+from app.shared.infrastructure.database import get_memory_store
+from app.shared.infrastructure.memory import MemoryStore
+
+router = APIRouter(prefix="/board", tags=["board"])
+
+
+def get_board_query_service(
+    db: AsyncSession = Depends(get_db),
+    store: MemoryStore | None = Depends(get_memory_store),
+) -> BoardQueryService:
+    """Dependency injection for the board read model"""
+    if store is not None:
+        return InMemoryBoardQueryService(store)
+    return BoardQueryServiceImpl(db)
+
+
+@router.get("", response_model=BoardDTO, dependencies=[Depends(conditional_get(*ITEM_TABLES))])
+async def get_board(
+    limit: int = Query(50, ge=1),
+    tag_limit: int = Query(100, ge=1),
+    query_service: BoardQueryService = Depends(get_board_query_service),
+):
+    """Get the tags and the first ``limit`` cards of every column in one round trip.
+
+    Everything is read from one database snapshot, so counts, cursors and cards
+    agree with each other; ``version`` changes whenever any of them could have.
+    """
+    use_case = GetBoardUseCase(query_service)
+    return await use_case.execute(limit=limit, tag_limit=tag_limit)
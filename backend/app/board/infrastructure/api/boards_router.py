@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.board.application.dtos.board_dto import BoardCreateDTO, BoardInfoDTO
+from app.board.application.use_cases.board_use_cases import CreateBoardUseCase, ListBoardsUseCase
+from app.board.infrastructure.database.board_registry_impl import BoardRegistryImpl
+from app.shared.infrastructure.database import shards
+
+router = APIRouter(prefix="/boards", tags=["boards"])
+
+
+def get_board_registry() -> BoardRegistryImpl:
+    """Dependency injection for the board registry"""
+    return BoardRegistryImpl(shards)
+
+
+@router.get("", response_model=list[BoardInfoDTO])
+async def get_boards(registry: BoardRegistryImpl = Depends(get_board_registry)):
+    """Get every board; the items, tags, stats and board of one are under /boards/{id}"""
+    use_case = ListBoardsUseCase(registry)
+    return await use_case.execute()
+
+
+@router.post("", response_model=BoardInfoDTO, status_code=201)
+async def create_board(
+    board: BoardCreateDTO,
+    registry: BoardRegistryImpl = Depends(get_board_registry),
+):
+    """Create a board in a database file of its own.
+
+    Boards do not share a write lock, so writes to different boards never wait
+    for each other.
+    """
+    use_case = CreateBoardUseCase(registry)
+    try:
+        return await use_case.execute(board)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
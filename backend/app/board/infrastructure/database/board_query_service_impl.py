@@ -0,0 +1,47 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.board.domain.entities.board_snapshot import BoardSnapshot
+from app.board.domain.interfaces.board_query_service import BoardQueryService
+from app.items.domain.entities.item import ITEM_STATUSES
+from app.items.infrastructure.database.item_counters import ITEMS_VERSION, status_counter
+from app.items.infrastructure.database.item_query_service_impl import ItemQueryServiceImpl
+from app.shared.infrastructure.database import begin_read_snapshot
+from app.shared.infrastructure.database.counters import read_counters
+from app.tags.infrastructure.database.tag_counters import (
+    ITEM_TAGS_VERSION,
+    TAG_COUNT,
+    TAGS_VERSION,
+)
+from app.tags.infrastructure.database.tag_query_service_impl import TagQueryServiceImpl
+
+VERSIONS = [ITEMS_VERSION, TAGS_VERSION, ITEM_TAGS_VERSION]
+
+
+class BoardQueryServiceImpl(BoardQueryService):
+    """Builds the snapshot from three queries in one read transaction.
+
+    One query reads every count and version from the counters table, one the
+    first page of tags and one the first page of all columns (see
+    ItemQueryServiceImpl.get_columns). The explicit read transaction makes the
+    three agree with each other even while writes commit in between.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.items = ItemQueryServiceImpl(db)
+        self.tags = TagQueryServiceImpl(db)
+
+    async def get_snapshot(self, limit: int = 50, tag_limit: int = 100) -> BoardSnapshot:
+        """Read the counters, tags and columns from a single snapshot"""
+        await begin_read_snapshot(self.db)
+        status_names = {status: status_counter(status) for status in ITEM_STATUSES}
+        counts = await read_counters(self.db, [*VERSIONS, TAG_COUNT, *status_names.values()])
+        tags = await self.tags.get_page(limit=tag_limit, sort="name")
+        columns = await self.items.get_columns(limit)
+        return BoardSnapshot(
+            version=sum(counts[name] for name in VERSIONS),
+            tags=tags,
+            tag_count=counts[TAG_COUNT],
+            columns=columns,
+            column_counts={status: counts[name] for status, name in status_names.items()},
+        )
@@ -0,0 +1,17 @@
+from app.board.domain.interfaces.board_registry import BoardRegistry
+from app.shared.infrastructure.database import ShardRouter
+
+
+class BoardRegistryImpl(BoardRegistry):
+    """BoardRegistry over the board database files of a ShardRouter"""
+
+    def __init__(self, shards: ShardRouter):
+        self.shards = shards
+
+    def list_ids(self) -> list[str]:
+        """Get the IDs of every board, sorted"""
+        return self.shards.board_ids()
+
+    async def create(self, board_id: str) -> None:
+        """Create the board's database file with the current schema"""
+        await self.shards.create(board_id)
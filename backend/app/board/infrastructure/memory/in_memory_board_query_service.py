@@ -0,0 +1,30 @@
+from app.board.domain.entities.board_snapshot import BoardSnapshot
+from app.board.domain.interfaces.board_query_service import BoardQueryService
+from app.items.domain.entities.item import ITEM_STATUSES
+from app.items.infrastructure.memory.in_memory_item_query_service import (
+    InMemoryItemQueryService,
+)
+from app.shared.infrastructure.memory.store import MemoryStore
+from app.tags.infrastructure.memory.in_memory_tag_query_service import InMemoryTagQueryService
+
+
+class InMemoryBoardQueryService(BoardQueryService):
+    """Builds the snapshot from a MemoryStore.
+
+    No write can run between the reads, so they agree without a transaction.
+    """
+
+    def __init__(self, store: MemoryStore):
+        self.store = store
+        self.items = InMemoryItemQueryService(store)
+        self.tags = InMemoryTagQueryService(store)
+
+    async def get_snapshot(self, limit: int = 50, tag_limit: int = 100) -> BoardSnapshot:
+        """Read the counts, tags and columns"""
+        return BoardSnapshot(
+            version=self.store.versions.total(),
+            tags=await self.tags.get_page(limit=tag_limit, sort="name"),
+            tag_count=len(self.store.tag_ids),
+            columns=await self.items.get_columns(limit),
+            column_counts={status: len(self.store.columns[status]) for status in ITEM_STATUSES},
+        )
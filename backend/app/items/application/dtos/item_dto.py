@@ -1,6 +1,14 @@
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.items.domain.entities.item import ItemStatus
+
+# Upper bound on rows per bulk request, to keep one request's transaction reasonably short
+MAX_BULK_ITEMS = 10_000
+# Upper bound on tags per bulk tag assignment; they share SQLite's variable limit with item IDs
+MAX_BULK_TAGS = 100
 
 
 class TagInItemDTO(BaseModel):
@@ -22,7 +30,41 @@ class ItemDTO(BaseModel):
     description: str | None = None
     created_at: datetime
     updated_at: datetime | None = None
+    status: ItemStatus = "todo"
+    position: str = ""
     tags: list[TagInItemDTO] = []
+    # Set only on items read from the archive
+    archived_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
+
+
+class ItemPageDTO(BaseModel):
+    """DTO for a page of items, the cursor of the next page and the total if it is known"""
+
+    items: list[ItemDTO]
+    next_cursor: str | None = None
+    total: int | None = None
+
+
+class ItemTombstoneDTO(BaseModel):
+    """DTO for a deleted item: its ID and when it was deleted"""
+
+    id: int
+    deleted_at: datetime
+
+
+class ItemSearchResultDTO(BaseModel):
+    """DTO for a full-text search hit.
+
+    ``rank`` is the bm25 score (lower is more relevant) and ``snippet`` an excerpt
+    of the matching text with the matched terms wrapped in ``<mark>`` tags.
+    """
+
+    item: ItemDTO
+    rank: float
+    snippet: str
 
     class Config:
         from_attributes = True
@@ -33,6 +75,7 @@ class ItemCreateDTO(BaseModel):
 
     name: str
     description: str | None = None
+    status: ItemStatus = "todo"
     tag_ids: list[int] = []
 
 
@@ -42,3 +85,74 @@ class ItemUpdateDTO(BaseModel):
     name: str | None = None
     description: str | None = None
     tag_ids: list[int] | None = None
+
+
+class ItemMoveDTO(BaseModel):
+    """DTO for moving an item to a column, optionally between two of its cards.
+
+    ``after_id`` is the card that ends up directly above the item and ``before_id``
+    the one directly below; leaving both out moves the item to the bottom.
+    """
+
+    status: ItemStatus
+    after_id: int | None = None
+    before_id: int | None = None
+
+
+class ItemArchiveDTO(BaseModel):
+    """DTO for archiving the items of a column that have not changed for a while"""
+
+    older_than_days: int = Field(..., ge=0)
+    status: ItemStatus = "done"
+    batch_size: int = Field(500, ge=1, le=MAX_BULK_ITEMS)
+
+
+class BulkItemCreateDTO(BaseModel):
+    """DTO for creating many items in one request"""
+
+    items: list[ItemCreateDTO] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkItemPatchDTO(ItemUpdateDTO):
+    """DTO for one entry of a bulk update: the item ID plus the fields to change"""
+
+    id: int
+
+
+class BulkItemUpdateDTO(BaseModel):
+    """DTO for updating many items in one request"""
+
+    items: list[BulkItemPatchDTO] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkItemDeleteDTO(BaseModel):
+    """DTO for deleting many items in one request"""
+
+    ids: list[int] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkItemResultDTO(BaseModel):
+    """DTO for the outcome of one row of a bulk request, in request order"""
+
+    index: int
+    id: int
+    status: Literal["created", "updated", "deleted", "not_found"]
+
+
+class BulkItemResponseDTO(BaseModel):
+    """DTO for bulk responses"""
+
+    results: list[BulkItemResultDTO]
+
+
+class BulkTagAssignmentDTO(BaseModel):
+    """DTO for attaching or detaching a set of tags on a set of items"""
+
+    item_ids: list[int] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+    tag_ids: list[int] = Field(..., min_length=1, max_length=MAX_BULK_TAGS)
+
+
+class BulkTagAssignmentResultDTO(BaseModel):
+    """DTO for the number of item-tag links created or removed"""
+
+    affected: int
@@ -1,17 +1,66 @@
-from app.items.application.dtos.item_dto import ItemCreateDTO, ItemDTO, ItemUpdateDTO
-from app.items.domain.entities.item import Item
+from datetime import datetime, timedelta
+
+from app.items.application.dtos.item_dto import (
+    BulkItemCreateDTO,
+    BulkItemDeleteDTO,
+    BulkItemResponseDTO,
+    BulkItemResultDTO,
+    BulkItemUpdateDTO,
+    BulkTagAssignmentDTO,
+    BulkTagAssignmentResultDTO,
+    ItemCreateDTO,
+    ItemDTO,
+    ItemMoveDTO,
+    ItemPageDTO,
+    ItemSearchResultDTO,
+    ItemTombstoneDTO,
+    ItemUpdateDTO,
+)
+from app.items.domain.entities.archive_policy import ArchivePolicy
+from app.items.domain.entities.item import Item, ItemSortKey, ItemStatus
+from app.items.domain.entities.item_changes import ItemChanges
+from app.items.domain.interfaces.item_archive_repository import ItemArchiveRepository
+from app.items.domain.interfaces.item_query_service import ItemQueryService
 from app.items.domain.interfaces.item_repository import ItemRepository
+from app.shared.domain.pagination import parse_cursor
+from app.shared.domain.tombstones import retention_cutoff, to_naive_utc
+from app.tags.domain.interfaces.tag_repository import TagRepositoryInterface
+
+
+def _changes_from_dto(item_id: int, dto: ItemUpdateDTO) -> ItemChanges:
+    """Partial update described by an update DTO: fields left out or null are not changed"""
+    fields = dto.model_dump(include={"name", "description"}, exclude_none=True)
+    return ItemChanges(item_id, fields, tag_ids=dto.tag_ids)
+
+
+async def _live_tag_ids(
+    tag_repository: TagRepositoryInterface | None, tag_ids: list[int] | None
+) -> list[int] | None:
+    """The given tag IDs that belong to live tags, in request order.
+
+    Resolved through the tag port, so a caching tag repository answers them
+    from its cache; without one the item repository skips unknown IDs itself.
+    """
+    if tag_repository is None or not tag_ids:
+        return tag_ids
+    live = {tag.id for tag in await tag_repository.get_by_ids(tag_ids)}
+    return [tag_id for tag_id in dict.fromkeys(tag_ids) if tag_id in live]
 
 
 class GetItemUseCase:
     """Use case to retrieve a specific item"""
 
-    def __init__(self, repository: ItemRepository):
+    def __init__(
+        self, repository: ItemRepository, archive_repository: ItemArchiveRepository | None = None
+    ):
         self.repository = repository
+        self.archive_repository = archive_repository
 
-    async def execute(self, item_id: int) -> ItemDTO | None:
-        """Get an item by ID"""
+    async def execute(self, item_id: int, include_archived: bool = False) -> ItemDTO | None:
+        """Get an item by ID, falling back to the archive if ``include_archived``"""
         item = await self.repository.get_by_id(item_id)
+        if item is None and include_archived and self.archive_repository is not None:
+            item = await self.archive_repository.get_by_id(item_id)
         if item is None:
             return None
         return ItemDTO.model_validate(item)
@@ -23,46 +72,186 @@ class GetAllItemsUseCase:
     def __init__(self, repository: ItemRepository):
         self.repository = repository
 
-    async def execute(self, skip: int = 0, limit: int = 100) -> list[ItemDTO]:
-        """Get all items with pagination"""
-        items = await self.repository.get_all(skip=skip, limit=limit)
+    async def execute(
+        self, skip: int = 0, limit: int = 100, tag_id: int | None = None
+    ) -> list[ItemDTO]:
+        """Get all items with pagination, optionally only those having a tag"""
+        items = await self.repository.get_all(skip=skip, limit=limit, tag_id=tag_id)
         return [ItemDTO.model_validate(item) for item in items]
 
 
+class GetItemsPageUseCase:
+    """Use case to retrieve items page by page with keyset pagination"""
+
+    def __init__(self, query_service: ItemQueryService):
+        self.query_service = query_service
+
+    async def execute(
+        self,
+        after: str | None = None,
+        limit: int = 100,
+        sort: ItemSortKey = "id",
+        tag_id: int | None = None,
+        status: ItemStatus | None = None,
+    ) -> ItemPageDTO:
+        """Get the page of items following the cursor; raises ValueError on a bad cursor"""
+        page = await self.query_service.get_page(
+            after=parse_cursor(after, sort),
+            limit=limit,
+            sort=sort,
+            tag_id=tag_id,
+            status=status,
+        )
+        return ItemPageDTO(
+            items=[ItemDTO.model_validate(item) for item in page.items],
+            next_cursor=page.next_cursor.encode() if page.next_cursor else None,
+            total=await self.query_service.count(tag_id=tag_id, status=status),
+        )
+
+
+class CountItemsUseCase:
+    """Use case to read the maintained number of items matching a filter"""
+
+    def __init__(self, query_service: ItemQueryService):
+        self.query_service = query_service
+
+    async def execute(
+        self, tag_id: int | None = None, status: ItemStatus | None = None
+    ) -> int | None:
+        """Get the item count, or None if it is not maintained for this filter"""
+        return await self.query_service.count(tag_id=tag_id, status=status)
+
+
+class GetItemTombstonesUseCase:
+    """Use case to list deleted items, for clients syncing deletions"""
+
+    def __init__(self, query_service: ItemQueryService):
+        self.query_service = query_service
+
+    async def execute(
+        self, since: datetime | None = None, limit: int = 1000
+    ) -> list[ItemTombstoneDTO]:
+        """Get the items deleted at or after ``since``, oldest deletion first"""
+        if since is not None:
+            since = to_naive_utc(since)
+        tombstones = await self.query_service.get_tombstones(since=since, limit=limit)
+        return [ItemTombstoneDTO.model_validate(tombstone) for tombstone in tombstones]
+
+
+class SearchItemsUseCase:
+    """Use case to find items by full-text search"""
+
+    def __init__(self, repository: ItemRepository):
+        self.repository = repository
+
+    async def execute(self, query: str, limit: int = 20) -> list[ItemSearchResultDTO]:
+        """Search items, best matches first; raises ValueError on an empty query"""
+        if not query.strip():
+            raise ValueError("Search query must not be empty")
+        hits = await self.repository.search(query, limit=limit)
+        return [ItemSearchResultDTO.model_validate(hit) for hit in hits]
+
+
 class CreateItemUseCase:
     """Use case to create a new item"""
 
-    def __init__(self, repository: ItemRepository):
+    def __init__(
+        self, repository: ItemRepository, tag_repository: TagRepositoryInterface | None = None
+    ):
         self.repository = repository
+        self.tag_repository = tag_repository
 
     async def execute(self, dto: ItemCreateDTO) -> ItemDTO:
-        """Create a new item"""
-        item = Item(name=dto.name, description=dto.description)
-        created_item = await self.repository.create(item, tag_ids=dto.tag_ids)
+        """Create a new item, linked to those of its tags that exist"""
+        item = Item(name=dto.name, description=dto.description, status=dto.status)
+        tag_ids = await _live_tag_ids(self.tag_repository, dto.tag_ids)
+        created_item = await self.repository.create(item, tag_ids=tag_ids)
         return ItemDTO.model_validate(created_item)
 
 
 class UpdateItemUseCase:
     """Use case to update an existing item"""
 
-    def __init__(self, repository: ItemRepository):
+    def __init__(
+        self, repository: ItemRepository, tag_repository: TagRepositoryInterface | None = None
+    ):
         self.repository = repository
+        self.tag_repository = tag_repository
 
     async def execute(self, item_id: int, dto: ItemUpdateDTO) -> ItemDTO | None:
-        """Update an existing item"""
-        # Get the current item
-        current_item = await self.repository.get_by_id(item_id)
-        if current_item is None:
+        """Update only the fields provided, in a single UPDATE ... RETURNING"""
+        changes = _changes_from_dto(item_id, dto)
+        changes.tag_ids = await _live_tag_ids(self.tag_repository, changes.tag_ids)
+        updated_item = await self.repository.patch(changes)
+        if updated_item is None:
             return None
+        return ItemDTO.model_validate(updated_item)
 
-        # Update fields if provided
-        if dto.name is not None:
-            current_item.name = dto.name
-        if dto.description is not None:
-            current_item.description = dto.description
 
-        updated_item = await self.repository.update(item_id, current_item, tag_ids=dto.tag_ids)
-        return ItemDTO.model_validate(updated_item)
+class MoveItemUseCase:
+    """Use case to move an item to a Kanban column and position"""
+
+    def __init__(self, repository: ItemRepository):
+        self.repository = repository
+
+    async def execute(self, item_id: int, dto: ItemMoveDTO) -> ItemDTO | None:
+        """Move the item; raises ValueError if a neighbour is not in the target column"""
+        if item_id in (dto.after_id, dto.before_id):
+            raise ValueError("An item cannot be placed next to itself")
+        moved = await self.repository.move(
+            item_id, dto.status, after_id=dto.after_id, before_id=dto.before_id
+        )
+        return ItemDTO.model_validate(moved) if moved else None
+
+
+class RebalanceColumnUseCase:
+    """Use case to renumber a Kanban column once its rank keys grow long"""
+
+    def __init__(self, repository: ItemRepository):
+        self.repository = repository
+
+    async def execute(self, status: ItemStatus) -> int:
+        """Rebalance the column, returning how many items it holds"""
+        return await self.repository.rebalance(status)
+
+
+class ArchiveItemsUseCase:
+    """Use case to move the items matching an archive policy into the archive"""
+
+    def __init__(self, repository: ItemArchiveRepository):
+        self.repository = repository
+
+    async def execute(self, policy: ArchivePolicy, batch_size: int = 500) -> int:
+        """Archive in batches of one transaction each, returning how many items moved.
+
+        The cutoff is fixed when the run starts, and each batch resumes after the
+        last ID of the previous one, so the run ends even while items keep aging.
+        """
+        before = policy.cutoff()
+        after_id = 0
+        archived = 0
+        while True:
+            ids = await self.repository.archive_batch(
+                policy.status, before, after_id=after_id, limit=batch_size
+            )
+            archived += len(ids)
+            if len(ids) < batch_size:
+                return archived
+            after_id = ids[-1]
+
+
+class RestoreItemUseCase:
+    """Use case to bring an archived item back onto the board"""
+
+    def __init__(self, repository: ItemArchiveRepository):
+        self.repository = repository
+
+    async def execute(self, item_id: int) -> ItemDTO | None:
+        """Restore an archived item; raises ValueError if its ID is in use"""
+        item = await self.repository.restore(item_id)
+        if item is None:
+            return None
+        return ItemDTO.model_validate(item)
 
 
 class DeleteItemUseCase:
@@ -74,3 +263,108 @@ class DeleteItemUseCase:
     async def execute(self, item_id: int) -> bool:
         """Delete an item"""
         return await self.repository.delete(item_id)
+
+
+class PurgeDeletedItemsUseCase:
+    """Use case to permanently remove items deleted longer ago than a retention window"""
+
+    def __init__(self, repository: ItemRepository):
+        self.repository = repository
+
+    async def execute(self, retention: timedelta, batch_size: int = 500) -> int:
+        """Purge in batches of one transaction each, returning how many items went"""
+        before = retention_cutoff(retention)
+        purged = 0
+        while True:
+            count = await self.repository.purge_deleted(before, limit=batch_size)
+            purged += count
+            if count < batch_size:
+                return purged
+
+
+class BulkCreateItemsUseCase:
+    """Use case to create many items at once"""
+
+    def __init__(self, repository: ItemRepository):
+        self.repository = repository
+
+    async def execute(self, dto: BulkItemCreateDTO) -> BulkItemResponseDTO:
+        """Create all items in one transaction"""
+        items = [
+            Item(name=entry.name, description=entry.description, status=entry.status)
+            for entry in dto.items
+        ]
+        ids = await self.repository.bulk_create(items, [entry.tag_ids for entry in dto.items])
+        return BulkItemResponseDTO(
+            results=[
+                BulkItemResultDTO(index=index, id=item_id, status="created")
+                for index, item_id in enumerate(ids)
+            ]
+        )
+
+
+class BulkUpdateItemsUseCase:
+    """Use case to update many items at once"""
+
+    def __init__(self, repository: ItemRepository):
+        self.repository = repository
+
+    async def execute(self, dto: BulkItemUpdateDTO) -> BulkItemResponseDTO:
+        """Update all items in one transaction, reporting IDs that do not exist"""
+        changes = [_changes_from_dto(entry.id, entry) for entry in dto.items]
+        found = await self.repository.bulk_update(changes)
+        return BulkItemResponseDTO(
+            results=[
+                BulkItemResultDTO(
+                    index=index,
+                    id=entry.id,
+                    status="updated" if entry.id in found else "not_found",
+                )
+                for index, entry in enumerate(dto.items)
+            ]
+        )
+
+
+class BulkDeleteItemsUseCase:
+    """Use case to delete many items at once"""
+
+    def __init__(self, repository: ItemRepository):
+        self.repository = repository
+
+    async def execute(self, dto: BulkItemDeleteDTO) -> BulkItemResponseDTO:
+        """Delete all items in one transaction, reporting IDs that do not exist"""
+        deleted = await self.repository.bulk_delete(dto.ids)
+        return BulkItemResponseDTO(
+            results=[
+                BulkItemResultDTO(
+                    index=index,
+                    id=item_id,
+                    status="deleted" if item_id in deleted else "not_found",
+                )
+                for index, item_id in enumerate(dto.ids)
+            ]
+        )
+
+
+class AttachTagsUseCase:
+    """Use case to attach tags to many items at once"""
+
+    def __init__(self, repository: ItemRepository):
+        self.repository = repository
+
+    async def execute(self, dto: BulkTagAssignmentDTO) -> BulkTagAssignmentResultDTO:
+        """Attach every tag to every item; unknown IDs and existing links are skipped"""
+        affected = await self.repository.attach_tags(dto.item_ids, dto.tag_ids)
+        return BulkTagAssignmentResultDTO(affected=affected)
+
+
+class DetachTagsUseCase:
+    """Use case to detach tags from many items at once"""
+
+    def __init__(self, repository: ItemRepository):
+        self.repository = repository
+
+    async def execute(self, dto: BulkTagAssignmentDTO) -> BulkTagAssignmentResultDTO:
+        """Detach every tag from every item"""
+        affected = await self.repository.detach_tags(dto.item_ids, dto.tag_ids)
+        return BulkTagAssignmentResultDTO(affected=affected)
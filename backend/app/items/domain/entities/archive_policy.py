@@ -0,0 +1,16 @@
+from datetime import UTC, datetime, timedelta
+
+from app.items.domain.entities.item import ItemStatus
+
+
+class ArchivePolicy:
+    """Which items to archive: those in ``status`` untouched for ``older_than``"""
+
+    def __init__(self, older_than: timedelta, status: ItemStatus = "done"):
+        self.older_than = older_than
+        self.status = status
+
+    def cutoff(self, now: datetime | None = None) -> datetime:
+        """Items last changed before this UTC time are archived"""
+        now = now or datetime.now(UTC)
+        return (now - self.older_than).replace(tzinfo=None)
@@ -1,4 +1,12 @@
 from datetime import datetime
+from typing import Literal, get_args
+
+# Kanban column of an item, in board order
+ItemStatus = Literal["todo", "inprogress", "done"]
+ITEM_STATUSES: tuple[ItemStatus, ...] = get_args(ItemStatus)
+
+# Orders an item list may use; position is the manual order within a column
+ItemSortKey = Literal["id", "name", "position"]
 
 
 class Item:
@@ -11,9 +19,14 @@ class Item:
         id: int | None = None,
         created_at: datetime | None = None,
         updated_at: datetime | None = None,
+        status: ItemStatus = "todo",
+        position: str = "",
     ):
         self.id = id
         self.name = name
         self.description = description
         self.created_at = created_at
         self.updated_at = updated_at
+        self.status = status
+        # Fractional rank key within the status column (see app.shared.domain.rank)
+        self.position = position
@@ -0,0 +1,30 @@
+from typing import Any
+
+
+class ItemChanges:
+    """Partial update of one item: only the given fields (and tags, if set) change"""
+
+    def __init__(self, item_id: int, fields: dict[str, Any], tag_ids: list[int] | None = None):
+        self.item_id = item_id
+        self.fields = fields
+        self.tag_ids = tag_ids
+
+
+def merge_changes(changes: list[ItemChanges]) -> list[ItemChanges]:
+    """One ItemChanges per item, combining the ones for the same ID in input order.
+
+    Fields of a later entry override those of an earlier one and the others are
+    kept; a later tag list replaces an earlier one.
+    """
+    merged: dict[int, ItemChanges] = {}
+    for change in changes:
+        previous = merged.get(change.item_id)
+        if previous is None:
+            merged[change.item_id] = ItemChanges(
+                change.item_id, dict(change.fields), change.tag_ids
+            )
+            continue
+        previous.fields.update(change.fields)
+        if change.tag_ids is not None:
+            previous.tag_ids = change.tag_ids
+    return list(merged.values())
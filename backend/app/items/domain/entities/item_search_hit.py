@@ -0,0 +1,10 @@
+from app.items.domain.entities.item import Item
+
+
+class ItemSearchHit:
+    """An item matching a full-text search, with its relevance and a highlighted excerpt"""
+
+    def __init__(self, item: Item, rank: float, snippet: str):
+        self.item = item
+        self.rank = rank
+        self.snippet = snippet
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+
+from app.items.domain.entities.item import Item, ItemStatus
+
+
+class ItemArchiveRepository(ABC):
+    """Repository moving items between the items table and the archive"""
+
+    @abstractmethod
+    async def archive_batch(
+        self, status: ItemStatus, before: datetime, after_id: int = 0, limit: int = 500
+    ) -> list[int]:
+        """Archive up to ``limit`` items in ``status`` last changed before ``before``.
+
+        Only IDs above ``after_id`` are scanned; returns the archived IDs in ascending order.
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, item_id: int) -> dict[str, Any] | None:
+        """Get an archived item as a dict shaped like ItemDTO, tags included"""
+        pass
+
+    @abstractmethod
+    async def restore(self, item_id: int) -> Item | None:
+        """Move an archived item back to the bottom of its column.
+
+        Tags deleted in the meantime are dropped. Raises ValueError if the ID is taken.
+        """
+        pass
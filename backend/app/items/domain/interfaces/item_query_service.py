@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+
+from app.items.domain.entities.item import ItemSortKey, ItemStatus
+from app.shared.domain.pagination import Page, PageCursor
+
+
+class ItemQueryService(ABC):
+    """Read model for item listings, returning plain rows instead of entities"""
+
+    @abstractmethod
+    async def get_page(
+        self,
+        after: PageCursor | None = None,
+        limit: int = 100,
+        sort: ItemSortKey = "id",
+        tag_id: int | None = None,
+        status: ItemStatus | None = None,
+    ) -> Page[dict[str, Any]]:
+        """Get a page of items as dicts shaped like ItemDTO, tags included"""
+        pass
+
+    @abstractmethod
+    async def get_columns(self, limit: int = 50) -> dict[ItemStatus, Page[dict[str, Any]]]:
+        """Get the first page of every Kanban column, in board order"""
+        pass
+
+    @abstractmethod
+    async def count(
+        self, tag_id: int | None = None, status: ItemStatus | None = None
+    ) -> int | None:
+        """Number of items matching the filters, or None if no maintained count covers them"""
+        pass
+
+    @abstractmethod
+    async def get_tombstones(
+        self, since: datetime | None = None, limit: int = 1000
+    ) -> list[dict[str, Any]]:
+        """IDs and deletion times of the items deleted at or after ``since``, oldest first"""
+        pass
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 
-from app.items.domain.entities.item import Item
+from app.items.domain.entities.item import Item, ItemSortKey, ItemStatus
+from app.items.domain.entities.item_changes import ItemChanges
+from app.items.domain.entities.item_search_hit import ItemSearchHit
+from app.shared.domain.pagination import Page, PageCursor
 
 
 class ItemRepository(ABC):
@@ -12,8 +16,30 @@ class ItemRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_all(self, skip: int = 0, limit: int = 100) -> list[Item]:
-        """Get all items with pagination"""
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, tag_id: int | None = None
+    ) -> list[Item]:
+        """Get all items with pagination, optionally only those having a tag"""
+        pass
+
+    @abstractmethod
+    async def get_page(
+        self,
+        after: PageCursor | None = None,
+        limit: int = 100,
+        sort: ItemSortKey = "id",
+        tag_id: int | None = None,
+        status: ItemStatus | None = None,
+    ) -> Page[Item]:
+        """Get a page of items ordered by (sort, id), starting after the cursor.
+
+        If tag_id or status is given, only items having that tag or status are returned.
+        """
+        pass
+
+    @abstractmethod
+    async def search(self, query: str, limit: int = 20) -> list[ItemSearchHit]:
+        """Full-text search over names and descriptions, best matches first"""
         pass
 
     @abstractmethod
@@ -26,7 +52,67 @@ class ItemRepository(ABC):
         """Update an existing item"""
         pass
 
+    @abstractmethod
+    async def patch(self, changes: ItemChanges) -> Item | None:
+        """Change only the given fields (and tags, if set) of an item; None if it does not exist"""
+        pass
+
+    @abstractmethod
+    async def move(
+        self,
+        item_id: int,
+        status: ItemStatus,
+        after_id: int | None = None,
+        before_id: int | None = None,
+    ) -> Item | None:
+        """Move an item to a column, directly below after_id and above before_id.
+
+        Without neighbours the item goes to the bottom. Returns None if the item
+        does not exist; raises ValueError if a neighbour is not in that column
+        or after_id does not sort before before_id.
+        """
+        pass
+
+    @abstractmethod
+    async def rebalance(self, status: ItemStatus) -> int:
+        """Reassign short, evenly spaced positions to a column, keeping its order"""
+        pass
+
     @abstractmethod
     async def delete(self, item_id: int) -> bool:
-        """Delete an item"""
+        """Delete an item, leaving a tombstone"""
+        pass
+
+    @abstractmethod
+    async def purge_deleted(self, before: datetime, limit: int = 500) -> int:
+        """Permanently remove up to ``limit`` items deleted before ``before``; returns how many"""
+        pass
+
+    @abstractmethod
+    async def bulk_create(self, items: list[Item], tag_ids: list[list[int]]) -> list[int]:
+        """Create many items in one transaction, returning their IDs in input order"""
+        pass
+
+    @abstractmethod
+    async def bulk_update(self, changes: list[ItemChanges]) -> set[int]:
+        """Apply many partial updates in one transaction, returning the IDs that exist.
+
+        Changes to the same item are merged in input order: later fields win,
+        earlier ones are kept.
+        """
+        pass
+
+    @abstractmethod
+    async def attach_tags(self, item_ids: list[int], tag_ids: list[int]) -> int:
+        """Attach every tag to every item, returning the number of new links"""
+        pass
+
+    @abstractmethod
+    async def detach_tags(self, item_ids: list[int], tag_ids: list[int]) -> int:
+        """Detach every tag from every item, returning the number of removed links"""
+        pass
+
+    @abstractmethod
+    async def bulk_delete(self, item_ids: list[int]) -> set[int]:
+        """Delete many items in one transaction, returning the IDs that were deleted"""
         pass
@@ -1,56 +1,302 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
 
-from app.items.application.dtos.item_dto import ItemCreateDTO, ItemDTO, ItemUpdateDTO
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.items.application.dtos.item_dto import (
+    BulkItemCreateDTO,
+    BulkItemDeleteDTO,
+    BulkItemResponseDTO,
+    BulkItemUpdateDTO,
+    BulkTagAssignmentDTO,
+    BulkTagAssignmentResultDTO,
+    ItemArchiveDTO,
+    ItemCreateDTO,
+    ItemDTO,
+    ItemMoveDTO,
+    ItemSearchResultDTO,
+    ItemTombstoneDTO,
+    ItemUpdateDTO,
+)
 from app.items.application.use_cases.item_use_cases import (
+    ArchiveItemsUseCase,
+    AttachTagsUseCase,
+    BulkCreateItemsUseCase,
+    BulkDeleteItemsUseCase,
+    BulkUpdateItemsUseCase,
+    CountItemsUseCase,
     CreateItemUseCase,
     DeleteItemUseCase,
+    DetachTagsUseCase,
     GetAllItemsUseCase,
+    GetItemsPageUseCase,
+    GetItemTombstonesUseCase,
     GetItemUseCase,
+    MoveItemUseCase,
+    PurgeDeletedItemsUseCase,
+    RebalanceColumnUseCase,
+    RestoreItemUseCase,
+    SearchItemsUseCase,
     UpdateItemUseCase,
 )
+from app.items.domain.entities.archive_policy import ArchivePolicy
+from app.items.domain.entities.item import ItemSortKey, ItemStatus
+from app.items.domain.interfaces.item_archive_repository import ItemArchiveRepository
+from app.items.domain.interfaces.item_query_service import ItemQueryService
+from app.items.domain.interfaces.item_repository import ItemRepository
+from app.items.infrastructure.cache.caching_item_repository import CachingItemRepository
+from app.items.infrastructure.database.item_archive_repository_impl import (
+    ItemArchiveRepositoryImpl,
+)
+from app.items.infrastructure.database.item_query_service_impl import ItemQueryServiceImpl
 from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl
+from app.items.infrastructure.memory.in_memory_item_archive_repository import (
+    InMemoryItemArchiveRepository,
+)
+from app.items.infrastructure.memory.in_memory_item_query_service import (
+    InMemoryItemQueryService,
+)
+from app.items.infrastructure.memory.in_memory_item_repository import InMemoryItemRepository
+from app.shared.domain.data_version import ITEM_TABLES
+from app.shared.domain.rank import needs_rebalance
 from app.shared.infrastructure import get_db
+from app.shared.infrastructure.api.conditional import conditional_get, raise_if_not_modified
+from app.shared.infrastructure.api.pagination import (
+    set_next_page_headers,
+    set_total_count_header,
+)
+from app.shared.infrastructure.cache import BoardCaches
+from app.shared.infrastructure.database import (
+    GroupCommitWriter,
+    board_path,
+    get_board_id,
+    get_group_commit_writer,
+    get_memory_store,
+    get_repository_caches,
+    memory_store,
+    repository_caches,
+    shards,
+)
+from app.shared.infrastructure.memory import MemoryStore
+from app.tags.domain.interfaces.tag_repository import TagRepositoryInterface
+from app.tags.infrastructure.cache.caching_tag_repository import CachingTagRepository
+from app.tags.infrastructure.database.tag_repository_impl import TagRepositoryImpl
 
 router = APIRouter(prefix="/items", tags=["items"])
 
 
-def get_item_repository(db: Session = Depends(get_db)) -> ItemRepositoryImpl:
-    """Dependency injection for item repository"""
-    return ItemRepositoryImpl(db)
+def get_item_repository(
+    db: AsyncSession = Depends(get_db),
+    writer: GroupCommitWriter | None = Depends(get_group_commit_writer),
+    store: MemoryStore | None = Depends(get_memory_store),
+    caches: BoardCaches | None = Depends(get_repository_caches),
+) -> ItemRepository:
+    """Dependency injection for item repository, cached when DATABASE_CACHE_REPOSITORIES is on"""
+    if store is not None:
+        return InMemoryItemRepository(store)
+    if caches is not None:
+        return CachingItemRepository(ItemRepositoryImpl(db, writer), caches.items)
+    return ItemRepositoryImpl(db, writer)
+
+
+def get_item_tag_repository(
+    db: AsyncSession = Depends(get_db),
+    writer: GroupCommitWriter | None = Depends(get_group_commit_writer),
+    store: MemoryStore | None = Depends(get_memory_store),
+    caches: BoardCaches | None = Depends(get_repository_caches),
+) -> TagRepositoryInterface | None:
+    """Dependency injection for the tag port resolving the tag IDs of item writes.
 
+    Only with DATABASE_CACHE_REPOSITORIES on: the cached tags then answer the
+    lookup, otherwise the item repository skips unknown tags in its own write.
+    """
+    if store is not None or caches is None:
+        return None
+    return CachingTagRepository(TagRepositoryImpl(db, writer), caches.tags, caches.items)
 
-@router.get("/", response_model=list[ItemDTO])
+
+def get_item_archive_repository(
+    db: AsyncSession = Depends(get_db),
+    writer: GroupCommitWriter | None = Depends(get_group_commit_writer),
+    store: MemoryStore | None = Depends(get_memory_store),
+) -> ItemArchiveRepository:
+    """Dependency injection for the item archive"""
+    if store is not None:
+        return InMemoryItemArchiveRepository(store)
+    return ItemArchiveRepositoryImpl(db, writer)
+
+
+def get_item_query_service(
+    db: AsyncSession = Depends(get_db),
+    store: MemoryStore | None = Depends(get_memory_store),
+) -> ItemQueryService:
+    """Dependency injection for the item listing read model"""
+    if store is not None:
+        return InMemoryItemQueryService(store)
+    return ItemQueryServiceImpl(db)
+
+
+@router.get(
+    "/", response_model=list[ItemDTO], dependencies=[Depends(conditional_get(*ITEM_TABLES))]
+)
 async def get_items(
-    skip: int = 0,
-    limit: int = 100,
-    repository: ItemRepositoryImpl = Depends(get_item_repository),
+    response: Response,
+    after: str | None = None,
+    limit: int = Query(100, ge=1),
+    sort: ItemSortKey = "id",
+    skip: int | None = Query(None, ge=0),
+    tag_id: int | None = None,
+    status: ItemStatus | None = None,
+    board_id: str | None = Depends(get_board_id),
+    repository: ItemRepository = Depends(get_item_repository),
+    query_service: ItemQueryService = Depends(get_item_query_service),
 ):
-    """Get all items with pagination"""
-    use_case = GetAllItemsUseCase(repository)
-    return await use_case.execute(skip=skip, limit=limit)
+    """Get items page by page, optionally only those having ``tag_id`` or ``status``.
+
+    ``status`` with ``sort=position`` lists a Kanban column in board order.
+
+    Pages are addressed by the opaque ``after`` cursor; the cursor of the next
+    page is returned in the Link and X-Next-Cursor headers. Passing ``skip``
+    selects the legacy offset pagination instead. Cursor pages are read
+    through the Core read model, bypassing the ORM.
+
+    X-Total-Count carries the maintained size of the filtered list; it is left
+    out when filtering by tag and status at once, which has no counter.
+    """
+    if skip is not None:
+        use_case = GetAllItemsUseCase(repository)
+        items = await use_case.execute(skip=skip, limit=limit, tag_id=tag_id)
+        set_total_count_header(response, await CountItemsUseCase(query_service).execute(tag_id))
+        return items
+
+    use_case = GetItemsPageUseCase(query_service)
+    try:
+        page = await use_case.execute(
+            after=after, limit=limit, sort=sort, tag_id=tag_id, status=status
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    filters = {"tag_id": tag_id, "status": status}
+    path = board_path(board_id, router.prefix + "/")
+    set_next_page_headers(response, path, page.next_cursor, limit, sort, filters)
+    set_total_count_header(response, page.total)
+    return page.items
+
+
+@router.get(
+    "/search",
+    response_model=list[ItemSearchResultDTO],
+    dependencies=[Depends(conditional_get(*ITEM_TABLES))],
+)
+async def search_items(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    repository: ItemRepository = Depends(get_item_repository),
+):
+    """Full-text search over item names and descriptions, best matches first"""
+    use_case = SearchItemsUseCase(repository)
+    try:
+        return await use_case.execute(q, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@router.get(
+    "/tombstones",
+    response_model=list[ItemTombstoneDTO],
+    dependencies=[Depends(conditional_get("items"))],
+)
+async def get_item_tombstones(
+    since: datetime | None = None,
+    limit: int = Query(1000, ge=1),
+    query_service: ItemQueryService = Depends(get_item_query_service),
+):
+    """Get the items deleted at or after ``since``, oldest deletion first.
+
+    Tombstones are kept for the retention window, then purged. Clients pass
+    the last ``deleted_at`` they saw as the next ``since``; the boundary is
+    inclusive, so items deleted in the same second are not missed.
+    """
+    use_case = GetItemTombstonesUseCase(query_service)
+    return await use_case.execute(since=since, limit=limit)
+
+
+@router.post("/bulk", response_model=BulkItemResponseDTO, status_code=201)
+async def bulk_create_items(
+    items: BulkItemCreateDTO,
+    repository: ItemRepository = Depends(get_item_repository),
+):
+    """Create many items in one transaction"""
+    use_case = BulkCreateItemsUseCase(repository)
+    return await use_case.execute(items)
+
+
+@router.patch("/bulk", response_model=BulkItemResponseDTO)
+async def bulk_update_items(
+    items: BulkItemUpdateDTO,
+    repository: ItemRepository = Depends(get_item_repository),
+):
+    """Update many items in one transaction; missing IDs are reported per row"""
+    use_case = BulkUpdateItemsUseCase(repository)
+    return await use_case.execute(items)
+
+
+@router.delete("/bulk", response_model=BulkItemResponseDTO)
+async def bulk_delete_items(
+    items: BulkItemDeleteDTO,
+    repository: ItemRepository = Depends(get_item_repository),
+):
+    """Delete many items in one transaction; missing IDs are reported per row"""
+    use_case = BulkDeleteItemsUseCase(repository)
+    return await use_case.execute(items)
+
+
+@router.post("/bulk/tags", response_model=BulkTagAssignmentResultDTO)
+async def attach_tags(
+    assignment: BulkTagAssignmentDTO,
+    repository: ItemRepository = Depends(get_item_repository),
+):
+    """Attach tags to many items; returns the number of links created"""
+    use_case = AttachTagsUseCase(repository)
+    return await use_case.execute(assignment)
+
+
+@router.delete("/bulk/tags", response_model=BulkTagAssignmentResultDTO)
+async def detach_tags(
+    assignment: BulkTagAssignmentDTO,
+    repository: ItemRepository = Depends(get_item_repository),
+):
+    """Detach tags from many items; returns the number of links removed"""
+    use_case = DetachTagsUseCase(repository)
+    return await use_case.execute(assignment)
 
 
 @router.get("/{item_id}", response_model=ItemDTO)
 async def get_item(
     item_id: int,
-    repository: ItemRepositoryImpl = Depends(get_item_repository),
+    include_archived: bool = False,
+    if_none_match: str | None = Header(None),
+    etag: str = Depends(conditional_get(*ITEM_TABLES, after_lookup=True)),
+    repository: ItemRepository = Depends(get_item_repository),
+    archive_repository: ItemArchiveRepository = Depends(get_item_archive_repository),
 ):
-    """Get a specific item by ID"""
-    use_case = GetItemUseCase(repository)
-    item = await use_case.execute(item_id)
+    """Get a specific item by ID; ``include_archived`` also looks in the archive"""
+    use_case = GetItemUseCase(repository, archive_repository)
+    item = await use_case.execute(item_id, include_archived=include_archived)
     if item is None:
         raise HTTPException(status_code=404, detail="Item not found")
+    raise_if_not_modified(if_none_match, etag)
     return item
 
 
 @router.post("/", response_model=ItemDTO, status_code=201)
 async def create_item(
     item: ItemCreateDTO,
-    repository: ItemRepositoryImpl = Depends(get_item_repository),
+    repository: ItemRepository = Depends(get_item_repository),
+    tag_repository: TagRepositoryInterface | None = Depends(get_item_tag_repository),
 ):
     """Create a new item"""
-    use_case = CreateItemUseCase(repository)
+    use_case = CreateItemUseCase(repository, tag_repository)
     return await use_case.execute(item)
 
 
@@ -58,22 +304,132 @@ async def create_item(
 async def update_item(
     item_id: int,
     item: ItemUpdateDTO,
-    repository: ItemRepositoryImpl = Depends(get_item_repository),
+    repository: ItemRepository = Depends(get_item_repository),
+    tag_repository: TagRepositoryInterface | None = Depends(get_item_tag_repository),
 ):
     """Update an existing item"""
-    use_case = UpdateItemUseCase(repository)
+    use_case = UpdateItemUseCase(repository, tag_repository)
     updated_item = await use_case.execute(item_id, item)
     if updated_item is None:
         raise HTTPException(status_code=404, detail="Item not found")
     return updated_item
 
 
+@router.post("/{item_id}/move", response_model=ItemDTO)
+async def move_item(
+    item_id: int,
+    move: ItemMoveDTO,
+    background_tasks: BackgroundTasks,
+    board_id: str | None = Depends(get_board_id),
+    repository: ItemRepository = Depends(get_item_repository),
+):
+    """Move an item to a column, between ``after_id`` and ``before_id`` if given.
+
+    Only the moved row is written. When its new rank key has grown long, the
+    column is rebalanced after the response is sent.
+    """
+    use_case = MoveItemUseCase(repository)
+    try:
+        moved_item = await use_case.execute(item_id, move)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if moved_item is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    if needs_rebalance(moved_item.position):
+        background_tasks.add_task(rebalance_column, move.status, board_id)
+    return moved_item
+
+
+async def rebalance_column(status: ItemStatus, board_id: str | None = None) -> None:
+    """Background task: renumber a board's column in a session of its own"""
+    store = memory_store(board_id)
+    if store is not None:
+        await RebalanceColumnUseCase(InMemoryItemRepository(store)).execute(status)
+        return
+    async with shards.lease(board_id) as board, board.session() as session:
+        repository = ItemRepositoryImpl(session, board.group_commit)
+        caches = repository_caches(board_id)
+        if caches is not None:
+            repository = CachingItemRepository(repository, caches.items)
+        await RebalanceColumnUseCase(repository).execute(status)
+
+
+@router.post("/archive", status_code=202)
+async def archive_items(
+    archive: ItemArchiveDTO,
+    background_tasks: BackgroundTasks,
+    board_id: str | None = Depends(get_board_id),
+):
+    """Archive the items of ``status`` unchanged for ``older_than_days``, in the background.
+
+    Items move to the archive ``batch_size`` at a time, one transaction per batch,
+    so regular writes are never blocked for long.
+    """
+    policy = ArchivePolicy(timedelta(days=archive.older_than_days), archive.status)
+    background_tasks.add_task(archive_old_items, policy, archive.batch_size, board_id)
+
+
+async def archive_old_items(
+    policy: ArchivePolicy, batch_size: int, board_id: str | None = None
+) -> None:
+    """Background task: archive a board's items in a session of its own"""
+    store = memory_store(board_id)
+    if store is not None:
+        use_case = ArchiveItemsUseCase(InMemoryItemArchiveRepository(store))
+        await use_case.execute(policy, batch_size=batch_size)
+        return
+    async with shards.lease(board_id) as board, board.session() as session:
+        use_case = ArchiveItemsUseCase(ItemArchiveRepositoryImpl(session, board.group_commit))
+        try:
+            await use_case.execute(policy, batch_size=batch_size)
+        finally:
+            # Archived items must no longer be served from the cache
+            caches = repository_caches(board_id)
+            if caches is not None:
+                caches.items.clear()
+
+
+async def purge_deleted_items(retention: timedelta, batch_size: int) -> int:
+    """Background job: purge the item tombstones of every board, a session each"""
+    purged = 0
+    for board_id in [None, *shards.board_ids()]:
+        store = memory_store(board_id)
+        if store is not None:
+            use_case = PurgeDeletedItemsUseCase(InMemoryItemRepository(store))
+            purged += await use_case.execute(retention, batch_size=batch_size)
+            continue
+        async with shards.lease(board_id) as board, board.session() as session:
+            use_case = PurgeDeletedItemsUseCase(ItemRepositoryImpl(session, board.group_commit))
+            purged += await use_case.execute(retention, batch_size=batch_size)
+    return purged
+
+
+@router.post("/{item_id}/restore", response_model=ItemDTO)
+async def restore_item(
+    item_id: int,
+    archive_repository: ItemArchiveRepository = Depends(get_item_archive_repository),
+    caches: BoardCaches | None = Depends(get_repository_caches),
+):
+    """Move an archived item back to the bottom of its column"""
+    use_case = RestoreItemUseCase(archive_repository)
+    try:
+        item = await use_case.execute(item_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    finally:
+        if caches is not None:
+            caches.items.clear()
+    if item is None:
+        raise HTTPException(status_code=404, detail="Archived item not found")
+    return item
+
+
 @router.delete("/{item_id}", status_code=204)
 async def delete_item(
     item_id: int,
-    repository: ItemRepositoryImpl = Depends(get_item_repository),
+    repository: ItemRepository = Depends(get_item_repository),
 ):
-    """Delete an item"""
+    """Delete an item; it is listed in GET /items/tombstones until purged"""
     use_case = DeleteItemUseCase(repository)
     success = await use_case.execute(item_id)
     if not success:
@@ -0,0 +1,180 @@
+from datetime import datetime
+
+from app.items.domain.entities.item import Item, ItemSortKey, ItemStatus
+from app.items.domain.entities.item_changes import ItemChanges
+from app.items.domain.entities.item_search_hit import ItemSearchHit
+from app.items.domain.interfaces.item_repository import ItemRepository
+from app.shared.domain.pagination import Page, PageCursor
+from app.shared.infrastructure.cache import MISSING, LRUCache
+from app.shared.infrastructure.memory import TaggedItem
+from app.tags.domain.entities.tag import Tag
+
+
+class CachingItemRepository(ItemRepository):
+    """ItemRepository decorator answering get_by_id and get_all from an LRU cache.
+
+    The cache holds TaggedItem copies, never ORM rows, so nothing it returns is
+    tied to the session that read it. Keyset pages and search are not cached.
+    Every write clears the cache; single-item writes then store the written
+    item under its ID (write-through).
+    """
+
+    def __init__(self, repository: ItemRepository, cache: LRUCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def get_by_id(self, item_id: int) -> Item | None:
+        """Get an item by ID, from the cache if there"""
+        key = ("id", item_id)
+        item = self.cache.get(key)
+        if item is MISSING:
+            generation = self.cache.generation
+            item = _snapshot(await self.repository.get_by_id(item_id))
+            self.cache.put(key, item, generation)
+        return item
+
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, tag_id: int | None = None
+    ) -> list[Item]:
+        """Get all items with offset pagination, from the cache if there"""
+        key = ("all", skip, limit, tag_id)
+        items = self.cache.get(key)
+        if items is MISSING:
+            generation = self.cache.generation
+            rows = await self.repository.get_all(skip=skip, limit=limit, tag_id=tag_id)
+            items = [_snapshot(row) for row in rows]
+            self.cache.put(key, items, generation)
+        return list(items)
+
+    async def get_page(
+        self,
+        after: PageCursor | None = None,
+        limit: int = 100,
+        sort: ItemSortKey = "id",
+        tag_id: int | None = None,
+        status: ItemStatus | None = None,
+    ) -> Page[Item]:
+        """Get a page of items, always from the repository"""
+        return await self.repository.get_page(
+            after=after, limit=limit, sort=sort, tag_id=tag_id, status=status
+        )
+
+    async def search(self, query: str, limit: int = 20) -> list[ItemSearchHit]:
+        """Search items, always in the repository"""
+        return await self.repository.search(query, limit=limit)
+
+    async def create(self, item: Item, tag_ids: list[int] | None = None) -> Item:
+        """Create an item and cache it"""
+        try:
+            created = await self.repository.create(item, tag_ids=tag_ids)
+        finally:
+            self.cache.clear()
+        self.cache.put(("id", created.id), _snapshot(created))
+        return created
+
+    async def update(
+        self, item_id: int, item: Item, tag_ids: list[int] | None = None
+    ) -> Item | None:
+        """Update an item and cache the result"""
+        try:
+            updated = await self.repository.update(item_id, item, tag_ids=tag_ids)
+        finally:
+            self.cache.clear()
+        self.cache.put(("id", item_id), _snapshot(updated))
+        return updated
+
+    async def patch(self, changes: ItemChanges) -> Item | None:
+        """Change the given fields of an item and cache the result"""
+        try:
+            patched = await self.repository.patch(changes)
+        finally:
+            self.cache.clear()
+        self.cache.put(("id", changes.item_id), _snapshot(patched))
+        return patched
+
+    async def move(
+        self,
+        item_id: int,
+        status: ItemStatus,
+        after_id: int | None = None,
+        before_id: int | None = None,
+    ) -> Item | None:
+        """Move an item and cache the result"""
+        try:
+            moved = await self.repository.move(item_id, status, after_id, before_id)
+        finally:
+            self.cache.clear()
+        self.cache.put(("id", item_id), _snapshot(moved))
+        return moved
+
+    async def rebalance(self, status: ItemStatus) -> int:
+        """Renumber a column, forgetting the cached positions"""
+        try:
+            return await self.repository.rebalance(status)
+        finally:
+            self.cache.clear()
+
+    async def delete(self, item_id: int) -> bool:
+        """Delete an item and cache that it is gone"""
+        try:
+            deleted = await self.repository.delete(item_id)
+        finally:
+            self.cache.clear()
+        self.cache.put(("id", item_id), None)
+        return deleted
+
+    async def purge_deleted(self, before: datetime, limit: int = 500) -> int:
+        """Purge item tombstones; the cache never holds them"""
+        return await self.repository.purge_deleted(before, limit)
+
+    async def bulk_create(self, items: list[Item], tag_ids: list[list[int]]) -> list[int]:
+        """Create many items, forgetting the cached lists"""
+        try:
+            return await self.repository.bulk_create(items, tag_ids)
+        finally:
+            self.cache.clear()
+
+    async def bulk_update(self, changes: list[ItemChanges]) -> set[int]:
+        """Update many items, forgetting the cache"""
+        try:
+            return await self.repository.bulk_update(changes)
+        finally:
+            self.cache.clear()
+
+    async def attach_tags(self, item_ids: list[int], tag_ids: list[int]) -> int:
+        """Attach tags to many items, forgetting the cache"""
+        try:
+            return await self.repository.attach_tags(item_ids, tag_ids)
+        finally:
+            self.cache.clear()
+
+    async def detach_tags(self, item_ids: list[int], tag_ids: list[int]) -> int:
+        """Detach tags from many items, forgetting the cache"""
+        try:
+            return await self.repository.detach_tags(item_ids, tag_ids)
+        finally:
+            self.cache.clear()
+
+    async def bulk_delete(self, item_ids: list[int]) -> set[int]:
+        """Delete many items, forgetting the cache"""
+        try:
+            return await self.repository.bulk_delete(item_ids)
+        finally:
+            self.cache.clear()
+
+
+def _snapshot(item: Item | None) -> TaggedItem | None:
+    """Copy of an item and its tags, detached from any session"""
+    if item is None:
+        return None
+    tags = [
+        Tag(
+            name=tag.name,
+            color=tag.color,
+            id=tag.id,
+            created_at=tag.created_at,
+            updated_at=tag.updated_at,
+        )
+        for tag in getattr(item, "tags", [])
+    ]
+    return TaggedItem(item, tags)
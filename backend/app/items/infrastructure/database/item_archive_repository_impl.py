@@ -0,0 +1,183 @@
+# Archive of long-finished items.
+#
+# Archived rows live in items_archive, out of the items table and its indexes.
+# Archive old done cards from a cron job, in batches of short transactions:
+#
+#     python -m app.items.infrastructure.database.item_archive_repository_impl --older-than-days 30
+#
+# --board archives the items of one board instead of the default one.
+
+import argparse
+import asyncio
+import json
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.items.application.use_cases.item_use_cases import ArchiveItemsUseCase
+from app.items.domain.entities.archive_policy import ArchivePolicy
+from app.items.domain.entities.item import ITEM_STATUSES, ItemStatus
+from app.items.domain.interfaces.item_archive_repository import ItemArchiveRepository
+from app.items.infrastructure.orm.item_orm import ItemORM, items_archive
+from app.shared.domain.rank import rank_between
+from app.shared.infrastructure.database import GroupCommitWriter, database, run_write, shards
+from app.tags.infrastructure.orm.tag_orm import TagORM, item_tags
+
+items = ItemORM.__table__
+
+# Columns copied verbatim between items and items_archive
+COPIED_COLUMNS = ["id", "name", "description", "created_at", "updated_at", "status", "position"]
+
+# The tag IDs of the outer item as a JSON array
+item_tag_ids_json = (
+    select(func.json_group_array(item_tags.c.tag_id))
+    .where(item_tags.c.item_id == items.c.id)
+    .scalar_subquery()
+)
+
+
+class ItemArchiveRepositoryImpl(ItemArchiveRepository):
+    """SQLAlchemy implementation of ItemArchiveRepository"""
+
+    def __init__(self, db: AsyncSession, writer: GroupCommitWriter | None = None):
+        self.db = db
+        self.writer = writer
+
+    async def archive_batch(
+        self, status: ItemStatus, before: datetime, after_id: int = 0, limit: int = 500
+    ) -> list[int]:
+        """Copy a batch into the archive and delete it from items, in one transaction.
+
+        The batch is found by walking the primary key upwards from ``after_id``,
+        so a run over all batches reads the items table once. Deleting fires the
+        same triggers and cascades as any delete: the search index, the counts
+        and the tag links follow.
+        """
+
+        async def operation(session: AsyncSession) -> list[int]:
+            result = await session.execute(
+                select(items.c.id)
+                .where(
+                    items.c.id > after_id,
+                    items.c.deleted_at.is_(None),
+                    items.c.status == status,
+                    func.coalesce(items.c.updated_at, items.c.created_at) < before,
+                )
+                .order_by(items.c.id)
+                .limit(limit)
+            )
+            ids = list(result.scalars().all())
+            if not ids:
+                return ids
+            await session.execute(
+                insert(items_archive).from_select(
+                    [*COPIED_COLUMNS, "tag_ids"],
+                    select(*(items.c[name] for name in COPIED_COLUMNS), item_tag_ids_json).where(
+                        items.c.id.in_(ids)
+                    ),
+                )
+            )
+            await session.execute(delete(items).where(items.c.id.in_(ids)))
+            return ids
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def get_by_id(self, item_id: int) -> dict[str, Any] | None:
+        """Get an archived item with the tags that still exist"""
+        result = await self.db.execute(select(items_archive).where(items_archive.c.id == item_id))
+        row = result.first()
+        if row is None:
+            return None
+        values = row._asdict()
+        tag_ids = json.loads(values.pop("tag_ids"))
+        values["tags"] = await self._get_tags(self.db, tag_ids) if tag_ids else []
+        return values
+
+    async def restore(self, item_id: int) -> ItemORM | None:
+        """Move an archived item back into items - returns ORM for tags support"""
+
+        async def operation(session: AsyncSession) -> ItemORM | None:
+            result = await session.execute(
+                delete(items_archive)
+                .where(items_archive.c.id == item_id)
+                .returning(*items_archive.c)
+            )
+            row = result.first()
+            if row is None:
+                return None
+            # Queried rather than session.get, which may answer from a stale identity map
+            taken = await session.execute(select(items.c.id).where(items.c.id == item_id))
+            if taken.first() is not None:
+                raise ValueError(f"Item ID {item_id} is already in use")
+
+            last = await session.execute(
+                select(func.max(items.c.position)).where(
+                    items.c.status == row.status, items.c.deleted_at.is_(None)
+                )
+            )
+            values = {name: getattr(row, name) for name in COPIED_COLUMNS}
+            values["position"] = rank_between(last.scalar_one_or_none(), None)
+            await session.execute(insert(items).values(**values))
+
+            tag_ids = json.loads(row.tag_ids)
+            if tag_ids:
+                # Tags deleted while the item was archived are skipped
+                await session.execute(
+                    insert(item_tags).from_select(
+                        ["item_id", "tag_id"],
+                        select(literal(item_id), TagORM.id).where(
+                            TagORM.id.in_(tag_ids), TagORM.deleted_at.is_(None)
+                        ),
+                    )
+                )
+            result = await session.execute(
+                select(ItemORM)
+                .where(ItemORM.id == item_id)
+                .options(selectinload(ItemORM.tags))
+                .execution_options(populate_existing=True)
+            )
+            return result.scalar_one()
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def _get_tags(self, session: AsyncSession, tag_ids: list[int]) -> list[dict[str, Any]]:
+        """Tags matching the given IDs, shaped like TagInItemDTO"""
+        result = await session.execute(
+            select(TagORM.id, TagORM.name, TagORM.color).where(
+                TagORM.id.in_(tag_ids), TagORM.deleted_at.is_(None)
+            )
+        )
+        return [row._asdict() for row in result.all()]
+
+
+async def _archive(policy: ArchivePolicy, batch_size: int, board_id: str | None = None) -> int:
+    """Archive every matching item of a board, then close the database connections"""
+    try:
+        async with shards.lease(board_id) as board, board.session() as session:
+            use_case = ArchiveItemsUseCase(ItemArchiveRepositoryImpl(session))
+            return await use_case.execute(policy, batch_size=batch_size)
+    finally:
+        await shards.dispose()
+        await database.dispose()
+
+
+def main() -> None:
+    """Command line entry point to archive old items"""
+    parser = argparse.ArgumentParser(description="Move old items into the archive")
+    parser.add_argument("--older-than-days", type=int, required=True)
+    parser.add_argument("--status", choices=ITEM_STATUSES, default="done")
+    parser.add_argument("--batch-size", type=int, default=500, help="items per transaction")
+    parser.add_argument("--board", help="board ID (default: the default board)")
+    args = parser.parse_args()
+    if args.board is not None and not shards.exists(args.board):
+        parser.error(f"no board {args.board!r}")
+    policy = ArchivePolicy(timedelta(days=args.older_than_days), args.status)
+    archived = asyncio.run(_archive(policy, args.batch_size, args.board))
+    print(f"Archived {archived} items")
+
+
+if __name__ == "__main__":
+    main()
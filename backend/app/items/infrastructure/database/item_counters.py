@@ -0,0 +1,49 @@
+# Maintained item counts (all items and the items of each status) and the items version.
+# Only live items are counted: setting deleted_at takes an item out of its counts,
+# and purging the tombstone later leaves them alone.
+# See app.shared.infrastructure.database.counters.
+
+from app.shared.infrastructure.database.counters import (
+    CounterSet,
+    decrement_sql,
+    increment_sql,
+    table_version,
+    version_counter,
+)
+
+ITEM_COUNT = "items"
+ITEMS_VERSION = version_counter("items")
+
+
+def status_counter(status: str) -> str:
+    """Name of the counter of the items having a status"""
+    return f"items:{status}"
+
+
+_ALL = f"'{ITEM_COUNT}'"
+_STATUS_OF_NEW = "'items:' || new.status"
+_STATUS_OF_OLD = "'items:' || old.status"
+
+item_counters = CounterSet(
+    triggers={
+        "items_count_ai": "AFTER INSERT ON items WHEN new.deleted_at IS NULL BEGIN "
+        f"{increment_sql(_ALL)} {increment_sql(_STATUS_OF_NEW)} END",
+        "items_count_ad": "AFTER DELETE ON items WHEN old.deleted_at IS NULL BEGIN "
+        f"{decrement_sql(_ALL)} {decrement_sql(_STATUS_OF_OLD)} END",
+        "items_count_au": "AFTER UPDATE OF status ON items "
+        "WHEN old.status IS NOT new.status AND new.deleted_at IS NULL BEGIN "
+        f"{decrement_sql(_STATUS_OF_OLD)} {increment_sql(_STATUS_OF_NEW)} END",
+        "items_count_tombstone": "AFTER UPDATE OF deleted_at ON items "
+        "WHEN old.deleted_at IS NULL AND new.deleted_at IS NOT NULL BEGIN "
+        f"{decrement_sql(_ALL)} {decrement_sql(_STATUS_OF_OLD)} END",
+    },
+    recount=[
+        f"DELETE FROM counters WHERE name = '{ITEM_COUNT}' OR name LIKE 'items:%'",
+        f"INSERT INTO counters(name, value) "
+        f"SELECT '{ITEM_COUNT}', count(*) FROM items WHERE deleted_at IS NULL",
+        "INSERT INTO counters(name, value) "
+        "SELECT 'items:' || status, count(*) FROM items WHERE deleted_at IS NULL GROUP BY status",
+    ],
+)
+
+items_version = table_version("items")
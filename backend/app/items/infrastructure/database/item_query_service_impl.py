@@ -0,0 +1,144 @@
+import json
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, func, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.items.domain.entities.item import ITEM_STATUSES, ItemSortKey, ItemStatus
+from app.items.domain.interfaces.item_query_service import ItemQueryService
+from app.items.infrastructure.database.item_counters import ITEM_COUNT, status_counter
+from app.items.infrastructure.orm.item_orm import ItemORM
+from app.shared.domain.pagination import Page, PageCursor
+from app.shared.infrastructure.database.counters import read_counters
+from app.shared.infrastructure.database.pagination import apply_keyset, to_page
+from app.tags.infrastructure.database.tag_counters import tag_items_counter
+from app.tags.infrastructure.orm.tag_orm import TagORM, item_tags
+
+items = ItemORM.__table__
+tags = TagORM.__table__
+
+# The live tags of the outer item as one JSON array, read through the item_tags primary key
+item_tags_json = (
+    select(
+        func.json_group_array(
+            func.json_object("id", tags.c.id, "name", tags.c.name, "color", tags.c.color)
+        )
+    )
+    .select_from(item_tags.join(tags, tags.c.id == item_tags.c.tag_id))
+    .where(item_tags.c.item_id == items.c.id, tags.c.deleted_at.is_(None))
+    .scalar_subquery()
+    .label("tags")
+)
+
+
+class ItemQueryServiceImpl(ItemQueryService):
+    """SQLAlchemy Core implementation of the item read model.
+
+    Rows never pass through the ORM: there is no identity map, no ItemORM
+    instances and no per-item tag collections, only tuples turned into dicts.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_page(
+        self,
+        after: PageCursor | None = None,
+        limit: int = 100,
+        sort: ItemSortKey = "id",
+        tag_id: int | None = None,
+        status: ItemStatus | None = None,
+    ) -> Page[dict[str, Any]]:
+        """Get a page of items by keyset pagination, tags aggregated in SQL"""
+        statement = self._select_rows(tag_id)
+        if status is not None:
+            # With sort="position" this is a range scan of ix_items_status_position
+            statement = statement.where(items.c.status == status)
+        statement = apply_keyset(statement, items.c[sort], items.c.id, after, limit)
+        result = await self.db.execute(statement)
+        page = to_page(result.all(), limit, sort)
+        return Page([self._to_dict(row) for row in page.items], page.next_cursor)
+
+    async def get_columns(self, limit: int = 50) -> dict[ItemStatus, Page[dict[str, Any]]]:
+        """Get the first page of every column in one statement.
+
+        Each column is its own LIMITed range scan of ix_items_status_position and
+        the scans are glued together with UNION ALL, so no row past the first
+        page of a column is read.
+        """
+        columns = [
+            apply_keyset(
+                self._select_rows(None).where(items.c.status == status),
+                items.c.position,
+                items.c.id,
+                None,
+                limit,
+            ).subquery()
+            for status in ITEM_STATUSES
+        ]
+        result = await self.db.execute(union_all(*(select(column) for column in columns)))
+        rows_by_status: dict[str, list] = {status: [] for status in ITEM_STATUSES}
+        for row in result.all():
+            rows_by_status[row.status].append(row)
+
+        pages = {}
+        for status, rows in rows_by_status.items():
+            # UNION ALL does not promise to keep the order of its parts
+            rows.sort(key=lambda row: (row.position, row.id))
+            page = to_page(rows, limit, "position")
+            pages[status] = Page([self._to_dict(row) for row in page.items], page.next_cursor)
+        return pages
+
+    async def count(
+        self, tag_id: int | None = None, status: ItemStatus | None = None
+    ) -> int | None:
+        """Read the maintained count of the filter; tag and status together have none"""
+        if tag_id is not None and status is not None:
+            return None
+        if tag_id is not None:
+            name = tag_items_counter(tag_id)
+        elif status is not None:
+            name = status_counter(status)
+        else:
+            name = ITEM_COUNT
+        counts = await read_counters(self.db, [name])
+        return counts[name]
+
+    async def get_tombstones(
+        self, since: datetime | None = None, limit: int = 1000
+    ) -> list[dict[str, Any]]:
+        """Read deleted items from the partial deleted_at index"""
+        statement = select(items.c.id, items.c.deleted_at).where(items.c.deleted_at.is_not(None))
+        if since is not None:
+            statement = statement.where(items.c.deleted_at >= since)
+        statement = statement.order_by(items.c.deleted_at, items.c.id).limit(limit)
+        result = await self.db.execute(statement)
+        return [row._asdict() for row in result.all()]
+
+    def _select_rows(self, tag_id: int | None) -> Select:
+        """Select live items plus their tags, restricted to the tag if one is given"""
+        statement = select(
+            items.c.id,
+            items.c.name,
+            items.c.description,
+            items.c.created_at,
+            items.c.updated_at,
+            items.c.status,
+            items.c.position,
+            item_tags_json,
+        ).where(items.c.deleted_at.is_(None))
+        if tag_id is not None:
+            # A tag tombstone keeps its links until purged, but lists no items
+            statement = (
+                statement.join(item_tags, item_tags.c.item_id == items.c.id)
+                .join(tags, tags.c.id == item_tags.c.tag_id)
+                .where(item_tags.c.tag_id == tag_id, tags.c.deleted_at.is_(None))
+            )
+        return statement
+
+    def _to_dict(self, row) -> dict[str, Any]:
+        """Convert a result row into an ItemDTO-shaped dict"""
+        values = row._asdict()
+        values["tags"] = json.loads(values["tags"])
+        return values
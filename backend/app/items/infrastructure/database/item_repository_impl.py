@@ -1,70 +1,565 @@
-from sqlalchemy.orm import Session
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
 
-from app.items.domain.entities.item import Item
+from sqlalchemy import Select, delete, func, insert, select, true, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlalchemy.orm.util import identity_key
+
+from app.items.domain.entities.item import Item, ItemSortKey, ItemStatus
+from app.items.domain.entities.item_changes import ItemChanges, merge_changes
+from app.items.domain.entities.item_search_hit import ItemSearchHit
 from app.items.domain.interfaces.item_repository import ItemRepository
+from app.items.infrastructure.database.search_index import (
+    bm25_rank,
+    items_fts,
+    match_snippet,
+    matches,
+)
 from app.items.infrastructure.orm.item_orm import ItemORM
-from app.tags.infrastructure.orm.tag_orm import TagORM
+from app.shared.domain.pagination import Page, PageCursor
+from app.shared.domain.rank import rank_between, spread_ranks
+from app.shared.infrastructure.database import GroupCommitWriter, run_write
+from app.shared.infrastructure.database.batching import SQLITE_MAX_VARIABLES, chunked
+from app.shared.infrastructure.database.pagination import apply_keyset, to_page
+from app.tags.infrastructure.orm.tag_orm import TagORM, item_tags
+
+# A loader option factory applied to ItemORM.tags, e.g. selectinload
+type TagLoader = Callable[[Any], LoaderOption]
+
+# Items that are not tombstones; every read and write of the repository is limited
+# to them, which also lets SQLite use the partial live-row indexes
+LIVE = ItemORM.deleted_at.is_(None)
+LIVE_TAG = TagORM.deleted_at.is_(None)
+
+
+class TagLoading:
+    """How ItemRepositoryImpl loads item tags for each kind of query.
+
+    - lists (pages, search hits): selectinload fetches the tags of a whole page in
+      one extra SELECT ... WHERE item_id IN (...) instead of returning one joined
+      row per (item, tag) pair and forcing LIMIT into a subquery.
+    - detail (single item reads and mutation results): selectinload as well. A
+      joinedload over the item_tags association renders a nested join that SQLite
+      materializes by scanning all of item_tags, which only pays off for items
+      without tags on tiny databases.
+    - mutations (lookups done only to change or delete an item): lazyload leaves
+      the tags unloaded; they are only fetched when a mutation replaces them.
+
+    See benchmarks/tag_loading.py for the measurements behind these defaults.
+    """
+
+    def __init__(
+        self,
+        lists: TagLoader = selectinload,
+        detail: TagLoader = selectinload,
+        mutations: TagLoader = lazyload,
+    ):
+        self.lists = lists
+        self.detail = detail
+        self.mutations = mutations
 
 
 class ItemRepositoryImpl(ItemRepository):
     """Implementation of ItemRepository using SQLAlchemy"""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: AsyncSession,
+        writer: GroupCommitWriter | None = None,
+        loading: TagLoading | None = None,
+    ):
         self.db = db
+        self.writer = writer
+        self.loading = loading or TagLoading()
 
     async def get_by_id(self, item_id: int) -> ItemORM | None:
         """Get an item by ID - returns ORM for tags support"""
-        orm_item = self.db.query(ItemORM).filter(ItemORM.id == item_id).first()
-        return orm_item
+        return await self._get_orm(self.db, item_id, self.loading.detail)
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> list[ItemORM]:
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, tag_id: int | None = None
+    ) -> list[ItemORM]:
         """Get all items with pagination - returns ORM for tags support"""
-        orm_items = self.db.query(ItemORM).offset(skip).limit(limit).all()
-        return orm_items
+        statement = self._select_items(tag_id).order_by(ItemORM.id).offset(skip).limit(limit)
+        result = await self.db.execute(statement)
+        return list(result.unique().scalars().all())
+
+    async def get_page(
+        self,
+        after: PageCursor | None = None,
+        limit: int = 100,
+        sort: ItemSortKey = "id",
+        tag_id: int | None = None,
+        status: ItemStatus | None = None,
+    ) -> Page[ItemORM]:
+        """Get a page of items by keyset pagination - returns ORM for tags support"""
+        statement = self._select_items(tag_id)
+        if status is not None:
+            statement = statement.where(ItemORM.status == status)
+        sort_column = getattr(ItemORM, sort)
+        statement = apply_keyset(statement, sort_column, ItemORM.id, after, limit)
+        result = await self.db.execute(statement)
+        return to_page(list(result.unique().scalars().all()), limit, sort)
+
+    async def search(self, query: str, limit: int = 20) -> list[ItemSearchHit]:
+        """Full-text search ranked by bm25 - hits hold ORM items for tags support"""
+        rank = bm25_rank().label("rank")
+        statement = (
+            select(ItemORM, rank, match_snippet().label("snippet"))
+            .options(self.loading.lists(ItemORM.tags))
+            .join(items_fts, items_fts.c.rowid == ItemORM.id)
+            .where(matches(query), LIVE)
+            .order_by(rank)
+            .limit(limit)
+        )
+        result = await self.db.execute(statement)
+        return [
+            ItemSearchHit(item=item, rank=rank, snippet=snippet)
+            for item, rank, snippet in result.unique().all()
+        ]
 
     async def create(self, item: Item, tag_ids: list[int] | None = None) -> ItemORM:
         """Create a new item - returns ORM for tags support"""
-        orm_item = ItemORM(
-            name=item.name,
-            description=item.description,
-        )
 
-        # Assign tags if provided
-        if tag_ids:
-            tags = self.db.query(TagORM).filter(TagORM.id.in_(tag_ids)).all()
-            orm_item.tags = tags
+        async def operation(session: AsyncSession) -> ItemORM:
+            orm_item = ItemORM(
+                name=item.name,
+                description=item.description,
+                status=item.status,
+                # New cards go to the bottom of their column
+                position=rank_between(await self._last_position(session, item.status), None),
+            )
 
-        self.db.add(orm_item)
-        self.db.commit()
-        self.db.refresh(orm_item)
-        return orm_item
+            session.add(orm_item)
+            await session.flush()
+            # Link the tags in one INSERT ... SELECT, skipping the ones that are gone
+            if tag_ids:
+                await session.execute(self._insert_links(ItemORM.id == orm_item.id, tag_ids))
+            # Re-read server defaults (created_at) together with the tags
+            return await self._get_orm(session, orm_item.id, self.loading.detail, refresh=True)
+
+        return await run_write(self.db, self.writer, operation)
 
     async def update(
         self, item_id: int, item: Item, tag_ids: list[int] | None = None
     ) -> ItemORM | None:
         """Update an existing item - returns ORM for tags support"""
-        orm_item = self.db.query(ItemORM).filter(ItemORM.id == item_id).first()
-        if orm_item is None:
-            return None
 
-        orm_item.name = item.name
-        orm_item.description = item.description
+        async def operation(session: AsyncSession) -> ItemORM | None:
+            orm_item = await self._get_orm(session, item_id, self.loading.mutations)
+            if orm_item is None:
+                return None
+
+            orm_item.name = item.name
+            orm_item.description = item.description
+
+            # Replace the links with a set diff, without loading the current tags
+            if tag_ids is not None:
+                await self._replace_tags(session, item_id, tag_ids)
+
+            await session.flush()
+            return await self._get_orm(session, item_id, self.loading.detail, refresh=True)
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def patch(self, changes: ItemChanges) -> ItemORM | None:
+        """Partially update an item with UPDATE ... RETURNING - returns ORM for tags support"""
 
-        # Update tags if provided
-        if tag_ids is not None:
-            tags = self.db.query(TagORM).filter(TagORM.id.in_(tag_ids)).all()
-            orm_item.tags = tags
+        async def operation(session: AsyncSession) -> ItemORM | None:
+            statement = (
+                update(ItemORM)
+                .where(ItemORM.id == changes.item_id, LIVE)
+                .values(**changes.fields, updated_at=func.now())
+                .returning(ItemORM)
+                .execution_options(populate_existing=True)
+            )
+            if changes.tag_ids is None:
+                # RETURNING cannot carry a join, so the tags follow in one selectin query
+                result = await session.execute(statement.options(selectinload(ItemORM.tags)))
+                return result.scalar_one_or_none()
 
-        self.db.commit()
-        self.db.refresh(orm_item)
-        return orm_item
+            # Relink only once the UPDATE has found a live item, then read the new tags
+            orm_item = (
+                await session.execute(statement.options(lazyload(ItemORM.tags)))
+            ).scalar_one_or_none()
+            if orm_item is not None:
+                await self._replace_tags(session, orm_item.id, changes.tag_ids)
+                tags = await session.execute(
+                    select(TagORM)
+                    .join(item_tags, item_tags.c.tag_id == TagORM.id)
+                    .where(item_tags.c.item_id == orm_item.id, LIVE_TAG)
+                )
+                set_committed_value(orm_item, "tags", list(tags.scalars()))
+            return orm_item
+
+        return await run_write(self.db, self.writer, operation)
 
     async def delete(self, item_id: int) -> bool:
-        """Delete an item"""
-        orm_item = self.db.query(ItemORM).filter(ItemORM.id == item_id).first()
-        if orm_item is None:
-            return False
-
-        self.db.delete(orm_item)
-        self.db.commit()
-        return True
+        """Turn an item into a tombstone with one UPDATE, whatever its number of tags.
+
+        The row, its tag links and its search entry stay until purge_deleted.
+        """
+
+        async def operation(session: AsyncSession) -> bool:
+            result = await session.execute(
+                update(ItemORM)
+                .where(ItemORM.id == item_id, LIVE)
+                .values(deleted_at=func.now())
+                .returning(ItemORM.id)
+                .execution_options(synchronize_session=False)
+            )
+            return result.scalar_one_or_none() is not None
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def purge_deleted(self, before: datetime, limit: int = 500) -> int:
+        """Hard-delete up to ``limit`` items deleted before ``before``, oldest first.
+
+        The links go first, while their items are still tombstones, so the tag
+        counts (adjusted when the items were deleted) are left alone.
+        """
+
+        async def operation(session: AsyncSession) -> int:
+            result = await session.execute(
+                select(ItemORM.id)
+                .where(ItemORM.deleted_at < before)
+                .order_by(ItemORM.deleted_at)
+                .limit(limit)
+            )
+            ids = list(result.scalars().all())
+            if ids:
+                await session.execute(delete(item_tags).where(item_tags.c.item_id.in_(ids)))
+                await session.execute(
+                    delete(ItemORM)
+                    .where(ItemORM.id.in_(ids))
+                    .execution_options(synchronize_session=False)
+                )
+            return len(ids)
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def move(
+        self,
+        item_id: int,
+        status: ItemStatus,
+        after_id: int | None = None,
+        before_id: int | None = None,
+    ) -> ItemORM | None:
+        """Move an item into a column between two cards, writing only its own row.
+
+        The new position is a rank key between the neighbours' keys. Raises
+        ValueError if a neighbour is not a card of that column or ``after_id``
+        does not sort before ``before_id``.
+        """
+
+        async def operation(session: AsyncSession) -> ItemORM | None:
+            low, high = await self._gap(session, item_id, status, after_id, before_id)
+            if high is not None and (low or "") == high:
+                # Unranked or colliding neighbours leave no gap: renumber, then retry
+                await self._rebalance(session, status)
+                low, high = await self._gap(session, item_id, status, after_id, before_id)
+
+            statement = (
+                update(ItemORM)
+                .where(ItemORM.id == item_id, LIVE)
+                .values(status=status, position=rank_between(low, high), updated_at=func.now())
+                .returning(ItemORM)
+                .options(selectinload(ItemORM.tags))
+                .execution_options(populate_existing=True)
+            )
+            result = await session.execute(statement)
+            return result.scalar_one_or_none()
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def rebalance(self, status: ItemStatus) -> int:
+        """Rewrite a column's positions as short, evenly spaced keys; returns the card count"""
+
+        async def operation(session: AsyncSession) -> int:
+            return await self._rebalance(session, status)
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def bulk_create(self, items: list[Item], tag_ids: list[list[int]]) -> list[int]:
+        """Create many items with executemany inserts, returning their IDs in input order"""
+
+        async def operation(session: AsyncSession) -> list[int]:
+            created: list[int] = []
+            last_positions: dict[str, str | None] = {}
+            for chunk in chunked(list(zip(items, tag_ids, strict=True))):
+                rows = []
+                for item, _ in chunk:
+                    # Append in input order to the bottom of each item's column
+                    if item.status not in last_positions:
+                        last_positions[item.status] = await self._last_position(
+                            session, item.status
+                        )
+                    position = rank_between(last_positions[item.status], None)
+                    last_positions[item.status] = position
+                    rows.append(
+                        {
+                            "name": item.name,
+                            "description": item.description,
+                            "status": item.status,
+                            "position": position,
+                        }
+                    )
+                # Multi-row INSERT ... RETURNING (insertmanyvalues). SQLite returns the
+                # rows in no set order, and sort_by_parameter_order would fall back to
+                # one INSERT per row on it. Every row of this write has its own rank in
+                # its column, so (status, position) maps the IDs back to input order.
+                result = await session.execute(
+                    insert(ItemORM).returning(ItemORM.id, ItemORM.status, ItemORM.position),
+                    rows,
+                )
+                id_by_rank = {
+                    (status, position): item_id for item_id, status, position in result.all()
+                }
+                ids = [id_by_rank[row["status"], row["position"]] for row in rows]
+                await self._link_tags(
+                    session, list(zip(ids, (tags for _, tags in chunk), strict=True))
+                )
+                created.extend(ids)
+            return created
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def bulk_update(self, changes: list[ItemChanges]) -> set[int]:
+        """Apply partial updates with executemany, returning the IDs that exist.
+
+        Several changes to one item are merged in input order.
+        """
+
+        async def operation(session: AsyncSession) -> set[int]:
+            found: set[int] = set()
+            for chunk in chunked(merge_changes(changes)):
+                # Touching the rows both bumps updated_at and tells which IDs exist
+                result = await session.execute(
+                    update(ItemORM)
+                    .where(ItemORM.id.in_([change.item_id for change in chunk]), LIVE)
+                    .values(updated_at=func.now())
+                    .returning(ItemORM.id)
+                    .execution_options(synchronize_session=False)
+                )
+                ids = set(result.scalars().all())
+                found |= ids
+                chunk = [change for change in chunk if change.item_id in ids]
+
+                rows = [
+                    {"id": change.item_id, **change.fields} for change in chunk if change.fields
+                ]
+                if rows:
+                    await session.execute(update(ItemORM), rows)
+
+                retagged = [change for change in chunk if change.tag_ids is not None]
+                if retagged:
+                    await session.execute(
+                        delete(item_tags).where(
+                            item_tags.c.item_id.in_([change.item_id for change in retagged])
+                        )
+                    )
+                    await self._link_tags(
+                        session, [(change.item_id, change.tag_ids) for change in retagged]
+                    )
+                    # The links changed behind the ORM: items this session already
+                    # holds reload their tags on next access
+                    for change in retagged:
+                        held = session.identity_map.get(identity_key(ItemORM, change.item_id))
+                        if held is not None:
+                            session.expire(held, ["tags"])
+            return found
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def attach_tags(self, item_ids: list[int], tag_ids: list[int]) -> int:
+        """Attach tags with one INSERT OR IGNORE ... SELECT per chunk of items"""
+
+        async def operation(session: AsyncSession) -> int:
+            attached = 0
+            for chunk in self._item_id_chunks(item_ids, tag_ids):
+                statement = self._insert_links(ItemORM.id.in_(chunk), tag_ids)
+                attached += (await session.execute(statement)).rowcount
+            return attached
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def detach_tags(self, item_ids: list[int], tag_ids: list[int]) -> int:
+        """Detach tags with one DELETE ... WHERE per chunk of items"""
+
+        async def operation(session: AsyncSession) -> int:
+            detached = 0
+            for chunk in self._item_id_chunks(item_ids, tag_ids):
+                live_items = select(ItemORM.id).where(ItemORM.id.in_(chunk), LIVE)
+                statement = delete(item_tags).where(
+                    item_tags.c.item_id.in_(live_items), item_tags.c.tag_id.in_(tag_ids)
+                )
+                detached += (await session.execute(statement)).rowcount
+            return detached
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def bulk_delete(self, item_ids: list[int]) -> set[int]:
+        """Turn many items into tombstones, returning the IDs that were deleted"""
+
+        async def operation(session: AsyncSession) -> set[int]:
+            deleted: set[int] = set()
+            for chunk in chunked(list(dict.fromkeys(item_ids))):
+                result = await session.execute(
+                    update(ItemORM)
+                    .where(ItemORM.id.in_(chunk), LIVE)
+                    .values(deleted_at=func.now())
+                    .returning(ItemORM.id)
+                    .execution_options(synchronize_session=False)
+                )
+                deleted.update(result.scalars().all())
+            return deleted
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def _last_position(self, session: AsyncSession, status: str) -> str | None:
+        """Position of the bottom card of a column, read from the end of the index"""
+        result = await session.execute(
+            select(func.max(ItemORM.position)).where(ItemORM.status == status, LIVE)
+        )
+        return result.scalar_one_or_none()
+
+    async def _gap(
+        self,
+        session: AsyncSession,
+        item_id: int,
+        status: str,
+        after_id: int | None,
+        before_id: int | None,
+    ) -> tuple[str | None, str | None]:
+        """Positions of the cards directly above and below the slot an item moves into"""
+        in_column = (ItemORM.status == status, ItemORM.id != item_id, LIVE)
+        position_and_id = tuple_(ItemORM.position, ItemORM.id)
+        above = await self._card_position(session, after_id, in_column) if after_id else None
+        below = await self._card_position(session, before_id, in_column) if before_id else None
+        if above is not None and below is not None and (above, after_id) >= (below, before_id):
+            raise ValueError(f"Item {after_id} does not sort before item {before_id}")
+
+        # A missing neighbour is the next card in the column (or none: the column's end)
+        if after_id is not None and before_id is None:
+            statement = (
+                select(ItemORM.position)
+                .where(*in_column, position_and_id > tuple_(above, after_id))
+                .order_by(ItemORM.position, ItemORM.id)
+                .limit(1)
+            )
+            below = (await session.execute(statement)).scalar_one_or_none()
+        elif before_id is not None and after_id is None:
+            statement = (
+                select(ItemORM.position)
+                .where(*in_column, position_and_id < tuple_(below, before_id))
+                .order_by(ItemORM.position.desc(), ItemORM.id.desc())
+                .limit(1)
+            )
+            above = (await session.execute(statement)).scalar_one_or_none()
+        elif after_id is None and before_id is None:
+            statement = select(func.max(ItemORM.position)).where(*in_column)
+            above = (await session.execute(statement)).scalar_one_or_none()
+        return above, below
+
+    async def _card_position(self, session: AsyncSession, card_id: int, in_column) -> str:
+        """Position of a neighbour card, which must be another card of the column"""
+        result = await session.execute(
+            select(ItemORM.position).where(ItemORM.id == card_id, *in_column)
+        )
+        position = result.scalar_one_or_none()
+        if position is None:
+            raise ValueError(f"Item {card_id} is not another card of the target column")
+        return position
+
+    async def _rebalance(self, session: AsyncSession, status: str) -> int:
+        """Assign evenly spaced keys to a column in its current order"""
+        result = await session.execute(
+            select(ItemORM.id)
+            .where(ItemORM.status == status, LIVE)
+            .order_by(ItemORM.position, ItemORM.id)
+        )
+        ids = list(result.scalars().all())
+        rows = [
+            {"id": item_id, "position": position}
+            for item_id, position in zip(ids, spread_ranks(len(ids)), strict=True)
+        ]
+        for chunk in chunked(rows):
+            await session.execute(update(ItemORM), chunk)
+        return len(ids)
+
+    async def _replace_tags(self, session: AsyncSession, item_id: int, tag_ids: list[int]) -> None:
+        """Make tag_ids the item's tags with a set diff, without reading the current ones"""
+        await session.execute(
+            delete(item_tags).where(
+                item_tags.c.item_id == item_id, item_tags.c.tag_id.not_in(tag_ids)
+            )
+        )
+        if tag_ids:
+            await session.execute(self._insert_links(ItemORM.id == item_id, tag_ids))
+
+    def _insert_links(self, items_clause, tag_ids: list[int]):
+        """INSERT OR IGNORE linking every matching item to every given tag.
+
+        Selecting from live items and tags skips IDs that do not exist (or are
+        tombstones), OR IGNORE skips links that already do.
+        """
+        return (
+            insert(item_tags)
+            .prefix_with("OR IGNORE")
+            .from_select(
+                ["item_id", "tag_id"],
+                select(ItemORM.id, TagORM.id)
+                .join_from(ItemORM, TagORM, true())  # every item x every tag
+                .where(items_clause, LIVE, TagORM.id.in_(tag_ids), LIVE_TAG),
+            )
+        )
+
+    def _item_id_chunks(self, item_ids: list[int], tag_ids: list[int]):
+        """Chunk item IDs so each statement also has room for all tag IDs"""
+        return chunked(list(dict.fromkeys(item_ids)), SQLITE_MAX_VARIABLES - len(tag_ids))
+
+    def _select_items(self, tag_id: int | None) -> Select:
+        """Select items for a list, restricted to those having the tag if one is given"""
+        statement = select(ItemORM).where(LIVE).options(self.loading.lists(ItemORM.tags))
+        if tag_id is not None:
+            # Served by the (tag_id, item_id) index, already ordered by item id.
+            # A tag tombstone keeps its links until purged, but lists no items
+            statement = (
+                statement.join(item_tags, item_tags.c.item_id == ItemORM.id)
+                .join(TagORM, TagORM.id == item_tags.c.tag_id)
+                .where(item_tags.c.tag_id == tag_id, LIVE_TAG)
+            )
+        return statement
+
+    async def _get_orm(
+        self, session: AsyncSession, item_id: int, loader: TagLoader, refresh: bool = False
+    ) -> ItemORM | None:
+        """Load the ORM row for an item, loading its tags with the given strategy"""
+        statement = select(ItemORM).where(ItemORM.id == item_id, LIVE).options(loader(ItemORM.tags))
+        if refresh:
+            # Overwrite the identity map copy with what was just written
+            statement = statement.execution_options(populate_existing=True)
+        result = await session.execute(statement)
+        return result.unique().scalar_one_or_none()
+
+    async def _link_tags(self, session: AsyncSession, links: list[tuple[int, list[int]]]) -> None:
+        """Attach tags to items, resolving all tag IDs of the batch in one query"""
+        wanted = list({tag_id for _, tag_ids in links for tag_id in tag_ids})
+        existing: set[int] = set()
+        for chunk in chunked(wanted):
+            result = await session.execute(select(TagORM.id).where(TagORM.id.in_(chunk), LIVE_TAG))
+            existing.update(result.scalars().all())
+
+        # Unknown tag IDs are skipped, as in create and update
+        rows = [
+            {"item_id": item_id, "tag_id": tag_id}
+            for item_id, tag_ids in links
+            for tag_id in dict.fromkeys(tag_ids)
+            if tag_id in existing
+        ]
+        if rows:
+            await session.execute(insert(item_tags), rows)
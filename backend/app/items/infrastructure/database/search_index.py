@@ -0,0 +1,142 @@
+# FTS5 full-text index over item names and descriptions.
+#
+# items_fts is an external-content FTS5 table: it stores only the inverted index
+# and reads the text back from items by rowid. Triggers on items keep it in sync,
+# so every write path (ORM, Core, raw SQL) is covered.
+#
+# Rebuild the index of an existing database, optionally switching tokenizer:
+#
+#     python -m app.items.infrastructure.database.search_index --tokenizer trigram [--board ID]
+
+import argparse
+
+from sqlalchemy import Connection, Engine, column, func, literal_column, table
+
+from app.shared.infrastructure.database.settings import SearchTokenizer
+
+SEARCH_TABLE = "items_fts"
+
+# FTS5 tokenize= arguments of the supported tokenizers
+TOKENIZERS: dict[str, str] = {
+    "unicode61": "unicode61 remove_diacritics 2",
+    "trigram": "trigram remove_diacritics 1",
+}
+
+# bm25 column weights: a match in the name counts more than one in the description
+NAME_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+items_fts = table(SEARCH_TABLE, column("rowid"))
+_fts = literal_column(SEARCH_TABLE)
+
+
+def bm25_rank():
+    """bm25 score of the current match; lower is better"""
+    return func.bm25(_fts, NAME_WEIGHT, DESCRIPTION_WEIGHT)
+
+
+def match_snippet(tokens: int = 12):
+    """Excerpt of the best matching column with the matched terms wrapped in <mark>"""
+    return func.snippet(_fts, -1, "<mark>", "</mark>", "…", tokens)
+
+
+def matches(query: str):
+    """WHERE clause matching a user query against the index"""
+    return _fts.op("MATCH")(build_match_query(query))
+
+
+def build_match_query(query: str) -> str:
+    """Turn free text into an FTS5 query.
+
+    Every word is quoted so FTS5 operators and punctuation in user input are
+    taken literally; words are ANDed together and the last one is matched as
+    a prefix, for search-as-you-type.
+    """
+    terms = ['"' + term.replace('"', '""') + '"' for term in query.split()]
+    if not terms:
+        raise ValueError("Search query must not be empty")
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def search_index_ddl(tokenizer: SearchTokenizer = "unicode61") -> list[str]:
+    """Statements creating the index and its sync triggers if they do not exist"""
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+        f"name, description, content='items', content_rowid='id', "
+        f"tokenize='{TOKENIZERS[tokenizer]}')",
+        f"CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ai AFTER INSERT ON items BEGIN "
+        f"INSERT INTO {SEARCH_TABLE}(rowid, name, description) "
+        f"VALUES (new.id, new.name, new.description); END",
+        f"CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ad AFTER DELETE ON items BEGIN "
+        f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, name, description) "
+        f"VALUES ('delete', old.id, old.name, old.description); END",
+        f"CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_au "
+        f"AFTER UPDATE OF name, description ON items BEGIN "
+        f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, name, description) "
+        f"VALUES ('delete', old.id, old.name, old.description); "
+        f"INSERT INTO {SEARCH_TABLE}(rowid, name, description) "
+        f"VALUES (new.id, new.name, new.description); END",
+    ]
+
+
+def drop_search_index_ddl() -> list[str]:
+    """Statements dropping the index and its triggers"""
+    return [
+        f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ai",
+        f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ad",
+        f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_au",
+        f"DROP TABLE IF EXISTS {SEARCH_TABLE}",
+    ]
+
+
+def ensure_search_index(connection: Connection, tokenizer: SearchTokenizer = "unicode61") -> None:
+    """Create the index if it is missing, indexing the items that already exist"""
+    if connection.dialect.name != "sqlite":
+        return
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (SEARCH_TABLE,)
+    ).first()
+    for statement in search_index_ddl(tokenizer):
+        connection.exec_driver_sql(statement)
+    if not exists:
+        connection.exec_driver_sql(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')")
+
+
+def rebuild_search_index(engine: Engine, tokenizer: SearchTokenizer = "unicode61") -> None:
+    """Drop and recreate the index with the given tokenizer, reindexing every item"""
+    with engine.begin() as connection:
+        for statement in drop_search_index_ddl():
+            connection.exec_driver_sql(statement)
+        ensure_search_index(connection, tokenizer)
+
+
+def main() -> None:
+    """Command line entry point to rebuild the search index"""
+    from app.shared.infrastructure.database.database import engine, settings, shards
+    from app.shared.infrastructure.database.engine import create_db_engine
+
+    parser = argparse.ArgumentParser(description="Rebuild the item full-text search index")
+    parser.add_argument(
+        "--tokenizer",
+        choices=list(TOKENIZERS),
+        default=settings.search_tokenizer,
+        help="FTS5 tokenizer (default: DATABASE_SEARCH_TOKENIZER)",
+    )
+    parser.add_argument("--board", help="board ID (default: the default board)")
+    args = parser.parse_args()
+    if args.board is None:
+        rebuild_search_index(engine, args.tokenizer)
+    elif not shards.exists(args.board):
+        parser.error(f"no board {args.board!r}")
+    else:
+        board_engine = create_db_engine(shards.board_settings(args.board))
+        try:
+            rebuild_search_index(board_engine, args.tokenizer)
+        finally:
+            board_engine.dispose()
+    print(f"Rebuilt {SEARCH_TABLE} with the {args.tokenizer} tokenizer")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import Any
+
+from app.items.domain.entities.item import Item, ItemStatus
+from app.items.domain.interfaces.item_archive_repository import ItemArchiveRepository
+from app.shared.domain.rank import rank_between
+from app.shared.infrastructure.memory.store import ArchivedItem, MemoryStore, TaggedItem, utc_now
+
+
+class InMemoryItemArchiveRepository(ItemArchiveRepository):
+    """ItemArchiveRepository over a MemoryStore, with the semantics of ItemArchiveRepositoryImpl"""
+
+    def __init__(self, store: MemoryStore):
+        self.store = store
+
+    async def archive_batch(
+        self, status: ItemStatus, before: datetime, after_id: int = 0, limit: int = 500
+    ) -> list[int]:
+        """Move a batch of items into the archive, walking the ID index upwards from after_id"""
+        archived = []
+        for item_id in self.store.item_ids.after(after_id):
+            item = self.store.items[item_id]
+            if item.status == status and (item.updated_at or item.created_at) < before:
+                archived.append(item_id)
+                if len(archived) == limit:
+                    break
+        for item_id in archived:
+            tag_ids = sorted(self.store.tag_ids_by_item[item_id])
+            item = self.store.items[item_id]
+            self.store.remove_item(item_id)
+            self.store.archive[item_id] = ArchivedItem(item, tag_ids, utc_now())
+        return archived
+
+    async def get_by_id(self, item_id: int) -> dict[str, Any] | None:
+        """Get an archived item with the tags that still exist"""
+        archived = self.store.archive.get(item_id)
+        if archived is None:
+            return None
+        item = archived.item
+        tags = [self.store.get_tag(tag_id) for tag_id in archived.tag_ids]
+        return {
+            "id": item.id,
+            "name": item.name,
+            "description": item.description,
+            "created_at": item.created_at,
+            "updated_at": item.updated_at,
+            "status": item.status,
+            "position": item.position,
+            "archived_at": archived.archived_at,
+            "tags": [{"id": tag.id, "name": tag.name, "color": tag.color} for tag in tags if tag],
+        }
+
+    async def restore(self, item_id: int) -> TaggedItem | None:
+        """Move an archived item back to the bottom of its column"""
+        archived = self.store.archive.get(item_id)
+        if archived is None:
+            return None
+        if self.store.item_id_taken(item_id):
+            raise ValueError(f"Item ID {item_id} is already in use")
+        del self.store.archive[item_id]
+        item = archived.item
+        position = rank_between(self.store.last_position(item.status), None)
+        restored = self.store.add_item(
+            Item(
+                name=item.name,
+                description=item.description,
+                created_at=item.created_at,
+                updated_at=item.updated_at,
+                status=item.status,
+                position=position,
+            ),
+            item_id=item_id,
+        )
+        # Tags deleted while the item was archived are skipped
+        self.store.set_tags(item_id, archived.tag_ids)
+        return self.store.tagged(restored)
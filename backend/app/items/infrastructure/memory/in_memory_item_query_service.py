@@ -0,0 +1,70 @@
+from datetime import datetime
+from typing import Any
+
+from app.items.domain.entities.item import ITEM_STATUSES, Item, ItemSortKey, ItemStatus
+from app.items.domain.interfaces.item_query_service import ItemQueryService
+from app.shared.domain.pagination import Page, PageCursor
+from app.shared.infrastructure.memory.store import MemoryStore, take
+
+
+class InMemoryItemQueryService(ItemQueryService):
+    """Item read model over a MemoryStore; counts are the sizes of its indexes"""
+
+    def __init__(self, store: MemoryStore):
+        self.store = store
+
+    async def get_page(
+        self,
+        after: PageCursor | None = None,
+        limit: int = 100,
+        sort: ItemSortKey = "id",
+        tag_id: int | None = None,
+        status: ItemStatus | None = None,
+    ) -> Page[dict[str, Any]]:
+        """Get a page of items as ItemDTO-shaped dicts, from the index of the sort order"""
+        item_ids, more = take(self.store.ordered_item_ids(sort, after, tag_id, status), limit)
+        rows = [self._to_dict(self.store.items[item_id]) for item_id in item_ids]
+        if not more:
+            return Page(rows)
+        last = rows[-1]
+        return Page(rows, PageCursor(sort=sort, value=last[sort], id=last["id"]))
+
+    async def get_columns(self, limit: int = 50) -> dict[ItemStatus, Page[dict[str, Any]]]:
+        """Get the first page of every column from its (position, id) index"""
+        return {
+            status: await self.get_page(limit=limit, sort="position", status=status)
+            for status in ITEM_STATUSES
+        }
+
+    async def count(
+        self, tag_id: int | None = None, status: ItemStatus | None = None
+    ) -> int | None:
+        """Size of the index covering the filter; tag and status together have none"""
+        if tag_id is not None and status is not None:
+            return None
+        if tag_id is not None:
+            return len(self.store.item_ids_by_tag.get(tag_id, ()))
+        if status is not None:
+            return len(self.store.columns[status])
+        return len(self.store.item_ids)
+
+    async def get_tombstones(
+        self, since: datetime | None = None, limit: int = 1000
+    ) -> list[dict[str, Any]]:
+        """Read the item tombstones, oldest deletion first"""
+        tombstones = self.store.oldest_tombstones(self.store.item_tombstones, since, limit)
+        return [{"id": item_id, "deleted_at": deleted_at} for item_id, deleted_at in tombstones]
+
+    def _to_dict(self, item: Item) -> dict[str, Any]:
+        """Convert a stored item into an ItemDTO-shaped dict"""
+        tagged = self.store.tagged(item)
+        return {
+            "id": item.id,
+            "name": item.name,
+            "description": item.description,
+            "created_at": item.created_at,
+            "updated_at": item.updated_at,
+            "status": item.status,
+            "position": item.position,
+            "tags": [{"id": tag.id, "name": tag.name, "color": tag.color} for tag in tagged.tags],
+        }
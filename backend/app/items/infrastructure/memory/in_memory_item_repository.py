@@ -0,0 +1,272 @@
+import re
+import unicodedata
+from datetime import datetime
+from itertools import islice
+
+from app.items.domain.entities.item import Item, ItemSortKey, ItemStatus
+from app.items.domain.entities.item_changes import ItemChanges, merge_changes
+from app.items.domain.entities.item_search_hit import ItemSearchHit
+from app.items.domain.interfaces.item_repository import ItemRepository
+from app.items.infrastructure.database.search_index import (
+    DESCRIPTION_WEIGHT,
+    NAME_WEIGHT,
+    build_match_query,
+)
+from app.shared.domain.pagination import Page, PageCursor
+from app.shared.domain.rank import rank_between, spread_ranks
+from app.shared.infrastructure.memory.store import (
+    MemoryStore,
+    TaggedItem,
+    take,
+    utc_now,
+)
+
+# Words as the unicode61 tokenizer sees them
+WORD = re.compile(r"\w+")
+
+
+class InMemoryItemRepository(ItemRepository):
+    """ItemRepository over a MemoryStore, with the semantics of ItemRepositoryImpl.
+
+    Items come back as TaggedItem copies carrying their tags, like the ORM rows
+    of the SQL implementation. Search has no inverted index: it scans the live
+    items, which is fine for the data sizes an in-memory board holds.
+    """
+
+    def __init__(self, store: MemoryStore):
+        self.store = store
+
+    async def get_by_id(self, item_id: int) -> TaggedItem | None:
+        """Get an item by ID, with its tags"""
+        item = self.store.items.get(item_id)
+        return self.store.tagged(item) if item else None
+
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, tag_id: int | None = None
+    ) -> list[TaggedItem]:
+        """Get all items by ID with offset pagination"""
+        item_ids = islice(self.store.ordered_item_ids("id", tag_id=tag_id), skip, skip + limit)
+        return [self._tagged(item_id) for item_id in item_ids]
+
+    async def get_page(
+        self,
+        after: PageCursor | None = None,
+        limit: int = 100,
+        sort: ItemSortKey = "id",
+        tag_id: int | None = None,
+        status: ItemStatus | None = None,
+    ) -> Page[TaggedItem]:
+        """Get a page of items from the index of the sort order"""
+        item_ids, more = take(self.store.ordered_item_ids(sort, after, tag_id, status), limit)
+        items = [self._tagged(item_id) for item_id in item_ids]
+        if not more:
+            return Page(items)
+        last = items[-1]
+        return Page(items, PageCursor(sort=sort, value=getattr(last, sort), id=last.id))
+
+    async def search(self, query: str, limit: int = 20) -> list[ItemSearchHit]:
+        """Match every word (the last one as a prefix) against names and descriptions.
+
+        Ranked like bm25 with the same column weights, lower is better, though
+        by plain term counts.
+        """
+        build_match_query(query)  # same ValueError on an empty query
+        words = [_fold(word) for word in WORD.findall(query)]
+        if not words:
+            return []
+        hits = []
+        for item in self.store.items.values():
+            name_hits = _count_matches(words, item.name)
+            description_hits = _count_matches(words, item.description or "")
+            if not all(name_hits[index] + description_hits[index] for index in range(len(words))):
+                continue
+            name_score = NAME_WEIGHT * sum(name_hits)
+            description_score = DESCRIPTION_WEIGHT * sum(description_hits)
+            text = item.name if name_score >= description_score else item.description
+            rank = -(name_score + description_score)
+            hits.append((rank, item.id, _snippet(words, text)))
+        hits.sort()
+        return [
+            ItemSearchHit(item=self._tagged(item_id), rank=rank, snippet=snippet)
+            for rank, item_id, snippet in hits[:limit]
+        ]
+
+    async def create(self, item: Item, tag_ids: list[int] | None = None) -> TaggedItem:
+        """Create an item at the bottom of its column"""
+        position = rank_between(self.store.last_position(item.status), None)
+        stored = self.store.add_item(
+            Item(
+                name=item.name,
+                description=item.description,
+                status=item.status,
+                position=position,
+            )
+        )
+        self.store.set_tags(stored.id, tag_ids or [])
+        return self.store.tagged(stored)
+
+    async def update(
+        self, item_id: int, item: Item, tag_ids: list[int] | None = None
+    ) -> TaggedItem | None:
+        """Replace an item's name and description, and its tags if given"""
+        updated = self.store.change_item(
+            item_id, name=item.name, description=item.description, updated_at=utc_now()
+        )
+        if updated is None:
+            return None
+        if tag_ids is not None:
+            self.store.set_tags(item_id, tag_ids)
+        return self.store.tagged(updated)
+
+    async def patch(self, changes: ItemChanges) -> TaggedItem | None:
+        """Set only the given fields, and the tags if given"""
+        if changes.item_id not in self.store.items:
+            return None
+        if changes.tag_ids is not None:
+            self.store.set_tags(changes.item_id, changes.tag_ids)
+        updated = self.store.change_item(changes.item_id, **changes.fields, updated_at=utc_now())
+        return self.store.tagged(updated)
+
+    async def delete(self, item_id: int) -> bool:
+        """Turn an item into a tombstone"""
+        return self.store.delete_item(item_id)
+
+    async def purge_deleted(self, before: datetime, limit: int = 500) -> int:
+        """Forget up to ``limit`` item tombstones older than ``before``, oldest first"""
+        return self.store.purge(self.store.item_tombstones, before, limit)
+
+    async def move(
+        self,
+        item_id: int,
+        status: ItemStatus,
+        after_id: int | None = None,
+        before_id: int | None = None,
+    ) -> TaggedItem | None:
+        """Move an item into a column between two cards.
+
+        Raises ValueError if a neighbour is not a card of that column or
+        ``after_id`` does not sort before ``before_id``.
+        """
+        low, high = self._gap(item_id, status, after_id, before_id)
+        if high is not None and (low or "") == high:
+            # Unranked or colliding neighbours leave no gap: renumber, then retry
+            self._rebalance(status)
+            low, high = self._gap(item_id, status, after_id, before_id)
+        moved = self.store.change_item(
+            item_id, status=status, position=rank_between(low, high), updated_at=utc_now()
+        )
+        return self.store.tagged(moved) if moved else None
+
+    async def rebalance(self, status: ItemStatus) -> int:
+        """Rewrite a column's positions as evenly spaced keys; returns the card count"""
+        return self._rebalance(status)
+
+    async def bulk_create(self, items: list[Item], tag_ids: list[list[int]]) -> list[int]:
+        """Create many items, returning their IDs in input order"""
+        created = []
+        for item, item_tag_ids in zip(items, tag_ids, strict=True):
+            created.append((await self.create(item, item_tag_ids)).id)
+        return created
+
+    async def bulk_update(self, changes: list[ItemChanges]) -> set[int]:
+        """Apply partial updates, merging those of one item, returning the IDs that exist"""
+        found = set()
+        for change in merge_changes(changes):
+            if await self.patch(change) is not None:
+                found.add(change.item_id)
+        return found
+
+    async def attach_tags(self, item_ids: list[int], tag_ids: list[int]) -> int:
+        """Link every item to every tag, skipping unknown IDs and existing links"""
+        return sum(
+            self.store.link(item_id, tag_id)
+            for item_id in dict.fromkeys(item_ids)
+            for tag_id in dict.fromkeys(tag_ids)
+        )
+
+    async def detach_tags(self, item_ids: list[int], tag_ids: list[int]) -> int:
+        """Remove the links between the items and the tags"""
+        return sum(
+            self.store.unlink(item_id, tag_id)
+            for item_id in dict.fromkeys(item_ids)
+            if item_id in self.store.items
+            for tag_id in dict.fromkeys(tag_ids)
+        )
+
+    async def bulk_delete(self, item_ids: list[int]) -> set[int]:
+        """Turn many items into tombstones, returning the IDs that were deleted"""
+        return {item_id for item_id in dict.fromkeys(item_ids) if self.store.delete_item(item_id)}
+
+    def _tagged(self, item_id: int) -> TaggedItem:
+        """Copy of a live item with its tags"""
+        return self.store.tagged(self.store.items[item_id])
+
+    def _gap(
+        self, item_id: int, status: str, after_id: int | None, before_id: int | None
+    ) -> tuple[str | None, str | None]:
+        """Positions of the cards directly above and below the slot an item moves into"""
+        column = self.store.columns[status]
+        above = self._card_key(after_id, item_id, status) if after_id else None
+        below = self._card_key(before_id, item_id, status) if before_id else None
+        if above is not None and below is not None and above >= below:
+            raise ValueError(f"Item {after_id} does not sort before item {before_id}")
+
+        # A missing neighbour is the next card in the column (or none: the column's end)
+        others = (key for key in column.keys if key[1] != item_id)
+        if after_id is not None and before_id is None:
+            below = next((key for key in column.after(above) if key[1] != item_id), None)
+        elif before_id is not None and after_id is None:
+            above = max((key for key in others if key < below), default=None)
+        elif after_id is None and before_id is None:
+            above = max(others, default=None)
+        return (above[0] if above else None), (below[0] if below else None)
+
+    def _card_key(self, card_id: int, item_id: int, status: str) -> tuple[str, int]:
+        """(position, id) of a neighbour card, which must be another card of the column"""
+        card = self.store.items.get(card_id)
+        if card is None or card_id == item_id or card.status != status:
+            raise ValueError(f"Item {card_id} is not another card of the target column")
+        return card.position, card_id
+
+    def _rebalance(self, status: str) -> int:
+        """Assign evenly spaced keys to a column in its current order"""
+        item_ids = [item_id for _, item_id in self.store.columns[status].keys]
+        for item_id, position in zip(item_ids, spread_ranks(len(item_ids)), strict=True):
+            self.store.change_item(item_id, position=position)
+        return len(item_ids)
+
+
+def _fold(text: str) -> str:
+    """Lower case without diacritics, as the unicode61 tokenizer compares words"""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _count_matches(words: list[str], text: str) -> list[int]:
+    """How often each query word occurs in text; the last one matches as a prefix"""
+    tokens = [_fold(token) for token in WORD.findall(text)]
+    counts = [sum(token == word for token in tokens) for word in words[:-1]]
+    counts.append(sum(token.startswith(words[-1]) for token in tokens))
+    return counts
+
+
+def _snippet(words: list[str], text: str, tokens: int = 12) -> str:
+    """Up to ``tokens`` words of text from the first match, matches wrapped in <mark>"""
+    matches = list(WORD.finditer(text))
+
+    def is_match(token: str) -> bool:
+        folded = _fold(token)
+        return folded in words[:-1] or folded.startswith(words[-1])
+
+    first = next((index for index, match in enumerate(matches) if is_match(match[0])), 0)
+    start = max(0, min(first, len(matches) - tokens))
+    window = matches[start : start + tokens]
+    if not window:
+        return text
+    parts = ["…" if start > 0 else text[: window[0].start()]]
+    for index, match in enumerate(window):
+        parts.append(f"<mark>{match[0]}</mark>" if is_match(match[0]) else match[0])
+        end = window[index + 1].start() if index + 1 < len(window) else match.end()
+        parts.append(text[match.end() : end])
+    parts.append("…" if start + tokens < len(matches) else text[window[-1].end() :])
+    return "".join(parts)
@@ -1,8 +1,14 @@
-from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy import Column, DateTime, Index, Integer, String, Table, event, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
+from app.items.infrastructure.database.item_counters import item_counters, items_version
+from app.items.infrastructure.database.search_index import (
+    drop_search_index_ddl,
+    ensure_search_index,
+)
 from app.shared.infrastructure import Base
+from app.shared.infrastructure.database import get_database_settings
 
 
 class ItemORM(Base):
@@ -11,10 +17,82 @@ class ItemORM(Base):
     __tablename__ = "items"
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, index=True, nullable=False)
+    name = Column(String, nullable=False)
     description = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Kanban column and fractional rank key within it; ItemRepositoryImpl assigns
+    # positions, rows inserted any other way start unranked ("") at the top
+    status = Column(String, nullable=False, default="todo", server_default="todo")
+    position = Column(String, nullable=False, default="", server_default="")
+    # Tombstone: set when the item is deleted, the row goes once the retention
+    # window has passed (see ItemRepositoryImpl.purge_deleted)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
 
-    # Relationship to tags
-    tags = relationship("TagORM", secondary="item_tags", back_populates="items", lazy="joined")
+    # A column in board order is one range scan; SQLite appends the rowid (id)
+    # to index entries, so ORDER BY position, id needs no sort step either.
+    # The live-row indexes are partial: tombstones stay out of them, and SQLite
+    # only uses them for queries that also say deleted_at IS NULL.
+    # AUTOINCREMENT never hands out an ID again, so archived items can be
+    # restored under their own ID.
+    __table_args__ = (
+        Index(
+            "ix_items_status_position",
+            "status",
+            "position",
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index("ix_items_name", "name", sqlite_where=text("deleted_at IS NULL")),
+        Index("ix_items_deleted_at", "deleted_at", sqlite_where=text("deleted_at IS NOT NULL")),
+        {"sqlite_autoincrement": True},
+    )
+
+    # Relationship to the live tags; ItemRepositoryImpl picks the loading strategy
+    # per query, selectin is the fallback for queries that do not
+    tags = relationship(
+        "TagORM",
+        secondary="item_tags",
+        secondaryjoin="and_(TagORM.id == item_tags.c.tag_id, TagORM.deleted_at.is_(None))",
+        back_populates="items",
+        lazy="selectin",
+        passive_deletes=True,
+    )
+
+
+# Archived items: the columns of items plus the IDs of their tags as a JSON array.
+# Rows move here in batches (see ItemArchiveRepositoryImpl), out of the items
+# table, its indexes, the search index and the maintained counts.
+items_archive = Table(
+    "items_archive",
+    Base.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("description", String, nullable=True),
+    Column("created_at", DateTime(timezone=True)),
+    Column("updated_at", DateTime(timezone=True)),
+    Column("status", String, nullable=False),
+    Column("position", String, nullable=False),
+    Column("tag_ids", String, nullable=False, server_default="[]"),
+    Column("archived_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+
+@event.listens_for(ItemORM.__table__, "after_create")
+def _create_search_index(target, connection, **kw):
+    """Create the full-text search index together with the items table"""
+    ensure_search_index(connection, get_database_settings().search_tokenizer)
+
+
+@event.listens_for(ItemORM.__table__, "after_create")
+def _create_item_counters(target, connection, **kw):
+    """Install the triggers maintaining the item counts and version"""
+    item_counters.ensure(connection)
+    items_version.ensure(connection)
+
+
+@event.listens_for(ItemORM.__table__, "before_drop")
+def _drop_search_index(target, connection, **kw):
+    """Drop the full-text search index before the items table"""
+    if connection.dialect.name == "sqlite":
+        for statement in drop_search_index_ddl():
+            connection.exec_driver_sql(statement)
@@ -1,22 +1,59 @@
+from contextlib import asynccontextmanager
+from datetime import timedelta
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.items.infrastructure.api.item_router import router as items_router
+from app.backups.infrastructure.api.backups_router import get_backup_store, router as backups_router
+from app.board.infrastructure.api.board_router import router as board_router
+from app.board.infrastructure.api.boards_router import router as boards_router
+from app.items.infrastructure.api.item_router import purge_deleted_items, router as items_router
 
 # Import ORM models to register them with Base (avoid circular imports)
 from app.items.infrastructure.orm.item_orm import ItemORM  # noqa: F401
-from app.shared.infrastructure.database.database import Base, engine
-from app.tags.infrastructure.api.tag_router import router as tags_router
+from app.shared.infrastructure.database import BOARD_PREFIX, TombstonePurger
+from app.shared.infrastructure.database.backup import BackupScheduler
+from app.shared.infrastructure.database.database import (
+    board_caches,
+    database,
+    engine,
+    settings,
+    shards,
+)
+from app.shared.infrastructure.database.migrations import upgrade
+from app.stats.infrastructure.api.stats_router import router as stats_router
+from app.tags.infrastructure.api.tag_router import purge_deleted_tags, router as tags_router
 from app.tags.infrastructure.orm.tag_orm import TagORM  # noqa: F401
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Migrate the schema and run the tombstone purger and backup scheduler; stop them
+    and the group commit writers and close database connections of every board on shutdown"""
+    if settings.migrate_on_startup:
+        upgrade(engine)
+    purger = TombstonePurger(
+        [purge_deleted_items, purge_deleted_tags],
+        retention=timedelta(days=settings.tombstone_retention_days),
+        batch_size=settings.purge_batch_size,
+        interval=settings.purge_interval_seconds,
+    )
+    purger.start()
+    backups = BackupScheduler(get_backup_store().create_all, settings.backup_interval_seconds)
+    backups.start()
+    yield
+    await backups.close()
+    await purger.close()
+    await shards.dispose()
+    await database.dispose()
+
 
 # Create FastAPI app
 app = FastAPI(
     title="Vibe Coding Test API",
     description="A FastAPI backend with SQLAlchemy and SQLite following Hexagonal Architecture",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS for frontend communication
@@ -26,11 +63,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Link", "X-Next-Cursor", "X-Total-Count"],
 )
 
-# Include routers
-app.include_router(items_router)
-app.include_router(tags_router)
+# Include routers: the unprefixed paths serve the default board, the same
+# routes under /boards/{board_id} serve the other boards
+app.include_router(boards_router)
+app.include_router(backups_router)
+for prefix in ("", BOARD_PREFIX):
+    app.include_router(items_router, prefix=prefix)
+    app.include_router(tags_router, prefix=prefix)
+    app.include_router(stats_router, prefix=prefix)
+    app.include_router(board_router, prefix=prefix)
 
 
 @app.get("/")
@@ -47,3 +91,9 @@ def read_root():
 def health_check():
     """Health check endpoint"""
     return {"status": "healthy"}
+
+
+@app.get("/admin/caches")
+def cache_stats():
+    """Hit and miss counters of the repository caches of every board used so far"""
+    return [{"board_id": board_id, **caches.stats()} for board_id, caches in board_caches.items()]
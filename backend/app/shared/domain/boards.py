@@ -0,0 +1,4 @@
+# Boards are independent Kanban boards, each stored in a database of its own.
+# A board ID names its database file, so it is restricted to a safe file name.
+
+BOARD_ID_PATTERN = r"^[a-z0-9][a-z0-9_-]{0,62}$"
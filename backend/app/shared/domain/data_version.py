@@ -0,0 +1,19 @@
+# Data versions: every write to a table bumps its version, so a client holding a
+# resource read at one version learns it is unchanged by comparing versions,
+# without reading the rows again.
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+# Tables a resource is read from. Items are returned with their tags
+ITEM_TABLES = ("items", "tags", "item_tags")
+TAG_TABLES = ("tags",)
+
+
+class DataVersionService(ABC):
+    """Read model for the version of the rows of some tables"""
+
+    @abstractmethod
+    async def get_version(self, tables: Sequence[str]) -> str:
+        """Opaque version of the tables' rows; it differs after any write to one of them"""
+        pass
@@ -0,0 +1,54 @@
+import base64
+import binascii
+import json
+from typing import Literal
+
+# Columns a list can be ordered by; the id is always appended as tie-breaker
+SortKey = Literal["id", "name"]
+
+
+class PageCursor:
+    """Position after the last row of a page, for keyset (cursor) pagination"""
+
+    def __init__(self, sort: str, value: str | int, id: int):
+        self.sort = sort
+        self.value = value
+        self.id = id
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque URL-safe token"""
+        raw = json.dumps([self.sort, self.value, self.id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """Decode a token produced by encode, raising ValueError if it is malformed"""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            sort, value, id = json.loads(base64.urlsafe_b64decode(padded))
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+            raise ValueError("Invalid pagination cursor") from e
+        # The value is compared with the sort column: an integer for id, text for
+        # the others. bool is a subclass of int, so types are matched exactly.
+        value_type = int if sort == "id" else str
+        if not isinstance(sort, str) or type(id) is not int or type(value) is not value_type:
+            raise ValueError("Invalid pagination cursor")
+        return cls(sort=sort, value=value, id=id)
+
+
+class Page[T]:
+    """A page of results plus the cursor of the next page, if there is one"""
+
+    def __init__(self, items: list[T], next_cursor: PageCursor | None = None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+
+def parse_cursor(token: str | None, sort: str) -> PageCursor | None:
+    """Decode an optional cursor token, rejecting cursors issued for another sort order"""
+    if token is None:
+        return None
+    cursor = PageCursor.decode(token)
+    if cursor.sort != sort:
+        raise ValueError("Pagination cursor does not match the requested sort")
+    return cursor
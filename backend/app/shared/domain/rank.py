@@ -0,0 +1,89 @@
+# Fractional rank keys for manually ordered lists (e.g. Kanban columns).
+#
+# A key is a base-62 fraction written without its leading "0.": "V" is 0.5,
+# "k" about 0.74. Keys never end in "0", so ordering the strings byte by byte
+# (SQLite's BINARY collation) orders the fractions. A key strictly between any
+# two keys always exists, which turns moving a card into a single-row write.
+# Repeated inserts into the same gap make keys longer, so lists are
+# rebalanced to short, evenly spaced keys once a key exceeds MAX_RANK_LENGTH.
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+# Keys longer than this trigger a rebalance of their list
+MAX_RANK_LENGTH = 12
+
+
+def rank_between(before: str | None, after: str | None) -> str:
+    """Return a key sorting strictly between two keys; None means an open end.
+
+    Raises ValueError if ``before`` does not sort below ``after`` or a key is malformed.
+    """
+    low = before or ""
+    for key in (low, after):
+        if key and (key.endswith(DIGITS[0]) or key.strip(DIGITS)):
+            raise ValueError(f"Invalid rank key: {key!r}")
+    if after is not None and low >= after:
+        raise ValueError(f"Rank {before!r} does not sort before {after!r}")
+    if after is None and low:
+        return _successor(low)
+    return _midpoint(low, after)
+
+
+def spread_ranks(count: int) -> list[str]:
+    """Return ``count`` ascending keys of equal, minimal length spread over the whole range"""
+    width = 1
+    while BASE**width <= count:
+        width += 1
+    step = BASE**width // (count + 1)
+    return [_encode((i + 1) * step, width) for i in range(count)]
+
+
+def needs_rebalance(key: str) -> bool:
+    """Whether a key has grown long enough to rebalance its list"""
+    return len(key) > MAX_RANK_LENGTH
+
+
+def _midpoint(low: str, high: str | None) -> str:
+    """Key between low ("" for the start) and high (None for the end), low < high"""
+    if high is not None:
+        # Keep the common prefix and split the remainder
+        n = 0
+        while n < len(high) and (low[n] if n < len(low) else DIGITS[0]) == high[n]:
+            n += 1
+        if n > 0:
+            return high[:n] + _midpoint(low[n:], high[n:])
+
+    digit_low = DIGITS.index(low[0]) if low else 0
+    digit_high = DIGITS.index(high[0]) if high is not None else BASE
+    if digit_high - digit_low > 1:
+        return DIGITS[(digit_low + digit_high + 1) // 2]
+    # Adjacent first digits: the shorter key is between, or go one digit deeper
+    if high is not None and len(high) > 1:
+        return high[:1]
+    return DIGITS[digit_low] + _midpoint(low[1:], None)
+
+
+def _successor(low: str) -> str:
+    """Short key after low with nothing above it, for appending at the end.
+
+    Counts up in the digits after low's leading run of "z"s, using twice as many
+    digits as the run is long, so appended keys grow logarithmically rather than
+    by a digit every BASE - 1 keys.
+    """
+    run = len(low) - len(low.lstrip(DIGITS[-1]))
+    width = max(run + 1, 2 * run)
+    # No carry reaches past the run: the digit after it is padding or not "z"
+    value = 0
+    for char in low[:width].ljust(width, DIGITS[0]):
+        value = value * BASE + DIGITS.index(char)
+    return _encode(value + 1, width)
+
+
+def _encode(value: int, width: int) -> str:
+    """Write value as width base-62 digits, dropping trailing zeros"""
+    digits = []
+    for _ in range(width):
+        value, digit = divmod(value, BASE)
+        digits.append(DIGITS[digit])
+    return "".join(reversed(digits)).rstrip(DIGITS[0])
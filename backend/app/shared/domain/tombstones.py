@@ -0,0 +1,17 @@
+# Soft delete: deleting a row only sets its deleted_at. The tombstone tells synced
+# clients what disappeared, and is purged for good once the retention window has
+# passed. Times are stored by SQLite as naive UTC, so they are compared as such.
+
+from datetime import UTC, datetime, timedelta
+
+
+def to_naive_utc(moment: datetime) -> datetime:
+    """The same instant as a naive UTC datetime; naive input is taken to be UTC already"""
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(UTC).replace(tzinfo=None)
+
+
+def retention_cutoff(retention: timedelta, now: datetime | None = None) -> datetime:
+    """Tombstones older than this naive UTC time are past the retention window"""
+    return to_naive_utc(now or datetime.now(UTC)) - retention
@@ -1,4 +1,4 @@
 # Shared infrastructure
-from .database import Base, SessionLocal, engine, get_db
+from .database import Base, async_engine, engine, get_db
 
-__all__ = ["Base", "SessionLocal", "engine", "get_db"]
+__all__ = ["Base", "engine", "async_engine", "get_db"]
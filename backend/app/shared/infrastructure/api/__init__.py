@@ -0,0 +1 @@
+# Shared API helpers
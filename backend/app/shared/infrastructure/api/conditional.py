@@ -0,0 +1,79 @@
+from collections.abc import Awaitable, Callable
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.domain.data_version import DataVersionService
+from app.shared.infrastructure.cache import BoardCaches
+from app.shared.infrastructure.database import (
+    get_db,
+    get_memory_store,
+    get_repository_caches,
+)
+from app.shared.infrastructure.database.data_version_service_impl import DataVersionServiceImpl
+from app.shared.infrastructure.memory import MemoryStore
+from app.shared.infrastructure.memory.in_memory_data_version_service import (
+    InMemoryDataVersionService,
+)
+
+
+def get_data_version_service(
+    db: AsyncSession = Depends(get_db),
+    store: MemoryStore | None = Depends(get_memory_store),
+) -> DataVersionService:
+    """Dependency injection for the data version read model"""
+    if store is not None:
+        return InMemoryDataVersionService(store)
+    return DataVersionServiceImpl(db)
+
+
+def entity_tag(version: str) -> str:
+    """Strong ETag of a data version"""
+    return f'"{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header lists the ETag, compared weakly as RFC 9110 asks"""
+    if not if_none_match:
+        return False
+    candidates = (candidate.strip().removeprefix("W/") for candidate in if_none_match.split(","))
+    return etag in candidates
+
+
+def raise_if_not_modified(if_none_match: str | None, etag: str) -> None:
+    """Answer an empty 304 carrying the ETag if the client already holds it"""
+    if etag_matches(if_none_match, etag):
+        raise HTTPException(status_code=304, headers={"ETag": etag})
+
+
+def conditional_get(*tables: str, after_lookup: bool = False) -> Callable[..., Awaitable[str]]:
+    """Dependency answering conditional GETs of a resource read from ``tables``.
+
+    Reads the tables' version before the endpoint runs. A client whose
+    If-None-Match holds it gets an empty 304 without any row being read;
+    otherwise the response carries it as its ETag. The version is read before
+    the rows, and handed to the repository caches, so the body is never older
+    than its ETag.
+
+    The version covers whole tables, so it matches for IDs that do not exist
+    too. Endpoints of a single resource pass ``after_lookup``: the dependency
+    then only returns the ETag, and the endpoint calls raise_if_not_modified
+    once it has answered 404 for a missing resource.
+    """
+
+    async def check_version(
+        request: Request,
+        response: Response,
+        versions: DataVersionService = Depends(get_data_version_service),
+        caches: BoardCaches | None = Depends(get_repository_caches),
+    ) -> str:
+        version = await versions.get_version(tables)
+        if caches is not None:
+            caches.sync(tables, version)
+        etag = entity_tag(version)
+        if not after_lookup:
+            raise_if_not_modified(request.headers.get("if-none-match"), etag)
+        response.headers["ETag"] = etag
+        return etag
+
+    return check_version
@@ -0,0 +1,31 @@
+from urllib.parse import urlencode
+
+from fastapi import Response
+
+
+def set_next_page_headers(
+    response: Response,
+    path: str,
+    next_cursor: str | None,
+    limit: int,
+    sort: str,
+    filters: dict[str, object] | None = None,
+) -> None:
+    """Advertise the next page through the Link and X-Next-Cursor headers.
+
+    Lists keep returning a plain JSON array so existing clients are unaffected;
+    clients that page simply follow the rel="next" link until it disappears.
+    Filters that are set are carried over into the link.
+    """
+    if next_cursor is None:
+        return
+    params = {key: value for key, value in (filters or {}).items() if value is not None}
+    query = urlencode({**params, "after": next_cursor, "limit": limit, "sort": sort})
+    response.headers["Link"] = f'<{path}?{query}>; rel="next"'
+    response.headers["X-Next-Cursor"] = next_cursor
+
+
+def set_total_count_header(response: Response, total: int | None) -> None:
+    """Report the size of the whole filtered list in X-Total-Count, when it is known"""
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
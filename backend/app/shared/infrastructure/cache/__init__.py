@@ -0,0 +1,3 @@
+from .lru_cache import MISSING, BoardCaches, LRUCache
+
+__all__ = ["MISSING", "BoardCaches", "LRUCache"]
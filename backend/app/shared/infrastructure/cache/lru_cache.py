@@ -0,0 +1,106 @@
+# Bounded caches in front of the repositories.
+#
+# Each board gets one cache for tag lookups and one for item lookups, shared by
+# every request the process serves. Entries are evicted least recently used
+# beyond max_entries and expire ttl seconds after they were stored, which bounds
+# how stale a row can get when another process writes it.
+#
+# Writes through a caching repository clear its cache. A read that started
+# before such a write could still store the value it read after the clear, so
+# every clear starts a new generation and values read in an older generation are
+# dropped instead of stored.
+#
+# Conditional GETs read the data version of the tables behind a cache before
+# reading through it, and hand it to sync: a version this process did not see
+# before means another process wrote, so the cache is cleared and no response
+# carries rows older than its ETag.
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from app.shared.domain.data_version import ITEM_TABLES, TAG_TABLES
+
+# Returned by get when a key is not cached (None is a value that can be cached)
+MISSING = object()
+
+
+class LRUCache:
+    """LRU cache of at most ``max_entries`` entries living ``ttl`` seconds each.
+
+    Counts hits and misses. Single threaded: use it from the event loop only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.generation = 0
+        self.version: str | None = None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """The cached value of a key, or MISSING if it is absent or expired"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self.clock():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return MISSING
+
+    def put(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        """Cache a value, unless it was read in a generation that has been cleared since"""
+        if generation is not None and generation != self.generation:
+            return
+        self._entries[key] = (self.clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every entry and start a new generation"""
+        self._entries.clear()
+        self.generation += 1
+
+    def sync(self, version: str) -> None:
+        """Clear the cache if the data version differs from the last one seen"""
+        if version != self.version:
+            self.clear()
+            self.version = version
+
+    def stats(self) -> dict[str, int]:
+        """Hit and miss counts and the number of entries"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class BoardCaches:
+    """The repository caches of one board"""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0):
+        self.tags = LRUCache(max_entries, ttl)
+        # Cached items carry their tags, so tag writes clear this one too
+        self.items = LRUCache(max_entries, ttl)
+
+    def sync(self, tables: tuple[str, ...], version: str) -> None:
+        """Pass the data version of some tables to the cache filled from exactly those"""
+        for cache, cache_tables in [(self.items, ITEM_TABLES), (self.tags, TAG_TABLES)]:
+            if tables == cache_tables:
+                cache.sync(version)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Counters of both caches"""
+        return {"tags": self.tags.stats(), "items": self.items.stats()}
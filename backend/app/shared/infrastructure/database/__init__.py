@@ -1,3 +1,55 @@
-from .database import Base, SessionLocal, engine, get_db
+from .database import (
+    Base,
+    async_engine,
+    board_caches,
+    database,
+    engine,
+    get_board_id,
+    get_database,
+    get_db,
+    get_group_commit_writer,
+    get_memory_store,
+    get_repository_caches,
+    memory_store,
+    memory_stores,
+    repository_caches,
+    shards,
+)
+from .engine import create_async_db_engine, create_db_engine
+from .group_commit import GroupCommitWriter, run_write
+from .purger import TombstonePurger
+from .routing import Database, RoutingSession
+from .settings import DatabaseSettings, get_database_settings
+from .sharding import BOARD_PREFIX, ShardRouter, board_path
+from .snapshot import begin_read_snapshot
 
-__all__ = ["Base", "SessionLocal", "get_db", "engine"]
+__all__ = [
+    "Base",
+    "get_db",
+    "get_board_id",
+    "get_database",
+    "get_group_commit_writer",
+    "get_memory_store",
+    "memory_store",
+    "memory_stores",
+    "get_repository_caches",
+    "repository_caches",
+    "board_caches",
+    "GroupCommitWriter",
+    "run_write",
+    "engine",
+    "async_engine",
+    "database",
+    "shards",
+    "Database",
+    "RoutingSession",
+    "ShardRouter",
+    "BOARD_PREFIX",
+    "board_path",
+    "create_db_engine",
+    "create_async_db_engine",
+    "DatabaseSettings",
+    "get_database_settings",
+    "begin_read_snapshot",
+    "TombstonePurger",
+]
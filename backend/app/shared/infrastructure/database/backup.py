@@ -0,0 +1,266 @@
+# Online backups of the SQLite databases.
+#
+# A backup copies the database with SQLite's online backup API, step_pages pages
+# per step with a pause between steps, while the app keeps serving. The source
+# connection holds one read transaction for the whole copy: in WAL mode that pins
+# a snapshot, so writers carry on committing and the copy is consistent as of
+# its start. Without the pinned snapshot every commit by another connection
+# restarts the copy, and under steady writes it never finishes. The pauses
+# leave disk bandwidth to the writers; the WAL cannot be checkpointed past the
+# snapshot and grows until the backup ends. With a rollback journal the read
+# lock blocks writers for the whole backup instead.
+#
+# The copy is written next to its final name and renamed into place once
+# complete, so a backup file is never partial. Each database has its own
+# directory of backups, named by UTC time, and only the newest backup_keep
+# are kept:
+#
+#     python -m app.shared.infrastructure.database.backup create [--board ID]
+#     python -m app.shared.infrastructure.database.backup list [--board ID]
+#     python -m app.shared.infrastructure.database.backup restore FILE [--board ID]
+#
+# Restoring copies a backup over the database with the same API in one step,
+# under SQLite's locks, then applies the migrations the backup is missing. The
+# table versions (see counters.table_version) of the restored database are set
+# past the ones it replaced, so ETags handed out before the restore never match
+# the restored rows.
+
+import argparse
+import asyncio
+import logging
+import sqlite3
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+from sqlalchemy import make_url
+
+from .settings import DatabaseSettings
+
+logger = logging.getLogger(__name__)
+
+# Backup file names sort by creation time
+STAMP_FORMAT = "%Y%m%dT%H%M%S%fZ"
+
+
+class BackupResult:
+    """A finished backup: where it went, how many pages and how long it took"""
+
+    def __init__(self, path: Path, pages: int, steps: int, seconds: float):
+        self.path = path
+        self.pages = pages
+        self.steps = steps
+        self.seconds = seconds
+
+
+def database_file(settings: DatabaseSettings) -> Path:
+    """Path of the database file of settings; in-memory databases have none"""
+    database = make_url(settings.url).database
+    if not database or database == ":memory:" or "mode=memory" in settings.url:
+        raise ValueError("An in-memory database cannot be backed up")
+    return Path(database)
+
+
+def backup_directory(settings: DatabaseSettings, board_id: str | None = None) -> Path:
+    """Directory holding the backups of a board; "default" is the default board's"""
+    root = Path(settings.backup_dir)
+    return root / "default" if board_id is None else root / "boards" / board_id
+
+
+def backup_database(
+    source: Path, target: Path, step_pages: int = 1024, pause: float = 0.005
+) -> BackupResult:
+    """Copy a live database into target, step_pages pages at a time.
+
+    Sleeps ``pause`` seconds between steps. Raises FileNotFoundError if there is
+    no database at source.
+    """
+    if not source.is_file():
+        raise FileNotFoundError(source)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    partial = target.with_name(target.name + ".partial")
+    partial.unlink(missing_ok=True)
+
+    steps = 0
+    pages = 0
+
+    def progress(status: int, remaining: int, total: int) -> None:
+        nonlocal steps, pages
+        steps += 1
+        pages = total
+        if remaining and pause:
+            time.sleep(pause)
+
+    start = time.perf_counter()
+    reader = sqlite3.connect(f"file:{source}?mode=ro", uri=True, isolation_level=None)
+    copy = sqlite3.connect(partial)
+    try:
+        # Pin the snapshot the copy is taken from (see the module comment)
+        reader.execute("BEGIN")
+        reader.execute("SELECT count(*) FROM sqlite_schema").fetchone()
+        reader.backup(copy, pages=step_pages, progress=progress)
+        reader.execute("COMMIT")
+        # A backup is a single self-contained file
+        copy.execute("PRAGMA journal_mode=DELETE")
+    finally:
+        copy.close()
+        reader.close()
+    partial.replace(target)
+    return BackupResult(target, pages, steps, time.perf_counter() - start)
+
+
+def list_backups(directory: Path) -> list[Path]:
+    """Backups in a directory, oldest first"""
+    if not directory.is_dir():
+        return []
+    return sorted(directory.glob("*.db"))
+
+
+def rotate(directory: Path, keep: int) -> list[Path]:
+    """Delete all but the newest ``keep`` backups in a directory, returning the deleted ones"""
+    backups = list_backups(directory)
+    expired = backups[: max(len(backups) - keep, 0)]
+    for path in expired:
+        path.unlink()
+    return expired
+
+
+def create_backup(settings: DatabaseSettings, board_id: str | None = None) -> BackupResult:
+    """Back up the database of settings into its board's backup directory, then rotate it"""
+    directory = backup_directory(settings, board_id)
+    target = directory / f"{datetime.now(UTC).strftime(STAMP_FORMAT)}.db"
+    result = backup_database(
+        database_file(settings),
+        target,
+        step_pages=settings.backup_step_pages,
+        pause=settings.backup_step_pause_ms / 1000,
+    )
+    rotate(directory, settings.backup_keep)
+    return result
+
+
+def restore_database(backup: Path, target: Path) -> float:
+    """Copy a backup over a database in one step, returning the seconds it took.
+
+    The backup is checked first; raises ValueError if it is damaged, and
+    sqlite3.DatabaseError if it is no database at all. Connections to the
+    database wait on SQLite's locks while it is overwritten.
+    """
+    start = time.perf_counter()
+    source = sqlite3.connect(f"file:{backup}?mode=ro", uri=True)
+    try:
+        (check,) = source.execute("PRAGMA quick_check").fetchone()
+        if check != "ok":
+            raise ValueError(f"Backup {backup} is damaged: {check}")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        database = sqlite3.connect(target)
+        try:
+            replaced = _table_versions(database)
+            source.backup(database)
+            _advance_table_versions(database, replaced)
+        finally:
+            database.close()
+    finally:
+        source.close()
+    return time.perf_counter() - start
+
+
+def _table_versions(database: sqlite3.Connection) -> dict[str, int] | None:
+    """The version counters of a database; None if it has no counters table"""
+    try:
+        rows = database.execute(
+            "SELECT name, value FROM counters WHERE name LIKE 'version:%'"
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return None
+    return dict(rows)
+
+
+def _advance_table_versions(database: sqlite3.Connection, replaced: dict[str, int] | None) -> None:
+    """Move every version counter past its value in the database that was replaced"""
+    if not replaced or _table_versions(database) is None:
+        return
+    with database:
+        database.executemany(
+            "INSERT INTO counters(name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = max(value, excluded.value)",
+            [(name, value + 1) for name, value in replaced.items()],
+        )
+
+
+# Backs up every database once, returning how many backups were made
+type BackupJob = Callable[[], Awaitable[int]]
+
+
+class BackupScheduler:
+    """Runs a backup job every ``interval`` seconds in a background task.
+
+    A failing run is logged and tried again on the next round. An interval of
+    0 disables it.
+    """
+
+    def __init__(self, job: BackupJob, interval: float = 0.0):
+        self.job = job
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the background task, unless it runs already or backups are disabled"""
+        if self.interval > 0 and (self._task is None or self._task.done()):
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the background task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """Back up once per interval"""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                made = await self.job()
+                logger.info("Made %d backups", made)
+            except Exception:
+                logger.exception("Scheduled backup failed")
+
+
+def main() -> None:
+    """Command line entry point to create, list and restore backups"""
+    from .database import settings, shards
+    from .sharding import migrate
+
+    parser = argparse.ArgumentParser(description="Online backups of the databases")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name in ("create", "list"):
+        command = commands.add_parser(name)
+        command.add_argument("--board", help="board ID (default: the default board)")
+    restore = commands.add_parser("restore", help="replace a database with a backup")
+    restore.add_argument("backup", type=Path)
+    restore.add_argument("--board", help="board ID (default: the default board)")
+    args = parser.parse_args()
+
+    if args.board is not None and args.command != "restore" and not shards.exists(args.board):
+        parser.error(f"no board {args.board!r}")
+    board_settings = settings if args.board is None else shards.board_settings(args.board)
+
+    if args.command == "create":
+        result = create_backup(board_settings, args.board)
+        print(f"Backed up {result.pages} pages to {result.path} in {result.seconds:.2f}s")
+    elif args.command == "list":
+        for path in list_backups(backup_directory(settings, args.board)):
+            print(f"{path}  {path.stat().st_size} bytes")
+    else:
+        seconds = restore_database(args.backup, database_file(board_settings))
+        applied = migrate(board_settings)
+        print(f"Restored {args.backup} in {seconds:.2f}s, applied migrations {applied}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+from collections.abc import Iterator, Sequence
+
+# SQLite's compile-time SQLITE_MAX_VARIABLE_NUMBER before 3.32; newer builds allow 32766,
+# staying under the old limit keeps IN (...) lists valid on every build
+SQLITE_MAX_VARIABLES = 999
+
+
+def chunked[T](values: Sequence[T], size: int = SQLITE_MAX_VARIABLES) -> Iterator[Sequence[T]]:
+    """Split values into consecutive chunks of at most size elements"""
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
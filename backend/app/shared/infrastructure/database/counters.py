@@ -0,0 +1,114 @@
+# Maintained row counts.
+#
+# counters holds one row per counted set (all items, the items of a status, the
+# items of a tag, ...). Triggers on the counted tables adjust it inside the
+# writing transaction, so every write path (ORM, Core, raw SQL, ON DELETE
+# CASCADE) is covered and reading a count is a single primary key lookup
+# instead of a COUNT(*) scan.
+#
+# Modules declare their counters with CounterSet and install them from an
+# after_create listener of the counted table, like the search index. The table
+# lives outside Base.metadata because whichever counted table is created first
+# creates it; recounting on install makes a left-over table harmless.
+
+from collections.abc import Iterable
+
+from sqlalchemy import Column, Connection, Integer, MetaData, String, Table, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+counters = Table(
+    "counters",
+    MetaData(),
+    Column("name", String, primary_key=True),
+    Column("value", Integer, nullable=False),
+    sqlite_with_rowid=False,
+)
+
+
+def increment_sql(name_sql: str) -> str:
+    """Trigger statement adding one to the counter named by a SQL expression"""
+    return (
+        f"INSERT INTO counters(name, value) VALUES ({name_sql}, 1) "
+        f"ON CONFLICT(name) DO UPDATE SET value = value + 1;"
+    )
+
+
+def decrement_sql(name_sql: str) -> str:
+    """Trigger statement subtracting one from the counter named by a SQL expression.
+
+    Never creates the row, so a counter dropped by its owner's delete trigger
+    is not brought back to -1 by cascaded deletes that fire afterwards.
+    """
+    return f"UPDATE counters SET value = value - 1 WHERE name = {name_sql};"
+
+
+class CounterSet:
+    """Triggers maintaining a group of counters, plus the statements recounting them.
+
+    ``triggers`` maps trigger names to their ``AFTER ... BEGIN ... END`` body,
+    ``recount`` are statements deleting and recomputing every counter of the
+    group from the tables.
+    """
+
+    def __init__(self, triggers: dict[str, str], recount: list[str]):
+        self.triggers = triggers
+        self.recount = recount
+
+    def ddl(self) -> list[str]:
+        """Statements creating the triggers if they do not exist"""
+        return [
+            f"CREATE TRIGGER IF NOT EXISTS {name} {body}" for name, body in self.triggers.items()
+        ]
+
+    def drop_ddl(self) -> list[str]:
+        """Statements dropping the triggers"""
+        return [f"DROP TRIGGER IF EXISTS {name}" for name in self.triggers]
+
+    def ensure(self, connection: Connection) -> None:
+        """Install missing triggers, recounting from the tables if any was missing"""
+        if connection.dialect.name != "sqlite":
+            return
+        counters.create(connection, checkfirst=True)
+        installed = {
+            name
+            for (name,) in connection.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+            )
+        }
+        if set(self.triggers) <= installed:
+            return
+        for statement in self.ddl():
+            connection.exec_driver_sql(statement)
+        for statement in self.recount:
+            connection.exec_driver_sql(statement)
+
+
+def version_counter(table: str) -> str:
+    """Name of the counter bumped by every write to a table"""
+    return f"version:{table}"
+
+
+def table_version(table: str) -> CounterSet:
+    """Triggers bumping the version counter of a table on every insert, update and delete.
+
+    Versions only ever grow and are never recounted, so a changed version means
+    the table changed since it was last read.
+    """
+    bump = increment_sql(f"'{version_counter(table)}'")
+    return CounterSet(
+        triggers={
+            f"{table}_version_{suffix}": f"AFTER {event} ON {table} BEGIN {bump} END"
+            for suffix, event in [("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE")]
+        },
+        recount=[],
+    )
+
+
+async def read_counters(session: AsyncSession, names: Iterable[str]) -> dict[str, int]:
+    """Current value of each counter; counters that were never incremented are 0"""
+    names = list(names)
+    result = await session.execute(
+        select(counters.c.name, counters.c.value).where(counters.c.name.in_(names))
+    )
+    values = dict(result.tuples().all())
+    return {name: values.get(name, 0) for name in names}
@@ -0,0 +1,23 @@
+from collections.abc import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.domain.data_version import DataVersionService
+
+from .counters import read_counters, version_counter
+
+
+class DataVersionServiceImpl(DataVersionService):
+    """Versions from the version:<table> counters bumped by the table triggers.
+
+    One primary key lookup per table in a single Core query; no ORM row is loaded.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_version(self, tables: Sequence[str]) -> str:
+        """The tables' version counters joined by dots"""
+        names = [version_counter(table) for table in tables]
+        counts = await read_counters(self.db, names)
+        return ".".join(str(counts[name]) for name in names)
@@ -1,24 +1,90 @@
-from sqlalchemy import create_engine
+from collections.abc import AsyncIterator
+
+from fastapi import Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 
-# SQLite database URL
-SQLALCHEMY_DATABASE_URL = "sqlite:///./app.db"
+from app.shared.infrastructure.cache import BoardCaches
+from app.shared.infrastructure.memory.store import MemoryStore
+
+from .engine import create_db_engine
+from .group_commit import GroupCommitWriter
+from .routing import Database
+from .settings import get_database_settings
+from .sharding import ShardRouter
+
+# Database settings (URL and SQLite tuning profile) from the environment
+settings = get_database_settings()
+
+# Create engine (sync, used for schema management) with the configured pragmas
+engine = create_db_engine(settings)
+
+# Async engines of the default board: reads go to read-only connections, writes to the writer
+database = Database(settings)
+async_engine = database.writer_engine
 
-# Create engine with SQLite-specific settings
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+# Databases of the other boards, one file each, opened on demand
+shards = ShardRouter(settings, database)
 
-# Create SessionLocal class for database sessions
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# In-memory stores of the boards when settings.backend is "memory", created on first use
+memory_stores: dict[str | None, MemoryStore] = {}
+
+# Repository caches of the boards when settings.cache_repositories is on, created on first use
+board_caches: dict[str | None, BoardCaches] = {}
 
 # Base class for models
 Base = declarative_base()
 
 
+# Dependency to get the board addressed by the request path (None for the default board)
+def get_board_id(request: Request) -> str | None:
+    return request.path_params.get("board_id")
+
+
+def memory_store(board_id: str | None = None) -> MemoryStore | None:
+    """A board's in-memory store, or None when the repositories use SQLite"""
+    if settings.backend != "memory":
+        return None
+    if board_id not in memory_stores:
+        memory_stores[board_id] = MemoryStore()
+    return memory_stores[board_id]
+
+
+# Dependency to get the in-memory store of the request's board (None with SQLite)
+def get_memory_store(board_id: str | None = Depends(get_board_id)) -> MemoryStore | None:
+    return memory_store(board_id)
+
+
+def repository_caches(board_id: str | None = None) -> BoardCaches | None:
+    """A board's repository caches, or None when caching is off"""
+    if not settings.cache_repositories or settings.backend != "sqlite":
+        return None
+    if board_id not in board_caches:
+        board_caches[board_id] = BoardCaches(settings.cache_max_entries, settings.cache_ttl_seconds)
+    return board_caches[board_id]
+
+
+# Dependency to get the repository caches of the request's board (None when caching is off)
+def get_repository_caches(board_id: str | None = Depends(get_board_id)) -> BoardCaches | None:
+    return repository_caches(board_id)
+
+
+# Dependency to get the database of the request's board, held open until the response
+async def get_database(board_id: str | None = Depends(get_board_id)) -> AsyncIterator[Database]:
+    if board_id is not None and not shards.exists(board_id):
+        raise HTTPException(status_code=404, detail="Board not found")
+    async with shards.lease(board_id) as board_database:
+        yield board_database
+
+
 # Dependency to get database session
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db(board_database: Database = Depends(get_database)) -> AsyncIterator[AsyncSession]:
+    async with board_database.session() as db:
         yield db
-    finally:
-        db.close()
+
+
+# Dependency to get the group commit writer (None when group commit is disabled)
+def get_group_commit_writer(
+    board_database: Database = Depends(get_database),
+) -> GroupCommitWriter | None:
+    return board_database.group_commit
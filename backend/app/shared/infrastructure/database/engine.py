@@ -0,0 +1,88 @@
+from sqlalchemy import Engine, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from .settings import DatabaseSettings, SQLitePragmas
+
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas: SQLitePragmas, read_only: bool = False) -> None:
+    """Apply the tuning pragmas to a freshly opened DBAPI connection"""
+    statements = [
+        f"PRAGMA synchronous={pragmas.synchronous}",
+        f"PRAGMA cache_size={pragmas.cache_size}",
+        f"PRAGMA mmap_size={pragmas.mmap_size}",
+        f"PRAGMA temp_store={pragmas.temp_store}",
+        f"PRAGMA busy_timeout={pragmas.busy_timeout}",
+        f"PRAGMA foreign_keys={'ON' if pragmas.foreign_keys else 'OFF'}",
+    ]
+    # The journal mode is a property of the database file, only writers may change it
+    if not read_only:
+        statements.insert(0, f"PRAGMA journal_mode={pragmas.journal_mode}")
+    cursor = dbapi_connection.cursor()
+    try:
+        for statement in statements:
+            cursor.execute(statement)
+    finally:
+        cursor.close()
+
+
+def _install_pragma_listener(
+    engine: Engine, pragmas: SQLitePragmas, read_only: bool = False
+) -> None:
+    """Run apply_sqlite_pragmas on every new connection of a SQLite engine"""
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection, pragmas, read_only=read_only)
+
+
+def create_db_engine(settings: DatabaseSettings) -> Engine:
+    """Create a sync engine configured from settings"""
+    engine = create_engine(settings.url, connect_args={"check_same_thread": False})
+    _install_pragma_listener(engine, settings.pragmas)
+    return engine
+
+
+def create_async_db_engine(settings: DatabaseSettings) -> AsyncEngine:
+    """Create an async engine configured from settings"""
+    engine = create_async_engine(settings.async_url)
+    _install_pragma_listener(engine.sync_engine, settings.pragmas)
+    return engine
+
+
+def create_async_writer_engine(settings: DatabaseSettings) -> AsyncEngine:
+    """Create the async engine owning the single writer connection.
+
+    With split reads enabled the pool holds exactly one connection, so concurrent
+    writers queue up in the pool instead of fighting over the SQLite write lock.
+    """
+    if not settings.uses_split_reads:
+        return create_async_db_engine(settings)
+    engine = create_async_engine(
+        settings.async_url,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=settings.writer_queue_timeout,
+    )
+    _install_pragma_listener(engine.sync_engine, settings.pragmas)
+    return engine
+
+
+def create_async_reader_engine(settings: DatabaseSettings) -> AsyncEngine:
+    """Create the async engine with a pool of read-only (mode=ro) connections"""
+    url = make_url(settings.async_url)
+    read_only_url = url.set(
+        database=f"file:{url.database}",
+        query={**url.query, "mode": "ro", "uri": "true"},
+    )
+    engine = create_async_engine(
+        read_only_url,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.read_pool_size,
+        max_overflow=settings.read_pool_size,
+    )
+    _install_pragma_listener(engine.sync_engine, settings.pragmas, read_only=True)
+    return engine
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# A unit of work: receives the shared writer session, must not commit it
+type WriteOperation[T] = Callable[[AsyncSession], Awaitable[T]]
+
+# Session.info key marking a transaction whose reads must go to the writer too
+WRITE_TRANSACTION = "write_transaction"
+
+
+class GroupCommitWriter:
+    """Applies concurrently submitted write operations in shared transactions.
+
+    Operations arriving within ``max_latency`` seconds of the first queued one
+    (or until ``max_batch_size`` operations are queued) run in one session and
+    are committed together, so the batch pays for a single commit. Each caller
+    awaits its own result, which resolves once the shared commit has landed.
+    If a batch fails, its operations are retried one transaction each so only
+    the failing caller receives the error.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_batch_size: int = 64,
+        max_latency: float = 0.002,
+    ):
+        self.session_factory = session_factory
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self._queue: asyncio.Queue[tuple[WriteOperation[Any], asyncio.Future]] | None = None
+        self._task: asyncio.Task | None = None
+
+    async def submit[T](self, operation: WriteOperation[T]) -> T:
+        """Queue an operation and wait until its batch is committed"""
+        queue = self._ensure_running()
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((operation, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the writer task, failing operations that were never applied"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError("Group commit writer was closed"))
+            self._queue = None
+
+    def _ensure_running(self) -> asyncio.Queue:
+        """Start the background writer task on first use"""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        """Collect batches from the queue and apply them"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except TimeoutError:
+                    break
+            await self._apply(batch)
+
+    async def _apply(self, batch: list[tuple[WriteOperation[Any], asyncio.Future]]) -> None:
+        """Run a batch in one transaction, falling back to one transaction per operation"""
+        if len(batch) > 1:
+            try:
+                async with self.session_factory() as session:
+                    results = [await operation(session) for operation, _ in batch]
+                    await session.commit()
+            except Exception:
+                logger.warning("Group commit of %d operations failed, retrying singly", len(batch))
+            else:
+                for (_, future), result in zip(batch, results, strict=True):
+                    if not future.done():
+                        future.set_result(result)
+                return
+
+        for operation, future in batch:
+            try:
+                async with self.session_factory() as session:
+                    result = await operation(session)
+                    await session.commit()
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+
+async def run_write[T](
+    session: AsyncSession, writer: GroupCommitWriter | None, operation: WriteOperation[T]
+) -> T:
+    """Run a write through the group commit writer, or on the session with its own commit"""
+    if writer is not None:
+        return await writer.submit(operation)
+    # Reads that decide what to write (e.g. the next rank key) must see the
+    # writer's transaction, not a reader snapshot taken before the first flush
+    session.info[WRITE_TRANSACTION] = True
+    try:
+        result = await operation(session)
+        await session.commit()
+    finally:
+        session.info.pop(WRITE_TRANSACTION, None)
+    return result
@@ -0,0 +1,25 @@
+from .runner import (
+    Migration,
+    OnlineIndex,
+    add_column,
+    current_version,
+    load_migrations,
+    pending_migrations,
+    rebuild_table,
+    schema_version,
+    table_definition,
+    upgrade,
+)
+
+__all__ = [
+    "Migration",
+    "OnlineIndex",
+    "add_column",
+    "current_version",
+    "load_migrations",
+    "pending_migrations",
+    "rebuild_table",
+    "schema_version",
+    "table_definition",
+    "upgrade",
+]
@@ -0,0 +1,63 @@
+# Apply or inspect schema migrations:
+#
+#     python -m app.shared.infrastructure.database.migrations status
+#     python -m app.shared.infrastructure.database.migrations upgrade [--target N]
+#
+# Both act on the default database and on every board database.
+
+import argparse
+
+from sqlalchemy import Engine
+
+from app.shared.infrastructure.database.migrations.runner import (
+    current_version,
+    load_migrations,
+    pending_migrations,
+    upgrade,
+)
+
+
+def status(engine: Engine) -> list[str]:
+    """Current version and the migrations still to apply, one line each"""
+    with engine.begin() as connection:
+        version = current_version(connection)
+    lines = [f"Current version: {version}"]
+    lines += [
+        f"Pending {migration.version:04d}: {migration.description}"
+        for migration in pending_migrations(engine, load_migrations())
+    ]
+    return lines
+
+
+def main() -> None:
+    """Command line entry point to migrate the configured databases"""
+    from app.shared.infrastructure.database.database import engine, shards
+    from app.shared.infrastructure.database.engine import create_db_engine
+
+    parser = argparse.ArgumentParser(description="Apply versioned schema migrations")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="show the current version and pending migrations")
+    upgrade_parser = commands.add_parser("upgrade", help="apply pending migrations")
+    upgrade_parser.add_argument("--target", type=int, help="stop at this version")
+    args = parser.parse_args()
+    targets = [("default", engine)]
+    targets += [
+        (f"board {board_id}", create_db_engine(shards.board_settings(board_id)))
+        for board_id in shards.board_ids()
+    ]
+    for name, target_engine in targets:
+        try:
+            if args.command == "status":
+                print(f"[{name}] " + "\n".join(status(target_engine)))
+            else:
+                applied = upgrade(target_engine, target=args.target)
+                print(
+                    f"[{name}] Applied {len(applied)} migrations"
+                    + (f": {applied}" if applied else "")
+                )
+        finally:
+            target_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+# Versioned schema migrations.
+#
+# Each module of the versions package is one migration, named v<NNNN>_<slug>.py:
+# its docstring describes it, upgrade(connection) changes the schema and the
+# optional INDEXES lists OnlineIndex builds. Migrations are frozen once shipped;
+# a later schema change is a new module, never an edit of an old one. The ORM
+# models stay the source of truth for new tables in tests (create_all), and a
+# test checks that migrating an empty database yields the same schema.
+#
+# schema_version records every applied migration. A migration, its index builds
+# and its schema_version row commit in one BEGIN IMMEDIATE transaction, so a
+# failed migration leaves nothing behind and concurrent runners (several workers
+# starting at once) apply each migration exactly once. Migrations run with
+# foreign keys off, so rebuild_table can replace a table other tables reference.
+
+import importlib
+import pkgutil
+from collections.abc import Callable
+from types import ModuleType
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Engine,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    insert,
+    select,
+)
+
+schema_version = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, server_default=func.now()),
+)
+
+# Connection settings for index builds: worker threads for the external sort and
+# room in the page cache for the table read ahead of the build (KiB)
+SORTER_THREADS = 4
+INDEX_BUILD_CACHE_KIB = 262144
+
+
+class OnlineIndex:
+    """An index a migration builds on a table that may already be large.
+
+    SQLite cannot build an index concurrently with writes: CREATE INDEX holds
+    the write lock until it is done (readers carry on under WAL). The build is
+    kept to the sort itself: the table is read into the page cache before the
+    lock is taken, and the sort uses worker threads. Give big indexes a
+    migration of their own, so writers get their turn between builds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        table: str,
+        columns: list[str],
+        where: str | None = None,
+        unique: bool = False,
+    ):
+        self.name = name
+        self.table = table
+        self.columns = columns
+        self.where = where
+        self.unique = unique
+
+    def ddl(self) -> str:
+        """CREATE INDEX statement, a no-op if the index exists"""
+        unique = "UNIQUE " if self.unique else ""
+        where = f" WHERE {self.where}" if self.where else ""
+        return (
+            f"CREATE {unique}INDEX IF NOT EXISTS {self.name} "
+            f"ON {self.table} ({', '.join(self.columns)}){where}"
+        )
+
+    def prewarm(self, connection: Connection) -> None:
+        """Read every page of the table, outside any write transaction.
+
+        Counting NOT INDEXED walks the table b-tree rather than a smaller index.
+        A table the migration itself creates has nothing to read yet.
+        """
+        exists = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (self.table,)
+        ).first()
+        if exists:
+            connection.exec_driver_sql(f"SELECT count(*) FROM {self.table} NOT INDEXED").all()
+
+
+class Migration:
+    """One schema version: a description, its upgrade and its index builds"""
+
+    def __init__(
+        self,
+        version: int,
+        description: str,
+        upgrade: Callable[[Connection], None],
+        indexes: list[OnlineIndex] | None = None,
+    ):
+        self.version = version
+        self.description = description
+        self.upgrade = upgrade
+        self.indexes = indexes or []
+
+    @classmethod
+    def from_module(cls, module: ModuleType) -> "Migration":
+        """Migration defined by a v<NNNN>_<slug> module"""
+        version = int(module.__name__.rpartition(".")[2][1:].partition("_")[0])
+        description = (module.__doc__ or "").strip().splitlines()[0]
+        return cls(version, description, module.upgrade, getattr(module, "INDEXES", None))
+
+
+def load_migrations(package: str = f"{__package__}.versions") -> list[Migration]:
+    """Every migration of a versions package, in version order"""
+    path = importlib.import_module(package).__path__
+    migrations = [
+        Migration.from_module(importlib.import_module(f"{package}.{info.name}"))
+        for info in pkgutil.iter_modules(path)
+        if info.name.startswith("v")
+    ]
+    migrations.sort(key=lambda migration: migration.version)
+    versions = [migration.version for migration in migrations]
+    if len(set(versions)) != len(versions):
+        raise ValueError(f"Duplicate migration versions in {package}: {versions}")
+    return migrations
+
+
+def current_version(connection: Connection) -> int:
+    """Latest applied version; 0 for a database that was never migrated"""
+    schema_version.create(connection, checkfirst=True)
+    version = connection.execute(select(func.max(schema_version.c.version))).scalar()
+    return version or 0
+
+
+def pending_migrations(
+    engine: Engine, migrations: list[Migration] | None = None
+) -> list[Migration]:
+    """Migrations not applied to the database yet"""
+    migrations = load_migrations() if migrations is None else migrations
+    with engine.begin() as connection:
+        version = current_version(connection)
+    return [migration for migration in migrations if migration.version > version]
+
+
+def upgrade(
+    engine: Engine, target: int | None = None, migrations: list[Migration] | None = None
+) -> list[int]:
+    """Apply the pending migrations up to ``target`` (default: all); returns their versions"""
+    migrations = load_migrations() if migrations is None else migrations
+    applied: list[int] = []
+    with engine.connect() as connection:
+        cache_size = connection.exec_driver_sql("PRAGMA cache_size").scalar()
+        foreign_keys = connection.exec_driver_sql("PRAGMA foreign_keys").scalar()
+        connection.exec_driver_sql(f"PRAGMA threads={SORTER_THREADS}")
+        connection.exec_driver_sql(f"PRAGMA cache_size=-{INDEX_BUILD_CACHE_KIB}")
+        # Dropping a table cascades to the rows referencing it while foreign keys
+        # are on; the pragma only takes effect outside a transaction
+        connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        connection.commit()
+        try:
+            for migration in migrations:
+                if target is not None and migration.version > target:
+                    break
+                if migration.version <= current_version(connection):
+                    connection.commit()
+                    continue
+                for index in migration.indexes:
+                    index.prewarm(connection)
+                connection.commit()
+                if _apply(connection, migration):
+                    applied.append(migration.version)
+        finally:
+            # The connection goes back to the pool
+            connection.rollback()
+            connection.exec_driver_sql("PRAGMA threads=0")
+            connection.exec_driver_sql(f"PRAGMA cache_size={cache_size}")
+            connection.exec_driver_sql(f"PRAGMA foreign_keys={foreign_keys}")
+            connection.commit()
+    return applied
+
+
+def _apply(connection: Connection, migration: Migration) -> bool:
+    """Run a migration in one write transaction, unless another runner got there first"""
+    with connection.begin():
+        # pysqlite does not begin a transaction before DDL by itself
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+        if migration.version <= current_version(connection):
+            return False
+        migration.upgrade(connection)
+        for index in migration.indexes:
+            connection.exec_driver_sql(index.ddl())
+        connection.execute(
+            insert(schema_version).values(
+                version=migration.version, description=migration.description
+            )
+        )
+    return True
+
+
+def add_column(connection: Connection, table: str, column_ddl: str) -> None:
+    """ALTER TABLE ... ADD COLUMN, skipped if the table already has the column.
+
+    Adding a column only rewrites the table definition, not its rows, so it
+    is instant on any table size. Databases created by create_all at a later
+    schema already have it.
+    """
+    name = column_ddl.split()[0]
+    columns = {row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({table})")}
+    if name not in columns:
+        connection.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column_ddl}")
+
+
+def table_definition(connection: Connection, table: str) -> str | None:
+    """CREATE TABLE statement of a table as SQLite stores it; None if there is no such table"""
+    return connection.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).scalar()
+
+
+def rebuild_table(
+    connection: Connection, table: str, definition: str, where: str | None = None
+) -> None:
+    """Replace a table by one created from ``definition``, keeping its rows.
+
+    SQLite cannot ALTER a column's collation, the foreign keys or the rowid of
+    a table, so the table is created anew under a temporary name, the columns
+    both tables have are copied (the rows matching ``where``, default all) and
+    it takes the old table's place. Indexes and triggers go with the old
+    table; the migration creates the ones it needs again. ``definition`` is
+    everything after the table name: the column list and options such as
+    WITHOUT ROWID.
+    """
+    staging = f"{table}_rebuild"
+    connection.exec_driver_sql(f"CREATE TABLE {staging} {definition}")
+    old = {row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({table})")}
+    columns = ", ".join(
+        row[1]
+        for row in connection.exec_driver_sql(f"PRAGMA table_info({staging})")
+        if row[1] in old
+    )
+    condition = f" WHERE {where}" if where else ""
+    connection.exec_driver_sql(
+        f"INSERT INTO {staging} ({columns}) SELECT {columns} FROM {table}{condition}"
+    )
+    connection.exec_driver_sql(f"DROP TABLE {table}")
+    connection.exec_driver_sql(f"ALTER TABLE {staging} RENAME TO {table}")
+    violations = connection.exec_driver_sql(f"PRAGMA foreign_key_check({table})").all()
+    if violations:
+        raise ValueError(f"Rebuilt {table} has rows without their parent: {violations[:10]}")
@@ -0,0 +1,39 @@
+"""Baseline: items, tags and the item_tags links
+
+The schema the app created before versioned migrations, with create_all on the
+first models. Every statement is a no-op on a database that already has it.
+"""
+
+from sqlalchemy import Connection
+
+TABLES = [
+    "CREATE TABLE IF NOT EXISTS items ("
+    "id INTEGER NOT NULL, "
+    "name VARCHAR NOT NULL, "
+    "description VARCHAR, "
+    "created_at DATETIME DEFAULT (CURRENT_TIMESTAMP), "
+    "updated_at DATETIME, "
+    "PRIMARY KEY (id))",
+    "CREATE INDEX IF NOT EXISTS ix_items_name ON items (name)",
+    "CREATE INDEX IF NOT EXISTS ix_items_id ON items (id)",
+    "CREATE TABLE IF NOT EXISTS tags ("
+    "id INTEGER NOT NULL, "
+    "name VARCHAR NOT NULL, "
+    "color VARCHAR NOT NULL, "
+    "created_at DATETIME DEFAULT (CURRENT_TIMESTAMP), "
+    "updated_at DATETIME, "
+    "PRIMARY KEY (id))",
+    "CREATE INDEX IF NOT EXISTS ix_tags_id ON tags (id)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_tags_name ON tags (name)",
+    "CREATE TABLE IF NOT EXISTS item_tags ("
+    "item_id INTEGER NOT NULL, "
+    "tag_id INTEGER NOT NULL, "
+    "PRIMARY KEY (item_id, tag_id), "
+    "FOREIGN KEY(item_id) REFERENCES items (id), "
+    "FOREIGN KEY(tag_id) REFERENCES tags (id))",
+]
+
+
+def upgrade(connection: Connection) -> None:
+    for statement in TABLES:
+        connection.exec_driver_sql(statement)
@@ -0,0 +1,31 @@
+"""Links: item_tags WITHOUT ROWID, ON DELETE CASCADE and the (tag_id, item_id) index
+
+Rows live in the primary key b-tree and the reverse index answers "items having
+tag X" from the index alone. Deleting an item or a tag removes its links in the
+database. Links whose item or tag no longer exists are dropped on the way.
+"""
+
+from sqlalchemy import Connection
+
+from app.shared.infrastructure.database.migrations.runner import (
+    rebuild_table,
+    table_definition,
+)
+
+DEFINITION = (
+    "(item_id INTEGER NOT NULL, "
+    "tag_id INTEGER NOT NULL, "
+    "PRIMARY KEY (item_id, tag_id), "
+    "FOREIGN KEY(item_id) REFERENCES items (id) ON DELETE CASCADE, "
+    "FOREIGN KEY(tag_id) REFERENCES tags (id) ON DELETE CASCADE) WITHOUT ROWID"
+)
+
+LIVE_LINKS = "item_id IN (SELECT id FROM items) AND tag_id IN (SELECT id FROM tags)"
+
+
+def upgrade(connection: Connection) -> None:
+    if "WITHOUT ROWID" not in table_definition(connection, "item_tags"):
+        rebuild_table(connection, "item_tags", DEFINITION, where=LIVE_LINKS)
+    connection.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_item_tags_tag_id_item_id ON item_tags (tag_id, item_id)"
+    )
@@ -0,0 +1,50 @@
+"""Tag names: NOCASE collation, so "Bug" and "bug" are the same tag
+
+Tags whose names differ only in ASCII case are merged into the oldest of them
+(lowest ID), which takes over their links, before the unique index is built
+again under the new collation.
+"""
+
+from sqlalchemy import Connection
+
+from app.shared.infrastructure.database.migrations.runner import (
+    rebuild_table,
+    table_definition,
+)
+
+DEFINITION = (
+    "(id INTEGER NOT NULL, "
+    'name VARCHAR COLLATE "NOCASE" NOT NULL, '
+    "color VARCHAR NOT NULL, "
+    "created_at DATETIME DEFAULT (CURRENT_TIMESTAMP), "
+    "updated_at DATETIME, "
+    "PRIMARY KEY (id))"
+)
+
+# lower() folds ASCII case only, like NOCASE
+KEPT = "SELECT min(id) FROM tags GROUP BY lower(name)"
+
+MERGE = [
+    "INSERT OR IGNORE INTO item_tags (item_id, tag_id) "
+    "SELECT item_tags.item_id, kept.id FROM item_tags "
+    "JOIN tags ON tags.id = item_tags.tag_id "
+    "JOIN (SELECT min(id) AS id, lower(name) AS name FROM tags GROUP BY lower(name)) AS kept "
+    "ON kept.name = lower(tags.name) "
+    "WHERE tags.id != kept.id",
+    f"DELETE FROM item_tags WHERE tag_id NOT IN ({KEPT})",
+]
+
+TABLE_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_tags_id ON tags (id)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_tags_name ON tags (name)",
+]
+
+
+def upgrade(connection: Connection) -> None:
+    if "NOCASE" in table_definition(connection, "tags"):
+        return
+    for statement in MERGE:
+        connection.exec_driver_sql(statement)
+    rebuild_table(connection, "tags", DEFINITION, where=f"id IN ({KEPT})")
+    for statement in TABLE_INDEXES:
+        connection.exec_driver_sql(statement)
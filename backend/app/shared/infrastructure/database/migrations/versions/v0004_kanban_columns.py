@@ -0,0 +1,17 @@
+"""Kanban: status and position on items, indexed for board order
+
+Existing items start in the todo column, unranked ("") at its top.
+"""
+
+from sqlalchemy import Connection
+
+from app.shared.infrastructure.database.migrations.runner import OnlineIndex, add_column
+
+INDEXES = [
+    OnlineIndex("ix_items_status_position", "items", ["status", "position"]),
+]
+
+
+def upgrade(connection: Connection) -> None:
+    add_column(connection, "items", "status VARCHAR DEFAULT 'todo' NOT NULL")
+    add_column(connection, "items", "position VARCHAR DEFAULT '' NOT NULL")
@@ -0,0 +1,51 @@
+"""Archive: items_archive, and AUTOINCREMENT IDs on items
+
+AUTOINCREMENT never hands out an ID again, so an archived item can be restored
+under its own ID. The sequence starts after the highest ID items holds.
+"""
+
+from sqlalchemy import Connection
+
+from app.shared.infrastructure.database.migrations.runner import (
+    rebuild_table,
+    table_definition,
+)
+
+DEFINITION = (
+    "(id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT, "
+    "name VARCHAR NOT NULL, "
+    "description VARCHAR, "
+    "created_at DATETIME DEFAULT (CURRENT_TIMESTAMP), "
+    "updated_at DATETIME, "
+    "status VARCHAR DEFAULT 'todo' NOT NULL, "
+    "position VARCHAR DEFAULT '' NOT NULL)"
+)
+
+TABLE_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_items_name ON items (name)",
+    "CREATE INDEX IF NOT EXISTS ix_items_status_position ON items (status, position)",
+    "CREATE INDEX IF NOT EXISTS ix_items_id ON items (id)",
+]
+
+ARCHIVE = (
+    "CREATE TABLE IF NOT EXISTS items_archive ("
+    "id INTEGER NOT NULL, "
+    "name VARCHAR NOT NULL, "
+    "description VARCHAR, "
+    "created_at DATETIME, "
+    "updated_at DATETIME, "
+    "status VARCHAR NOT NULL, "
+    "position VARCHAR NOT NULL, "
+    "tag_ids VARCHAR DEFAULT '[]' NOT NULL, "
+    "archived_at DATETIME DEFAULT (CURRENT_TIMESTAMP), "
+    "PRIMARY KEY (id))"
+)
+
+
+def upgrade(connection: Connection) -> None:
+    # Copying the rows with their IDs moves the sequence past the highest one
+    if "AUTOINCREMENT" not in table_definition(connection, "items"):
+        rebuild_table(connection, "items", DEFINITION)
+        for statement in TABLE_INDEXES:
+            connection.exec_driver_sql(statement)
+    connection.exec_driver_sql(ARCHIVE)
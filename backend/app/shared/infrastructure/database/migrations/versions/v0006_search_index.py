@@ -0,0 +1,15 @@
+"""Search: the items_fts full-text index over item names and descriptions
+
+Existing items are indexed when the index is created.
+"""
+
+from sqlalchemy import Connection
+
+from app.items.infrastructure.database.search_index import ensure_search_index
+from app.shared.infrastructure.database.settings import get_database_settings
+
+
+def upgrade(connection: Connection) -> None:
+    # The index follows the configured tokenizer; switch it with the
+    # search_index command rather than a migration
+    ensure_search_index(connection, get_database_settings().search_tokenizer)
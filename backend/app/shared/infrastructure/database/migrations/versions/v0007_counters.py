@@ -0,0 +1,63 @@
+"""Counts: the counters table, its triggers and the table versions
+
+Triggers keep the number of items, of items per status, of tags and of items
+per tag, and bump a version counter on every write to items, tags and
+item_tags. The counts of existing rows are taken once.
+"""
+
+from sqlalchemy import Connection
+
+COUNTERS = (
+    "CREATE TABLE IF NOT EXISTS counters ("
+    "name VARCHAR NOT NULL, "
+    "value INTEGER NOT NULL, "
+    "PRIMARY KEY (name)) WITHOUT ROWID"
+)
+
+_INCREMENT = (
+    "INSERT INTO counters(name, value) VALUES ({}, 1) "
+    "ON CONFLICT(name) DO UPDATE SET value = value + 1;"
+)
+_DECREMENT = "UPDATE counters SET value = value - 1 WHERE name = {};"
+
+TRIGGERS = {
+    "items_count_ai": "AFTER INSERT ON items BEGIN "
+    f"{_INCREMENT.format("'items'")} {_INCREMENT.format("'items:' || new.status")} END",
+    "items_count_ad": "AFTER DELETE ON items BEGIN "
+    f"{_DECREMENT.format("'items'")} {_DECREMENT.format("'items:' || old.status")} END",
+    "items_count_au": "AFTER UPDATE OF status ON items WHEN old.status IS NOT new.status BEGIN "
+    f"{_DECREMENT.format("'items:' || old.status")} "
+    f"{_INCREMENT.format("'items:' || new.status")} END",
+    "tags_count_ai": f"AFTER INSERT ON tags BEGIN {_INCREMENT.format("'tags'")} END",
+    "tags_count_ad": f"AFTER DELETE ON tags BEGIN {_DECREMENT.format("'tags'")} "
+    "DELETE FROM counters WHERE name = 'tag_items:' || old.id; END",
+    "item_tags_count_ai": "AFTER INSERT ON item_tags BEGIN "
+    f"{_INCREMENT.format("'tag_items:' || new.tag_id")} END",
+    "item_tags_count_ad": "AFTER DELETE ON item_tags BEGIN "
+    f"{_DECREMENT.format("'tag_items:' || old.tag_id")} END",
+    **{
+        f"{table}_version_{suffix}": f"AFTER {event} ON {table} BEGIN "
+        f"{_INCREMENT.format(f"'version:{table}'")} END"
+        for table in ("items", "tags", "item_tags")
+        for suffix, event in [("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE")]
+    },
+}
+
+RECOUNT = [
+    "DELETE FROM counters WHERE name IN ('items', 'tags') "
+    "OR name LIKE 'items:%' OR name LIKE 'tag_items:%'",
+    "INSERT INTO counters(name, value) SELECT 'items', count(*) FROM items",
+    "INSERT INTO counters(name, value) "
+    "SELECT 'items:' || status, count(*) FROM items GROUP BY status",
+    "INSERT INTO counters(name, value) SELECT 'tags', count(*) FROM tags",
+    "INSERT INTO counters(name, value) "
+    "SELECT 'tag_items:' || tag_id, count(*) FROM item_tags GROUP BY tag_id",
+]
+
+
+def upgrade(connection: Connection) -> None:
+    connection.exec_driver_sql(COUNTERS)
+    for name, body in TRIGGERS.items():
+        connection.exec_driver_sql(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+    for statement in RECOUNT:
+        connection.exec_driver_sql(statement)
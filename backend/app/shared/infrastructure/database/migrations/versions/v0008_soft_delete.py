@@ -0,0 +1,84 @@
+"""Soft delete: deleted_at on items and tags, live-row indexes and counts
+
+Indexes on live rows become partial (WHERE deleted_at IS NULL), so tombstones
+stay out of the board, name and tag-name lookups and a deleted tag's name can
+be reused. The counter triggers skip tombstones.
+"""
+
+from sqlalchemy import Connection
+
+from app.shared.infrastructure.database.migrations.runner import OnlineIndex, add_column
+
+LIVE = "deleted_at IS NULL"
+TOMBSTONE = "deleted_at IS NOT NULL"
+
+INDEXES = [
+    OnlineIndex("ix_items_status_position", "items", ["status", "position"], where=LIVE),
+    OnlineIndex("ix_items_name", "items", ["name"], where=LIVE),
+    OnlineIndex("ix_items_deleted_at", "items", ["deleted_at"], where=TOMBSTONE),
+    OnlineIndex("ix_tags_name", "tags", ["name"], where=LIVE, unique=True),
+    OnlineIndex("ix_tags_deleted_at", "tags", ["deleted_at"], where=TOMBSTONE),
+]
+
+_INCREMENT = (
+    "INSERT INTO counters(name, value) VALUES ({}, 1) "
+    "ON CONFLICT(name) DO UPDATE SET value = value + 1;"
+)
+_DECREMENT = "UPDATE counters SET value = value - 1 WHERE name = {};"
+_BECOMES_TOMBSTONE = "WHEN old.deleted_at IS NULL AND new.deleted_at IS NOT NULL"
+
+TRIGGERS = {
+    "items_count_ai": "AFTER INSERT ON items WHEN new.deleted_at IS NULL BEGIN "
+    f"{_INCREMENT.format("'items'")} {_INCREMENT.format("'items:' || new.status")} END",
+    "items_count_ad": "AFTER DELETE ON items WHEN old.deleted_at IS NULL BEGIN "
+    f"{_DECREMENT.format("'items'")} {_DECREMENT.format("'items:' || old.status")} END",
+    "items_count_au": "AFTER UPDATE OF status ON items "
+    "WHEN old.status IS NOT new.status AND new.deleted_at IS NULL BEGIN "
+    f"{_DECREMENT.format("'items:' || old.status")} "
+    f"{_INCREMENT.format("'items:' || new.status")} END",
+    "items_count_tombstone": f"AFTER UPDATE OF deleted_at ON items {_BECOMES_TOMBSTONE} BEGIN "
+    f"{_DECREMENT.format("'items'")} {_DECREMENT.format("'items:' || old.status")} END",
+    "tags_count_ai": "AFTER INSERT ON tags WHEN new.deleted_at IS NULL BEGIN "
+    f"{_INCREMENT.format("'tags'")} END",
+    "tags_count_ad": "AFTER DELETE ON tags WHEN old.deleted_at IS NULL BEGIN "
+    f"{_DECREMENT.format("'tags'")} "
+    "DELETE FROM counters WHERE name = 'tag_items:' || old.id; END",
+    "tags_count_tombstone": f"AFTER UPDATE OF deleted_at ON tags {_BECOMES_TOMBSTONE} BEGIN "
+    f"{_DECREMENT.format("'tags'")} "
+    "DELETE FROM counters WHERE name = 'tag_items:' || old.id; END",
+    "item_tags_count_ad": "AFTER DELETE ON item_tags WHEN NOT EXISTS "
+    "(SELECT 1 FROM items WHERE id = old.item_id AND deleted_at IS NOT NULL) BEGIN "
+    f"{_DECREMENT.format("'tag_items:' || old.tag_id")} END",
+    "item_tags_count_tombstone": f"AFTER UPDATE OF deleted_at ON items {_BECOMES_TOMBSTONE} BEGIN "
+    "UPDATE counters SET value = value - 1 WHERE name IN "
+    "(SELECT 'tag_items:' || tag_id FROM item_tags WHERE item_id = new.id); END",
+}
+
+RECOUNT = [
+    "DELETE FROM counters WHERE name IN ('items', 'tags') "
+    "OR name LIKE 'items:%' OR name LIKE 'tag_items:%'",
+    "INSERT INTO counters(name, value) "
+    "SELECT 'items', count(*) FROM items WHERE deleted_at IS NULL",
+    "INSERT INTO counters(name, value) "
+    "SELECT 'items:' || status, count(*) FROM items WHERE deleted_at IS NULL GROUP BY status",
+    "INSERT INTO counters(name, value) SELECT 'tags', count(*) FROM tags WHERE deleted_at IS NULL",
+    "INSERT INTO counters(name, value) "
+    "SELECT 'tag_items:' || item_tags.tag_id, count(*) FROM item_tags "
+    "JOIN items ON items.id = item_tags.item_id "
+    "JOIN tags ON tags.id = item_tags.tag_id "
+    "WHERE items.deleted_at IS NULL AND tags.deleted_at IS NULL "
+    "GROUP BY item_tags.tag_id",
+]
+
+
+def upgrade(connection: Connection) -> None:
+    add_column(connection, "items", "deleted_at DATETIME")
+    add_column(connection, "tags", "deleted_at DATETIME")
+    # Rebuilt as partial indexes by INDEXES, in the same transaction
+    for index in INDEXES:
+        connection.exec_driver_sql(f"DROP INDEX IF EXISTS {index.name}")
+    for name, body in TRIGGERS.items():
+        connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+        connection.exec_driver_sql(f"CREATE TRIGGER {name} {body}")
+    for statement in RECOUNT:
+        connection.exec_driver_sql(statement)
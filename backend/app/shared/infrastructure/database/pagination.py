@@ -0,0 +1,36 @@
+from sqlalchemy import ColumnElement, Select, tuple_
+
+from app.shared.domain.pagination import Page, PageCursor
+
+
+def apply_keyset(
+    statement: Select,
+    sort_column: ColumnElement,
+    id_column: ColumnElement,
+    after: PageCursor | None,
+    limit: int,
+) -> Select:
+    """Order a query by (sort_column, id) and start it after the cursor.
+
+    One extra row is fetched so to_page can tell whether another page exists.
+    The seek condition lets SQLite start from the index position instead of
+    scanning and discarding the rows of all previous pages.
+    """
+    if sort_column is id_column:
+        order_by = [id_column]
+        seek = id_column > after.id if after else None
+    else:
+        order_by = [sort_column, id_column]
+        seek = tuple_(sort_column, id_column) > tuple_(after.value, after.id) if after else None
+    if seek is not None:
+        statement = statement.where(seek)
+    return statement.order_by(*order_by).limit(limit + 1)
+
+
+def to_page(rows: list, limit: int, sort: str) -> Page:
+    """Trim the extra row fetched by apply_keyset and build the next cursor"""
+    if len(rows) <= limit:
+        return Page(rows)
+    rows = rows[:limit]
+    last = rows[-1]
+    return Page(rows, PageCursor(sort=sort, value=getattr(last, sort), id=last.id))
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+
+logger = logging.getLogger(__name__)
+
+# Purges the tombstones of one table older than a retention window, ``batch_size``
+# rows per transaction, returning how many rows went
+type PurgeJob = Callable[[timedelta, int], Awaitable[int]]
+
+
+class TombstonePurger:
+    """Runs the tombstone purge jobs every ``interval`` seconds in a background task.
+
+    Deletes only mark rows, so request latency does not depend on how much a
+    delete cascades; the rows, their links and their search entries are
+    removed here, in short transactions between regular writes. A failing job
+    is logged and tried again on the next round. An interval of 0 disables it.
+    """
+
+    def __init__(
+        self,
+        jobs: list[PurgeJob],
+        retention: timedelta,
+        batch_size: int = 500,
+        interval: float = 3600.0,
+    ):
+        self.jobs = jobs
+        self.retention = retention
+        self.batch_size = batch_size
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the background task, unless it runs already or purging is disabled"""
+        if self.interval > 0 and (self._task is None or self._task.done()):
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the background task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def purge(self) -> int:
+        """Run every job once, returning how many rows were purged"""
+        purged = 0
+        for job in self.jobs:
+            try:
+                purged += await job(self.retention, self.batch_size)
+            except Exception:
+                logger.exception("Purging tombstones with %s failed", job.__name__)
+        return purged
+
+    async def _run(self) -> None:
+        """Purge once per interval"""
+        while True:
+            await asyncio.sleep(self.interval)
+            purged = await self.purge()
+            if purged:
+                logger.info("Purged %d tombstones", purged)
@@ -0,0 +1,100 @@
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from .engine import create_async_reader_engine, create_async_writer_engine
+from .group_commit import WRITE_TRANSACTION, GroupCommitWriter
+from .settings import DatabaseSettings
+
+
+class RoutingSession(Session):
+    """Session that sends reads to the reader engine and writes to the writer engine.
+
+    A transaction sticks to the writer once it has flushed or executed an
+    INSERT/UPDATE/DELETE, so it always reads its own uncommitted writes. A
+    transaction opened by run_write uses the writer from its first statement.
+    """
+
+    def __init__(self, *args, writer: Engine, reader: Engine, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.writer = writer
+        self.reader = reader
+        self._uses_writer = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs) -> Engine:
+        """Pick the engine for a statement"""
+        if (
+            self._uses_writer
+            or self._flushing
+            or self.info.get(WRITE_TRANSACTION)
+            or isinstance(clause, UpdateBase)
+        ):
+            self._uses_writer = True
+            return self.writer
+        return self.reader
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _release_writer(session: RoutingSession, transaction) -> None:
+    """Route reads back to the readers once the outermost transaction ends"""
+    if transaction.parent is None:
+        session._uses_writer = False
+
+
+class Database:
+    """Engines and session factory of one SQLite database.
+
+    File databases get one serialized writer connection plus a pool of
+    read-only connections; in-memory databases use a single engine. When
+    group commit is enabled, repository mutations are funneled through a
+    GroupCommitWriter bound to the writer engine.
+    """
+
+    def __init__(self, settings: DatabaseSettings):
+        self.settings = settings
+        self.writer_engine: AsyncEngine = create_async_writer_engine(settings)
+        if settings.uses_split_reads:
+            self.reader_engine: AsyncEngine = create_async_reader_engine(settings)
+            self.session_factory = async_sessionmaker(
+                class_=AsyncSession,
+                sync_session_class=RoutingSession,
+                writer=self.writer_engine.sync_engine,
+                reader=self.reader_engine.sync_engine,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+        else:
+            self.reader_engine = self.writer_engine
+            self.session_factory = async_sessionmaker(
+                bind=self.writer_engine,
+                class_=AsyncSession,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+
+        self.writer_session_factory = async_sessionmaker(
+            bind=self.writer_engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        self.group_commit: GroupCommitWriter | None = None
+        if settings.group_commit:
+            self.group_commit = GroupCommitWriter(
+                self.writer_session_factory,
+                max_batch_size=settings.group_commit_max_batch,
+                max_latency=settings.group_commit_max_latency_ms / 1000,
+            )
+
+    def session(self) -> AsyncSession:
+        """Open a new session"""
+        return self.session_factory()
+
+    async def dispose(self) -> None:
+        """Stop the group commit writer and close all pooled connections"""
+        if self.group_commit is not None:
+            await self.group_commit.close()
+        await self.writer_engine.dispose()
+        if self.reader_engine is not self.writer_engine:
+            await self.reader_engine.dispose()
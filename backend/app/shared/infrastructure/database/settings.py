@@ -0,0 +1,138 @@
+from functools import lru_cache
+from typing import Literal
+
+from pydantic import BaseModel
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy import make_url
+
+DatabaseProfile = Literal["dev", "test", "prod"]
+SearchTokenizer = Literal["unicode61", "trigram"]
+RepositoryBackend = Literal["sqlite", "memory"]
+
+
+class SQLitePragmas(BaseModel):
+    """PRAGMA values applied to every new SQLite connection"""
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size: int = -16000  # negative values are KiB, so 16 MiB of page cache
+    mmap_size: int = 134217728  # 128 MiB
+    temp_store: str = "MEMORY"
+    busy_timeout: int = 5000  # milliseconds
+    foreign_keys: bool = True
+
+
+# Named tuning profiles; individual values can still be overridden through settings
+PROFILES: dict[str, SQLitePragmas] = {
+    "dev": SQLitePragmas(),
+    "test": SQLitePragmas(
+        journal_mode="MEMORY",
+        synchronous="OFF",
+        mmap_size=0,
+        busy_timeout=1000,
+    ),
+    "prod": SQLitePragmas(
+        cache_size=-64000,
+        mmap_size=1073741824,  # 1 GiB
+    ),
+}
+
+
+class DatabaseSettings(BaseSettings):
+    """Database configuration, read from DATABASE_* environment variables or .env"""
+
+    model_config = SettingsConfigDict(env_prefix="DATABASE_", env_file=".env", extra="ignore")
+
+    url: str = "sqlite:///./app.db"
+    profile: DatabaseProfile = "dev"
+
+    # Where the repositories keep the data: "memory" serves every board from
+    # process memory (gone on restart), for demos, ephemeral deployments and benchmarks
+    backend: RepositoryBackend = "sqlite"
+
+    # Repository caches: tag and item lookups are kept per board in LRU caches of
+    # cache_max_entries entries for cache_ttl_seconds, cleared by this process's
+    # writes and by a GET seeing a new data version (an ETag), and expired after
+    # the TTL in any case. Only with the sqlite backend
+    cache_repositories: bool = False
+    cache_max_entries: int = 1024
+    cache_ttl_seconds: float = 30.0
+
+    # Read/write split: one serialized writer connection plus a pool of read-only readers
+    split_reads: bool = True
+    read_pool_size: int = 4
+    writer_queue_timeout: float = 30.0  # seconds a write waits for the writer connection
+
+    # Group commit: batch concurrent mutations into one transaction
+    group_commit: bool = False
+    group_commit_max_batch: int = 64
+    group_commit_max_latency_ms: float = 2.0
+
+    # FTS5 tokenizer of the item search index; trigram also matches inside words
+    search_tokenizer: SearchTokenizer = "unicode61"
+
+    # Boards: every board is a SQLite file of its own in boards_dir. At most
+    # max_open_boards are kept open, each holding up to 1 + 2 * read_pool_size
+    # connections, which caps the open file handles
+    boards_dir: str = "./boards"
+    max_open_boards: int = 32
+
+    # Apply pending schema migrations when the app starts; turn off to run them
+    # from the migrations command instead
+    migrate_on_startup: bool = True
+
+    # Online backups: every database is copied into its own directory under
+    # backup_dir, backup_step_pages pages per step with backup_step_pause_ms
+    # between steps, every backup_interval_seconds (0 disables it); only the
+    # newest backup_keep backups are kept
+    backup_dir: str = "./backups"
+    backup_keep: int = 7
+    backup_interval_seconds: float = 0.0
+    backup_step_pages: int = 1024
+    backup_step_pause_ms: float = 5.0
+
+    # Soft delete: tombstones older than the retention window are purged in the
+    # background every purge_interval_seconds (0 disables it), purge_batch_size
+    # rows per transaction
+    tombstone_retention_days: int = 30
+    purge_interval_seconds: float = 3600.0
+    purge_batch_size: int = 500
+
+    # Optional per-pragma overrides on top of the selected profile
+    journal_mode: str | None = None
+    synchronous: str | None = None
+    cache_size: int | None = None
+    mmap_size: int | None = None
+    temp_store: str | None = None
+    busy_timeout: int | None = None
+    foreign_keys: bool | None = None
+
+    @property
+    def async_url(self) -> str:
+        """URL using the aiosqlite driver for the async engine"""
+        if self.url.startswith("sqlite://"):
+            return self.url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+        return self.url
+
+    @property
+    def uses_split_reads(self) -> bool:
+        """Whether a separate read-only engine can be used (needs a file-backed database)"""
+        database = make_url(self.url).database
+        in_memory = not database or database == ":memory:" or "mode=memory" in self.url
+        return self.split_reads and not in_memory
+
+    @property
+    def pragmas(self) -> SQLitePragmas:
+        """Pragmas of the selected profile with explicit overrides applied"""
+        overrides = {
+            name: value
+            for name in SQLitePragmas.model_fields
+            if (value := getattr(self, name)) is not None
+        }
+        return PROFILES[self.profile].model_copy(update=overrides)
+
+
+@lru_cache
+def get_database_settings() -> DatabaseSettings:
+    """Return the cached database settings"""
+    return DatabaseSettings()
@@ -0,0 +1,173 @@
+# Per-board databases.
+#
+# Every board is a SQLite file of its own in boards_dir, with its own write lock,
+# so writes to different boards never wait for each other. The API serves a board
+# under /boards/{board_id}; the unprefixed paths keep serving the database of
+# settings.url as the default board.
+#
+# ShardRouter opens a board's Database (writer engine, read pool and group commit
+# writer) on first use and keeps the max_open_boards most recently used ones
+# open. Closing the least recently used board caps the number of open file
+# handles; a board is never closed while a request or job holds a lease on it.
+# Opening a board migrates its file first: only leases of that board wait for
+# it, under the board's own lock. The router lock guards the bookkeeping alone.
+
+import asyncio
+import re
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from app.shared.domain.boards import BOARD_ID_PATTERN
+
+from .engine import create_db_engine
+from .migrations import upgrade
+from .routing import Database
+from .settings import DatabaseSettings
+
+BOARD_PREFIX = "/boards/{board_id}"
+
+
+def board_path(board_id: str | None, path: str) -> str:
+    """API path of a resource of a board; unprefixed for the default board"""
+    if board_id is None:
+        return path
+    return BOARD_PREFIX.format(board_id=board_id) + path
+
+
+def migrate(settings: DatabaseSettings) -> list[int]:
+    """Apply the pending migrations to the database of settings"""
+    engine = create_db_engine(settings)
+    try:
+        return upgrade(engine)
+    finally:
+        engine.dispose()
+
+
+class ShardRouter:
+    """Databases keyed by board ID, opened on demand and closed least recently used first"""
+
+    def __init__(self, settings: DatabaseSettings, default: Database):
+        self.settings = settings
+        self.default = default
+        self.directory = Path(settings.boards_dir)
+        self.max_open = settings.max_open_boards
+        self._open: OrderedDict[str, Database] = OrderedDict()
+        self._leases: Counter[str] = Counter()
+        self._lock = asyncio.Lock()
+        # One per board ever created or opened, held while its file is migrated
+        self._board_locks: dict[str, asyncio.Lock] = {}
+
+    def board_settings(self, board_id: str) -> DatabaseSettings:
+        """Settings of a board's database: the shared ones, pointed at its file"""
+        if not re.fullmatch(BOARD_ID_PATTERN, board_id):
+            raise ValueError(f"Invalid board ID: {board_id!r}")
+        path = self.directory / f"{board_id}.db"
+        return self.settings.model_copy(update={"url": f"sqlite:///{path}"})
+
+    def exists(self, board_id: str) -> bool:
+        """Whether a board of that ID has been created"""
+        if not re.fullmatch(BOARD_ID_PATTERN, board_id):
+            return False
+        return (self.directory / f"{board_id}.db").is_file()
+
+    def board_ids(self) -> list[str]:
+        """IDs of every created board, sorted"""
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            path.stem
+            for path in self.directory.glob("*.db")
+            if re.fullmatch(BOARD_ID_PATTERN, path.stem)
+        )
+
+    async def create(self, board_id: str) -> None:
+        """Create a board's database file with the current schema"""
+        settings = self.board_settings(board_id)
+        async with self._board_lock(board_id):
+            if self.exists(board_id):
+                raise ValueError(f"Board {board_id!r} already exists")
+            self.directory.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(migrate, settings)
+
+    @asynccontextmanager
+    async def lease(self, board_id: str | None = None) -> AsyncIterator[Database]:
+        """Hold a board's database open; None is the default board.
+
+        Raises KeyError for a board that was never created.
+        """
+        if board_id is None:
+            yield self.default
+            return
+        async with self._lock:
+            database = self._claim(board_id)
+        if database is None:
+            if not self.exists(board_id):
+                raise KeyError(board_id)
+            async with self._board_lock(board_id):
+                # Another lease may have opened it while this one waited
+                async with self._lock:
+                    database = self._claim(board_id)
+                if database is None:
+                    opened = await self._connect(board_id)
+                    async with self._lock:
+                        self._open[board_id] = opened
+                        database = self._claim(board_id)
+        async with self._lock:
+            closing = self._take_closable()
+        await _dispose_all(closing)
+        try:
+            yield database
+        finally:
+            self._leases[board_id] -= 1
+            async with self._lock:
+                closing = self._take_closable()
+            await _dispose_all(closing)
+
+    def open_board_ids(self) -> list[str]:
+        """IDs of the boards whose database is open, least recently used first"""
+        return list(self._open)
+
+    async def dispose(self) -> None:
+        """Close every open board database; the default one is left to its owner"""
+        async with self._lock:
+            closing = list(self._open.values())
+            self._open.clear()
+        await _dispose_all(closing)
+
+    async def _connect(self, board_id: str) -> Database:
+        """Open a board's database, migrating it first if migrations run on startup"""
+        settings = self.board_settings(board_id)
+        if settings.migrate_on_startup:
+            await asyncio.to_thread(migrate, settings)
+        return Database(settings)
+
+    def _board_lock(self, board_id: str) -> asyncio.Lock:
+        """Lock held while a board's file is created or migrated"""
+        return self._board_locks.setdefault(board_id, asyncio.Lock())
+
+    def _claim(self, board_id: str) -> Database | None:
+        """Lease a board if its database is open, marking it most recently used"""
+        database = self._open.get(board_id)
+        if database is not None:
+            self._open.move_to_end(board_id)
+            self._leases[board_id] += 1
+        return database
+
+    def _take_closable(self) -> list[Database]:
+        """Remove the least recently used boards nobody holds, down to max_open"""
+        closing = []
+        for board_id in list(self._open):
+            if len(self._open) <= self.max_open:
+                break
+            if self._leases[board_id] == 0:
+                closing.append(self._open.pop(board_id))
+                del self._leases[board_id]
+        return closing
+
+
+async def _dispose_all(databases: list[Database]) -> None:
+    """Close the connections and group commit writers of databases"""
+    for database in databases:
+        await database.dispose()
@@ -0,0 +1,15 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def begin_read_snapshot(session: AsyncSession) -> None:
+    """Open an explicit read transaction so the following SELECTs see one snapshot.
+
+    The sqlite3 driver only starts transactions before writes, so consecutive
+    SELECTs on a session each read the latest committed state. A deferred BEGIN
+    pins the snapshot at the first read until the session ends its transaction;
+    with split reads it holds on to the reader connection like any transaction.
+    """
+    if session.get_bind().dialect.name != "sqlite":
+        return
+    await session.execute(text("BEGIN"))
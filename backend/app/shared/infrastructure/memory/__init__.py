@@ -0,0 +1,3 @@
+from .store import MemoryStore, SortedIndex, TaggedItem
+
+__all__ = ["MemoryStore", "SortedIndex", "TaggedItem"]
@@ -0,0 +1,20 @@
+from collections.abc import Sequence
+
+from app.shared.domain.data_version import DataVersionService
+
+from .store import MemoryStore
+
+
+class InMemoryDataVersionService(DataVersionService):
+    """Versions from a MemoryStore's write counters.
+
+    The counters restart at 0 with the process, so the store's random epoch
+    leads the version: versions handed out before a restart never match again.
+    """
+
+    def __init__(self, store: MemoryStore):
+        self.store = store
+
+    async def get_version(self, tables: Sequence[str]) -> str:
+        """The store's epoch and the tables' write counters joined by dots"""
+        return ".".join([self.store.epoch, *(str(self.store.versions[table]) for table in tables)])
@@ -0,0 +1,401 @@
+# In-memory storage of a board, for ephemeral, demo and benchmark deployments.
+#
+# MemoryStore keeps the live items and tags in dicts, plus the secondary indexes
+# the SQLite schema has: the unique case-insensitive tag names, the item_tags
+# links in both directions and one sorted key list per keyset order. Pages,
+# lookups and counts therefore never scan every row. Everything is lost when the
+# process exits.
+#
+# Repositories only touch the store from synchronous code between awaits, so on
+# one event loop every repository call is applied atomically without locking.
+
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from heapq import merge
+from itertools import count, islice
+from secrets import token_hex
+from typing import Any
+
+from app.items.domain.entities.item import ITEM_STATUSES, Item
+from app.shared.domain.pagination import PageCursor
+from app.tags.domain.entities.tag import Tag
+
+
+def utc_now() -> datetime:
+    """Current time as naive UTC, the way SQLite stores it"""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def name_key(name: str) -> str:
+    """Tag name as compared by the NOCASE collation, which folds ASCII letters only"""
+    return name.translate(_ASCII_LOWER)
+
+
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+class SortedIndex:
+    """Keys kept in sorted order, like the entries of a b-tree index"""
+
+    def __init__(self):
+        self.keys: list = []
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key) -> None:
+        """Insert a key at its place"""
+        insort(self.keys, key)
+
+    def remove(self, key) -> None:
+        """Remove a key, if present"""
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            del self.keys[index]
+
+    def after(self, key=None) -> Iterator:
+        """Keys greater than ``key`` in ascending order, all of them without one"""
+        start = 0 if key is None else bisect_right(self.keys, key)
+        for index in range(start, len(self.keys)):
+            yield self.keys[index]
+
+    def last(self):
+        """Greatest key, or None if the index is empty"""
+        return self.keys[-1] if self.keys else None
+
+
+class TaggedItem(Item):
+    """An item read from the store together with its live tags"""
+
+    def __init__(self, item: Item, tags: list[Tag]):
+        super().__init__(
+            name=item.name,
+            description=item.description,
+            id=item.id,
+            created_at=item.created_at,
+            updated_at=item.updated_at,
+            status=item.status,
+            position=item.position,
+        )
+        self.tags = tags
+
+
+class ArchivedItem:
+    """An item moved out of the live items, with the IDs of its tags at the time"""
+
+    def __init__(self, item: Item, tag_ids: list[int], archived_at: datetime):
+        self.item = item
+        self.tag_ids = tag_ids
+        self.archived_at = archived_at
+
+
+class MemoryStore:
+    """Items, tags, their links, tombstones and archive of one board, indexed.
+
+    The methods keep every index in step with the rows; adapters read the
+    indexes directly but change rows only through the methods.
+    """
+
+    def __init__(self):
+        self.items: dict[int, Item] = {}
+        self.tags: dict[int, Tag] = {}
+        self.item_tombstones: dict[int, datetime] = {}
+        self.tag_tombstones: dict[int, datetime] = {}
+        self.archive: dict[int, ArchivedItem] = {}
+
+        # Keyset orders: item IDs, (name, id), (position, id) per column,
+        # tag IDs and (NOCASE name, id)
+        self.item_ids = SortedIndex()
+        self.item_names = SortedIndex()
+        self.columns: dict[str, SortedIndex] = {status: SortedIndex() for status in ITEM_STATUSES}
+        self.tag_ids = SortedIndex()
+        self.tag_names = SortedIndex()
+
+        # Unique live tag names, and the links in both directions
+        self.tag_id_by_name: dict[str, int] = {}
+        self.item_ids_by_tag: dict[int, set[int]] = {}
+        self.tag_ids_by_item: dict[int, set[int]] = {}
+
+        # Bumped by every write to a table, like the version counters of SQLite;
+        # the epoch tells the counters of this store from those of an earlier one
+        self.versions: Counter[str] = Counter()
+        self.epoch = token_hex(4)
+
+        self._next_item_id = count(1)
+        self._next_tag_id = count(1)
+
+    # Items
+
+    def add_item(self, item: Item, item_id: int | None = None) -> Item:
+        """Store a copy of a new item under a fresh ID (or the given one)"""
+        stored = Item(
+            name=item.name,
+            description=item.description,
+            id=item_id if item_id is not None else next(self._next_item_id),
+            created_at=item.created_at or utc_now(),
+            updated_at=item.updated_at,
+            status=item.status,
+            position=item.position,
+        )
+        self.items[stored.id] = stored
+        self.tag_ids_by_item[stored.id] = set()
+        self._index_item(stored)
+        self.versions["items"] += 1
+        return stored
+
+    def change_item(self, item_id: int, **fields: Any) -> Item | None:
+        """Set fields of a live item, moving its index entries along"""
+        item = self.items.get(item_id)
+        if item is None:
+            return None
+        self._unindex_item(item)
+        for name, value in fields.items():
+            setattr(item, name, value)
+        self._index_item(item)
+        self.versions["items"] += 1
+        return item
+
+    def remove_item(self, item_id: int) -> bool:
+        """Unlink and unindex a live item; the caller decides whether it leaves a tombstone"""
+        item = self.items.pop(item_id, None)
+        if item is None:
+            return False
+        self._unindex_item(item)
+        for tag_id in self.tag_ids_by_item.pop(item_id):
+            self.item_ids_by_tag[tag_id].discard(item_id)
+        self.versions["items"] += 1
+        self.versions["item_tags"] += 1
+        return True
+
+    def delete_item(self, item_id: int) -> bool:
+        """Turn a live item into a tombstone"""
+        if not self.remove_item(item_id):
+            return False
+        self.item_tombstones[item_id] = utc_now()
+        return True
+
+    def item_id_taken(self, item_id: int) -> bool:
+        """Whether a live item or a tombstone holds the ID"""
+        return item_id in self.items or item_id in self.item_tombstones
+
+    def tagged(self, item: Item) -> TaggedItem:
+        """Copy of an item with its live tags, in tag ID order"""
+        tag_ids = sorted(self.tag_ids_by_item.get(item.id, ()))
+        return TaggedItem(item, [self._copy_tag(self.tags[tag_id]) for tag_id in tag_ids])
+
+    def last_position(self, status: str) -> str | None:
+        """Position of the bottom card of a column"""
+        last = self.columns[status].last()
+        return last[0] if last else None
+
+    def ordered_item_ids(
+        self,
+        sort: str,
+        after: PageCursor | None = None,
+        tag_id: int | None = None,
+        status: str | None = None,
+    ) -> Iterator[int]:
+        """IDs of the live items in (sort, id) order after the cursor, lazily.
+
+        Without a tag this walks the sorted index of the order from the cursor
+        on; a status with sort="position" walks that column's index alone. With
+        a tag only the tag's items are looked at.
+        """
+        if tag_id is not None:
+            item_ids = self.item_ids_by_tag.get(tag_id, set())
+            keys = sorted(
+                key
+                for key in map(self._item_key(sort), item_ids)
+                if (status is None or self.items[_key_id(key)].status == status)
+                and (after is None or key > _seek(sort, after))
+            )
+            yield from map(_key_id, keys)
+            return
+
+        seek = None if after is None else _seek(sort, after)
+        if sort == "position" and status is not None:
+            keys = self.columns[status].after(seek)
+            status = None
+        elif sort == "position":
+            keys = merge(*(column.after(seek) for column in self.columns.values()))
+        else:
+            keys = (self.item_ids if sort == "id" else self.item_names).after(seek)
+        for key in keys:
+            item_id = _key_id(key)
+            if status is None or self.items[item_id].status == status:
+                yield item_id
+
+    # Links
+
+    def link(self, item_id: int, tag_id: int) -> bool:
+        """Link a live item to a live tag; False if either is missing or already linked"""
+        if item_id not in self.items or tag_id not in self.tags:
+            return False
+        tag_ids = self.tag_ids_by_item[item_id]
+        if tag_id in tag_ids:
+            return False
+        tag_ids.add(tag_id)
+        self.item_ids_by_tag[tag_id].add(item_id)
+        self.versions["item_tags"] += 1
+        return True
+
+    def unlink(self, item_id: int, tag_id: int) -> bool:
+        """Remove a link; False if there was none"""
+        tag_ids = self.tag_ids_by_item.get(item_id)
+        if tag_ids is None or tag_id not in tag_ids:
+            return False
+        tag_ids.discard(tag_id)
+        self.item_ids_by_tag[tag_id].discard(item_id)
+        self.versions["item_tags"] += 1
+        return True
+
+    def set_tags(self, item_id: int, tag_ids: list[int]) -> None:
+        """Make the live ones of tag_ids the item's tags"""
+        wanted = set(tag_ids)
+        for tag_id in self.tag_ids_by_item[item_id] - wanted:
+            self.unlink(item_id, tag_id)
+        for tag_id in tag_ids:
+            self.link(item_id, tag_id)
+
+    # Tags
+
+    def add_tag(self, tag: Tag) -> Tag:
+        """Store a copy of a new tag; the caller has checked its name is free"""
+        stored = Tag(
+            name=tag.name,
+            color=tag.color,
+            id=next(self._next_tag_id),
+            created_at=utc_now(),
+        )
+        self.tags[stored.id] = stored
+        self.item_ids_by_tag[stored.id] = set()
+        self._index_tag(stored)
+        self.versions["tags"] += 1
+        return self._copy_tag(stored)
+
+    def change_tag(self, tag_id: int, **fields: Any) -> Tag | None:
+        """Set fields of a live tag; raises ValueError if the new name is taken"""
+        tag = self.tags.get(tag_id)
+        if tag is None:
+            return None
+        name = fields.get("name")
+        if name is not None and self.tag_id_by_name.get(name_key(name), tag_id) != tag_id:
+            raise ValueError(f"Tag with name '{name}' already exists")
+        self._unindex_tag(tag)
+        for field, value in fields.items():
+            setattr(tag, field, value)
+        self._index_tag(tag)
+        self.versions["tags"] += 1
+        return self._copy_tag(tag)
+
+    def delete_tag(self, tag_id: int) -> bool:
+        """Turn a live tag into a tombstone, dropping its links"""
+        tag = self.tags.pop(tag_id, None)
+        if tag is None:
+            return False
+        self._unindex_tag(tag)
+        for item_id in self.item_ids_by_tag.pop(tag_id):
+            self.tag_ids_by_item[item_id].discard(tag_id)
+        self.tag_tombstones[tag_id] = utc_now()
+        self.versions["tags"] += 1
+        self.versions["item_tags"] += 1
+        return True
+
+    def tag_by_name(self, name: str) -> Tag | None:
+        """Live tag of a name, ignoring ASCII case"""
+        tag_id = self.tag_id_by_name.get(name_key(name))
+        return None if tag_id is None else self._copy_tag(self.tags[tag_id])
+
+    def get_tag(self, tag_id: int) -> Tag | None:
+        """Copy of a live tag"""
+        tag = self.tags.get(tag_id)
+        return None if tag is None else self._copy_tag(tag)
+
+    def ordered_tag_ids(self, sort: str, after: PageCursor | None = None) -> Iterator[int]:
+        """IDs of the live tags in (sort, id) order after the cursor, lazily"""
+        if sort == "name":
+            seek = None if after is None else (name_key(after.value), after.id)
+            return map(_key_id, self.tag_names.after(seek))
+        return self.tag_ids.after(None if after is None else after.id)
+
+    # Tombstones
+
+    @staticmethod
+    def oldest_tombstones(
+        tombstones: dict[int, datetime], since: datetime | None = None, limit: int = 1000
+    ) -> list[tuple[int, datetime]]:
+        """(id, deleted_at) pairs deleted at or after ``since``, oldest first"""
+        pairs = sorted(
+            (deleted_at, item_id)
+            for item_id, deleted_at in tombstones.items()
+            if since is None or deleted_at >= since
+        )
+        return [(item_id, deleted_at) for deleted_at, item_id in pairs[:limit]]
+
+    @staticmethod
+    def purge(tombstones: dict[int, datetime], before: datetime, limit: int) -> int:
+        """Forget up to ``limit`` tombstones older than ``before``, oldest first"""
+        expired = sorted(
+            (deleted_at, item_id)
+            for item_id, deleted_at in tombstones.items()
+            if deleted_at < before
+        )[:limit]
+        for _, item_id in expired:
+            del tombstones[item_id]
+        return len(expired)
+
+    # Index upkeep
+
+    def _item_key(self, sort: str):
+        """Function from an item ID to its key in the index of an order"""
+        if sort == "id":
+            return lambda item_id: item_id
+        return lambda item_id: (getattr(self.items[item_id], sort), item_id)
+
+    def _index_item(self, item: Item) -> None:
+        self.item_ids.add(item.id)
+        self.item_names.add((item.name, item.id))
+        self.columns[item.status].add((item.position, item.id))
+
+    def _unindex_item(self, item: Item) -> None:
+        self.item_ids.remove(item.id)
+        self.item_names.remove((item.name, item.id))
+        self.columns[item.status].remove((item.position, item.id))
+
+    def _index_tag(self, tag: Tag) -> None:
+        self.tag_ids.add(tag.id)
+        self.tag_names.add((name_key(tag.name), tag.id))
+        self.tag_id_by_name[name_key(tag.name)] = tag.id
+
+    def _unindex_tag(self, tag: Tag) -> None:
+        self.tag_ids.remove(tag.id)
+        self.tag_names.remove((name_key(tag.name), tag.id))
+        del self.tag_id_by_name[name_key(tag.name)]
+
+    @staticmethod
+    def _copy_tag(tag: Tag) -> Tag:
+        return Tag(
+            name=tag.name,
+            color=tag.color,
+            id=tag.id,
+            created_at=tag.created_at,
+            updated_at=tag.updated_at,
+        )
+
+
+def _seek(sort: str, after: PageCursor):
+    """Index key of a cursor"""
+    return after.id if sort == "id" else (after.value, after.id)
+
+
+def _key_id(key) -> int:
+    """Row ID of an index key: the key itself or its last part"""
+    return key if isinstance(key, int) else key[-1]
+
+
+def take(keys: Iterator, limit: int) -> tuple[list, bool]:
+    """The first ``limit`` keys, and whether more follow (the keyset limit + 1 trick)"""
+    taken = list(islice(keys, limit + 1))
+    return taken[:limit], len(taken) > limit
@@ -0,0 +1 @@
+"""Stats module reporting maintained counts of items and tags"""
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+from app.items.domain.entities.item import ItemStatus
+
+
+class StatsDTO(BaseModel):
+    """DTO for the totals of items and tags"""
+
+    items: int
+    tags: int
+    items_by_status: dict[ItemStatus, int]
@@ -0,0 +1,19 @@
+from app.items.domain.entities.item import ITEM_STATUSES
+from app.stats.application.dtos.stats_dto import StatsDTO
+from app.stats.domain.interfaces.stats_query_service import StatsQueryService
+
+
+class GetStatsUseCase:
+    """Use case to report the maintained item and tag counts"""
+
+    def __init__(self, query_service: StatsQueryService):
+        self.query_service = query_service
+
+    async def execute(self) -> StatsDTO:
+        """Get the totals without counting any rows"""
+        counts = await self.query_service.get_counts()
+        return StatsDTO(
+            items=counts["items"],
+            tags=counts["tags"],
+            items_by_status={status: counts[f"items:{status}"] for status in ITEM_STATUSES},
+        )
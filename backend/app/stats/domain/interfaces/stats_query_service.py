@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+
+class StatsQueryService(ABC):
+    """Read model for the maintained item and tag counts"""
+
+    @abstractmethod
+    async def get_counts(self) -> dict[str, int]:
+        """Get the counts keyed "items", "tags" and "items:<status>" for every status"""
+        pass
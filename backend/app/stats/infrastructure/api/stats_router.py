@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.domain.data_version import ITEM_TABLES
+from app.shared.infrastructure import get_db
+from app.shared.infrastructure.api.conditional import conditional_get
+from app.shared.infrastructure.database import get_memory_store
+from app.shared.infrastructure.memory import MemoryStore
+from app.stats.application.dtos.stats_dto import StatsDTO
+from app.stats.application.use_cases.stats_use_cases import GetStatsUseCase
+from app.stats.domain.interfaces.stats_query_service import StatsQueryService
+from app.stats.infrastructure.database.stats_query_service_impl import StatsQueryServiceImpl
+from app.stats.infrastructure.memory.in_memory_stats_query_service import (
+    InMemoryStatsQueryService,
+)
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+def get_stats_query_service(
+    db: AsyncSession = Depends(get_db),
+    store: MemoryStore | None = Depends(get_memory_store),
+) -> StatsQueryService:
+    """Dependency injection for the stats read model"""
+    if store is not None:
+        return InMemoryStatsQueryService(store)
+    return StatsQueryServiceImpl(db)
+
+
+@router.get("", response_model=StatsDTO, dependencies=[Depends(conditional_get(*ITEM_TABLES))])
+async def get_stats(query_service: StatsQueryService = Depends(get_stats_query_service)):
+    """Get the number of items, of tags and of items in each Kanban column.
+
+    Counts are maintained by triggers as rows are written, so this never scans a table.
+    """
+    use_case = GetStatsUseCase(query_service)
+    return await use_case.execute()
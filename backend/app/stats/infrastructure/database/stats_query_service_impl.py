@@ -0,0 +1,19 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.items.domain.entities.item import ITEM_STATUSES
+from app.items.infrastructure.database.item_counters import ITEM_COUNT, status_counter
+from app.shared.infrastructure.database.counters import read_counters
+from app.stats.domain.interfaces.stats_query_service import StatsQueryService
+from app.tags.infrastructure.database.tag_counters import TAG_COUNT
+
+
+class StatsQueryServiceImpl(StatsQueryService):
+    """Reads the counts from the counters table, one primary key lookup each"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_counts(self) -> dict[str, int]:
+        """Get the item, tag and per-status counts in one query"""
+        names = [ITEM_COUNT, TAG_COUNT, *(status_counter(status) for status in ITEM_STATUSES)]
+        return await read_counters(self.db, names)
@@ -0,0 +1,19 @@
+from app.items.domain.entities.item import ITEM_STATUSES
+from app.items.infrastructure.database.item_counters import ITEM_COUNT, status_counter
+from app.shared.infrastructure.memory.store import MemoryStore
+from app.stats.domain.interfaces.stats_query_service import StatsQueryService
+from app.tags.infrastructure.database.tag_counters import TAG_COUNT
+
+
+class InMemoryStatsQueryService(StatsQueryService):
+    """Reads the counts off the sizes of a MemoryStore's indexes"""
+
+    def __init__(self, store: MemoryStore):
+        self.store = store
+
+    async def get_counts(self) -> dict[str, int]:
+        """Get the item, tag and per-status counts"""
+        counts = {ITEM_COUNT: len(self.store.item_ids), TAG_COUNT: len(self.store.tag_ids)}
+        for status in ITEM_STATUSES:
+            counts[status_counter(status)] = len(self.store.columns[status])
+        return counts
@@ -16,6 +16,21 @@ class TagDTO(BaseModel):
         from_attributes = True
 
 
+class TagPageDTO(BaseModel):
+    """DTO for a page of tags, the cursor of the next page and the number of tags"""
+
+    items: list[TagDTO]
+    next_cursor: str | None = None
+    total: int | None = None
+
+
+class TagTombstoneDTO(BaseModel):
+    """DTO for a deleted tag: its ID and when it was deleted"""
+
+    id: int
+    deleted_at: datetime
+
+
 class TagCreateDTO(BaseModel):
     """DTO for creating tags"""
 
@@ -23,6 +38,12 @@ class TagCreateDTO(BaseModel):
     color: str = Field(..., pattern="^#[0-9A-Fa-f]{6}$")
 
 
+class TagUpsertDTO(BaseModel):
+    """DTO for creating or updating a tag addressed by its name"""
+
+    color: str = Field(..., pattern="^#[0-9A-Fa-f]{6}$")
+
+
 class TagUpdateDTO(BaseModel):
     """DTO for updating tags"""
 
@@ -1,5 +1,17 @@
-from app.tags.application.dtos.tag_dto import TagCreateDTO, TagDTO, TagUpdateDTO
+from datetime import datetime, timedelta
+
+from app.shared.domain.pagination import SortKey, parse_cursor
+from app.shared.domain.tombstones import retention_cutoff, to_naive_utc
+from app.tags.application.dtos.tag_dto import (
+    TagCreateDTO,
+    TagDTO,
+    TagPageDTO,
+    TagTombstoneDTO,
+    TagUpdateDTO,
+    TagUpsertDTO,
+)
 from app.tags.domain.entities.tag import Tag
+from app.tags.domain.interfaces.tag_query_service import TagQueryServiceInterface
 from app.tags.domain.interfaces.tag_repository import TagRepositoryInterface
 
 
@@ -11,16 +23,24 @@ class CreateTagUseCase:
 
     async def execute(self, tag_dto: TagCreateDTO) -> TagDTO:
         """Execute the create tag use case"""
-        # Check if tag with same name already exists
-        existing = await self.repository.get_by_name(tag_dto.name)
-        if existing:
-            raise ValueError(f"Tag with name '{tag_dto.name}' already exists")
-
+        # The repository rejects duplicate names atomically, no lookup first
         tag = Tag(name=tag_dto.name, color=tag_dto.color)
         created_tag = await self.repository.create(tag)
         return TagDTO.model_validate(created_tag)
 
 
+class UpsertTagUseCase:
+    """Use case for creating or updating a tag by name"""
+
+    def __init__(self, repository: TagRepositoryInterface):
+        self.repository = repository
+
+    async def execute(self, name: str, tag_dto: TagUpsertDTO) -> tuple[TagDTO, bool]:
+        """Execute the upsert tag use case, returning the tag and whether it was created"""
+        tag, created = await self.repository.upsert(Tag(name=name, color=tag_dto.color))
+        return TagDTO.model_validate(tag), created
+
+
 class GetTagUseCase:
     """Use case for getting a tag by ID"""
 
@@ -45,6 +65,53 @@ class GetAllTagsUseCase:
         return [TagDTO.model_validate(tag) for tag in tags]
 
 
+class GetTagsPageUseCase:
+    """Use case for getting tags page by page with keyset pagination"""
+
+    def __init__(self, query_service: TagQueryServiceInterface):
+        self.query_service = query_service
+
+    async def execute(
+        self, after: str | None = None, limit: int = 100, sort: SortKey = "id"
+    ) -> TagPageDTO:
+        """Execute the get tags page use case; raises ValueError on a bad cursor"""
+        page = await self.query_service.get_page(
+            after=parse_cursor(after, sort), limit=limit, sort=sort
+        )
+        return TagPageDTO(
+            items=[TagDTO.model_validate(tag) for tag in page.items],
+            next_cursor=page.next_cursor.encode() if page.next_cursor else None,
+            total=await self.query_service.count(),
+        )
+
+
+class CountTagsUseCase:
+    """Use case for reading the maintained number of tags"""
+
+    def __init__(self, query_service: TagQueryServiceInterface):
+        self.query_service = query_service
+
+    async def execute(self) -> int:
+        """Execute the count tags use case"""
+        return await self.query_service.count()
+
+
+class GetTagTombstonesUseCase:
+    """Use case for listing deleted tags, for clients syncing deletions"""
+
+    def __init__(self, query_service: TagQueryServiceInterface):
+        self.query_service = query_service
+
+    async def execute(
+        self, since: datetime | None = None, limit: int = 1000
+    ) -> list[TagTombstoneDTO]:
+        """Execute the tag tombstones use case, oldest deletion first"""
+        if since is not None:
+            since = to_naive_utc(since)
+        tombstones = await self.query_service.get_tombstones(since=since, limit=limit)
+        return [TagTombstoneDTO.model_validate(tombstone) for tombstone in tombstones]
+
+
 class UpdateTagUseCase:
     """Use case for updating a tag"""
 
@@ -53,25 +120,9 @@ class UpdateTagUseCase:
 
     async def execute(self, tag_id: int, tag_dto: TagUpdateDTO) -> TagDTO | None:
         """Execute the update tag use case"""
-        # Check if tag exists
-        existing_tag = await self.repository.get_by_id(tag_id)
-        if not existing_tag:
-            return None
-
-        # If name is being updated, check it doesn't conflict
-        if tag_dto.name and tag_dto.name != existing_tag.name:
-            name_conflict = await self.repository.get_by_name(tag_dto.name)
-            if name_conflict:
-                raise ValueError(f"Tag with name '{tag_dto.name}' already exists")
-
-        # Create updated tag entity
-        updated_tag = Tag(
-            id=tag_id,
-            name=tag_dto.name if tag_dto.name else existing_tag.name,
-            color=tag_dto.color if tag_dto.color else existing_tag.color,
-        )
-
-        result = await self.repository.update(tag_id, updated_tag)
+        # Only the fields provided change; the repository rejects duplicate names
+        fields = tag_dto.model_dump(exclude_none=True)
+        result = await self.repository.patch(tag_id, fields)
         return TagDTO.model_validate(result) if result else None
 
 
@@ -84,3 +135,20 @@ class DeleteTagUseCase:
     async def execute(self, tag_id: int) -> bool:
         """Execute the delete tag use case"""
         return await self.repository.delete(tag_id)
+
+
+class PurgeDeletedTagsUseCase:
+    """Use case for permanently removing tags deleted longer ago than a retention window"""
+
+    def __init__(self, repository: TagRepositoryInterface):
+        self.repository = repository
+
+    async def execute(self, retention: timedelta, batch_size: int = 500) -> int:
+        """Purge in batches of one transaction each, returning how many tags went"""
+        before = retention_cutoff(retention)
+        purged = 0
+        while True:
+            count = await self.repository.purge_deleted(before, limit=batch_size)
+            purged += count
+            if count < batch_size:
+                return purged
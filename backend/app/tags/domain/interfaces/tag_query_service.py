@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+
+from app.shared.domain.pagination import Page, PageCursor, SortKey
+
+
+class TagQueryServiceInterface(ABC):
+    """Interface for the tag listing read model"""
+
+    @abstractmethod
+    async def get_page(
+        self, after: PageCursor | None = None, limit: int = 100, sort: SortKey = "id"
+    ) -> Page[dict[str, Any]]:
+        """Get a page of tags as dicts shaped like TagDTO"""
+        pass
+
+    @abstractmethod
+    async def count(self) -> int:
+        """Number of tags"""
+        pass
+
+    @abstractmethod
+    async def get_tombstones(
+        self, since: datetime | None = None, limit: int = 1000
+    ) -> list[dict[str, Any]]:
+        """IDs and deletion times of the tags deleted at or after ``since``, oldest first"""
+        pass
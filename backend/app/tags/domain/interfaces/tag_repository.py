@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
 
+from app.shared.domain.pagination import Page, PageCursor, SortKey
 from app.tags.domain.entities.tag import Tag
 
 
@@ -8,7 +11,15 @@ class TagRepositoryInterface(ABC):
 
     @abstractmethod
     async def create(self, tag: Tag) -> Tag:
-        """Create a new tag"""
+        """Create a new tag, raising ValueError if the name is already taken"""
+        pass
+
+    @abstractmethod
+    async def upsert(self, tag: Tag) -> tuple[Tag, bool]:
+        """Create the tag, or update the color of the tag with that name.
+
+        Returns the tag and whether it was created.
+        """
         pass
 
     @abstractmethod
@@ -21,6 +32,13 @@ class TagRepositoryInterface(ABC):
         """Get all tags"""
         pass
 
+    @abstractmethod
+    async def get_page(
+        self, after: PageCursor | None = None, limit: int = 100, sort: SortKey = "id"
+    ) -> Page[Tag]:
+        """Get a page of tags ordered by (sort, id), starting after the cursor"""
+        pass
+
     @abstractmethod
     async def get_by_name(self, name: str) -> Tag | None:
         """Get a tag by name"""
@@ -31,9 +49,22 @@ class TagRepositoryInterface(ABC):
         """Update a tag"""
         pass
 
+    @abstractmethod
+    async def patch(self, tag_id: int, fields: dict[str, Any]) -> Tag | None:
+        """Change only the given fields of a tag; None if it does not exist.
+
+        Raises ValueError if the new name is already taken.
+        """
+        pass
+
     @abstractmethod
     async def delete(self, tag_id: int) -> bool:
-        """Delete a tag"""
+        """Delete a tag, leaving a tombstone"""
+        pass
+
+    @abstractmethod
+    async def purge_deleted(self, before: datetime, limit: int = 500) -> int:
+        """Permanently remove up to ``limit`` tags deleted before ``before``; returns how many"""
         pass
 
     @abstractmethod
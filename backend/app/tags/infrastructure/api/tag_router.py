@@ -1,53 +1,195 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
 
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.items.application.dtos.item_dto import ItemDTO
+from app.items.application.use_cases.item_use_cases import GetItemsPageUseCase
+from app.items.domain.entities.item import ItemSortKey
+from app.items.domain.interfaces.item_query_service import ItemQueryService
+from app.items.infrastructure.api.item_router import get_item_query_service
+from app.shared.domain.data_version import ITEM_TABLES, TAG_TABLES
+from app.shared.domain.pagination import SortKey
 from app.shared.infrastructure import get_db
-from app.tags.application.dtos.tag_dto import TagCreateDTO, TagDTO, TagUpdateDTO
+from app.shared.infrastructure.api.conditional import conditional_get, raise_if_not_modified
+from app.shared.infrastructure.api.pagination import (
+    set_next_page_headers,
+    set_total_count_header,
+)
+from app.shared.infrastructure.cache import BoardCaches
+from app.shared.infrastructure.database import (
+    GroupCommitWriter,
+    board_path,
+    get_board_id,
+    get_group_commit_writer,
+    get_memory_store,
+    get_repository_caches,
+    memory_store,
+    shards,
+)
+from app.shared.infrastructure.memory import MemoryStore
+from app.tags.application.dtos.tag_dto import (
+    TagCreateDTO,
+    TagDTO,
+    TagTombstoneDTO,
+    TagUpdateDTO,
+    TagUpsertDTO,
+)
 from app.tags.application.use_cases.tag_use_cases import (
+    CountTagsUseCase,
     CreateTagUseCase,
     DeleteTagUseCase,
     GetAllTagsUseCase,
+    GetTagsPageUseCase,
+    GetTagTombstonesUseCase,
     GetTagUseCase,
+    PurgeDeletedTagsUseCase,
     UpdateTagUseCase,
+    UpsertTagUseCase,
 )
+from app.tags.domain.interfaces.tag_query_service import TagQueryServiceInterface
+from app.tags.domain.interfaces.tag_repository import TagRepositoryInterface
+from app.tags.infrastructure.cache.caching_tag_query_service import CachingTagQueryService
+from app.tags.infrastructure.cache.caching_tag_repository import CachingTagRepository
+from app.tags.infrastructure.database.tag_query_service_impl import TagQueryServiceImpl
 from app.tags.infrastructure.database.tag_repository_impl import TagRepositoryImpl
+from app.tags.infrastructure.memory.in_memory_tag_query_service import InMemoryTagQueryService
+from app.tags.infrastructure.memory.in_memory_tag_repository import InMemoryTagRepository
 
 router = APIRouter(prefix="/tags", tags=["tags"])
 
 
-def get_tag_repository(db: Session = Depends(get_db)) -> TagRepositoryImpl:
-    """Dependency injection for tag repository"""
-    return TagRepositoryImpl(db)
+def get_tag_repository(
+    db: AsyncSession = Depends(get_db),
+    writer: GroupCommitWriter | None = Depends(get_group_commit_writer),
+    store: MemoryStore | None = Depends(get_memory_store),
+    caches: BoardCaches | None = Depends(get_repository_caches),
+) -> TagRepositoryInterface:
+    """Dependency injection for tag repository, cached when DATABASE_CACHE_REPOSITORIES is on"""
+    if store is not None:
+        return InMemoryTagRepository(store)
+    if caches is not None:
+        return CachingTagRepository(TagRepositoryImpl(db, writer), caches.tags, caches.items)
+    return TagRepositoryImpl(db, writer)
 
 
-@router.get("/", response_model=list[TagDTO])
+def get_tag_query_service(
+    db: AsyncSession = Depends(get_db),
+    store: MemoryStore | None = Depends(get_memory_store),
+    caches: BoardCaches | None = Depends(get_repository_caches),
+) -> TagQueryServiceInterface:
+    """Dependency injection for the tag listing read model, cached like the repository"""
+    if store is not None:
+        return InMemoryTagQueryService(store)
+    if caches is not None:
+        return CachingTagQueryService(TagQueryServiceImpl(db), caches.tags)
+    return TagQueryServiceImpl(db)
+
+
+@router.get("/", response_model=list[TagDTO], dependencies=[Depends(conditional_get(*TAG_TABLES))])
 async def get_tags(
-    skip: int = 0,
-    limit: int = 100,
-    repository: TagRepositoryImpl = Depends(get_tag_repository),
+    response: Response,
+    after: str | None = None,
+    limit: int = Query(100, ge=1),
+    sort: SortKey = "id",
+    skip: int | None = Query(None, ge=0),
+    board_id: str | None = Depends(get_board_id),
+    repository: TagRepositoryInterface = Depends(get_tag_repository),
+    query_service: TagQueryServiceInterface = Depends(get_tag_query_service),
+):
+    """Get tags page by page.
+
+    Pages are addressed by the opaque ``after`` cursor; the cursor of the next
+    page is returned in the Link and X-Next-Cursor headers. Passing ``skip``
+    selects the legacy offset pagination instead. X-Total-Count carries the
+    number of tags.
+    """
+    if skip is not None:
+        use_case = GetAllTagsUseCase(repository)
+        tags = await use_case.execute(skip=skip, limit=limit)
+        set_total_count_header(response, await CountTagsUseCase(query_service).execute())
+        return tags
+
+    use_case = GetTagsPageUseCase(query_service)
+    try:
+        page = await use_case.execute(after=after, limit=limit, sort=sort)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    path = board_path(board_id, router.prefix + "/")
+    set_next_page_headers(response, path, page.next_cursor, limit, sort)
+    set_total_count_header(response, page.total)
+    return page.items
+
+
+@router.get(
+    "/tombstones",
+    response_model=list[TagTombstoneDTO],
+    dependencies=[Depends(conditional_get(*TAG_TABLES))],
+)
+async def get_tag_tombstones(
+    since: datetime | None = None,
+    limit: int = Query(1000, ge=1),
+    query_service: TagQueryServiceInterface = Depends(get_tag_query_service),
 ):
-    """Get all tags with pagination"""
-    use_case = GetAllTagsUseCase(repository)
-    return await use_case.execute(skip=skip, limit=limit)
+    """Get the tags deleted at or after ``since``, oldest deletion first.
+
+    Tombstones are kept for the retention window, then purged. Clients pass
+    the last ``deleted_at`` they saw as the next ``since``; the boundary is
+    inclusive, so tombstones deleted in the same second are not missed.
+    """
+    use_case = GetTagTombstonesUseCase(query_service)
+    return await use_case.execute(since=since, limit=limit)
 
 
 @router.get("/{tag_id}", response_model=TagDTO)
 async def get_tag(
     tag_id: int,
-    repository: TagRepositoryImpl = Depends(get_tag_repository),
+    if_none_match: str | None = Header(None),
+    etag: str = Depends(conditional_get(*TAG_TABLES, after_lookup=True)),
+    repository: TagRepositoryInterface = Depends(get_tag_repository),
 ):
     """Get a specific tag by ID"""
     use_case = GetTagUseCase(repository)
     tag = await use_case.execute(tag_id)
     if tag is None:
         raise HTTPException(status_code=404, detail="Tag not found")
+    raise_if_not_modified(if_none_match, etag)
     return tag
 
 
+@router.get("/{tag_id}/items", response_model=list[ItemDTO])
+async def get_tag_items(
+    tag_id: int,
+    response: Response,
+    after: str | None = None,
+    limit: int = Query(100, ge=1),
+    sort: ItemSortKey = "id",
+    if_none_match: str | None = Header(None),
+    etag: str = Depends(conditional_get(*ITEM_TABLES, after_lookup=True)),
+    board_id: str | None = Depends(get_board_id),
+    repository: TagRepositoryInterface = Depends(get_tag_repository),
+    item_query_service: ItemQueryService = Depends(get_item_query_service),
+):
+    """Get the items having a tag, page by page like GET /items/"""
+    if await GetTagUseCase(repository).execute(tag_id) is None:
+        raise HTTPException(status_code=404, detail="Tag not found")
+    raise_if_not_modified(if_none_match, etag)
+
+    use_case = GetItemsPageUseCase(item_query_service)
+    try:
+        page = await use_case.execute(after=after, limit=limit, sort=sort, tag_id=tag_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    path = board_path(board_id, f"{router.prefix}/{tag_id}/items")
+    set_next_page_headers(response, path, page.next_cursor, limit, sort)
+    set_total_count_header(response, page.total)
+    return page.items
+
+
 @router.post("/", response_model=TagDTO, status_code=201)
 async def create_tag(
     tag: TagCreateDTO,
-    repository: TagRepositoryImpl = Depends(get_tag_repository),
+    repository: TagRepositoryInterface = Depends(get_tag_repository),
 ):
     """Create a new tag"""
     use_case = CreateTagUseCase(repository)
@@ -57,11 +199,26 @@ async def create_tag(
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
+@router.put("/by-name/{name}", response_model=TagDTO)
+async def upsert_tag(
+    tag: TagUpsertDTO,
+    response: Response,
+    name: str = Path(..., min_length=1, max_length=50),
+    repository: TagRepositoryInterface = Depends(get_tag_repository),
+):
+    """Create the tag with this name, or update its color if it exists (201 or 200)"""
+    use_case = UpsertTagUseCase(repository)
+    result, created = await use_case.execute(name, tag)
+    if created:
+        response.status_code = 201
+    return result
+
+
 @router.put("/{tag_id}", response_model=TagDTO)
 async def update_tag(
     tag_id: int,
     tag: TagUpdateDTO,
-    repository: TagRepositoryImpl = Depends(get_tag_repository),
+    repository: TagRepositoryInterface = Depends(get_tag_repository),
 ):
     """Update an existing tag"""
     use_case = UpdateTagUseCase(repository)
@@ -77,11 +234,26 @@ async def update_tag(
 @router.delete("/{tag_id}", status_code=204)
 async def delete_tag(
     tag_id: int,
-    repository: TagRepositoryImpl = Depends(get_tag_repository),
+    repository: TagRepositoryInterface = Depends(get_tag_repository),
 ):
-    """Delete a tag"""
+    """Delete a tag; it is listed in GET /tags/tombstones until purged"""
     use_case = DeleteTagUseCase(repository)
     success = await use_case.execute(tag_id)
     if not success:
         raise HTTPException(status_code=404, detail="Tag not found")
     return None
+
+
+async def purge_deleted_tags(retention: timedelta, batch_size: int) -> int:
+    """Background job: purge the tag tombstones of every board, a session each"""
+    purged = 0
+    for board_id in [None, *shards.board_ids()]:
+        store = memory_store(board_id)
+        if store is not None:
+            use_case = PurgeDeletedTagsUseCase(InMemoryTagRepository(store))
+            purged += await use_case.execute(retention, batch_size=batch_size)
+            continue
+        async with shards.lease(board_id) as board, board.session() as session:
+            use_case = PurgeDeletedTagsUseCase(TagRepositoryImpl(session, board.group_commit))
+            purged += await use_case.execute(retention, batch_size=batch_size)
+    return purged
@@ -0,0 +1,48 @@
+from datetime import datetime
+from typing import Any
+
+from app.shared.domain.pagination import Page, PageCursor, SortKey
+from app.shared.infrastructure.cache import MISSING, LRUCache
+from app.tags.domain.interfaces.tag_query_service import TagQueryServiceInterface
+
+
+class CachingTagQueryService(TagQueryServiceInterface):
+    """TagQueryServiceInterface decorator answering the first pages and the count from a cache.
+
+    Shares the tag cache of CachingTagRepository, so every tag write clears it.
+    Pages after a cursor and tombstones always read the database.
+    """
+
+    def __init__(self, query_service: TagQueryServiceInterface, cache: LRUCache):
+        self.query_service = query_service
+        self.cache = cache
+
+    async def get_page(
+        self, after: PageCursor | None = None, limit: int = 100, sort: SortKey = "id"
+    ) -> Page[dict[str, Any]]:
+        """Get a page of tags, from the cache if it is a first page"""
+        if after is not None:
+            return await self.query_service.get_page(after=after, limit=limit, sort=sort)
+        key = ("page", limit, sort)
+        page = self.cache.get(key)
+        if page is MISSING:
+            generation = self.cache.generation
+            page = await self.query_service.get_page(limit=limit, sort=sort)
+            self.cache.put(key, page, generation)
+        return page
+
+    async def count(self) -> int:
+        """Number of tags, from the cache if there"""
+        key = ("count",)
+        count = self.cache.get(key)
+        if count is MISSING:
+            generation = self.cache.generation
+            count = await self.query_service.count()
+            self.cache.put(key, count, generation)
+        return count
+
+    async def get_tombstones(
+        self, since: datetime | None = None, limit: int = 1000
+    ) -> list[dict[str, Any]]:
+        """Get tag tombstones, always from the database"""
+        return await self.query_service.get_tombstones(since=since, limit=limit)
@@ -0,0 +1,136 @@
+from datetime import datetime
+from typing import Any
+
+from app.shared.domain.pagination import Page, PageCursor, SortKey
+from app.shared.infrastructure.cache import MISSING, LRUCache
+from app.tags.domain.entities.tag import Tag
+from app.tags.domain.interfaces.tag_repository import TagRepositoryInterface
+
+
+class CachingTagRepository(TagRepositoryInterface):
+    """TagRepositoryInterface decorator answering lookups from an LRU cache.
+
+    get_by_id, get_by_ids, get_by_name and get_all are cached, including the
+    tags that do not exist; keyset pages are not. Every write clears the cache,
+    then stores the written tag under its ID (write-through). ``item_cache`` is
+    cleared as well, since cached items carry their tags.
+    """
+
+    def __init__(
+        self,
+        repository: TagRepositoryInterface,
+        cache: LRUCache,
+        item_cache: LRUCache | None = None,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.item_cache = item_cache
+
+    async def create(self, tag: Tag) -> Tag:
+        """Create a tag and cache it"""
+        try:
+            created = await self.repository.create(tag)
+        finally:
+            self._invalidate()
+        self.cache.put(("id", created.id), created)
+        return created
+
+    async def upsert(self, tag: Tag) -> tuple[Tag, bool]:
+        """Create or recolor a tag and cache it"""
+        try:
+            upserted, created = await self.repository.upsert(tag)
+        finally:
+            self._invalidate()
+        self.cache.put(("id", upserted.id), upserted)
+        return upserted, created
+
+    async def get_by_id(self, tag_id: int) -> Tag | None:
+        """Get a tag by ID, from the cache if there"""
+        key = ("id", tag_id)
+        tag = self.cache.get(key)
+        if tag is MISSING:
+            generation = self.cache.generation
+            tag = await self.repository.get_by_id(tag_id)
+            self.cache.put(key, tag, generation)
+        return tag
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[Tag]:
+        """Get all tags with offset pagination, from the cache if there"""
+        key = ("all", skip, limit)
+        tags = self.cache.get(key)
+        if tags is MISSING:
+            generation = self.cache.generation
+            tags = await self.repository.get_all(skip=skip, limit=limit)
+            self.cache.put(key, tags, generation)
+        return list(tags)
+
+    async def get_page(
+        self, after: PageCursor | None = None, limit: int = 100, sort: SortKey = "id"
+    ) -> Page[Tag]:
+        """Get a page of tags, always from the repository"""
+        return await self.repository.get_page(after=after, limit=limit, sort=sort)
+
+    async def get_by_name(self, name: str) -> Tag | None:
+        """Get a tag by name, from the cache if there"""
+        key = ("name", name)
+        tag = self.cache.get(key)
+        if tag is MISSING:
+            generation = self.cache.generation
+            tag = await self.repository.get_by_name(name)
+            self.cache.put(key, tag, generation)
+        return tag
+
+    async def update(self, tag_id: int, tag: Tag) -> Tag | None:
+        """Update a tag and cache the result"""
+        try:
+            updated = await self.repository.update(tag_id, tag)
+        finally:
+            self._invalidate()
+        self.cache.put(("id", tag_id), updated)
+        return updated
+
+    async def patch(self, tag_id: int, fields: dict[str, Any]) -> Tag | None:
+        """Change the given fields of a tag and cache the result"""
+        try:
+            patched = await self.repository.patch(tag_id, fields)
+        finally:
+            self._invalidate()
+        self.cache.put(("id", tag_id), patched)
+        return patched
+
+    async def delete(self, tag_id: int) -> bool:
+        """Delete a tag and cache that it is gone"""
+        try:
+            deleted = await self.repository.delete(tag_id)
+        finally:
+            self._invalidate()
+        self.cache.put(("id", tag_id), None)
+        return deleted
+
+    async def purge_deleted(self, before: datetime, limit: int = 500) -> int:
+        """Purge tag tombstones; the cache never holds them"""
+        return await self.repository.purge_deleted(before, limit)
+
+    async def get_by_ids(self, tag_ids: list[int]) -> list[Tag]:
+        """Get the tags of the given IDs in ID order, querying only the uncached ones"""
+        tags = {}
+        missing = []
+        for tag_id in dict.fromkeys(tag_ids):
+            tag = self.cache.get(("id", tag_id))
+            if tag is MISSING:
+                missing.append(tag_id)
+            elif tag is not None:
+                tags[tag_id] = tag
+        if missing:
+            generation = self.cache.generation
+            found = {tag.id: tag for tag in await self.repository.get_by_ids(missing)}
+            for tag_id in missing:
+                self.cache.put(("id", tag_id), found.get(tag_id), generation)
+            tags.update(found)
+        return [tags[tag_id] for tag_id in sorted(tags)]
+
+    def _invalidate(self) -> None:
+        """Forget everything a write may have changed"""
+        self.cache.clear()
+        if self.item_cache is not None:
+            self.item_cache.clear()
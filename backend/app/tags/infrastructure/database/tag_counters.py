@@ -0,0 +1,76 @@
+# Maintained tag counts (all tags and the items linked to each tag) and the versions
+# of the tags and item_tags tables.
+# Only live tags and the links of live items are counted. A deleted item keeps
+# its links until its tombstone is purged, so the tag counts drop when deleted_at
+# is set and purging the links (which goes first) leaves them alone.
+# See app.shared.infrastructure.database.counters.
+
+from app.shared.infrastructure.database.counters import (
+    CounterSet,
+    decrement_sql,
+    increment_sql,
+    table_version,
+    version_counter,
+)
+
+TAG_COUNT = "tags"
+TAGS_VERSION = version_counter("tags")
+ITEM_TAGS_VERSION = version_counter("item_tags")
+
+
+def tag_items_counter(tag_id: int) -> str:
+    """Name of the counter of the items linked to a tag"""
+    return f"tag_items:{tag_id}"
+
+
+_ALL = f"'{TAG_COUNT}'"
+_TAG_OF_NEW = "'tag_items:' || new.tag_id"
+_TAG_OF_OLD = "'tag_items:' || old.tag_id"
+_ITEM_IS_TOMBSTONE = (
+    "EXISTS (SELECT 1 FROM items WHERE id = old.item_id AND deleted_at IS NOT NULL)"
+)
+
+
+tag_counters = CounterSet(
+    triggers={
+        "tags_count_ai": "AFTER INSERT ON tags WHEN new.deleted_at IS NULL BEGIN "
+        f"{increment_sql(_ALL)} END",
+        # The tag's cascaded links decrement its item counter, which goes with the tag
+        "tags_count_ad": "AFTER DELETE ON tags WHEN old.deleted_at IS NULL BEGIN "
+        f"{decrement_sql(_ALL)} "
+        "DELETE FROM counters WHERE name = 'tag_items:' || old.id; END",
+        "tags_count_tombstone": "AFTER UPDATE OF deleted_at ON tags "
+        "WHEN old.deleted_at IS NULL AND new.deleted_at IS NOT NULL BEGIN "
+        f"{decrement_sql(_ALL)} "
+        "DELETE FROM counters WHERE name = 'tag_items:' || old.id; END",
+    },
+    recount=[
+        f"DELETE FROM counters WHERE name = '{TAG_COUNT}'",
+        f"INSERT INTO counters(name, value) "
+        f"SELECT '{TAG_COUNT}', count(*) FROM tags WHERE deleted_at IS NULL",
+    ],
+)
+
+tag_items_counters = CounterSet(
+    triggers={
+        "item_tags_count_ai": f"AFTER INSERT ON item_tags BEGIN {increment_sql(_TAG_OF_NEW)} END",
+        "item_tags_count_ad": "AFTER DELETE ON item_tags "
+        f"WHEN NOT {_ITEM_IS_TOMBSTONE} BEGIN {decrement_sql(_TAG_OF_OLD)} END",
+        "item_tags_count_tombstone": "AFTER UPDATE OF deleted_at ON items "
+        "WHEN old.deleted_at IS NULL AND new.deleted_at IS NOT NULL BEGIN "
+        "UPDATE counters SET value = value - 1 WHERE name IN "
+        "(SELECT 'tag_items:' || tag_id FROM item_tags WHERE item_id = new.id); END",
+    },
+    recount=[
+        "DELETE FROM counters WHERE name LIKE 'tag_items:%'",
+        "INSERT INTO counters(name, value) "
+        "SELECT 'tag_items:' || item_tags.tag_id, count(*) FROM item_tags "
+        "JOIN items ON items.id = item_tags.item_id "
+        "JOIN tags ON tags.id = item_tags.tag_id "
+        "WHERE items.deleted_at IS NULL AND tags.deleted_at IS NULL "
+        "GROUP BY item_tags.tag_id",
+    ],
+)
+
+tags_version = table_version("tags")
+item_tags_version = table_version("item_tags")
@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.domain.pagination import Page, PageCursor, SortKey
+from app.shared.infrastructure.database.counters import read_counters
+from app.shared.infrastructure.database.pagination import apply_keyset, to_page
+from app.tags.domain.interfaces.tag_query_service import TagQueryServiceInterface
+from app.tags.infrastructure.database.tag_counters import TAG_COUNT
+from app.tags.infrastructure.orm.tag_orm import TagORM
+
+tags = TagORM.__table__
+
+
+class TagQueryServiceImpl(TagQueryServiceInterface):
+    """SQLAlchemy Core implementation of the tag read model"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_page(
+        self, after: PageCursor | None = None, limit: int = 100, sort: SortKey = "id"
+    ) -> Page[dict[str, Any]]:
+        """Get a page of tags by keyset pagination, without hydrating ORM objects"""
+        sort_column = tags.c.name if sort == "name" else tags.c.id
+        statement = apply_keyset(
+            select(tags).where(tags.c.deleted_at.is_(None)), sort_column, tags.c.id, after, limit
+        )
+        result = await self.db.execute(statement)
+        page = to_page(result.all(), limit, sort)
+        return Page([row._asdict() for row in page.items], page.next_cursor)
+
+    async def count(self) -> int:
+        """Read the maintained tag count"""
+        counts = await read_counters(self.db, [TAG_COUNT])
+        return counts[TAG_COUNT]
+
+    async def get_tombstones(
+        self, since: datetime | None = None, limit: int = 1000
+    ) -> list[dict[str, Any]]:
+        """Read deleted tags from the partial deleted_at index"""
+        statement = select(tags.c.id, tags.c.deleted_at).where(tags.c.deleted_at.is_not(None))
+        if since is not None:
+            statement = statement.where(tags.c.deleted_at >= since)
+        statement = statement.order_by(tags.c.deleted_at, tags.c.id).limit(limit)
+        result = await self.db.execute(statement)
+        return [row._asdict() for row in result.all()]
@@ -1,15 +1,28 @@
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Any
 
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.domain.pagination import Page, PageCursor, SortKey
+from app.shared.infrastructure.database import GroupCommitWriter, run_write
+from app.shared.infrastructure.database.pagination import apply_keyset, to_page
 from app.tags.domain.entities.tag import Tag
 from app.tags.domain.interfaces.tag_repository import TagRepositoryInterface
 from app.tags.infrastructure.orm.tag_orm import TagORM
 
+# Tags that are not tombstones; the repository only ever reads and changes these
+LIVE = TagORM.deleted_at.is_(None)
+
 
 class TagRepositoryImpl(TagRepositoryInterface):
     """SQLAlchemy implementation of Tag repository"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, writer: GroupCommitWriter | None = None):
         self.db = db
+        self.writer = writer
 
     def _to_entity(self, orm: TagORM) -> Tag:
         """Convert ORM model to domain entity"""
@@ -32,54 +45,156 @@ class TagRepositoryImpl(TagRepositoryInterface):
         )
 
     async def create(self, tag: Tag) -> Tag:
-        """Create a new tag"""
-        db_tag = TagORM(name=tag.name, color=tag.color)
-        self.db.add(db_tag)
-        self.db.commit()
-        self.db.refresh(db_tag)
-        return self._to_entity(db_tag)
+        """Create a new tag with a single INSERT ... ON CONFLICT DO NOTHING"""
+
+        async def operation(session: AsyncSession) -> Tag:
+            statement = (
+                sqlite_insert(TagORM)
+                .values(name=tag.name, color=tag.color)
+                .on_conflict_do_nothing(index_elements=[TagORM.name], index_where=LIVE)
+                .returning(TagORM)
+            )
+            db_tag = (await session.execute(statement)).scalar_one_or_none()
+            # No row back means a live tag already holds this name
+            if db_tag is None:
+                raise ValueError(f"Tag with name '{tag.name}' already exists")
+            return self._to_entity(db_tag)
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def upsert(self, tag: Tag) -> tuple[Tag, bool]:
+        """Create or recolor a tag by name with a single INSERT ... ON CONFLICT DO UPDATE"""
+
+        async def operation(session: AsyncSession) -> tuple[Tag, bool]:
+            statement = sqlite_insert(TagORM).values(name=tag.name, color=tag.color)
+            statement = (
+                statement.on_conflict_do_update(
+                    index_elements=[TagORM.name],
+                    index_where=LIVE,
+                    set_={"color": statement.excluded.color, "updated_at": func.now()},
+                )
+                .returning(TagORM)
+                .execution_options(populate_existing=True)
+            )
+            db_tag = (await session.execute(statement)).scalar_one()
+            # Only the conflict branch sets updated_at, so a fresh row has none
+            return self._to_entity(db_tag), db_tag.updated_at is None
+
+        return await run_write(self.db, self.writer, operation)
 
     async def get_by_id(self, tag_id: int) -> Tag | None:
         """Get a tag by ID"""
-        db_tag = self.db.query(TagORM).filter(TagORM.id == tag_id).first()
+        db_tag = await self._get_orm(self.db, tag_id)
         return self._to_entity(db_tag) if db_tag else None
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[Tag]:
         """Get all tags"""
-        db_tags = self.db.query(TagORM).offset(skip).limit(limit).all()
+        result = await self.db.execute(select(TagORM).where(LIVE).offset(skip).limit(limit))
+        db_tags = result.scalars().all()
         return [self._to_entity(tag) for tag in db_tags]
 
+    async def get_page(
+        self, after: PageCursor | None = None, limit: int = 100, sort: SortKey = "id"
+    ) -> Page[Tag]:
+        """Get a page of tags by keyset pagination"""
+        sort_column = TagORM.name if sort == "name" else TagORM.id
+        statement = apply_keyset(select(TagORM).where(LIVE), sort_column, TagORM.id, after, limit)
+        result = await self.db.execute(statement)
+        page = to_page(list(result.scalars().all()), limit, sort)
+        return Page([self._to_entity(tag) for tag in page.items], page.next_cursor)
+
     async def get_by_name(self, name: str) -> Tag | None:
         """Get a tag by name"""
-        db_tag = self.db.query(TagORM).filter(TagORM.name == name).first()
+        result = await self.db.execute(select(TagORM).where(TagORM.name == name, LIVE))
+        db_tag = result.scalars().first()
         return self._to_entity(db_tag) if db_tag else None
 
     async def update(self, tag_id: int, tag: Tag) -> Tag | None:
         """Update a tag"""
-        db_tag = self.db.query(TagORM).filter(TagORM.id == tag_id).first()
-        if not db_tag:
-            return None
 
-        if tag.name is not None:
-            db_tag.name = tag.name
-        if tag.color is not None:
-            db_tag.color = tag.color
-
-        self.db.commit()
-        self.db.refresh(db_tag)
-        return self._to_entity(db_tag)
+        async def operation(session: AsyncSession) -> Tag | None:
+            db_tag = await self._get_orm(session, tag_id)
+            if not db_tag:
+                return None
+
+            if tag.name is not None:
+                db_tag.name = tag.name
+            if tag.color is not None:
+                db_tag.color = tag.color
+
+            await session.flush()
+            await session.refresh(db_tag)
+            return self._to_entity(db_tag)
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def patch(self, tag_id: int, fields: dict[str, Any]) -> Tag | None:
+        """Partially update a tag with UPDATE ... RETURNING"""
+
+        async def operation(session: AsyncSession) -> Tag | None:
+            statement = (
+                update(TagORM)
+                .where(TagORM.id == tag_id, LIVE)
+                .values(**fields, updated_at=func.now())
+                .returning(TagORM)
+                .execution_options(populate_existing=True)
+            )
+            # The unique index on name is the conflict check, no lookup needed
+            try:
+                async with session.begin_nested():
+                    result = await session.execute(statement)
+                    db_tag = result.scalar_one_or_none()
+            except IntegrityError as e:
+                raise ValueError(f"Tag with name '{fields.get('name')}' already exists") from e
+            return self._to_entity(db_tag) if db_tag else None
+
+        return await run_write(self.db, self.writer, operation)
 
     async def delete(self, tag_id: int) -> bool:
-        """Delete a tag"""
-        db_tag = self.db.query(TagORM).filter(TagORM.id == tag_id).first()
-        if not db_tag:
-            return False
-
-        self.db.delete(db_tag)
-        self.db.commit()
-        return True
+        """Turn a tag into a tombstone with one UPDATE, however many items it has.
+
+        Its links stay until purge_deleted removes the row and they go by
+        ON DELETE CASCADE.
+        """
+
+        async def operation(session: AsyncSession) -> bool:
+            result = await session.execute(
+                update(TagORM)
+                .where(TagORM.id == tag_id, LIVE)
+                .values(deleted_at=func.now())
+                .returning(TagORM.id)
+                .execution_options(synchronize_session=False)
+            )
+            return result.scalar_one_or_none() is not None
+
+        return await run_write(self.db, self.writer, operation)
+
+    async def purge_deleted(self, before: datetime, limit: int = 500) -> int:
+        """Hard-delete up to ``limit`` tags deleted before ``before``, oldest first"""
+
+        async def operation(session: AsyncSession) -> int:
+            oldest = (
+                select(TagORM.id)
+                .where(TagORM.deleted_at < before)
+                .order_by(TagORM.deleted_at)
+                .limit(limit)
+            )
+            result = await session.execute(
+                delete(TagORM)
+                .where(TagORM.id.in_(oldest))
+                .execution_options(synchronize_session=False)
+            )
+            return result.rowcount
+
+        return await run_write(self.db, self.writer, operation)
 
     async def get_by_ids(self, tag_ids: list[int]) -> list[Tag]:
         """Get multiple tags by their IDs"""
-        db_tags = self.db.query(TagORM).filter(TagORM.id.in_(tag_ids)).all()
+        result = await self.db.execute(select(TagORM).where(TagORM.id.in_(tag_ids), LIVE))
+        db_tags = result.scalars().all()
         return [self._to_entity(tag) for tag in db_tags]
+
+    async def _get_orm(self, session: AsyncSession, tag_id: int) -> TagORM | None:
+        """Load the ORM row for a tag"""
+        result = await session.execute(select(TagORM).where(TagORM.id == tag_id, LIVE))
+        return result.scalar_one_or_none()
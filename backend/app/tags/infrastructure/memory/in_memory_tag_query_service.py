@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Any
+
+from app.shared.domain.pagination import Page, PageCursor, SortKey
+from app.shared.infrastructure.memory.store import MemoryStore, take
+from app.tags.domain.interfaces.tag_query_service import TagQueryServiceInterface
+
+
+class InMemoryTagQueryService(TagQueryServiceInterface):
+    """Tag read model over a MemoryStore"""
+
+    def __init__(self, store: MemoryStore):
+        self.store = store
+
+    async def get_page(
+        self, after: PageCursor | None = None, limit: int = 100, sort: SortKey = "id"
+    ) -> Page[dict[str, Any]]:
+        """Get a page of tags as dicts, from the index of the sort order"""
+        tag_ids, more = take(self.store.ordered_tag_ids(sort, after), limit)
+        rows = [self._to_dict(tag_id) for tag_id in tag_ids]
+        if not more:
+            return Page(rows)
+        last = rows[-1]
+        return Page(rows, PageCursor(sort=sort, value=last[sort], id=last["id"]))
+
+    async def count(self) -> int:
+        """Number of live tags"""
+        return len(self.store.tag_ids)
+
+    async def get_tombstones(
+        self, since: datetime | None = None, limit: int = 1000
+    ) -> list[dict[str, Any]]:
+        """Read the tag tombstones, oldest deletion first"""
+        tombstones = self.store.oldest_tombstones(self.store.tag_tombstones, since, limit)
+        return [{"id": tag_id, "deleted_at": deleted_at} for tag_id, deleted_at in tombstones]
+
+    def _to_dict(self, tag_id: int) -> dict[str, Any]:
+        """A live tag as a row of the tags table"""
+        tag = self.store.tags[tag_id]
+        return {
+            "id": tag.id,
+            "name": tag.name,
+            "color": tag.color,
+            "created_at": tag.created_at,
+            "updated_at": tag.updated_at,
+            "deleted_at": None,
+        }
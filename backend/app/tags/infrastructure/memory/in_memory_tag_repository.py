@@ -0,0 +1,83 @@
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+from app.shared.domain.pagination import Page, PageCursor, SortKey
+from app.shared.infrastructure.memory.store import MemoryStore, take, utc_now
+from app.tags.domain.entities.tag import Tag
+from app.tags.domain.interfaces.tag_repository import TagRepositoryInterface
+
+
+class InMemoryTagRepository(TagRepositoryInterface):
+    """TagRepositoryInterface over a MemoryStore, with the semantics of TagRepositoryImpl.
+
+    Names are unique among live tags ignoring ASCII case, checked against the
+    store's name index instead of a unique index.
+    """
+
+    def __init__(self, store: MemoryStore):
+        self.store = store
+
+    async def create(self, tag: Tag) -> Tag:
+        """Create a new tag, raising ValueError if a live tag holds the name"""
+        if self.store.tag_by_name(tag.name) is not None:
+            raise ValueError(f"Tag with name '{tag.name}' already exists")
+        return self.store.add_tag(tag)
+
+    async def upsert(self, tag: Tag) -> tuple[Tag, bool]:
+        """Create a tag, or recolor the live tag of that name"""
+        existing = self.store.tag_by_name(tag.name)
+        if existing is None:
+            return self.store.add_tag(tag), True
+        return self.store.change_tag(existing.id, color=tag.color, updated_at=utc_now()), False
+
+    async def get_by_id(self, tag_id: int) -> Tag | None:
+        """Get a tag by ID"""
+        return self.store.get_tag(tag_id)
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[Tag]:
+        """Get all tags by ID with offset pagination"""
+        tag_ids = islice(self.store.ordered_tag_ids("id"), skip, skip + limit)
+        return [self.store.get_tag(tag_id) for tag_id in tag_ids]
+
+    async def get_page(
+        self, after: PageCursor | None = None, limit: int = 100, sort: SortKey = "id"
+    ) -> Page[Tag]:
+        """Get a page of tags from the index of the sort order"""
+        tag_ids, more = take(self.store.ordered_tag_ids(sort, after), limit)
+        tags = [self.store.get_tag(tag_id) for tag_id in tag_ids]
+        if not more:
+            return Page(tags)
+        last = tags[-1]
+        return Page(tags, PageCursor(sort=sort, value=getattr(last, sort), id=last.id))
+
+    async def get_by_name(self, name: str) -> Tag | None:
+        """Get a tag by name, ignoring ASCII case"""
+        return self.store.tag_by_name(name)
+
+    async def update(self, tag_id: int, tag: Tag) -> Tag | None:
+        """Update a tag's name and color, where given"""
+        fields = {
+            name: value
+            for name, value in [("name", tag.name), ("color", tag.color)]
+            if value is not None
+        }
+        return self.store.change_tag(tag_id, **fields, updated_at=utc_now())
+
+    async def patch(self, tag_id: int, fields: dict[str, Any]) -> Tag | None:
+        """Change only the given fields; raises ValueError if the new name is taken"""
+        return self.store.change_tag(tag_id, **fields, updated_at=utc_now())
+
+    async def delete(self, tag_id: int) -> bool:
+        """Turn a tag into a tombstone"""
+        return self.store.delete_tag(tag_id)
+
+    async def purge_deleted(self, before: datetime, limit: int = 500) -> int:
+        """Forget up to ``limit`` tag tombstones older than ``before``, oldest first"""
+        return self.store.purge(self.store.tag_tombstones, before, limit)
+
+    async def get_by_ids(self, tag_ids: list[int]) -> list[Tag]:
+        """Get the live tags among the given IDs, in ID order"""
+        return [
+            self.store.get_tag(tag_id) for tag_id in sorted(set(tag_ids) & self.store.tags.keys())
+        ]
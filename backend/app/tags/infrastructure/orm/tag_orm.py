@@ -1,15 +1,37 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Table
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+    event,
+    text,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.shared.infrastructure import Base
+from app.tags.infrastructure.database.tag_counters import (
+    item_tags_version,
+    tag_counters,
+    tag_items_counters,
+    tags_version,
+)
 
-# Association table for many-to-many relationship between items and tags
+# Association table for many-to-many relationship between items and tags.
+# WITHOUT ROWID stores rows directly in the (item_id, tag_id) primary key b-tree,
+# and the reverse (tag_id, item_id) index answers "items having tag X" lookups
+# without touching the table at all. Links are removed by ON DELETE CASCADE
+# (PRAGMA foreign_keys is on), so deleting an item or tag never loads the other side.
 item_tags = Table(
     "item_tags",
     Base.metadata,
-    Column("item_id", Integer, ForeignKey("items.id"), primary_key=True),
-    Column("tag_id", Integer, ForeignKey("tags.id"), primary_key=True),
+    Column("item_id", Integer, ForeignKey("items.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_item_tags_tag_id_item_id", "tag_id", "item_id"),
+    sqlite_with_rowid=False,
 )
 
 
@@ -19,10 +41,41 @@ class TagORM(Base):
     __tablename__ = "tags"
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, unique=True, index=True, nullable=False)
+    # NOCASE makes the unique index, lookups and sorting ignore ASCII case,
+    # so "Bug" and "bug" are the same tag
+    name = Column(String(collation="NOCASE"), nullable=False)
     color = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Tombstone: set when the tag is deleted, the row goes once the retention
+    # window has passed (see TagRepositoryImpl.purge_deleted)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Names are unique among live tags only, so a deleted tag's name can be reused
+    __table_args__ = (
+        Index("ix_tags_name", "name", unique=True, sqlite_where=text("deleted_at IS NULL")),
+        Index("ix_tags_deleted_at", "deleted_at", sqlite_where=text("deleted_at IS NOT NULL")),
+    )
+
+    # Relationship to the live items (will be configured from ItemORM side)
+    items = relationship(
+        "ItemORM",
+        secondary=item_tags,
+        secondaryjoin="and_(ItemORM.id == item_tags.c.item_id, ItemORM.deleted_at.is_(None))",
+        back_populates="tags",
+        passive_deletes=True,
+    )
+
+
+@event.listens_for(TagORM.__table__, "after_create")
+def _create_tag_counters(target, connection, **kw):
+    """Install the triggers maintaining the tag count and version"""
+    tag_counters.ensure(connection)
+    tags_version.ensure(connection)
+
 
-    # Relationship to items (will be configured from ItemORM side)
-    items = relationship("ItemORM", secondary=item_tags, back_populates="tags")
+@event.listens_for(item_tags, "after_create")
+def _create_tag_items_counters(target, connection, **kw):
+    """Install the triggers maintaining the item count of each tag and the links version"""
+    tag_items_counters.ensure(connection)
+    item_tags_version.ensure(connection)
@@ -0,0 +1,110 @@
+"""Benchmark an online backup and a restore of a large database under writes.
+
+Fills a WAL database with the app schema and --size-mb of filler pages, then
+measures item inserts per second from --writers threads: first alone, then
+while backup_database copies the database in paced steps. Reports how long the
+backup took, the write throughput and worst commit latency in both phases, and
+how long restoring the backup over the database takes.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.backup --size-mb 1024 --writers 2 --step-pages 1024 --pause-ms 5
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from app.shared.infrastructure.database import DatabaseSettings
+from app.shared.infrastructure.database.backup import backup_database, restore_database
+from app.shared.infrastructure.database.sharding import migrate
+
+
+def fill(path: Path, size_mb: int) -> None:
+    """Grow the database to about size_mb megabytes with a table of random blobs"""
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE filler (id INTEGER PRIMARY KEY, body BLOB)")
+    for _ in range(size_mb):
+        with db:
+            db.execute(
+                "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 256) "
+                "INSERT INTO filler (body) SELECT randomblob(4000) FROM n"
+            )
+    db.close()
+
+
+def writer(path: Path, stop: threading.Event, latencies: list[float]) -> None:
+    """Insert items, one commit each, until stopped"""
+    db = sqlite3.connect(path, timeout=30)
+    db.execute("PRAGMA synchronous=NORMAL")
+    while not stop.is_set():
+        start = time.perf_counter()
+        with db:
+            db.execute("INSERT INTO items (name) VALUES ('bench')")
+        latencies.append((time.perf_counter() - start) * 1000)
+    db.close()
+
+
+def under_writes(path: Path, writers: int, work) -> tuple[object, float, list[float]]:
+    """Run work() while writer threads commit; returns its result, seconds and latencies"""
+    stop = threading.Event()
+    latencies: list[float] = []
+    threads = [
+        threading.Thread(target=writer, args=(path, stop, latencies)) for _ in range(writers)
+    ]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    try:
+        result = work()
+    finally:
+        seconds = time.perf_counter() - start
+        stop.set()
+        for thread in threads:
+            thread.join()
+    return result, seconds, latencies
+
+
+def report(label: str, seconds: float, latencies: list[float]) -> None:
+    """Print write throughput and worst commit latency of a phase"""
+    print(
+        f"{label:>14}: {len(latencies) / seconds:8.0f} writes/s | "
+        f"max commit {max(latencies, default=0):7.1f} ms over {seconds:6.2f} s"
+    )
+
+
+def main(size_mb: int, writers: int, step_pages: int, pause_ms: float, idle: float) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        migrate(DatabaseSettings(url=f"sqlite:///{path}", journal_mode="WAL"))
+        start = time.perf_counter()
+        fill(path, size_mb)
+        print(f"filled {path.stat().st_size / 2**20:.0f} MB in {time.perf_counter() - start:.1f}s")
+
+        _, seconds, latencies = under_writes(path, writers, lambda: time.sleep(idle))
+        report("idle", seconds, latencies)
+
+        result, seconds, latencies = under_writes(
+            path,
+            writers,
+            lambda: backup_database(path, Path(tmp) / "backup.db", step_pages, pause_ms / 1000),
+        )
+        report("during backup", seconds, latencies)
+        print(f"backup: {result.pages} pages in {result.steps} steps, {result.seconds:.2f}s")
+
+        seconds = restore_database(result.path, path)
+        print(f"restore: {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--step-pages", type=int, default=1024)
+    parser.add_argument("--pause-ms", type=float, default=5.0)
+    parser.add_argument("--idle", type=float, default=5.0, help="seconds of writes alone")
+    args = parser.parse_args()
+    main(args.size_mb, args.writers, args.step_pages, args.pause_ms, args.idle)
@@ -0,0 +1,109 @@
+"""Benchmark GET latency while concurrent writes are running.
+
+Runs a pool of readers hitting ``GET /items/`` and ``GET /items/{id}`` through the
+ASGI app, first on an idle database and then while writers keep creating and
+updating items. Reports p50/p95/p99 read latency for both phases.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.concurrent_reads --readers 20 --writers 4 --duration 5 --profile prod
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.shared.infrastructure import Base, get_db
+from app.shared.infrastructure.database import Database, DatabaseSettings, create_db_engine
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the given percentile (0-100) of the samples"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def reader(client: AsyncClient, stop: asyncio.Event, latencies: list[float]) -> None:
+    """Issue list and detail GETs until stopped"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get("/items/", params={"limit": 50})
+        await client.get("/items/1")
+        latencies.append((time.perf_counter() - start) * 1000 / 2)
+
+
+async def writer(client: AsyncClient, stop: asyncio.Event, counter: list[int]) -> None:
+    """Create and update items until stopped"""
+    while not stop.is_set():
+        response = await client.post("/items/", json={"name": "bench", "description": "write"})
+        item_id = response.json()["id"]
+        await client.put(f"/items/{item_id}", json={"name": "bench updated"})
+        counter[0] += 2
+
+
+async def run_phase(client: AsyncClient, readers: int, writers: int, duration: float) -> dict:
+    """Run readers (and optionally writers) for a fixed duration"""
+    stop = asyncio.Event()
+    latencies: list[float] = []
+    writes = [0]
+    tasks = [asyncio.create_task(reader(client, stop, latencies)) for _ in range(readers)]
+    tasks += [asyncio.create_task(writer(client, stop, writes)) for _ in range(writers)]
+    await asyncio.sleep(duration)
+    stop.set()
+    await asyncio.gather(*tasks)
+    return {
+        "reads": len(latencies),
+        "writes": writes[0],
+        "p50": statistics.median(latencies),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+    }
+
+
+async def main(readers: int, writers: int, duration: float, seed: int, profile: str) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = DatabaseSettings(url=f"sqlite:///{Path(tmp) / 'bench.db'}", profile=profile)
+        schema_engine = create_db_engine(settings)
+        Base.metadata.create_all(bind=schema_engine)
+        schema_engine.dispose()
+        database = Database(settings)
+
+        async def get_bench_db():
+            async with database.session() as db:
+                yield db
+
+        app.dependency_overrides[get_db] = get_bench_db
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://bench") as client:
+                for i in range(seed):
+                    await client.post("/items/", json={"name": f"seed {i}"})
+
+                for label, phase_writers in (("idle", 0), ("under writes", writers)):
+                    stats = await run_phase(client, readers, phase_writers, duration)
+                    print(
+                        f"{label:>13}: {stats['reads']:6d} reads {stats['writes']:6d} writes | "
+                        f"p50 {stats['p50']:7.2f} ms  p95 {stats['p95']:7.2f} ms  "
+                        f"p99 {stats['p99']:7.2f} ms"
+                    )
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+            await database.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=20)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=500, help="items created before measuring")
+    parser.add_argument("--profile", choices=["dev", "test", "prod"], default="prod")
+    args = parser.parse_args()
+    asyncio.run(main(args.readers, args.writers, args.duration, args.seed, args.profile))
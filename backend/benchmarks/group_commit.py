@@ -0,0 +1,84 @@
+"""Benchmark write throughput with and without group commit.
+
+Concurrent workers create items through ItemRepositoryImpl for a fixed
+duration, once with a commit per request and once through the group commit
+writer. Reports operations per second and the number of commits issued.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.group_commit --workers 32 --duration 5 --synchronous FULL
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import event
+
+from app.items.domain.entities.item import Item
+from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl
+from app.shared.infrastructure import Base
+from app.shared.infrastructure.database import Database, DatabaseSettings, create_db_engine
+
+
+async def run_mode(settings: DatabaseSettings, workers: int, duration: float) -> dict:
+    """Create items from concurrent workers and measure throughput"""
+    schema_engine = create_db_engine(settings)
+    Base.metadata.create_all(bind=schema_engine)
+    schema_engine.dispose()
+    database = Database(settings)
+    commits = [0]
+
+    @event.listens_for(database.writer_engine.sync_engine, "commit")
+    def _on_commit(conn):
+        commits[0] += 1
+
+    stop = asyncio.Event()
+    done = [0]
+
+    async def worker() -> None:
+        while not stop.is_set():
+            async with database.session() as session:
+                repository = ItemRepositoryImpl(session, database.group_commit)
+                await repository.create(Item(name="bench", description="group commit"))
+            done[0] += 1
+
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+    await asyncio.sleep(duration)
+    stop.set()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    await database.dispose()
+    return {"ops": done[0], "ops_per_sec": done[0] / elapsed, "commits": commits[0]}
+
+
+async def main(args: argparse.Namespace) -> None:
+    for label, group_commit in (("commit per request", False), ("group commit", True)):
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = DatabaseSettings(
+                url=f"sqlite:///{Path(tmp) / 'bench.db'}",
+                profile=args.profile,
+                synchronous=args.synchronous,
+                group_commit=group_commit,
+                group_commit_max_batch=args.max_batch,
+                group_commit_max_latency_ms=args.max_latency_ms,
+            )
+            stats = await run_mode(settings, args.workers, args.duration)
+            print(
+                f"{label:>18}: {stats['ops']:7d} writes {stats['ops_per_sec']:9.1f} writes/s "
+                f"in {stats['commits']:6d} commits"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--profile", choices=["dev", "test", "prod"], default="prod")
+    parser.add_argument("--synchronous", default=None, help="override the profile, e.g. FULL")
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-latency-ms", type=float, default=2.0)
+    asyncio.run(main(parser.parse_args()))
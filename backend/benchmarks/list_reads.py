@@ -0,0 +1,87 @@
+"""Benchmark the Core read model against the ORM path for list endpoints.
+
+Fills a database with items carrying a few tags each, then walks every item
+page by page through GetItemsPageUseCase, once backed by ItemRepositoryImpl
+(ORM hydration plus from_attributes validation) and once by
+ItemQueryServiceImpl (Core rows, tags aggregated with json_group_array).
+Reports rows per second including DTO validation.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.list_reads --items 10000 --page-size 100 --rounds 3
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from app.items.application.use_cases.item_use_cases import GetItemsPageUseCase
+from app.items.domain.entities.item import Item
+from app.items.infrastructure.database.item_query_service_impl import ItemQueryServiceImpl
+from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl
+from app.shared.infrastructure import Base
+from app.shared.infrastructure.database import Database, DatabaseSettings, create_db_engine
+from app.tags.infrastructure.orm.tag_orm import TagORM
+
+# Both implement get_page with the same signature, so the use case takes either
+READ_PATHS = {"orm": ItemRepositoryImpl, "core": ItemQueryServiceImpl}
+
+
+async def seed(database: Database, items: int, tags_per_item: int) -> None:
+    """Create 50 tags and the items, each with tags_per_item of them"""
+    async with database.session() as session:
+        session.add_all([TagORM(name=f"tag-{i}", color="#000000") for i in range(50)])
+        await session.commit()
+        repository = ItemRepositoryImpl(session)
+        await repository.bulk_create(
+            [Item(name=f"item-{i}", description="benchmark") for i in range(items)],
+            [[(i + t) % 50 + 1 for t in range(tags_per_item)] for i in range(items)],
+        )
+
+
+async def walk(database: Database, read_path, page_size: int) -> int:
+    """Read every item page by page, one session per page as in a request"""
+    rows, after = 0, None
+    while True:
+        async with database.session() as session:
+            page = await GetItemsPageUseCase(read_path(session)).execute(
+                after=after, limit=page_size
+            )
+        rows += len(page.items)
+        if page.next_cursor is None:
+            return rows
+        after = page.next_cursor
+
+
+async def main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = DatabaseSettings(url=f"sqlite:///{Path(tmp) / 'bench.db'}", profile="prod")
+        schema_engine = create_db_engine(settings)
+        Base.metadata.create_all(bind=schema_engine)
+        schema_engine.dispose()
+        database = Database(settings)
+        await seed(database, args.items, args.tags_per_item)
+
+        print(f"{args.items} items, {args.tags_per_item} tags each, pages of {args.page_size}")
+        print("{:>6} {:>12} {:>10}".format("path", "rows/s", "walk ms"))
+        for name, read_path in READ_PATHS.items():
+            await walk(database, read_path, args.page_size)  # warm the page cache
+            best = float("inf")
+            for _ in range(args.rounds):
+                start = time.perf_counter()
+                rows = await walk(database, read_path, args.page_size)
+                best = min(best, time.perf_counter() - start)
+            assert rows == args.items
+            print(f"{name:>6} {rows / best:12,.0f} {best * 1000:10.1f}")
+        await database.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--tags-per-item", type=int, default=3)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,101 @@
+"""Benchmark tag loading strategies for item reads.
+
+Fills a database with items carrying 0, 5 or 50 tags each and times page
+reads (GET /items/) and single item reads (GET /items/{id}) through
+ItemRepositoryImpl with joined, selectin and subquery loading of the tags.
+Reports milliseconds and SQL statements per read.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.tag_loading --items 2000 --page-size 100 --reads 200
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.orm import joinedload, selectinload, subqueryload
+
+from app.items.domain.entities.item import Item
+from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl, TagLoading
+from app.shared.domain.pagination import PageCursor
+from app.shared.infrastructure import Base
+from app.shared.infrastructure.database import Database, DatabaseSettings, create_db_engine
+from app.tags.infrastructure.orm.tag_orm import TagORM
+
+STRATEGIES = {"joined": joinedload, "selectin": selectinload, "subquery": subqueryload}
+TAG_COUNTS = (0, 5, 50)
+
+
+async def seed(database: Database, items: int, tags_per_item: int) -> list[int]:
+    """Create 50 tags and the items, each with tags_per_item of them"""
+    async with database.session() as session:
+        session.add_all([TagORM(name=f"tag-{i}", color="#000000") for i in range(50)])
+        await session.commit()
+        repository = ItemRepositoryImpl(session)
+        return await repository.bulk_create(
+            [Item(name=f"item-{i}", description="benchmark") for i in range(items)],
+            [[(i + t) % 50 + 1 for t in range(tags_per_item)] for i in range(items)],
+        )
+
+
+async def time_reads(database: Database, loading: TagLoading, ids: list[int], args) -> dict:
+    """Time page reads and detail reads with the given loading strategies"""
+    counters = {"statements": 0}
+
+    @event.listens_for(database.reader_engine.sync_engine, "after_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        counters["statements"] += 1
+
+    results = {}
+    for kind in ("page", "detail"):
+        counters["statements"] = 0
+        start = time.perf_counter()
+        for i in range(args.reads):
+            async with database.session() as session:
+                repository = ItemRepositoryImpl(session, loading=loading)
+                if kind == "page":
+                    offset = ids[(i * args.page_size) % (len(ids) - args.page_size)]
+                    cursor = PageCursor(sort="id", value=offset, id=offset)
+                    page = await repository.get_page(after=cursor, limit=args.page_size)
+                    assert len(page.items) == args.page_size
+                else:
+                    assert await repository.get_by_id(ids[i % len(ids)]) is not None
+        elapsed = time.perf_counter() - start
+        results[kind] = (elapsed / args.reads * 1000, counters["statements"] / args.reads)
+    event.remove(database.reader_engine.sync_engine, "after_cursor_execute", _count)
+    return results
+
+
+async def main(args: argparse.Namespace) -> None:
+    header = ("tags/item", "strategy", "page ms", "stmts", "detail ms", "stmts")
+    print("{:>9} {:>9} {:>8} {:>5} {:>9} {:>5}".format(*header))
+    for tags_per_item in TAG_COUNTS:
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = DatabaseSettings(url=f"sqlite:///{Path(tmp) / 'bench.db'}", profile="prod")
+            schema_engine = create_db_engine(settings)
+            Base.metadata.create_all(bind=schema_engine)
+            schema_engine.dispose()
+            database = Database(settings)
+            ids = await seed(database, args.items, tags_per_item)
+            for name, loader in STRATEGIES.items():
+                loading = TagLoading(lists=loader, detail=loader)
+                stats = await time_reads(database, loading, ids, args)
+                page_ms, page_statements = stats["page"]
+                detail_ms, detail_statements = stats["detail"]
+                print(
+                    f"{tags_per_item:>9} {name:>9} {page_ms:8.2f} {page_statements:5.1f} "
+                    f"{detail_ms:9.3f} {detail_statements:5.1f}"
+                )
+            await database.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--reads", type=int, default=200)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,76 @@
+"""Unit tests for backup use cases"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.backups.application.dtos.backup_dto import BackupCreateDTO, BackupDTO
+from app.backups.application.use_cases.backup_use_cases import (
+    CreateBackupUseCase,
+    ListBackupsUseCase,
+)
+from app.backups.domain.entities.backup import Backup
+
+
+def create_backup_entity(board_id: str | None = None) -> Backup:
+    """A backup made on 1 January 2024"""
+    return Backup(
+        board_id=board_id,
+        name="20240101T000000000000Z.db",
+        size=4096,
+        created_at=datetime(2024, 1, 1),
+    )
+
+
+class TestListBackupsUseCase:
+    """Test ListBackupsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_the_board_backups(self):
+        """Test that the store's backups of the board come back as DTOs"""
+        # Arrange
+        mock_store = AsyncMock()
+        mock_store.list.return_value = [create_backup_entity("ops")]
+
+        # Act
+        result = await ListBackupsUseCase(mock_store).execute("ops")
+
+        # Assert
+        assert result == [
+            BackupDTO(
+                board_id="ops",
+                name="20240101T000000000000Z.db",
+                size=4096,
+                created_at=datetime(2024, 1, 1),
+            )
+        ]
+        mock_store.list.assert_called_once_with("ops")
+
+
+class TestCreateBackupUseCase:
+    """Test CreateBackupUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_backs_up_the_requested_board(self):
+        """Test that the backup made by the store is returned"""
+        # Arrange
+        mock_store = Mock(create=AsyncMock(return_value=create_backup_entity()))
+
+        # Act
+        result = await CreateBackupUseCase(mock_store).execute(BackupCreateDTO())
+
+        # Assert
+        assert result.board_id is None
+        assert result.size == 4096
+        mock_store.create.assert_awaited_once_with(None)
+
+    @pytest.mark.asyncio
+    async def test_execute_propagates_unknown_board(self):
+        """Test that the store's KeyError for an unknown board is not swallowed"""
+        # Arrange
+        mock_store = Mock(create=AsyncMock(side_effect=KeyError("ops")))
+
+        # Act & Assert
+        with pytest.raises(KeyError):
+            await CreateBackupUseCase(mock_store).execute(BackupCreateDTO(board_id="ops"))
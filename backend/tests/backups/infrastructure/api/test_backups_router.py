@@ -0,0 +1,76 @@
+"""Unit tests for backups router"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import HTTPException
+
+from app.backups.application.dtos.backup_dto import BackupCreateDTO, BackupDTO
+from app.backups.infrastructure.api.backups_router import create_backup, get_backups
+
+BACKUP = BackupDTO(name="20240101T000000000000Z.db", size=4096, created_at=datetime(2024, 1, 1))
+
+
+class TestGetBackupsEndpoint:
+    """Test GET /admin/backups endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_get_backups_returns_use_case_result(self, mocker):
+        """Test that the backups listed by the use case are returned"""
+        # Arrange
+        mock_store = Mock()
+        mock_use_case = AsyncMock(execute=AsyncMock(return_value=[BACKUP]))
+        mock_use_case_class = mocker.patch(
+            "app.backups.infrastructure.api.backups_router.ListBackupsUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act
+        result = await get_backups(board_id="ops", store=mock_store)
+
+        # Assert
+        assert result == [BACKUP]
+        mock_use_case_class.assert_called_once_with(mock_store)
+        mock_use_case.execute.assert_called_once_with("ops")
+
+
+class TestCreateBackupEndpoint:
+    """Test POST /admin/backups endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_create_backup_returns_the_backup(self, mocker):
+        """Test that the backup made is returned"""
+        # Arrange
+        request = BackupCreateDTO()
+        mock_use_case = AsyncMock(execute=AsyncMock(return_value=BACKUP))
+        mocker.patch(
+            "app.backups.infrastructure.api.backups_router.CreateBackupUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act
+        result = await create_backup(request=request, store=Mock())
+
+        # Assert
+        assert result == BACKUP
+        mock_use_case.execute.assert_called_once_with(request)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("error", "status_code"),
+        [(KeyError("ops"), 404), (ValueError("Backups need the SQLite backend"), 409)],
+    )
+    async def test_create_backup_maps_errors(self, mocker, error, status_code):
+        """Test that an unknown board is a 404 and an impossible backup a 409"""
+        # Arrange
+        mock_use_case = AsyncMock(execute=AsyncMock(side_effect=error))
+        mocker.patch(
+            "app.backups.infrastructure.api.backups_router.CreateBackupUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await create_backup(request=BackupCreateDTO(board_id="ops"), store=Mock())
+        assert exc_info.value.status_code == status_code
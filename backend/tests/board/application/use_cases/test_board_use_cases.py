@@ -0,0 +1,112 @@
+"""Unit tests for board use cases"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.board.application.dtos.board_dto import BoardCreateDTO, BoardInfoDTO
+from app.board.application.use_cases.board_use_cases import (
+    CreateBoardUseCase,
+    GetBoardUseCase,
+    ListBoardsUseCase,
+)
+from app.board.domain.entities.board_snapshot import BoardSnapshot
+from app.shared.domain.pagination import Page, PageCursor
+
+
+def create_item_row(id: int, status: str, position: str) -> dict:
+    """An item row as returned by the item read model"""
+    return {
+        "id": id,
+        "name": f"Item {id}",
+        "description": None,
+        "created_at": datetime(2024, 1, 1),
+        "updated_at": None,
+        "status": status,
+        "position": position,
+        "tags": [],
+    }
+
+
+class TestGetBoardUseCase:
+    """Test GetBoardUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_encodes_cursors_and_keeps_column_order(self):
+        """Test that columns come out in board order with their counts and cursors"""
+        # Arrange
+        mock_query_service = AsyncMock()
+        mock_query_service.get_snapshot.return_value = BoardSnapshot(
+            version=42,
+            tags=Page(
+                [{"id": 1, "name": "bug", "color": "#FF0000", "created_at": datetime(2024, 1, 1)}],
+                PageCursor(sort="name", value="bug", id=1),
+            ),
+            tag_count=2,
+            columns={
+                "todo": Page([create_item_row(1, "todo", "a")], PageCursor("position", "a", 1)),
+                "inprogress": Page([]),
+                "done": Page([create_item_row(2, "done", "a")]),
+            },
+            column_counts={"todo": 5, "inprogress": 0, "done": 1},
+        )
+        use_case = GetBoardUseCase(mock_query_service)
+
+        # Act
+        result = await use_case.execute(limit=1, tag_limit=1)
+
+        # Assert
+        assert result.version == 42
+        assert [tag.name for tag in result.tags] == ["bug"]
+        assert PageCursor.decode(result.tags_next_cursor).value == "bug"
+        assert result.tag_total == 2
+        assert [column.status for column in result.columns] == ["todo", "inprogress", "done"]
+        assert [column.total for column in result.columns] == [5, 0, 1]
+        assert PageCursor.decode(result.columns[0].next_cursor).id == 1
+        assert result.columns[2].next_cursor is None
+        mock_query_service.get_snapshot.assert_called_once_with(limit=1, tag_limit=1)
+
+
+class TestListBoardsUseCase:
+    """Test ListBoardsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_lists_the_registered_boards(self):
+        """Test every board ID of the registry is returned"""
+        # Arrange
+        registry = Mock(list_ids=Mock(return_value=["design", "ops"]))
+
+        # Act
+        result = await ListBoardsUseCase(registry).execute()
+
+        # Assert
+        assert result == [BoardInfoDTO(id="design"), BoardInfoDTO(id="ops")]
+
+
+class TestCreateBoardUseCase:
+    """Test CreateBoardUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_creates_the_board(self):
+        """Test the registry creates the board and its ID is returned"""
+        # Arrange
+        registry = AsyncMock()
+
+        # Act
+        result = await CreateBoardUseCase(registry).execute(BoardCreateDTO(id="ops"))
+
+        # Assert
+        assert result == BoardInfoDTO(id="ops")
+        registry.create.assert_awaited_once_with("ops")
+
+    @pytest.mark.asyncio
+    async def test_propagates_a_taken_id(self):
+        """Test the registry's ValueError reaches the caller"""
+        # Arrange
+        registry = AsyncMock()
+        registry.create.side_effect = ValueError("Board 'ops' already exists")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="already exists"):
+            await CreateBoardUseCase(registry).execute(BoardCreateDTO(id="ops"))
@@ -0,0 +1,33 @@
+"""Unit tests for board router"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.board.application.dtos.board_dto import BoardDTO
+from app.board.infrastructure.api.board_router import get_board
+
+
+class TestGetBoardEndpoint:
+    """Test GET /board endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_get_board_passes_limits(self, mocker):
+        """Test that the page sizes reach the use case and its result is returned"""
+        # Arrange
+        mock_query_service = AsyncMock()
+        board = BoardDTO(version=1, tags=[], tag_total=0, columns=[])
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=board)
+        mock_use_case_class = mocker.patch(
+            "app.board.infrastructure.api.board_router.GetBoardUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act
+        result = await get_board(limit=20, tag_limit=10, query_service=mock_query_service)
+
+        # Assert
+        assert result == board
+        mock_use_case_class.assert_called_once_with(mock_query_service)
+        mock_use_case.execute.assert_called_once_with(limit=20, tag_limit=10)
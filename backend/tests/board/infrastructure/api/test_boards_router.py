@@ -0,0 +1,79 @@
+"""Unit tests for boards router"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.board.application.dtos.board_dto import BoardCreateDTO, BoardInfoDTO
+from app.board.infrastructure.api.boards_router import create_board, get_boards
+
+
+class TestGetBoardsEndpoint:
+    """Test GET /boards endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_get_boards_returns_use_case_result(self, mocker):
+        """Test that the boards listed by the use case are returned"""
+        # Arrange
+        mock_registry = AsyncMock()
+        boards = [BoardInfoDTO(id="ops")]
+        mock_use_case = AsyncMock(execute=AsyncMock(return_value=boards))
+        mock_use_case_class = mocker.patch(
+            "app.board.infrastructure.api.boards_router.ListBoardsUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act
+        result = await get_boards(registry=mock_registry)
+
+        # Assert
+        assert result == boards
+        mock_use_case_class.assert_called_once_with(mock_registry)
+
+
+class TestCreateBoardEndpoint:
+    """Test POST /boards endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_create_board_returns_the_board(self, mocker):
+        """Test that the created board is returned"""
+        # Arrange
+        board = BoardCreateDTO(id="ops")
+        mock_use_case = AsyncMock(execute=AsyncMock(return_value=BoardInfoDTO(id="ops")))
+        mocker.patch(
+            "app.board.infrastructure.api.boards_router.CreateBoardUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act
+        result = await create_board(board=board, registry=AsyncMock())
+
+        # Assert
+        assert result == BoardInfoDTO(id="ops")
+        mock_use_case.execute.assert_called_once_with(board)
+
+    @pytest.mark.asyncio
+    async def test_create_board_with_taken_id_returns_409(self, mocker):
+        """Test that a board ID already in use is a conflict"""
+        # Arrange
+        mock_use_case = AsyncMock(
+            execute=AsyncMock(side_effect=ValueError("Board 'ops' already exists"))
+        )
+        mocker.patch(
+            "app.board.infrastructure.api.boards_router.CreateBoardUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await create_board(board=BoardCreateDTO(id="ops"), registry=AsyncMock())
+        assert exc_info.value.status_code == 409
+
+    def test_board_ids_must_be_safe_file_names(self):
+        """Test that IDs with path separators or upper case letters are rejected"""
+        # Act & Assert
+        for board_id in ("../app", "Ops", "", "a/b"):
+            with pytest.raises(ValidationError):
+                BoardCreateDTO(id=board_id)
@@ -0,0 +1,97 @@
+"""Integration tests for BackupStoreImpl"""
+
+import pytest
+from sqlalchemy import insert
+
+from app.backups.infrastructure.database.backup_store_impl import BackupStoreImpl
+from app.items.infrastructure.orm.item_orm import ItemORM
+from app.shared.infrastructure.database import Database, DatabaseSettings, ShardRouter
+from app.shared.infrastructure.database.sharding import migrate
+
+
+@pytest.fixture
+def settings(tmp_path) -> DatabaseSettings:
+    """Settings of a WAL database with a boards directory and a backup directory"""
+    return DatabaseSettings(
+        url=f"sqlite:///{tmp_path / 'app.db'}",
+        profile="test",
+        journal_mode="WAL",
+        boards_dir=str(tmp_path / "boards"),
+        backup_dir=str(tmp_path / "backups"),
+        backup_keep=3,
+    )
+
+
+@pytest.fixture
+async def shards(settings) -> ShardRouter:
+    """Router over the migrated default database, which holds one item"""
+    migrate(settings)
+    default = Database(settings)
+    async with default.session() as session:
+        await session.execute(insert(ItemORM).values(name="kept"))
+        await session.commit()
+    router = ShardRouter(settings, default)
+    yield router
+    await router.dispose()
+    await default.dispose()
+
+
+class TestBackupStoreImpl:
+    """Test BackupStoreImpl"""
+
+    async def test_create_then_list(self, shards, settings):
+        """Test a backup of the default board is listed with its time and size"""
+        # Arrange
+        store = BackupStoreImpl(shards, settings)
+
+        # Act
+        backup = await store.create()
+        listed = await store.list()
+
+        # Assert
+        assert [(entry.name, entry.size) for entry in listed] == [(backup.name, backup.size)]
+        assert listed[0].board_id is None
+        assert listed[0].created_at == backup.created_at
+        assert await store.list("ops") == []
+
+    async def test_list_skips_files_not_named_by_a_backup(self, shards, settings, tmp_path):
+        """Test a stray .db file in the backup directory is left out instead of failing"""
+        # Arrange
+        store = BackupStoreImpl(shards, settings)
+        backup = await store.create()
+        (tmp_path / "backups" / "default" / "copy.db").write_bytes(b"")
+
+        # Act
+        listed = await store.list()
+
+        # Assert
+        assert [entry.name for entry in listed] == [backup.name]
+
+    async def test_create_all_backs_up_every_board(self, shards, settings):
+        """Test the scheduled job covers the default board and the others"""
+        # Arrange
+        await shards.create("ops")
+        store = BackupStoreImpl(shards, settings)
+
+        # Act
+        made = await store.create_all()
+
+        # Assert
+        assert made == 2
+        assert len(await store.list()) == 1
+        assert len(await store.list("ops")) == 1
+
+    async def test_unknown_board_raises_key_error(self, shards, settings):
+        """Test there is no backup of a board that does not exist"""
+        # Act & Assert
+        with pytest.raises(KeyError):
+            await BackupStoreImpl(shards, settings).create("ops")
+
+    async def test_memory_backend_raises_value_error(self, shards, settings):
+        """Test the in-memory backend has no database file to back up"""
+        # Arrange
+        store = BackupStoreImpl(shards, settings.model_copy(update={"backend": "memory"}))
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await store.create()
@@ -0,0 +1,101 @@
+"""Integration tests for BoardQueryServiceImpl"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.board.infrastructure.database.board_query_service_impl import BoardQueryServiceImpl
+from app.items.domain.entities.item import Item
+from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl
+from app.shared.infrastructure import Base
+from app.shared.infrastructure.database import Database, DatabaseSettings
+from app.tags.infrastructure.orm.tag_orm import TagORM
+
+
+class TestBoardQueryServiceImplGetSnapshot:
+    """Test get_snapshot method"""
+
+    @pytest.mark.asyncio
+    async def test_get_snapshot_reads_everything_in_three_queries(
+        self, db_session: AsyncSession, sql_statements: list[str]
+    ):
+        """Test the columns, counts and tags of the snapshot and the statements it costs"""
+        # Arrange
+        db_session.add(TagORM(name="bug", color="#FF0000"))
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+        await repository.bulk_create(
+            [Item(name=f"todo {i}") for i in range(3)] + [Item(name="done", status="done")],
+            [[1], [], [], []],
+        )
+        query_service = BoardQueryServiceImpl(db_session)
+        sql_statements.clear()
+
+        # Act
+        snapshot = await query_service.get_snapshot(limit=2)
+
+        # Assert
+        assert [row["name"] for row in snapshot.columns["todo"].items] == ["todo 0", "todo 1"]
+        assert snapshot.columns["todo"].items[0]["tags"][0]["name"] == "bug"
+        assert (
+            snapshot.columns["todo"].next_cursor.value
+            == snapshot.columns["todo"].items[1]["position"]
+        )
+        assert snapshot.columns["inprogress"].items == []
+        assert [row["name"] for row in snapshot.columns["done"].items] == ["done"]
+        assert snapshot.column_counts == {"todo": 3, "inprogress": 0, "done": 1}
+        assert [tag["name"] for tag in snapshot.tags.items] == ["bug"]
+        assert snapshot.tag_count == 1
+        assert sql_statements[0] == "BEGIN"
+        assert len(sql_statements) == 4
+
+    @pytest.mark.asyncio
+    async def test_version_grows_with_every_write(self, db_session: AsyncSession):
+        """Test that inserts, updates and link changes all move the version"""
+        # Arrange
+        query_service = BoardQueryServiceImpl(db_session)
+        versions = [(await query_service.get_snapshot()).version]
+        await db_session.rollback()
+        writes = [
+            "INSERT INTO items (name) VALUES ('a')",
+            "INSERT INTO tags (name, color) VALUES ('t', '#FFFFFF')",
+            "INSERT INTO item_tags VALUES (1, 1)",
+            "UPDATE tags SET color = '#000000'",
+        ]
+
+        # Act
+        for write in writes:
+            await db_session.execute(text(write))
+            await db_session.commit()
+            versions.append((await query_service.get_snapshot()).version)
+            await db_session.rollback()
+
+        # Assert
+        assert versions == sorted(set(versions))
+
+    @pytest.mark.asyncio
+    async def test_get_snapshot_ignores_writes_committed_while_reading(self, tmp_path):
+        """Test that a write committed between the snapshot's queries is not seen"""
+        # Arrange
+        database = Database(DatabaseSettings(url=f"sqlite:///{tmp_path / 'board.db'}"))
+        async with database.writer_engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            await connection.execute(text("INSERT INTO items (name) VALUES ('a')"))
+        query_service = BoardQueryServiceImpl(database.session())
+        read_tags = query_service.tags.get_page
+
+        async def write_between_queries(**kwargs):
+            async with database.writer_engine.begin() as connection:
+                await connection.execute(text("INSERT INTO items (name) VALUES ('b')"))
+            return await read_tags(**kwargs)
+
+        query_service.tags.get_page = write_between_queries
+
+        # Act
+        snapshot = await query_service.get_snapshot()
+        await query_service.db.close()
+        await database.dispose()
+
+        # Assert
+        assert snapshot.column_counts["todo"] == 1
+        assert [row["name"] for row in snapshot.columns["todo"].items] == ["a"]
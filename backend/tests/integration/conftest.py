@@ -1,28 +1,42 @@
 """Fixtures for integration tests"""
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.shared.infrastructure import Base
+from app.shared.infrastructure.database import DatabaseSettings, create_async_db_engine
 
 
 @pytest.fixture
-def db_engine():
+async def db_engine():
     """Create a test database engine with in-memory SQLite"""
-    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
-    Base.metadata.create_all(bind=engine)
+    engine = create_async_db_engine(DatabaseSettings(url="sqlite:///:memory:", profile="test"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
     yield engine
-    Base.metadata.drop_all(bind=engine)
-    engine.dispose()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
 
 
 @pytest.fixture
-def db_session(db_engine) -> Session:
+async def db_session(db_engine) -> AsyncSession:
     """Create a test database session"""
-    testing_session_local = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
-    session = testing_session_local()
-    try:
+    testing_session_local = async_sessionmaker(
+        bind=db_engine, autoflush=False, expire_on_commit=False
+    )
+    async with testing_session_local() as session:
         yield session
-    finally:
-        session.close()
+
+
+@pytest.fixture
+def sql_statements(db_engine) -> list[str]:
+    """SQL statements sent to the test database, for asserting query counts"""
+    statements: list[str] = []
+
+    @event.listens_for(db_engine.sync_engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
@@ -0,0 +1,66 @@
+"""Fixtures running the contract tests against every repository backend"""
+
+import pytest
+
+from app.items.infrastructure.cache.caching_item_repository import CachingItemRepository
+from app.items.infrastructure.database.item_archive_repository_impl import (
+    ItemArchiveRepositoryImpl,
+)
+from app.items.infrastructure.database.item_query_service_impl import ItemQueryServiceImpl
+from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl
+from app.items.infrastructure.memory.in_memory_item_archive_repository import (
+    InMemoryItemArchiveRepository,
+)
+from app.items.infrastructure.memory.in_memory_item_query_service import (
+    InMemoryItemQueryService,
+)
+from app.items.infrastructure.memory.in_memory_item_repository import InMemoryItemRepository
+from app.shared.infrastructure.cache import BoardCaches
+from app.shared.infrastructure.memory import MemoryStore
+from app.tags.infrastructure.cache.caching_tag_repository import CachingTagRepository
+from app.tags.infrastructure.database.tag_query_service_impl import TagQueryServiceImpl
+from app.tags.infrastructure.database.tag_repository_impl import TagRepositoryImpl
+from app.tags.infrastructure.memory.in_memory_tag_query_service import InMemoryTagQueryService
+from app.tags.infrastructure.memory.in_memory_tag_repository import InMemoryTagRepository
+
+
+class Adapters:
+    """The repositories and query services of one backend, sharing its storage"""
+
+    def __init__(self, items, tags, item_queries, tag_queries, archive):
+        self.items = items
+        self.tags = tags
+        self.item_queries = item_queries
+        self.tag_queries = tag_queries
+        self.archive = archive
+
+
+@pytest.fixture(params=["sqlite", "memory", "cached"])
+def adapters(request) -> Adapters:
+    """Adapters of a fresh, empty board for each backend, and SQLite behind the caches"""
+    if request.param == "memory":
+        store = MemoryStore()
+        return Adapters(
+            InMemoryItemRepository(store),
+            InMemoryTagRepository(store),
+            InMemoryItemQueryService(store),
+            InMemoryTagQueryService(store),
+            InMemoryItemArchiveRepository(store),
+        )
+    db_session = request.getfixturevalue("db_session")
+    if request.param == "cached":
+        caches = BoardCaches()
+        return Adapters(
+            CachingItemRepository(ItemRepositoryImpl(db_session), caches.items),
+            CachingTagRepository(TagRepositoryImpl(db_session), caches.tags, caches.items),
+            ItemQueryServiceImpl(db_session),
+            TagQueryServiceImpl(db_session),
+            ItemArchiveRepositoryImpl(db_session),
+        )
+    return Adapters(
+        ItemRepositoryImpl(db_session),
+        TagRepositoryImpl(db_session),
+        ItemQueryServiceImpl(db_session),
+        TagQueryServiceImpl(db_session),
+        ItemArchiveRepositoryImpl(db_session),
+    )
@@ -0,0 +1,437 @@
+"""Contract tests every item repository and read model backend must pass"""
+
+from datetime import timedelta
+
+import pytest
+
+from app.items.domain.entities.item import Item
+from app.items.domain.entities.item_changes import ItemChanges
+from app.shared.infrastructure.memory.store import utc_now
+from app.tags.domain.entities.tag import Tag
+
+from .conftest import Adapters
+
+
+async def page_through(adapters: Adapters, limit: int, **filters) -> list:
+    """Follow the cursors of get_page to the end, collecting every item"""
+    items, cursor = [], None
+    while True:
+        page = await adapters.items.get_page(after=cursor, limit=limit, **filters)
+        items.extend(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            return items
+
+
+def tag_names(item) -> list[str]:
+    """Names of an item's tags, sorted"""
+    return sorted(tag.name for tag in item.tags)
+
+
+class TestItemContractCreateAndRead:
+    """Test creating items and reading them back"""
+
+    async def test_create_assigns_id_position_and_known_tags(self, adapters: Adapters):
+        """Test a new item gets an ID, a creation time, a position and only live tags"""
+        # Arrange
+        bug = await adapters.tags.create(Tag(name="bug", color="#f00"))
+        gone = await adapters.tags.create(Tag(name="gone", color="#000"))
+        await adapters.tags.delete(gone.id)
+
+        # Act
+        item = await adapters.items.create(
+            Item(name="Fix login", description="It breaks"), tag_ids=[bug.id, gone.id, 999]
+        )
+
+        # Assert
+        assert item.id is not None
+        assert item.created_at is not None
+        assert item.position != ""
+        assert tag_names(item) == ["bug"]
+        read = await adapters.items.get_by_id(item.id)
+        assert read.name == "Fix login"
+        assert read.description == "It breaks"
+        assert tag_names(read) == ["bug"]
+
+    async def test_new_items_go_to_the_bottom_of_their_column(self, adapters: Adapters):
+        """Test each new item is positioned after the last card of its column"""
+        # Act
+        first = await adapters.items.create(Item(name="first"))
+        second = await adapters.items.create(Item(name="second"))
+        done = await adapters.items.create(Item(name="done", status="done"))
+
+        # Assert
+        assert first.position < second.position
+        page = await adapters.items.get_page(sort="position", status="todo")
+        assert [item.id for item in page.items] == [first.id, second.id]
+        assert done.status == "done"
+
+    async def test_get_by_id_returns_none_for_missing_and_deleted(self, adapters: Adapters):
+        """Test unknown IDs and tombstones are not found"""
+        # Arrange
+        item = await adapters.items.create(Item(name="short lived"))
+        await adapters.items.delete(item.id)
+
+        # Act & Assert
+        assert await adapters.items.get_by_id(item.id) is None
+        assert await adapters.items.get_by_id(999) is None
+
+    async def test_get_all_pages_by_offset_and_filters_by_tag(self, adapters: Adapters):
+        """Test get_all applies skip, limit and the tag filter in ID order"""
+        # Arrange
+        tag = await adapters.tags.create(Tag(name="t", color="#111"))
+        ids = [
+            (await adapters.items.create(Item(name=f"i{n}"), [tag.id] if n % 2 else None)).id
+            for n in range(5)
+        ]
+
+        # Act
+        window = await adapters.items.get_all(skip=1, limit=2)
+        tagged = await adapters.items.get_all(tag_id=tag.id)
+
+        # Assert
+        assert [item.id for item in window] == ids[1:3]
+        assert [item.id for item in tagged] == [ids[1], ids[3]]
+
+
+class TestItemContractPagination:
+    """Test keyset pagination in every sort order"""
+
+    @pytest.mark.parametrize("sort", ["id", "name", "position"])
+    async def test_cursors_visit_every_item_once_in_order(self, adapters: Adapters, sort: str):
+        """Test following the cursors returns all items ordered by (sort, id)"""
+        # Arrange
+        for name, status in [("b", "todo"), ("a", "done"), ("b", "done"), ("c", "todo")]:
+            await adapters.items.create(Item(name=name, status=status))
+        await adapters.items.create(Item(name="a"))
+
+        # Act
+        items = await page_through(adapters, limit=2, sort=sort)
+
+        # Assert
+        keys = [(getattr(item, sort), item.id) for item in items]
+        assert len(items) == 5
+        assert keys == sorted(keys)
+
+    async def test_filters_by_tag_and_status(self, adapters: Adapters):
+        """Test only the items having the tag and the status are paged through"""
+        # Arrange
+        tag = await adapters.tags.create(Tag(name="t", color="#111"))
+        expected = []
+        for n in range(6):
+            status = "done" if n % 2 else "todo"
+            item = await adapters.items.create(Item(name=f"i{n}", status=status), [tag.id])
+            if status == "done":
+                expected.append(item.id)
+        await adapters.items.create(Item(name="untagged", status="done"))
+
+        # Act
+        items = await page_through(adapters, limit=2, sort="name", tag_id=tag.id, status="done")
+
+        # Assert
+        assert [item.id for item in items] == expected
+
+    async def test_query_service_pages_match_the_repository(self, adapters: Adapters):
+        """Test the read model returns the repository's items as ItemDTO-shaped dicts"""
+        # Arrange
+        tag = await adapters.tags.create(Tag(name="t", color="#111"))
+        for n in range(3):
+            await adapters.items.create(Item(name=f"i{n}"), [tag.id])
+
+        # Act
+        page = await adapters.item_queries.get_page(limit=2, sort="name")
+        repository_page = await adapters.items.get_page(limit=2, sort="name")
+
+        # Assert
+        assert [row["id"] for row in page.items] == [item.id for item in repository_page.items]
+        assert page.items[0]["tags"] == [{"id": tag.id, "name": "t", "color": "#111"}]
+        assert page.next_cursor.encode() == repository_page.next_cursor.encode()
+
+
+class TestItemContractWrites:
+    """Test updating, patching and bulk writes"""
+
+    async def test_update_replaces_fields_and_tags(self, adapters: Adapters):
+        """Test update sets name, description and tags and stamps updated_at"""
+        # Arrange
+        old = await adapters.tags.create(Tag(name="old", color="#111"))
+        new = await adapters.tags.create(Tag(name="new", color="#222"))
+        item = await adapters.items.create(Item(name="before"), [old.id])
+
+        # Act
+        updated = await adapters.items.update(item.id, Item(name="after"), tag_ids=[new.id])
+
+        # Assert
+        assert updated.name == "after"
+        assert updated.updated_at is not None
+        assert tag_names(updated) == ["new"]
+        assert await adapters.items.update(999, Item(name="x")) is None
+
+    async def test_patch_changes_only_given_fields(self, adapters: Adapters):
+        """Test patch leaves the other fields and the tags alone"""
+        # Arrange
+        tag = await adapters.tags.create(Tag(name="t", color="#111"))
+        item = await adapters.items.create(Item(name="name", description="desc"), [tag.id])
+
+        # Act
+        patched = await adapters.items.patch(ItemChanges(item.id, {"description": "new"}))
+
+        # Assert
+        assert patched.name == "name"
+        assert patched.description == "new"
+        assert tag_names(patched) == ["t"]
+        assert await adapters.items.patch(ItemChanges(999, {"name": "x"})) is None
+
+    async def test_bulk_writes(self, adapters: Adapters):
+        """Test bulk create, update, tag assignment and delete report what they did"""
+        # Arrange
+        tag = await adapters.tags.create(Tag(name="t", color="#111"))
+
+        # Act
+        ids = await adapters.items.bulk_create(
+            [Item(name="a"), Item(name="b"), Item(name="c")], [[tag.id], [], [999]]
+        )
+        found = await adapters.items.bulk_update(
+            [ItemChanges(ids[1], {"name": "B"}), ItemChanges(999, {"name": "x"})]
+        )
+        attached = await adapters.items.attach_tags(ids, [tag.id, 999])
+        detached = await adapters.items.detach_tags([ids[0]], [tag.id])
+        deleted = await adapters.items.bulk_delete([ids[2], ids[2], 999])
+
+        # Assert
+        assert ids == sorted(ids)
+        assert found == {ids[1]}
+        assert (await adapters.items.get_by_id(ids[1])).name == "B"
+        assert attached == 2
+        assert detached == 1
+        assert deleted == {ids[2]}
+        assert await adapters.item_queries.count(tag_id=tag.id) == 1
+
+    async def test_bulk_update_merges_changes_to_one_item(self, adapters: Adapters):
+        """Test several entries for one ID all apply, later fields over earlier ones"""
+        # Arrange
+        tag = await adapters.tags.create(Tag(name="t", color="#111"))
+        item = await adapters.items.create(Item(name="a", description="d"))
+
+        # Act
+        found = await adapters.items.bulk_update(
+            [
+                ItemChanges(item.id, {"name": "B1"}),
+                ItemChanges(item.id, {"description": "dd"}, tag_ids=[tag.id]),
+                ItemChanges(item.id, {"name": "B2"}),
+            ]
+        )
+
+        # Assert
+        updated = await adapters.items.get_by_id(item.id)
+        assert found == {item.id}
+        assert (updated.name, updated.description) == ("B2", "dd")
+        assert tag_names(updated) == ["t"]
+
+
+class TestItemContractMove:
+    """Test moving cards within and between columns"""
+
+    async def test_move_between_two_cards(self, adapters: Adapters):
+        """Test a card moved between two neighbours lands between them"""
+        # Arrange
+        a, b, c = [(await adapters.items.create(Item(name=name))).id for name in "abc"]
+
+        # Act
+        moved = await adapters.items.move(c, "todo", after_id=a, before_id=b)
+
+        # Assert
+        assert moved.id == c
+        page = await adapters.items.get_page(sort="position", status="todo")
+        assert [item.id for item in page.items] == [a, c, b]
+
+    async def test_move_to_other_column_ends(self, adapters: Adapters):
+        """Test a single neighbour or none places the card at the right end"""
+        # Arrange
+        a = (await adapters.items.create(Item(name="a"))).id
+        x = (await adapters.items.create(Item(name="x", status="done"))).id
+        y = (await adapters.items.create(Item(name="y", status="done"))).id
+
+        # Act
+        await adapters.items.move(a, "done", before_id=x)
+        await adapters.items.move(y, "done")
+
+        # Assert
+        page = await adapters.items.get_page(sort="position", status="done")
+        assert [item.id for item in page.items] == [a, x, y]
+        assert await adapters.item_queries.count(status="todo") == 0
+
+    async def test_move_rejects_a_neighbour_from_another_column(self, adapters: Adapters):
+        """Test ValueError when the neighbour is not a card of the target column"""
+        # Arrange
+        a = (await adapters.items.create(Item(name="a"))).id
+        b = (await adapters.items.create(Item(name="b", status="done"))).id
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await adapters.items.move(a, "todo", after_id=b)
+
+    async def test_move_rejects_neighbours_in_the_wrong_order(self, adapters: Adapters):
+        """Test ValueError naming both neighbours when after_id sorts below before_id"""
+        # Arrange
+        a, b, c = [(await adapters.items.create(Item(name=name))).id for name in "abc"]
+
+        # Act & Assert
+        with pytest.raises(ValueError, match=f"Item {b} does not sort before item {a}"):
+            await adapters.items.move(c, "todo", after_id=b, before_id=a)
+        page = await adapters.items.get_page(sort="position", status="todo")
+        assert [item.id for item in page.items] == [a, b, c]
+
+    async def test_rebalance_keeps_the_order(self, adapters: Adapters):
+        """Test rebalancing rewrites positions without reordering the column"""
+        # Arrange
+        ids = [(await adapters.items.create(Item(name=name))).id for name in "abcd"]
+        await adapters.items.move(ids[3], "todo", after_id=ids[0], before_id=ids[1])
+
+        # Act
+        count = await adapters.items.rebalance("todo")
+
+        # Assert
+        assert count == 4
+        page = await adapters.items.get_page(sort="position", status="todo")
+        assert [item.id for item in page.items] == [ids[0], ids[3], ids[1], ids[2]]
+
+
+class TestItemContractSearch:
+    """Test full-text search"""
+
+    async def test_search_matches_words_and_prefixes(self, adapters: Adapters):
+        """Test every word must match and the last one matches as a prefix"""
+        # Arrange
+        login = await adapters.items.create(Item(name="Fix login page", description="broken"))
+        await adapters.items.create(Item(name="Login docs", description="write them"))
+        deleted = await adapters.items.create(Item(name="Fix login form"))
+        await adapters.items.delete(deleted.id)
+
+        # Act
+        hits = await adapters.items.search("fix log")
+
+        # Assert
+        assert [hit.item.id for hit in hits] == [login.id]
+        assert "<mark>" in hits[0].snippet
+
+    async def test_name_matches_rank_before_description_matches(self, adapters: Adapters):
+        """Test a match in the name ranks higher than one in the description"""
+        # Arrange
+        in_description = await adapters.items.create(Item(name="Docs", description="deploy"))
+        in_name = await adapters.items.create(Item(name="Deploy", description="docs"))
+
+        # Act
+        hits = await adapters.items.search("deploy")
+
+        # Assert
+        assert [hit.item.id for hit in hits] == [in_name.id, in_description.id]
+
+    async def test_search_rejects_an_empty_query(self, adapters: Adapters):
+        """Test an empty query raises ValueError"""
+        with pytest.raises(ValueError):
+            await adapters.items.search("  ")
+
+
+class TestItemContractTombstones:
+    """Test soft delete, tombstones, purging and counts"""
+
+    async def test_delete_leaves_a_tombstone_until_purged(self, adapters: Adapters):
+        """Test deleted items leave the counts, are listed as tombstones and purge away"""
+        # Arrange
+        tag = await adapters.tags.create(Tag(name="t", color="#111"))
+        item = await adapters.items.create(Item(name="gone"), [tag.id])
+        await adapters.items.create(Item(name="kept"))
+
+        # Act
+        deleted = await adapters.items.delete(item.id)
+        deleted_again = await adapters.items.delete(item.id)
+        tombstones = await adapters.item_queries.get_tombstones()
+        counts = (
+            await adapters.item_queries.count(),
+            await adapters.item_queries.count(status="todo"),
+            await adapters.item_queries.count(tag_id=tag.id),
+        )
+        purged = await adapters.items.purge_deleted(utc_now() + timedelta(days=1))
+
+        # Assert
+        assert (deleted, deleted_again) == (True, False)
+        assert [tombstone["id"] for tombstone in tombstones] == [item.id]
+        assert counts == (1, 1, 0)
+        assert purged == 1
+        assert await adapters.item_queries.get_tombstones() == []
+
+    async def test_a_deleted_tag_filters_to_no_items(self, adapters: Adapters):
+        """Test the items still linked to a tag tombstone are not listed under it"""
+        # Arrange
+        tag = await adapters.tags.create(Tag(name="t", color="#111"))
+        for name in ["a", "b"]:
+            await adapters.items.create(Item(name=name), [tag.id])
+        await adapters.tags.delete(tag.id)
+
+        # Act
+        listed = await adapters.items.get_all(tag_id=tag.id)
+        paged = await page_through(adapters, limit=1, tag_id=tag.id)
+        page = await adapters.item_queries.get_page(tag_id=tag.id)
+        count = await adapters.item_queries.count(tag_id=tag.id)
+
+        # Assert
+        assert (listed, paged, page.items, count) == ([], [], [], 0)
+
+    async def test_purge_keeps_tombstones_inside_the_retention_window(self, adapters: Adapters):
+        """Test tombstones newer than the cutoff stay"""
+        # Arrange
+        item = await adapters.items.create(Item(name="gone"))
+        await adapters.items.delete(item.id)
+
+        # Act
+        purged = await adapters.items.purge_deleted(utc_now() - timedelta(days=1))
+
+        # Assert
+        assert purged == 0
+        assert len(await adapters.item_queries.get_tombstones()) == 1
+
+    async def test_columns_and_count_without_a_maintained_count(self, adapters: Adapters):
+        """Test get_columns pages every column and tag plus status has no count"""
+        # Arrange
+        for status in ["todo", "done", "done"]:
+            await adapters.items.create(Item(name=status, status=status))
+
+        # Act
+        columns = await adapters.item_queries.get_columns(limit=1)
+
+        # Assert
+        assert {status: len(page.items) for status, page in columns.items()} == {
+            "todo": 1,
+            "inprogress": 0,
+            "done": 1,
+        }
+        assert columns["done"].next_cursor is not None
+        assert columns["todo"].next_cursor is None
+        assert await adapters.item_queries.count(tag_id=1, status="todo") is None
+
+
+class TestItemContractArchive:
+    """Test archiving and restoring items"""
+
+    async def test_archive_then_restore(self, adapters: Adapters):
+        """Test an archived item leaves the board, keeps its tags and comes back at the bottom"""
+        # Arrange
+        tag = await adapters.tags.create(Tag(name="t", color="#111"))
+        item = await adapters.items.create(Item(name="old", status="done"), [tag.id])
+        other = await adapters.items.create(Item(name="new", status="done"))
+
+        # Act
+        archived = await adapters.archive.archive_batch("done", utc_now() + timedelta(days=1))
+        stored = await adapters.archive.get_by_id(item.id)
+        await adapters.items.create(Item(name="newer", status="done"))
+        restored = await adapters.archive.restore(item.id)
+
+        # Assert
+        assert archived == [item.id, other.id]
+        assert stored["tags"] == [{"id": tag.id, "name": "t", "color": "#111"}]
+        assert stored["archived_at"] is not None
+        assert tag_names(restored) == ["t"]
+        page = await adapters.items.get_page(sort="position", status="done")
+        assert page.items[-1].id == item.id
+        assert await adapters.archive.restore(item.id) is None
@@ -0,0 +1,136 @@
+"""Contract tests every tag repository and read model backend must pass"""
+
+from datetime import timedelta
+
+import pytest
+
+from app.items.domain.entities.item import Item
+from app.shared.infrastructure.memory.store import utc_now
+from app.tags.domain.entities.tag import Tag
+
+from .conftest import Adapters
+
+
+class TestTagContractNames:
+    """Test the unique, case-insensitive names of live tags"""
+
+    async def test_create_rejects_a_name_taken_in_any_case(self, adapters: Adapters):
+        """Test a live tag's name cannot be created again, whatever its case"""
+        # Arrange
+        await adapters.tags.create(Tag(name="Bug", color="#f00"))
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await adapters.tags.create(Tag(name="bug", color="#0f0"))
+
+    async def test_name_of_a_deleted_tag_can_be_reused(self, adapters: Adapters):
+        """Test deleting a tag frees its name"""
+        # Arrange
+        tag = await adapters.tags.create(Tag(name="bug", color="#f00"))
+        await adapters.tags.delete(tag.id)
+
+        # Act
+        again = await adapters.tags.create(Tag(name="bug", color="#0f0"))
+
+        # Assert
+        assert again.id != tag.id
+        assert (await adapters.tags.get_by_name("BUG")).id == again.id
+
+    async def test_upsert_creates_then_recolors(self, adapters: Adapters):
+        """Test upsert reports whether it created the tag and updates the color otherwise"""
+        # Act
+        created, was_created = await adapters.tags.upsert(Tag(name="bug", color="#f00"))
+        updated, was_created_again = await adapters.tags.upsert(Tag(name="bug", color="#0f0"))
+
+        # Assert
+        assert (was_created, was_created_again) == (True, False)
+        assert updated.id == created.id
+        assert updated.color == "#0f0"
+        assert updated.updated_at is not None
+
+    async def test_patch_rejects_a_taken_name(self, adapters: Adapters):
+        """Test renaming onto another live tag's name raises ValueError"""
+        # Arrange
+        await adapters.tags.create(Tag(name="bug", color="#f00"))
+        feature = await adapters.tags.create(Tag(name="feature", color="#0f0"))
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await adapters.tags.patch(feature.id, {"name": "BUG"})
+        assert (await adapters.tags.patch(feature.id, {"name": "Feature"})).name == "Feature"
+        assert await adapters.tags.patch(999, {"color": "#000"}) is None
+
+
+class TestTagContractReads:
+    """Test reading tags"""
+
+    async def test_pages_by_name_ignore_case(self, adapters: Adapters):
+        """Test paging by name follows the case-insensitive order across cursors"""
+        # Arrange
+        for name in ["beta", "Alpha", "delta", "Charlie", "echo"]:
+            await adapters.tags.create(Tag(name=name, color="#111"))
+
+        # Act
+        names, cursor = [], None
+        while True:
+            page = await adapters.tags.get_page(after=cursor, limit=2, sort="name")
+            names.extend(tag.name for tag in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        rows = await adapters.tag_queries.get_page(limit=5, sort="name")
+
+        # Assert
+        assert names == ["Alpha", "beta", "Charlie", "delta", "echo"]
+        assert [row["name"] for row in rows.items] == names
+
+    async def test_get_all_and_get_by_ids_skip_deleted_tags(self, adapters: Adapters):
+        """Test tombstones and unknown IDs are left out"""
+        # Arrange
+        ids = [(await adapters.tags.create(Tag(name=n, color="#111"))).id for n in "abc"]
+        await adapters.tags.delete(ids[1])
+
+        # Act
+        all_tags = await adapters.tags.get_all()
+        by_ids = await adapters.tags.get_by_ids([ids[2], ids[1], ids[0], 999])
+
+        # Assert
+        assert [tag.id for tag in all_tags] == [ids[0], ids[2]]
+        assert sorted(tag.id for tag in by_ids) == [ids[0], ids[2]]
+        assert await adapters.tags.get_by_id(ids[1]) is None
+        assert await adapters.tag_queries.count() == 2
+
+
+class TestTagContractTombstones:
+    """Test deleting and purging tags"""
+
+    async def test_deleted_tag_leaves_its_items(self, adapters: Adapters):
+        """Test a deleted tag no longer shows on items or in their counts"""
+        # Arrange
+        tag = await adapters.tags.create(Tag(name="bug", color="#f00"))
+        await adapters.items.create(Item(name="i"), [tag.id])
+
+        # Act
+        deleted = await adapters.tags.delete(tag.id)
+
+        # Assert
+        assert deleted is True
+        assert await adapters.tags.delete(tag.id) is False
+        assert (await adapters.item_queries.get_page()).items[0]["tags"] == []
+        assert await adapters.item_queries.count(tag_id=tag.id) == 0
+
+    async def test_tombstones_are_listed_then_purged(self, adapters: Adapters):
+        """Test deleted tags are tombstones until purged past the cutoff"""
+        # Arrange
+        tag = await adapters.tags.create(Tag(name="bug", color="#f00"))
+        await adapters.tags.delete(tag.id)
+
+        # Act
+        tombstones = await adapters.tag_queries.get_tombstones()
+        kept = await adapters.tags.purge_deleted(utc_now() - timedelta(days=1))
+        purged = await adapters.tags.purge_deleted(utc_now() + timedelta(days=1))
+
+        # Assert
+        assert [tombstone["id"] for tombstone in tombstones] == [tag.id]
+        assert (kept, purged) == (0, 1)
+        assert await adapters.tag_queries.get_tombstones() == []
@@ -0,0 +1,149 @@
+"""Integration tests for ItemArchiveRepositoryImpl"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.items.domain.entities.item import Item
+from app.items.infrastructure.database.item_archive_repository_impl import (
+    ItemArchiveRepositoryImpl,
+)
+from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl
+from app.items.infrastructure.orm.item_orm import ItemORM
+from app.shared.infrastructure.database.counters import read_counters
+from app.tags.infrastructure.orm.tag_orm import TagORM
+
+CUTOFF = datetime(2024, 6, 1)
+
+
+@pytest.fixture
+async def aged_items(db_session: AsyncSession) -> list[int]:
+    """Items 1-3 done long ago (1 tagged bug and ui), 4 done recently, 5 todo long ago"""
+    db_session.add_all([TagORM(name="bug", color="#FF0000"), TagORM(name="ui", color="#00FF00")])
+    await db_session.commit()
+    statuses = ["done", "done", "done", "done", "todo"]
+    ids = await ItemRepositoryImpl(db_session).bulk_create(
+        [Item(name=f"Item {i}", status=status) for i, status in enumerate(statuses, start=1)],
+        [[1, 2], [], [], [], []],
+    )
+    await db_session.execute(
+        text("UPDATE items SET updated_at = '2024-01-01 00:00:00' WHERE id != 4")
+    )
+    await db_session.execute(
+        text("UPDATE items SET updated_at = '2024-12-01 00:00:00' WHERE id = 4")
+    )
+    await db_session.commit()
+    return ids
+
+
+class TestItemArchiveRepositoryImplArchiveBatch:
+    """Test archive_batch method"""
+
+    @pytest.mark.asyncio
+    async def test_archive_batch_moves_old_items_of_the_status(
+        self, db_session: AsyncSession, aged_items: list[int]
+    ):
+        """Test that only old items of the status leave items, together with their counts"""
+        # Arrange
+        repository = ItemArchiveRepositoryImpl(db_session)
+
+        # Act
+        archived = await repository.archive_batch("done", CUTOFF)
+
+        # Assert
+        assert archived == [1, 2, 3]
+        remaining = await db_session.execute(text("SELECT id FROM items ORDER BY id"))
+        assert remaining.scalars().all() == [4, 5]
+        links = await db_session.execute(text("SELECT count(*) FROM item_tags"))
+        assert links.scalar() == 0
+        counts = await read_counters(db_session, ["items", "items:done", "tag_items:1"])
+        assert counts == {"items": 2, "items:done": 1, "tag_items:1": 0}
+        hits = await ItemRepositoryImpl(db_session).search("Item")
+        assert sorted(hit.item.id for hit in hits) == [4, 5]
+
+    @pytest.mark.asyncio
+    async def test_archive_batch_resumes_after_id(
+        self, db_session: AsyncSession, aged_items: list[int]
+    ):
+        """Test that batches are cut at the limit and continue after the given ID"""
+        # Arrange
+        repository = ItemArchiveRepositoryImpl(db_session)
+
+        # Act
+        first = await repository.archive_batch("done", CUTOFF, limit=2)
+        second = await repository.archive_batch("done", CUTOFF, after_id=first[-1], limit=2)
+
+        # Assert
+        assert (first, second) == ([1, 2], [3])
+
+
+class TestItemArchiveRepositoryImplRestore:
+    """Test get_by_id and restore methods"""
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_reads_archived_item_with_tags(
+        self, db_session: AsyncSession, aged_items: list[int]
+    ):
+        """Test that an archived item keeps its fields and tags"""
+        # Arrange
+        repository = ItemArchiveRepositoryImpl(db_session)
+        await repository.archive_batch("done", CUTOFF)
+
+        # Act
+        item = await repository.get_by_id(1)
+        missing = await repository.get_by_id(4)
+
+        # Assert
+        assert item["name"] == "Item 1"
+        assert item["status"] == "done"
+        assert item["archived_at"] is not None
+        assert sorted(tag["name"] for tag in item["tags"]) == ["bug", "ui"]
+        assert missing is None
+
+    @pytest.mark.asyncio
+    async def test_restore_appends_to_column_with_surviving_tags(
+        self, db_session: AsyncSession, aged_items: list[int]
+    ):
+        """Test restoring under the same ID, at the bottom, without deleted tags"""
+        # Arrange
+        repository = ItemArchiveRepositoryImpl(db_session)
+        await repository.archive_batch("done", CUTOFF)
+        await db_session.execute(text("DELETE FROM tags WHERE name = 'ui'"))
+        await db_session.commit()
+
+        # Act
+        restored = await repository.restore(1)
+        again = await repository.restore(1)
+
+        # Assert
+        assert restored.id == 1
+        assert [tag.name for tag in restored.tags] == ["bug"]
+        bottom = await db_session.execute(
+            text("SELECT id FROM items WHERE status = 'done' ORDER BY position DESC LIMIT 1")
+        )
+        assert bottom.scalar() == 1
+        assert await repository.get_by_id(1) is None
+        assert again is None
+        counts = await read_counters(db_session, ["items:done", "tag_items:1"])
+        assert counts == {"items:done": 2, "tag_items:1": 1}
+
+    @pytest.mark.asyncio
+    async def test_archived_ids_are_not_reused(
+        self, db_session: AsyncSession, aged_items: list[int]
+    ):
+        """Test that AUTOINCREMENT keeps new items off the IDs of archived ones"""
+        # Arrange
+        await db_session.execute(text("DELETE FROM items WHERE id IN (4, 5)"))
+        await db_session.commit()
+        repository = ItemArchiveRepositoryImpl(db_session)
+        await repository.archive_batch("done", CUTOFF)
+
+        # Act
+        db_session.add(ItemORM(name="New"))
+        await db_session.commit()
+
+        # Assert
+        new_id = await db_session.execute(text("SELECT id FROM items WHERE name = 'New'"))
+        assert new_id.scalar() == 6
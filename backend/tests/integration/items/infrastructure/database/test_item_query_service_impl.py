@@ -0,0 +1,211 @@
+"""Integration tests for ItemQueryServiceImpl"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.items.application.dtos.item_dto import ItemDTO
+from app.items.domain.entities.item import Item
+from app.items.infrastructure.database.item_query_service_impl import ItemQueryServiceImpl
+from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl
+from app.items.infrastructure.orm.item_orm import ItemORM
+from app.tags.infrastructure.database.tag_repository_impl import TagRepositoryImpl
+from app.tags.infrastructure.orm.tag_orm import TagORM
+
+
+@pytest.fixture
+async def tagged_items(db_session: AsyncSession) -> list[TagORM]:
+    """Five items, the odd ones tagged with both tags, the even ones with none"""
+    tags = [TagORM(name="Bug", color="#FF0000"), TagORM(name="Docs", color="#00FF00")]
+    db_session.add_all(tags)
+    db_session.add_all(
+        [
+            ItemORM(
+                name=f"Item {i}", description=None if i == 2 else "d", tags=tags if i % 2 else []
+            )
+            for i in range(5)
+        ]
+    )
+    await db_session.commit()
+    return tags
+
+
+class TestItemQueryServiceImplGetPage:
+    """Test get_page method"""
+
+    @pytest.mark.asyncio
+    async def test_rows_match_orm_path(self, db_session: AsyncSession, tagged_items):
+        """Test that Core rows validate into the same DTOs as ORM items"""
+        # Arrange
+        query_service = ItemQueryServiceImpl(db_session)
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        rows = await query_service.get_page(limit=10)
+        orm_items = await repository.get_page(limit=10)
+
+        # Assert
+        core = [ItemDTO.model_validate(row) for row in rows.items]
+        orm = [ItemDTO.model_validate(item) for item in orm_items.items]
+        assert [dto.model_dump() for dto in core] == [dto.model_dump() for dto in orm]
+        assert core[1].tags and core[0].tags == []
+
+    @pytest.mark.asyncio
+    async def test_page_is_one_statement(
+        self, db_session: AsyncSession, sql_statements: list[str], tagged_items
+    ):
+        """Test that tags are aggregated in the same query as the items"""
+        # Arrange
+        query_service = ItemQueryServiceImpl(db_session)
+        sql_statements.clear()
+
+        # Act
+        await query_service.get_page(limit=10)
+
+        # Assert
+        assert len(sql_statements) == 1
+        assert "json_group_array" in sql_statements[0]
+
+    @pytest.mark.asyncio
+    async def test_cursor_walk_filtered_by_tag(self, db_session: AsyncSession, tagged_items):
+        """Test walking the items of a tag by name, one at a time"""
+        # Arrange
+        query_service = ItemQueryServiceImpl(db_session)
+
+        # Act
+        first = await query_service.get_page(limit=1, sort="name", tag_id=tagged_items[0].id)
+        second = await query_service.get_page(
+            after=first.next_cursor, limit=1, sort="name", tag_id=tagged_items[0].id
+        )
+
+        # Assert
+        assert [row["name"] for row in first.items] == ["Item 1"]
+        assert [row["name"] for row in second.items] == ["Item 3"]
+        assert second.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_column_in_board_order(self, db_session: AsyncSession):
+        """Test listing one status by position, with positions in the rows"""
+        # Arrange
+        repository = ItemRepositoryImpl(db_session)
+        a, b, _ = await repository.bulk_create(
+            [Item(name="A", status="done"), Item(name="B", status="done"), Item(name="C")],
+            [[], [], []],
+        )
+        await repository.move(b, "done", before_id=a)
+        query_service = ItemQueryServiceImpl(db_session)
+
+        # Act
+        page = await query_service.get_page(limit=10, sort="position", status="done")
+
+        # Assert
+        assert [row["name"] for row in page.items] == ["B", "A"]
+        assert page.items[0]["position"] < page.items[1]["position"]
+        assert {row["status"] for row in page.items} == {"done"}
+
+
+class TestItemQueryServiceImplGetColumns:
+    """Test get_columns method"""
+
+    @pytest.mark.asyncio
+    async def test_get_columns_pages_every_column_in_one_statement(
+        self, db_session: AsyncSession, sql_statements: list[str]
+    ):
+        """Test that each column is cut at the limit, in board order, with its own cursor"""
+        # Arrange
+        repository = ItemRepositoryImpl(db_session)
+        await repository.bulk_create(
+            [Item(name=f"todo {i}") for i in range(3)] + [Item(name="doing", status="inprogress")],
+            [[], [], [], []],
+        )
+        query_service = ItemQueryServiceImpl(db_session)
+        sql_statements.clear()
+
+        # Act
+        columns = await query_service.get_columns(limit=2)
+
+        # Assert
+        assert list(columns) == ["todo", "inprogress", "done"]
+        assert [row["name"] for row in columns["todo"].items] == ["todo 0", "todo 1"]
+        assert columns["todo"].next_cursor.sort == "position"
+        assert [row["name"] for row in columns["inprogress"].items] == ["doing"]
+        assert columns["inprogress"].next_cursor is None
+        assert columns["done"].items == []
+        assert len(sql_statements) == 1
+
+
+class TestItemQueryServiceImplCount:
+    """Test count method"""
+
+    @pytest.mark.asyncio
+    async def test_count_reads_maintained_counter_of_filter(
+        self, db_session: AsyncSession, sql_statements: list[str]
+    ):
+        """Test counts by tag and by status, each from a single counters lookup"""
+        # Arrange
+        tag = TagORM(name="bug", color="#FF0000")
+        db_session.add_all(
+            [ItemORM(name="a", tags=[tag]), ItemORM(name="b", status="done", tags=[tag])]
+        )
+        await db_session.commit()
+        query_service = ItemQueryServiceImpl(db_session)
+        sql_statements.clear()
+
+        # Act
+        counts = [
+            await query_service.count(),
+            await query_service.count(tag_id=tag.id),
+            await query_service.count(status="done"),
+            await query_service.count(tag_id=tag.id, status="done"),
+        ]
+
+        # Assert
+        assert counts == [2, 2, 1, None]
+        assert len(sql_statements) == 3
+        assert all("FROM counters" in statement for statement in sql_statements)
+
+
+class TestItemQueryServiceImplTombstones:
+    """Test that deleted items and tags are left out, and get_tombstones"""
+
+    @pytest.mark.asyncio
+    async def test_pages_and_columns_leave_out_deleted_rows(
+        self, db_session: AsyncSession, tagged_items
+    ):
+        """Test deleted items are not listed and deleted tags not embedded"""
+        # Arrange
+        await ItemRepositoryImpl(db_session).delete(1)
+        await TagRepositoryImpl(db_session).delete(tagged_items[0].id)
+        query_service = ItemQueryServiceImpl(db_session)
+
+        # Act
+        page = await query_service.get_page()
+        columns = await query_service.get_columns()
+
+        # Assert
+        assert [item["id"] for item in page.items] == [2, 3, 4, 5]
+        assert [item["id"] for item in columns["todo"].items] == [2, 3, 4, 5]
+        assert [tag["name"] for tag in page.items[0]["tags"]] == ["Docs"]
+
+    @pytest.mark.asyncio
+    async def test_get_tombstones_since(self, db_session: AsyncSession, tagged_items):
+        """Test tombstones are listed oldest first from ``since`` on, inclusive"""
+        # Arrange
+        for item_id, day in [(3, 2), (1, 1), (2, 3)]:
+            await db_session.execute(
+                update(ItemORM)
+                .where(ItemORM.id == item_id)
+                .values(deleted_at=datetime(2026, 1, day))
+            )
+        await db_session.commit()
+        query_service = ItemQueryServiceImpl(db_session)
+
+        # Act
+        everything = await query_service.get_tombstones()
+        since = await query_service.get_tombstones(since=datetime(2026, 1, 2), limit=1)
+
+        # Assert
+        assert [tombstone["id"] for tombstone in everything] == [1, 3, 2]
+        assert since == [{"id": 3, "deleted_at": datetime(2026, 1, 2)}]
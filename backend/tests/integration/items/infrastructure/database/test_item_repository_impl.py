@@ -1,25 +1,36 @@
 """Integration tests for ItemRepositoryImpl"""
 
+from datetime import datetime
+
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from app.items.domain.entities.item import Item
-from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl
+from app.items.domain.entities.item_changes import ItemChanges
+from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl, TagLoading
 from app.items.infrastructure.orm.item_orm import ItemORM
-from app.tags.infrastructure.orm.tag_orm import TagORM
+from app.tags.infrastructure.orm.tag_orm import TagORM, item_tags
+
+
+async def fetch_by_id(db_session: AsyncSession, orm_class, row_id: int):
+    """Query a row straight from the database"""
+    result = await db_session.execute(select(orm_class).where(orm_class.id == row_id))
+    return result.unique().scalar_one_or_none()
 
 
 class TestItemRepositoryImplGetById:
     """Test get_by_id method"""
 
     @pytest.mark.asyncio
-    async def test_get_by_id_returns_existing_item(self, db_session: Session):
+    async def test_get_by_id_returns_existing_item(self, db_session: AsyncSession):
         """Test getting an existing item by ID"""
         # Arrange: Create test data in database
         test_item = ItemORM(name="Test Item", description="Test Description")
         db_session.add(test_item)
-        db_session.commit()
-        db_session.refresh(test_item)
+        await db_session.commit()
+        await db_session.refresh(test_item)
         item_id = test_item.id
 
         # Create repository instance
@@ -36,7 +47,7 @@ class TestItemRepositoryImplGetById:
         assert result.created_at is not None
 
     @pytest.mark.asyncio
-    async def test_get_by_id_returns_none_for_nonexistent_item(self, db_session: Session):
+    async def test_get_by_id_returns_none_for_nonexistent_item(self, db_session: AsyncSession):
         """Test getting a non-existent item returns None"""
         # Arrange
         repository = ItemRepositoryImpl(db_session)
@@ -48,20 +59,20 @@ class TestItemRepositoryImplGetById:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_get_by_id_returns_item_with_tags(self, db_session: Session):
+    async def test_get_by_id_returns_item_with_tags(self, db_session: AsyncSession):
         """Test getting an item with associated tags"""
         # Arrange: Create tags
         tag1 = TagORM(name="Tag1", color="#FF0000")
         tag2 = TagORM(name="Tag2", color="#00FF00")
         db_session.add_all([tag1, tag2])
-        db_session.commit()
+        await db_session.commit()
 
         # Create item with tags
         test_item = ItemORM(name="Tagged Item", description="Item with tags")
         test_item.tags = [tag1, tag2]
         db_session.add(test_item)
-        db_session.commit()
-        db_session.refresh(test_item)
+        await db_session.commit()
+        await db_session.refresh(test_item)
         item_id = test_item.id
 
         # Create repository
@@ -82,14 +93,14 @@ class TestItemRepositoryImplGetAll:
     """Test get_all method"""
 
     @pytest.mark.asyncio
-    async def test_get_all_returns_all_items(self, db_session: Session):
+    async def test_get_all_returns_all_items(self, db_session: AsyncSession):
         """Test getting all items"""
         # Arrange: Create multiple test items
         item1 = ItemORM(name="Item 1", description="Description 1")
         item2 = ItemORM(name="Item 2", description="Description 2")
         item3 = ItemORM(name="Item 3", description="Description 3")
         db_session.add_all([item1, item2, item3])
-        db_session.commit()
+        await db_session.commit()
 
         # Create repository
         repository = ItemRepositoryImpl(db_session)
@@ -102,7 +113,7 @@ class TestItemRepositoryImplGetAll:
         assert all(isinstance(item, ItemORM) for item in result)
 
     @pytest.mark.asyncio
-    async def test_get_all_returns_empty_list_when_no_items(self, db_session: Session):
+    async def test_get_all_returns_empty_list_when_no_items(self, db_session: AsyncSession):
         """Test getting all items when database is empty"""
         # Arrange
         repository = ItemRepositoryImpl(db_session)
@@ -114,13 +125,13 @@ class TestItemRepositoryImplGetAll:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_get_all_with_pagination(self, db_session: Session):
+    async def test_get_all_with_pagination(self, db_session: AsyncSession):
         """Test pagination with skip and limit parameters"""
         # Arrange: Create 5 items
         for i in range(5):
             item = ItemORM(name=f"Item {i}", description=f"Description {i}")
             db_session.add(item)
-        db_session.commit()
+        await db_session.commit()
 
         # Create repository
         repository = ItemRepositoryImpl(db_session)
@@ -132,13 +143,13 @@ class TestItemRepositoryImplGetAll:
         assert len(result) == 2
 
     @pytest.mark.asyncio
-    async def test_get_all_respects_limit(self, db_session: Session):
+    async def test_get_all_respects_limit(self, db_session: AsyncSession):
         """Test that limit parameter restricts the number of results"""
         # Arrange: Create 10 items
         for i in range(10):
             item = ItemORM(name=f"Item {i}", description=f"Description {i}")
             db_session.add(item)
-        db_session.commit()
+        await db_session.commit()
 
         # Create repository
         repository = ItemRepositoryImpl(db_session)
@@ -150,11 +161,115 @@ class TestItemRepositoryImplGetAll:
         assert len(result) == 5
 
 
+class TestItemRepositoryImplGetPage:
+    """Test keyset pagination"""
+
+    @pytest.mark.asyncio
+    async def test_get_page_walks_all_items_by_id(self, db_session: AsyncSession):
+        """Test following next cursors visits every item exactly once"""
+        # Arrange
+        db_session.add_all([ItemORM(name=f"Item {i}") for i in range(7)])
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        pages = [await repository.get_page(limit=3)]
+        while pages[-1].next_cursor is not None:
+            pages.append(await repository.get_page(after=pages[-1].next_cursor, limit=3))
+
+        # Assert
+        assert [len(page.items) for page in pages] == [3, 3, 1]
+        ids = [item.id for page in pages for item in page.items]
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 7
+
+    @pytest.mark.asyncio
+    async def test_get_page_by_name_breaks_ties_on_id(self, db_session: AsyncSession):
+        """Test that duplicate names do not repeat or skip rows across pages"""
+        # Arrange
+        names = ["b", "a", "b", "a", "c", "b"]
+        db_session.add_all([ItemORM(name=name) for name in names])
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        first = await repository.get_page(limit=2, sort="name")
+        second = await repository.get_page(after=first.next_cursor, limit=2, sort="name")
+        third = await repository.get_page(after=second.next_cursor, limit=2, sort="name")
+
+        # Assert
+        rows = [(item.name, item.id) for page in (first, second, third) for item in page.items]
+        assert rows == sorted(rows)
+        assert [name for name, _ in rows] == sorted(names)
+        assert third.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_get_page_keeps_tags_of_each_item(self, db_session: AsyncSession):
+        """Test that the row limit applies to items, not to joined tag rows"""
+        # Arrange
+        tags = [TagORM(name=f"Tag{i}", color="#000000") for i in range(3)]
+        db_session.add_all([ItemORM(name="Tagged", tags=tags), ItemORM(name="Plain")])
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        page = await repository.get_page(limit=1)
+
+        # Assert
+        assert len(page.items) == 1
+        assert len(page.items[0].tags) == 3
+        assert page.next_cursor is not None
+
+    @pytest.mark.asyncio
+    async def test_get_page_filtered_by_tag(self, db_session: AsyncSession):
+        """Test that only items having the tag are returned, with all their tags"""
+        # Arrange
+        red = TagORM(name="Red", color="#FF0000")
+        blue = TagORM(name="Blue", color="#0000FF")
+        db_session.add_all(
+            [
+                ItemORM(name="A", tags=[red]),
+                ItemORM(name="B", tags=[blue]),
+                ItemORM(name="C", tags=[red, blue]),
+                ItemORM(name="D"),
+            ]
+        )
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        first = await repository.get_page(limit=1, tag_id=red.id)
+        second = await repository.get_page(after=first.next_cursor, limit=1, tag_id=red.id)
+        legacy = await repository.get_all(tag_id=blue.id)
+
+        # Assert
+        assert [item.name for item in first.items + second.items] == ["A", "C"]
+        assert second.next_cursor is None
+        assert {tag.name for tag in second.items[0].tags} == {"Red", "Blue"}
+        assert {item.name for item in legacy} == {"B", "C"}
+
+    @pytest.mark.asyncio
+    async def test_tag_filter_uses_reverse_index(self, db_session: AsyncSession):
+        """Test that SQLite resolves the tag filter through the (tag_id, item_id) index"""
+        # Act
+        result = await db_session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT item_id FROM item_tags "
+                "WHERE tag_id = 1 AND item_id > 10 ORDER BY item_id"
+            )
+        )
+
+        # Assert
+        plan = " ".join(row[-1] for row in result)
+        assert "ix_item_tags_tag_id_item_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+
 class TestItemRepositoryImplCreate:
     """Test create method"""
 
     @pytest.mark.asyncio
-    async def test_create_item_without_tags(self, db_session: Session):
+    async def test_create_item_without_tags(self, db_session: AsyncSession):
         """Test creating an item without tags"""
         # Arrange
         repository = ItemRepositoryImpl(db_session)
@@ -172,18 +287,18 @@ class TestItemRepositoryImplCreate:
         assert result.tags == []
 
         # Verify item exists in database
-        db_item = db_session.query(ItemORM).filter(ItemORM.id == result.id).first()
+        db_item = await fetch_by_id(db_session, ItemORM, result.id)
         assert db_item is not None
         assert db_item.name == "New Item"
 
     @pytest.mark.asyncio
-    async def test_create_item_with_tags(self, db_session: Session):
+    async def test_create_item_with_tags(self, db_session: AsyncSession):
         """Test creating an item with associated tags"""
         # Arrange: Create tags first
         tag1 = TagORM(name="Tag1", color="#FF0000")
         tag2 = TagORM(name="Tag2", color="#00FF00")
         db_session.add_all([tag1, tag2])
-        db_session.commit()
+        await db_session.commit()
         tag_ids = [tag1.id, tag2.id]
 
         # Create item
@@ -201,11 +316,11 @@ class TestItemRepositoryImplCreate:
         assert tag_names == {"Tag1", "Tag2"}
 
         # Verify in database
-        db_item = db_session.query(ItemORM).filter(ItemORM.id == result.id).first()
+        db_item = await fetch_by_id(db_session, ItemORM, result.id)
         assert len(db_item.tags) == 2
 
     @pytest.mark.asyncio
-    async def test_create_item_with_empty_tag_list(self, db_session: Session):
+    async def test_create_item_with_empty_tag_list(self, db_session: AsyncSession):
         """Test creating an item with empty tag list"""
         # Arrange
         repository = ItemRepositoryImpl(db_session)
@@ -219,7 +334,7 @@ class TestItemRepositoryImplCreate:
         assert result.tags == []
 
     @pytest.mark.asyncio
-    async def test_create_item_with_nonexistent_tags(self, db_session: Session):
+    async def test_create_item_with_nonexistent_tags(self, db_session: AsyncSession):
         """Test creating an item with non-existent tag IDs"""
         # Arrange
         repository = ItemRepositoryImpl(db_session)
@@ -237,12 +352,12 @@ class TestItemRepositoryImplUpdate:
     """Test update method"""
 
     @pytest.mark.asyncio
-    async def test_update_item_without_tags(self, db_session: Session):
+    async def test_update_item_without_tags(self, db_session: AsyncSession):
         """Test updating an item without modifying tags"""
         # Arrange: Create an existing item
         existing_item = ItemORM(name="Original Name", description="Original Description")
         db_session.add(existing_item)
-        db_session.commit()
+        await db_session.commit()
         item_id = existing_item.id
 
         # Create repository and updated item data
@@ -259,12 +374,12 @@ class TestItemRepositoryImplUpdate:
         assert result.description == "Updated Description"
 
         # Verify in database
-        db_item = db_session.query(ItemORM).filter(ItemORM.id == item_id).first()
+        db_item = await fetch_by_id(db_session, ItemORM, item_id)
         assert db_item.name == "Updated Name"
         assert db_item.description == "Updated Description"
 
     @pytest.mark.asyncio
-    async def test_update_nonexistent_item(self, db_session: Session):
+    async def test_update_nonexistent_item(self, db_session: AsyncSession):
         """Test updating a non-existent item returns None"""
         # Arrange
         repository = ItemRepositoryImpl(db_session)
@@ -277,19 +392,19 @@ class TestItemRepositoryImplUpdate:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_update_item_add_tags(self, db_session: Session):
+    async def test_update_item_add_tags(self, db_session: AsyncSession):
         """Test updating an item to add tags"""
         # Arrange: Create item without tags
         existing_item = ItemORM(name="Item", description="Description")
         db_session.add(existing_item)
-        db_session.commit()
+        await db_session.commit()
         item_id = existing_item.id
 
         # Create tags
         tag1 = TagORM(name="NewTag1", color="#FF0000")
         tag2 = TagORM(name="NewTag2", color="#00FF00")
         db_session.add_all([tag1, tag2])
-        db_session.commit()
+        await db_session.commit()
         tag_ids = [tag1.id, tag2.id]
 
         # Create repository
@@ -306,24 +421,24 @@ class TestItemRepositoryImplUpdate:
         assert tag_names == {"NewTag1", "NewTag2"}
 
     @pytest.mark.asyncio
-    async def test_update_item_replace_tags(self, db_session: Session):
+    async def test_update_item_replace_tags(self, db_session: AsyncSession):
         """Test updating an item to replace existing tags"""
         # Arrange: Create item with initial tags
         tag1 = TagORM(name="OldTag1", color="#FF0000")
         tag2 = TagORM(name="OldTag2", color="#00FF00")
         db_session.add_all([tag1, tag2])
-        db_session.commit()
+        await db_session.commit()
 
         existing_item = ItemORM(name="Item", description="Description")
         existing_item.tags = [tag1, tag2]
         db_session.add(existing_item)
-        db_session.commit()
+        await db_session.commit()
         item_id = existing_item.id
 
         # Create new tags
         tag3 = TagORM(name="NewTag", color="#0000FF")
         db_session.add(tag3)
-        db_session.commit()
+        await db_session.commit()
 
         # Create repository
         repository = ItemRepositoryImpl(db_session)
@@ -338,17 +453,17 @@ class TestItemRepositoryImplUpdate:
         assert result.tags[0].name == "NewTag"
 
     @pytest.mark.asyncio
-    async def test_update_item_remove_all_tags(self, db_session: Session):
+    async def test_update_item_remove_all_tags(self, db_session: AsyncSession):
         """Test updating an item to remove all tags"""
         # Arrange: Create item with tags
         tag1 = TagORM(name="Tag1", color="#FF0000")
         db_session.add(tag1)
-        db_session.commit()
+        await db_session.commit()
 
         existing_item = ItemORM(name="Item", description="Description")
         existing_item.tags = [tag1]
         db_session.add(existing_item)
-        db_session.commit()
+        await db_session.commit()
         item_id = existing_item.id
 
         # Create repository
@@ -363,16 +478,126 @@ class TestItemRepositoryImplUpdate:
         assert result.tags == []
 
 
+class TestItemRepositoryImplPatch:
+    """Test patch method (partial UPDATE ... RETURNING)"""
+
+    @pytest.fixture
+    async def tagged_item(self, db_session: AsyncSession) -> tuple[int, list[int]]:
+        """An item linked to the first two of three tags"""
+        tags = [TagORM(name=f"Tag{i}", color="#FF0000") for i in range(3)]
+        item = ItemORM(name="Item", description="Description", tags=tags[:2])
+        db_session.add_all([*tags, item])
+        await db_session.commit()
+        return item.id, [tag.id for tag in tags]
+
+    @pytest.mark.asyncio
+    async def test_patch_changes_only_given_fields(self, db_session: AsyncSession, tagged_item):
+        """Test that fields left out keep their value and tags are untouched"""
+        # Arrange
+        item_id, tag_ids = tagged_item
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        result = await repository.patch(ItemChanges(item_id, {"name": "Renamed"}))
+
+        # Assert
+        assert result.name == "Renamed"
+        assert result.description == "Description"
+        assert result.updated_at is not None
+        assert {tag.id for tag in result.tags} == set(tag_ids[:2])
+
+    @pytest.mark.asyncio
+    async def test_patch_replaces_tags_by_set_diff(self, db_session: AsyncSession, tagged_item):
+        """Test that tag_ids become the item's tags, keeping existing links"""
+        # Arrange
+        item_id, tag_ids = tagged_item
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act: drop Tag0, keep Tag1, add Tag2, ignore an unknown tag
+        result = await repository.patch(ItemChanges(item_id, {}, tag_ids=[*tag_ids[1:], 999]))
+
+        # Assert
+        assert {tag.id for tag in result.tags} == set(tag_ids[1:])
+        links = await db_session.execute(
+            select(item_tags.c.tag_id).where(item_tags.c.item_id == item_id)
+        )
+        assert set(links.scalars()) == set(tag_ids[1:])
+
+    @pytest.mark.asyncio
+    async def test_patch_nonexistent_item(self, db_session: AsyncSession):
+        """Test patching a non-existent item returns None"""
+        # Arrange
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        result = await repository.patch(ItemChanges(999, {"name": "Name"}, tag_ids=[]))
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_patch_leaves_the_links_of_a_deleted_item(
+        self, db_session: AsyncSession, tagged_item
+    ):
+        """Test that tag_ids on a tombstone change nothing and return None"""
+        # Arrange
+        item_id, tag_ids = tagged_item
+        repository = ItemRepositoryImpl(db_session)
+        await repository.delete(item_id)
+
+        # Act
+        result = await repository.patch(ItemChanges(item_id, {}, tag_ids=[tag_ids[2]]))
+
+        # Assert
+        assert result is None
+        links = await db_session.execute(
+            select(item_tags.c.tag_id).where(item_tags.c.item_id == item_id)
+        )
+        assert set(links.scalars()) == set(tag_ids[:2])
+
+    @pytest.mark.asyncio
+    async def test_patch_saves_round_trips_over_read_then_update(
+        self, db_session: AsyncSession, sql_statements: list[str], tagged_item
+    ):
+        """Test statement counts of the old read-modify-write flow against patch"""
+        # Arrange
+        item_id, tag_ids = tagged_item
+        repository = ItemRepositoryImpl(db_session)
+
+        async def read_then_update(tags: list[int] | None) -> int:
+            sql_statements.clear()
+            current = await repository.get_by_id(item_id)
+            await repository.update(
+                item_id, Item(name="Old flow", description=current.description), tag_ids=tags
+            )
+            return len(sql_statements)
+
+        async def patch(tags: list[int] | None) -> int:
+            sql_statements.clear()
+            await repository.patch(ItemChanges(item_id, {"name": "New flow"}, tag_ids=tags))
+            return len(sql_statements)
+
+        # Act
+        before = {"fields": await read_then_update(None), "tags": await read_then_update(tag_ids)}
+        after = {"fields": await patch(None), "tags": await patch(tag_ids)}
+        print(f"statements per update: before={before} after={after}")
+
+        # Assert: UPDATE ... RETURNING + tags, plus DELETE and INSERT of links with tag_ids
+        assert after == {"fields": 2, "tags": 4}
+        assert before["fields"] > after["fields"]
+        assert before["tags"] > after["tags"]
+
+
 class TestItemRepositoryImplDelete:
     """Test delete method"""
 
     @pytest.mark.asyncio
-    async def test_delete_existing_item(self, db_session: Session):
+    async def test_delete_existing_item(self, db_session: AsyncSession):
         """Test deleting an existing item"""
         # Arrange: Create an item
         test_item = ItemORM(name="Item to Delete", description="Will be deleted")
         db_session.add(test_item)
-        db_session.commit()
+        await db_session.commit()
         item_id = test_item.id
 
         # Create repository
@@ -384,12 +609,13 @@ class TestItemRepositoryImplDelete:
         # Assert
         assert result is True
 
-        # Verify item is deleted from database
-        db_item = db_session.query(ItemORM).filter(ItemORM.id == item_id).first()
-        assert db_item is None
+        # Verify the item is gone for reads but left as a tombstone
+        assert await repository.get_by_id(item_id) is None
+        db_item = await fetch_by_id(db_session, ItemORM, item_id)
+        assert db_item.deleted_at is not None
 
     @pytest.mark.asyncio
-    async def test_delete_nonexistent_item(self, db_session: Session):
+    async def test_delete_nonexistent_item(self, db_session: AsyncSession):
         """Test deleting a non-existent item returns False"""
         # Arrange
         repository = ItemRepositoryImpl(db_session)
@@ -401,17 +627,17 @@ class TestItemRepositoryImplDelete:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_delete_item_with_tags(self, db_session: Session):
+    async def test_delete_item_with_tags(self, db_session: AsyncSession):
         """Test deleting an item with associated tags"""
         # Arrange: Create item with tags
         tag1 = TagORM(name="Tag1", color="#FF0000")
         db_session.add(tag1)
-        db_session.commit()
+        await db_session.commit()
 
         test_item = ItemORM(name="Item with Tags", description="Has tags")
         test_item.tags = [tag1]
         db_session.add(test_item)
-        db_session.commit()
+        await db_session.commit()
         item_id = test_item.id
         tag_id = tag1.id
 
@@ -425,9 +651,532 @@ class TestItemRepositoryImplDelete:
         assert result is True
 
         # Verify item is deleted
-        db_item = db_session.query(ItemORM).filter(ItemORM.id == item_id).first()
-        assert db_item is None
+        assert await repository.get_by_id(item_id) is None
 
         # Verify tag still exists (should not be deleted)
-        db_tag = db_session.query(TagORM).filter(TagORM.id == tag_id).first()
+        db_tag = await fetch_by_id(db_session, TagORM, tag_id)
         assert db_tag is not None
+
+        # Verify the link stays until the tombstone is purged
+        links = await db_session.execute(select(func.count()).select_from(item_tags))
+        assert links.scalar_one() == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_is_a_single_statement(
+        self, db_session: AsyncSession, sql_statements: list[str]
+    ):
+        """Test that delete neither loads the item nor touches its links"""
+        # Arrange
+        tag = TagORM(name="Tag1", color="#FF0000")
+        test_item = ItemORM(name="Item", description="Has tags", tags=[tag])
+        db_session.add(test_item)
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+        sql_statements.clear()
+
+        # Act
+        await repository.delete(test_item.id)
+
+        # Assert
+        queries = [s for s in sql_statements if "items" in s or "item_tags" in s]
+        assert len(queries) == 1
+        assert queries[0].startswith("UPDATE items SET")
+        assert "deleted_at=CURRENT_TIMESTAMP" in queries[0]
+        assert "RETURNING" in queries[0]
+
+
+class TestItemRepositoryImplBulk:
+    """Test bulk create, update and delete"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_returns_ids_in_input_order(self, db_session: AsyncSession):
+        """Test items and their tags are created, skipping unknown and repeated tags"""
+        # Arrange
+        tag = TagORM(name="Tag", color="#000000")
+        db_session.add(tag)
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        ids = await repository.bulk_create(
+            [
+                Item(name="First", status="done"),
+                Item(name="Second", description="Two"),
+                Item(name="Third", status="done"),
+            ],
+            [[tag.id, tag.id, 999], [], []],
+        )
+
+        # Assert
+        first = await fetch_by_id(db_session, ItemORM, ids[0])
+        second = await fetch_by_id(db_session, ItemORM, ids[1])
+        third = await fetch_by_id(db_session, ItemORM, ids[2])
+        assert (first.name, second.name, second.description) == ("First", "Second", "Two")
+        assert (first.status, third.name) == ("done", "Third")
+        assert [t.id for t in first.tags] == [tag.id]
+        assert second.tags == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_chunks_rows_under_variable_limit(
+        self, db_session: AsyncSession, sql_statements: list[str]
+    ):
+        """Test a large batch is written in chunks of one INSERT ... RETURNING and one tag query"""
+        # Arrange
+        tag = TagORM(name="Tag", color="#000000")
+        db_session.add(tag)
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+        sql_statements.clear()
+
+        # Act
+        ids = await repository.bulk_create(
+            [Item(name=f"Item {i}") for i in range(2500)], [[tag.id]] * 2500
+        )
+
+        # Assert
+        assert len(ids) == 2500
+        assert ids == sorted(set(ids))
+        inserts = [s for s in sql_statements if s.startswith("INSERT INTO items")]
+        tag_queries = [s for s in sql_statements if "FROM tags" in s]
+        assert len(inserts) == 3
+        assert all("RETURNING" in insert for insert in inserts)
+        assert len(tag_queries) == 3
+        assert not any("ORDER BY items.id DESC" in s for s in sql_statements)
+        count = await db_session.execute(select(func.count()).select_from(item_tags))
+        assert count.scalar() == 2500
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_applies_partial_changes(self, db_session: AsyncSession):
+        """Test only given fields change, tags are replaced, missing IDs are reported"""
+        # Arrange
+        old_tag = TagORM(name="Old", color="#000000")
+        new_tag = TagORM(name="New", color="#FFFFFF")
+        renamed = ItemORM(name="Before", description="Kept", tags=[old_tag])
+        retagged = ItemORM(name="Same", description="Same", tags=[old_tag])
+        db_session.add_all([renamed, retagged, new_tag])
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        found = await repository.bulk_update(
+            [
+                ItemChanges(renamed.id, {"name": "After"}),
+                ItemChanges(retagged.id, {}, tag_ids=[new_tag.id]),
+                ItemChanges(999, {"name": "Ghost"}),
+            ]
+        )
+
+        # Assert
+        db_session.expunge_all()
+        renamed_row = await fetch_by_id(db_session, ItemORM, renamed.id)
+        retagged_row = await fetch_by_id(db_session, ItemORM, retagged.id)
+        assert found == {renamed.id, retagged.id}
+        assert (renamed_row.name, renamed_row.description) == ("After", "Kept")
+        assert [t.name for t in renamed_row.tags] == ["Old"]
+        assert [t.name for t in retagged_row.tags] == ["New"]
+        assert renamed_row.updated_at is not None
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_leaves_tombstones(self, db_session: AsyncSession):
+        """Test deleted IDs are returned, and deleting them again finds nothing"""
+        # Arrange
+        tag = TagORM(name="Tag", color="#000000")
+        items = [ItemORM(name=f"Item {i}", tags=[tag]) for i in range(3)]
+        db_session.add_all(items)
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        deleted = await repository.bulk_delete([items[0].id, items[1].id, 999])
+        again = await repository.bulk_delete([items[0].id])
+
+        # Assert
+        assert deleted == {items[0].id, items[1].id}
+        assert again == set()
+        remaining = await repository.get_all()
+        assert [item.id for item in remaining] == [items[2].id]
+
+
+class TestItemRepositoryImplTagAssignment:
+    """Test set-based tag attach and detach"""
+
+    @pytest.mark.asyncio
+    async def test_attach_tags_counts_only_new_links(
+        self, db_session: AsyncSession, sql_statements: list[str]
+    ):
+        """Test existing links and unknown IDs are skipped by a single INSERT OR IGNORE"""
+        # Arrange
+        red = TagORM(name="Red", color="#FF0000")
+        blue = TagORM(name="Blue", color="#0000FF")
+        tagged = ItemORM(name="Tagged", tags=[red])
+        plain = ItemORM(name="Plain")
+        db_session.add_all([tagged, plain, blue])
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+        sql_statements.clear()
+
+        # Act
+        attached = await repository.attach_tags([tagged.id, plain.id, 999], [red.id, blue.id, 998])
+
+        # Assert
+        assert attached == 3
+        assert [s for s in sql_statements if s.startswith("INSERT")] == sql_statements[:1]
+        links = await db_session.execute(select(item_tags.c.item_id, item_tags.c.tag_id))
+        assert set(links.all()) == {
+            (tagged.id, red.id),
+            (tagged.id, blue.id),
+            (plain.id, red.id),
+            (plain.id, blue.id),
+        }
+
+    @pytest.mark.asyncio
+    async def test_detach_tags_counts_removed_links(self, db_session: AsyncSession):
+        """Test only the given tags are removed from the given items"""
+        # Arrange
+        red = TagORM(name="Red", color="#FF0000")
+        blue = TagORM(name="Blue", color="#0000FF")
+        first = ItemORM(name="First", tags=[red, blue])
+        second = ItemORM(name="Second", tags=[red])
+        untouched = ItemORM(name="Untouched", tags=[red])
+        db_session.add_all([first, second, untouched])
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        detached = await repository.detach_tags([first.id, second.id], [red.id])
+
+        # Assert
+        assert detached == 2
+        links = await db_session.execute(select(item_tags.c.item_id, item_tags.c.tag_id))
+        assert set(links.all()) == {(first.id, blue.id), (untouched.id, red.id)}
+
+    @pytest.mark.asyncio
+    async def test_attach_tags_chunks_large_item_sets(self, db_session: AsyncSession):
+        """Test item sets above the SQLite variable limit are attached in chunks"""
+        # Arrange
+        tag = TagORM(name="Tag", color="#000000")
+        db_session.add(tag)
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+        ids = await repository.bulk_create(
+            [Item(name=f"Item {i}") for i in range(1500)], [[]] * 1500
+        )
+
+        # Act
+        attached = await repository.attach_tags(ids, [tag.id])
+
+        # Assert
+        assert attached == 1500
+
+
+class TestItemRepositoryImplTagLoading:
+    """Test the tag loading strategy chosen for each kind of query"""
+
+    @pytest.fixture
+    async def tagged_items(self, db_session: AsyncSession) -> list[ItemORM]:
+        """Three items sharing two tags"""
+        tags = [TagORM(name="Red", color="#FF0000"), TagORM(name="Blue", color="#0000FF")]
+        items = [ItemORM(name=f"Item {i}", tags=tags) for i in range(3)]
+        db_session.add_all(items)
+        await db_session.commit()
+        db_session.expunge_all()
+        return items
+
+    @pytest.mark.asyncio
+    async def test_lists_select_tags_in_one_extra_query(
+        self, db_session: AsyncSession, sql_statements: list[str], tagged_items
+    ):
+        """Test a page is one item query plus one tag query, without a subquery"""
+        # Arrange
+        repository = ItemRepositoryImpl(db_session)
+        sql_statements.clear()
+
+        # Act
+        page = await repository.get_page(limit=2)
+
+        # Assert
+        assert [len(item.tags) for item in page.items] == [2, 2]
+        assert len(sql_statements) == 2
+        assert "JOIN" not in sql_statements[0]
+        assert "anon" not in sql_statements[0]
+
+    @pytest.mark.asyncio
+    async def test_detail_selects_tags_by_item_key(
+        self, db_session: AsyncSession, sql_statements: list[str], tagged_items
+    ):
+        """Test a single item read looks its tags up by item ID, not through a nested join"""
+        # Arrange
+        repository = ItemRepositoryImpl(db_session)
+        sql_statements.clear()
+
+        # Act
+        item = await repository.get_by_id(tagged_items[0].id)
+
+        # Assert
+        assert len(item.tags) == 2
+        assert len(sql_statements) == 2
+        assert "JOIN" not in sql_statements[0]
+
+    @pytest.mark.asyncio
+    async def test_mutation_lookups_skip_tags(
+        self, db_session: AsyncSession, sql_statements: list[str], tagged_items
+    ):
+        """Test updating fields does not load tags until the result is read back"""
+        # Arrange
+        repository = ItemRepositoryImpl(db_session)
+        sql_statements.clear()
+
+        # Act
+        updated = await repository.update(tagged_items[0].id, Item(name="Renamed"))
+
+        # Assert
+        assert updated.name == "Renamed"
+        assert len(updated.tags) == 2
+        lookup = sql_statements[0]
+        assert lookup.startswith("SELECT") and "tags" not in lookup
+
+    @pytest.mark.asyncio
+    async def test_strategies_are_configurable(
+        self, db_session: AsyncSession, sql_statements: list[str], tagged_items
+    ):
+        """Test a repository can be given other loaders, e.g. joined lists"""
+        # Arrange
+        repository = ItemRepositoryImpl(db_session, loading=TagLoading(lists=joinedload))
+        sql_statements.clear()
+
+        # Act
+        items = await repository.get_all(limit=2)
+
+        # Assert
+        assert [len(item.tags) for item in items] == [2, 2]
+        assert len(sql_statements) == 1
+        assert "JOIN tags" in sql_statements[0]
+
+
+class TestItemRepositoryImplKanban:
+    """Test column positions: create, move and rebalance"""
+
+    async def column(self, db_session: AsyncSession, status: str) -> list[str]:
+        """Names of a column's cards in board order"""
+        result = await db_session.execute(
+            select(ItemORM.name)
+            .where(ItemORM.status == status)
+            .order_by(ItemORM.position, ItemORM.id)
+        )
+        return list(result.scalars().all())
+
+    @pytest.mark.asyncio
+    async def test_created_items_go_to_the_bottom_of_their_column(self, db_session: AsyncSession):
+        """Test that single and bulk creates append in order"""
+        # Arrange
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        await repository.create(Item(name="A"))
+        await repository.bulk_create(
+            [Item(name="B"), Item(name="X", status="done"), Item(name="C")], [[], [], []]
+        )
+        await repository.create(Item(name="D"))
+
+        # Assert
+        assert await self.column(db_session, "todo") == ["A", "B", "C", "D"]
+        assert await self.column(db_session, "done") == ["X"]
+
+    @pytest.mark.asyncio
+    async def test_move_writes_only_the_moved_row(
+        self, db_session: AsyncSession, sql_statements: list[str]
+    ):
+        """Test moving a card between two cards of another column"""
+        # Arrange
+        repository = ItemRepositoryImpl(db_session)
+        ids = await repository.bulk_create(
+            [Item(name=name, status="done") for name in "ABC"] + [Item(name="M")],
+            [[]] * 4,
+        )
+        sql_statements.clear()
+
+        # Act
+        moved = await repository.move(ids[3], "done", after_id=ids[0], before_id=ids[1])
+
+        # Assert
+        assert moved.status == "done"
+        assert await self.column(db_session, "done") == ["A", "M", "B", "C"]
+        writes = [s for s in sql_statements if s.startswith(("UPDATE", "INSERT", "DELETE"))]
+        assert len(writes) == 1
+
+    @pytest.mark.asyncio
+    async def test_move_with_one_or_no_neighbour(self, db_session: AsyncSession):
+        """Test moving to the top, below a card and to the bottom"""
+        # Arrange
+        repository = ItemRepositoryImpl(db_session)
+        a, b, c = await repository.bulk_create([Item(name=name) for name in "ABC"], [[]] * 3)
+
+        # Act & Assert
+        await repository.move(c, "todo", before_id=a)
+        assert await self.column(db_session, "todo") == ["C", "A", "B"]
+        await repository.move(c, "todo", after_id=a)
+        assert await self.column(db_session, "todo") == ["A", "C", "B"]
+        await repository.move(a, "todo")
+        assert await self.column(db_session, "todo") == ["C", "B", "A"]
+
+    @pytest.mark.asyncio
+    async def test_move_rejects_neighbour_from_another_column(self, db_session: AsyncSession):
+        """Test that neighbours must be cards of the target column"""
+        # Arrange
+        repository = ItemRepositoryImpl(db_session)
+        a, b = await repository.bulk_create(
+            [Item(name="A"), Item(name="B", status="done")], [[], []]
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await repository.move(a, "todo", after_id=b)
+
+    @pytest.mark.asyncio
+    async def test_move_nonexistent_item(self, db_session: AsyncSession):
+        """Test moving a non-existent item returns None"""
+        assert await ItemRepositoryImpl(db_session).move(999, "done") is None
+
+    @pytest.mark.asyncio
+    async def test_move_between_unranked_cards_rebalances_first(self, db_session: AsyncSession):
+        """Test that rows inserted without positions are renumbered to make a gap"""
+        # Arrange: rows added outside the repository share the empty position
+        db_session.add_all([ItemORM(name=name) for name in "ABC"])
+        await db_session.commit()
+        ids = list((await db_session.execute(select(ItemORM.id).order_by(ItemORM.id))).scalars())
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        await repository.move(ids[2], "todo", after_id=ids[0], before_id=ids[1])
+
+        # Assert
+        assert await self.column(db_session, "todo") == ["A", "C", "B"]
+
+    @pytest.mark.asyncio
+    async def test_rebalance_keeps_order_with_short_keys(self, db_session: AsyncSession):
+        """Test that rebalancing shortens keys grown by repeated moves"""
+        # Arrange
+        repository = ItemRepositoryImpl(db_session)
+        a, b, c = await repository.bulk_create([Item(name=name) for name in "ABC"], [[]] * 3)
+        for _ in range(40):
+            await repository.move(c, "todo", after_id=a, before_id=b)
+            await repository.move(b, "todo", after_id=a, before_id=c)
+        order = await self.column(db_session, "todo")
+
+        # Act
+        count = await repository.rebalance("todo")
+
+        # Assert
+        assert count == 3
+        assert await self.column(db_session, "todo") == order
+        positions = await db_session.execute(select(ItemORM.position))
+        assert max(len(position) for position in positions.scalars()) == 1
+
+    @pytest.mark.asyncio
+    async def test_column_reads_use_status_position_index(self, db_session: AsyncSession):
+        """Test that a column in board order and its bottom card come from the index"""
+        # Act
+        page = await db_session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM items "
+                "WHERE status = 'todo' AND deleted_at IS NULL ORDER BY position, id LIMIT 10"
+            )
+        )
+        bottom = await db_session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT max(position) FROM items "
+                "WHERE status = 'todo' AND deleted_at IS NULL"
+            )
+        )
+
+        # Assert
+        page_plan = " ".join(row[-1] for row in page)
+        assert "ix_items_status_position" in page_plan
+        assert "TEMP B-TREE" not in page_plan
+        assert "ix_items_status_position" in " ".join(row[-1] for row in bottom)
+
+
+class TestItemRepositoryImplSoftDelete:
+    """Test tombstones and their purge"""
+
+    async def backdate(self, db_session: AsyncSession, item_id: int, deleted_at: datetime):
+        await db_session.execute(
+            update(ItemORM).where(ItemORM.id == item_id).values(deleted_at=deleted_at)
+        )
+        await db_session.commit()
+
+    @pytest.mark.asyncio
+    async def test_tombstones_are_left_out_of_reads_and_writes(self, db_session: AsyncSession):
+        """Test that a deleted item is neither read, changed nor used as a neighbour"""
+        # Arrange
+        repository = ItemRepositoryImpl(db_session)
+        kept = await repository.create(Item(name="Kept note"))
+        gone = await repository.create(Item(name="Gone note"))
+        await repository.delete(gone.id)
+
+        # Act
+        page = await repository.get_page()
+        hits = await repository.search("note")
+        patched = await repository.patch(ItemChanges(gone.id, {"name": "Back"}))
+        moved = await repository.move(gone.id, "done")
+        with pytest.raises(ValueError):
+            await repository.move(kept.id, "todo", after_id=gone.id)
+
+        # Assert
+        assert [item.id for item in page.items] == [kept.id]
+        assert [hit.item.id for hit in hits] == [kept.id]
+        assert (patched, moved) == (None, None)
+        assert await repository.bulk_update([ItemChanges(gone.id, {"name": "Back"})]) == set()
+
+    @pytest.mark.asyncio
+    async def test_deleted_tags_are_left_out_of_items(self, db_session: AsyncSession):
+        """Test that deleted tags disappear from items and cannot be attached"""
+        # Arrange
+        live, deleted = TagORM(name="Live", color="#000000"), TagORM(name="Gone", color="#FFFFFF")
+        item = ItemORM(name="Item", tags=[live, deleted])
+        db_session.add(item)
+        await db_session.commit()
+        await db_session.execute(
+            update(TagORM).where(TagORM.id == deleted.id).values(deleted_at=func.now())
+        )
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        attached = await repository.attach_tags([item.id], [deleted.id])
+        db_session.expunge_all()
+        loaded = await repository.get_by_id(item.id)
+
+        # Assert
+        assert attached == 0
+        assert [tag.name for tag in loaded.tags] == ["Live"]
+
+    @pytest.mark.asyncio
+    async def test_purge_deleted_removes_old_tombstones_oldest_first(
+        self, db_session: AsyncSession
+    ):
+        """Test that purging is bounded by limit and spares live and recent rows"""
+        # Arrange
+        tag = TagORM(name="Tag", color="#000000")
+        items = [ItemORM(name=f"Item {i}", tags=[tag]) for i in range(5)]
+        db_session.add_all(items)
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+        for item in items[:4]:
+            await repository.delete(item.id)
+        for day, item in zip([3, 1, 2], items[:3], strict=True):
+            await self.backdate(db_session, item.id, datetime(2020, 1, day))
+
+        # Act
+        first = await repository.purge_deleted(datetime(2021, 1, 1), limit=2)
+        remaining_old = await db_session.execute(select(ItemORM.id).order_by(ItemORM.id))
+        ids_after_first = remaining_old.scalars().all()
+        second = await repository.purge_deleted(datetime(2021, 1, 1), limit=2)
+
+        # Assert
+        assert (first, second) == (2, 1)
+        assert ids_after_first == [items[0].id, items[3].id, items[4].id]
+        rows = await db_session.execute(select(ItemORM.id).order_by(ItemORM.id))
+        assert rows.scalars().all() == [items[3].id, items[4].id]
+        links = await db_session.execute(select(item_tags.c.item_id).order_by(item_tags.c.item_id))
+        assert links.scalars().all() == [items[3].id, items[4].id]
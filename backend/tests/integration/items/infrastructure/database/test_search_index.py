@@ -0,0 +1,116 @@
+"""Integration tests for the item full-text search index"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl
+from app.items.infrastructure.database.search_index import (
+    drop_search_index_ddl,
+    rebuild_search_index,
+)
+from app.items.infrastructure.orm.item_orm import ItemORM
+from app.shared.infrastructure import Base
+from app.tags.infrastructure.orm.tag_orm import TagORM
+
+
+class TestItemRepositoryImplSearch:
+    """Test full-text search through the repository"""
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_name_matches_first(self, db_session: AsyncSession):
+        """Test bm25 ranking weights names above descriptions"""
+        # Arrange
+        db_session.add_all(
+            [
+                ItemORM(name="Write docs", description="Explain the login flow"),
+                ItemORM(name="Fix login bug", description="Users are logged out"),
+                ItemORM(name="Unrelated", description="Nothing here"),
+            ]
+        )
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        hits = await repository.search("login")
+
+        # Assert
+        assert [hit.item.name for hit in hits] == ["Fix login bug", "Write docs"]
+        assert hits[0].rank < hits[1].rank
+        assert hits[0].snippet == "Fix <mark>login</mark> bug"
+
+    @pytest.mark.asyncio
+    async def test_search_matches_prefix_of_last_word_and_keeps_tags(
+        self, db_session: AsyncSession
+    ):
+        """Test search-as-you-type and that hits carry their tags"""
+        # Arrange
+        tag = TagORM(name="Bug", color="#FF0000")
+        db_session.add(ItemORM(name="Crash on startup", tags=[tag]))
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        hits = await repository.search("crash sta")
+
+        # Assert
+        assert len(hits) == 1
+        assert [t.name for t in hits[0].item.tags] == ["Bug"]
+
+    @pytest.mark.asyncio
+    async def test_search_treats_operators_literally(self, db_session: AsyncSession):
+        """Test that FTS5 syntax in user input does not raise"""
+        # Arrange
+        db_session.add(ItemORM(name="Plain item"))
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        hits = await repository.search('plain AND "NOT (*')
+
+        # Assert
+        assert hits == []
+
+    @pytest.mark.asyncio
+    async def test_triggers_follow_updates_and_deletes(self, db_session: AsyncSession):
+        """Test the index stays in sync with the items table"""
+        # Arrange
+        kept = ItemORM(name="Alpha")
+        removed = ItemORM(name="Alpha beta")
+        db_session.add_all([kept, removed])
+        await db_session.commit()
+        repository = ItemRepositoryImpl(db_session)
+
+        # Act
+        kept.name = "Gamma"
+        await db_session.delete(removed)
+        await db_session.commit()
+
+        # Assert
+        assert await repository.search("alpha") == []
+        assert [hit.item.id for hit in await repository.search("gamma")] == [kept.id]
+
+
+class TestRebuildSearchIndex:
+    """Test rebuilding the index of an existing database"""
+
+    def test_rebuild_indexes_existing_rows_with_trigram(self, tmp_path):
+        """Test switching to the trigram tokenizer enables substring matches"""
+        # Arrange: a database whose items predate the search index
+        engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            for statement in drop_search_index_ddl():
+                conn.exec_driver_sql(statement)
+            conn.execute(text("INSERT INTO items (name) VALUES ('Refactoring notes')"))
+
+        # Act
+        rebuild_search_index(engine, "trigram")
+
+        # Assert
+        with engine.connect() as conn:
+            matches = conn.execute(
+                text("SELECT rowid FROM items_fts WHERE items_fts MATCH '\"factor\"'")
+            ).all()
+        engine.dispose()
+        assert len(matches) == 1
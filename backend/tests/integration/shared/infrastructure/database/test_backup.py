@@ -0,0 +1,195 @@
+"""Integration tests for online backups and restores of SQLite databases"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from app.shared.infrastructure.database import DatabaseSettings
+from app.shared.infrastructure.database.backup import (
+    backup_database,
+    backup_directory,
+    create_backup,
+    database_file,
+    list_backups,
+    restore_database,
+    rotate,
+)
+
+
+def make_database(path, rows: int = 2000) -> None:
+    """A WAL database with a table of ``rows`` rows of 200 characters"""
+    with sqlite3.connect(path) as db:
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, body TEXT)")
+        db.executemany("INSERT INTO t (body) VALUES (?)", [("x" * 200,)] * rows)
+    db.close()
+
+
+def count_rows(path) -> int:
+    """Number of rows in a database's table"""
+    db = sqlite3.connect(path)
+    try:
+        return db.execute("SELECT count(*) FROM t").fetchone()[0]
+    finally:
+        db.close()
+
+
+class TestBackupDatabase:
+    """Test backup_database"""
+
+    def test_backup_finishes_while_a_writer_commits(self, tmp_path):
+        """Test the copy completes in steps under writes and holds the snapshot it started from"""
+        # Arrange
+        source = tmp_path / "app.db"
+        make_database(source)
+        stop = threading.Event()
+        writes = 0
+
+        def write() -> None:
+            nonlocal writes
+            db = sqlite3.connect(source, timeout=5)
+            while not stop.is_set():
+                with db:
+                    db.execute("INSERT INTO t (body) VALUES ('y')")
+                writes += 1
+            db.close()
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        while writes == 0:
+            time.sleep(0.001)
+
+        # Act
+        try:
+            result = backup_database(source, tmp_path / "backup.db", step_pages=8, pause=0.002)
+        finally:
+            stop.set()
+            writer.join()
+
+        # Assert
+        copy = sqlite3.connect(result.path)
+        try:
+            assert copy.execute("PRAGMA quick_check").fetchone()[0] == "ok"
+            assert copy.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+            backed_up = copy.execute("SELECT count(*) FROM t").fetchone()[0]
+        finally:
+            copy.close()
+        assert result.steps > 1
+        assert 2000 < backed_up < count_rows(source)
+        assert [path.name for path in tmp_path.iterdir() if "partial" in path.name] == []
+
+    def test_missing_source_raises(self, tmp_path):
+        """Test there is no backup of a database that does not exist"""
+        # Act & Assert
+        with pytest.raises(FileNotFoundError):
+            backup_database(tmp_path / "missing.db", tmp_path / "backup.db")
+        assert not (tmp_path / "backup.db").exists()
+
+
+class TestRotation:
+    """Test create_backup and rotate"""
+
+    def test_create_backup_names_by_time_and_keeps_the_newest(self, tmp_path):
+        """Test every backup gets its own file and only backup_keep of them are kept"""
+        # Arrange
+        make_database(tmp_path / "app.db", rows=10)
+        settings = DatabaseSettings(
+            url=f"sqlite:///{tmp_path / 'app.db'}",
+            profile="test",
+            backup_dir=str(tmp_path / "backups"),
+            backup_keep=2,
+        )
+
+        # Act
+        results = [create_backup(settings) for _ in range(3)]
+
+        # Assert
+        directory = backup_directory(settings)
+        assert directory == tmp_path / "backups" / "default"
+        assert list_backups(directory) == [result.path for result in results[1:]]
+        assert backup_directory(settings, "ops") == tmp_path / "backups" / "boards" / "ops"
+
+    def test_rotate_deletes_the_oldest(self, tmp_path):
+        """Test rotate returns and removes everything but the newest backups"""
+        # Arrange
+        for name in ["3.db", "1.db", "2.db"]:
+            (tmp_path / name).touch()
+
+        # Act
+        deleted = rotate(tmp_path, keep=1)
+
+        # Assert
+        assert [path.name for path in deleted] == ["1.db", "2.db"]
+        assert list_backups(tmp_path) == [tmp_path / "3.db"]
+        assert rotate(tmp_path / "none", keep=1) == []
+
+    def test_in_memory_database_has_no_file(self):
+        """Test an in-memory database cannot be backed up"""
+        # Arrange
+        settings = DatabaseSettings(url="sqlite:///:memory:", profile="test")
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            database_file(settings)
+
+
+class TestRestoreDatabase:
+    """Test restore_database"""
+
+    def test_restore_replaces_the_database(self, tmp_path):
+        """Test the database holds the backup's rows after a restore"""
+        # Arrange
+        database = tmp_path / "app.db"
+        make_database(database, rows=10)
+        backup = backup_database(database, tmp_path / "backup.db").path
+        with sqlite3.connect(database) as db:
+            db.execute("DELETE FROM t")
+        db.close()
+
+        # Act
+        seconds = restore_database(backup, database)
+
+        # Assert
+        assert seconds >= 0
+        assert count_rows(database) == 10
+
+    def test_damaged_backup_is_refused(self, tmp_path):
+        """Test a backup that is not a database leaves the target alone"""
+        # Arrange
+        database = tmp_path / "app.db"
+        make_database(database, rows=10)
+        backup = tmp_path / "backup.db"
+        backup.write_bytes(b"not a database" * 100)
+
+        # Act & Assert
+        with pytest.raises(sqlite3.DatabaseError):
+            restore_database(backup, database)
+        assert count_rows(database) == 10
+
+    def test_restore_moves_table_versions_past_the_replaced_ones(self, tmp_path):
+        """Test versions keep growing across a restore, so old ETags cannot match"""
+        # Arrange
+        database = tmp_path / "app.db"
+        make_database(database, rows=10)
+        with sqlite3.connect(database) as db:
+            db.execute("CREATE TABLE counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            db.execute("INSERT INTO counters VALUES ('version:items', 3), ('items', 10)")
+        db.close()
+        backup = backup_database(database, tmp_path / "backup.db").path
+        with sqlite3.connect(database) as db:
+            db.execute("UPDATE counters SET value = 7 WHERE name = 'version:items'")
+            db.execute("INSERT INTO counters VALUES ('version:tags', 2)")
+        db.close()
+
+        # Act
+        restore_database(backup, database)
+
+        # Assert
+        db = sqlite3.connect(database)
+        try:
+            counters = dict(db.execute("SELECT name, value FROM counters").fetchall())
+        finally:
+            db.close()
+        assert counters == {"version:items": 8, "version:tags": 3, "items": 10}
@@ -0,0 +1,151 @@
+"""Integration tests for the trigger-maintained counters"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.items.domain.entities.item import Item
+from app.items.infrastructure.database.item_counters import item_counters
+from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl
+from app.shared.infrastructure.database.counters import read_counters
+from app.tags.domain.entities.tag import Tag
+from app.tags.infrastructure.database.tag_counters import tag_counters, tag_items_counters
+from app.tags.infrastructure.database.tag_repository_impl import TagRepositoryImpl
+
+NAMES = ["items", "items:todo", "items:done", "tags", "tag_items:1", "tag_items:2"]
+
+
+class TestCounters:
+    """Test that every write path keeps the counters in step with the tables"""
+
+    @pytest.mark.asyncio
+    async def test_counts_follow_creates_moves_and_links(self, db_session: AsyncSession):
+        """Test counts after single and bulk creates, a column change and tag links"""
+        # Arrange
+        items = ItemRepositoryImpl(db_session)
+        tags = TagRepositoryImpl(db_session)
+        await tags.create(Tag(name="bug", color="#FF0000"))
+        await tags.create(Tag(name="ui", color="#00FF00"))
+        first = await items.create(Item(name="first"))
+
+        # Act
+        await items.bulk_create([Item(name="a"), Item(name="b")], [[1, 2], [1]])
+        await items.move(first.id, "done", None, None)
+        await items.attach_tags([first.id], [1])
+
+        # Assert
+        assert await read_counters(db_session, NAMES) == {
+            "items": 3,
+            "items:todo": 2,
+            "items:done": 1,
+            "tags": 2,
+            "tag_items:1": 3,
+            "tag_items:2": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_counts_follow_cascaded_deletes(self, db_session: AsyncSession):
+        """Test that links removed by ON DELETE CASCADE are uncounted too"""
+        # Arrange
+        items = ItemRepositoryImpl(db_session)
+        tags = TagRepositoryImpl(db_session)
+        await tags.create(Tag(name="bug", color="#FF0000"))
+        await tags.create(Tag(name="ui", color="#00FF00"))
+        ids = await items.bulk_create([Item(name="a"), Item(name="b")], [[1, 2], [1, 2]])
+
+        # Act
+        await items.delete(ids[0])
+        await tags.delete(1)
+
+        # Assert
+        counts = await read_counters(db_session, NAMES)
+        assert (counts["items"], counts["items:todo"], counts["tags"]) == (1, 1, 1)
+        assert (counts["tag_items:1"], counts["tag_items:2"]) == (0, 1)
+        remaining = await db_session.execute(
+            text("SELECT count(*) FROM counters WHERE name = 'tag_items:1'")
+        )
+        assert remaining.scalar() == 0
+
+    @pytest.mark.asyncio
+    async def test_ensure_recounts_when_triggers_are_missing(self, db_session: AsyncSession):
+        """Test that installing the triggers on existing rows counts those rows"""
+        # Arrange
+        await db_session.execute(text("INSERT INTO items (name) VALUES ('a'), ('b')"))
+        await db_session.execute(text("INSERT INTO tags (name, color) VALUES ('t', '#FFFFFF')"))
+        await db_session.execute(text("INSERT INTO item_tags VALUES (1, 1), (2, 1)"))
+        await db_session.commit()
+        for statement in item_counters.drop_ddl() + tag_items_counters.drop_ddl():
+            await db_session.execute(text(statement))
+        await db_session.execute(text("DELETE FROM counters"))
+        await db_session.commit()
+
+        # Act
+        connection = await db_session.connection()
+        await connection.run_sync(item_counters.ensure)
+        await connection.run_sync(tag_items_counters.ensure)
+        await db_session.commit()
+
+        # Assert
+        counts = await read_counters(db_session, ["items", "items:todo", "tag_items:1"])
+        assert counts == {"items": 2, "items:todo": 2, "tag_items:1": 2}
+
+    @pytest.mark.asyncio
+    async def test_counts_follow_soft_deletes_not_purges(self, db_session: AsyncSession):
+        """Test that deleting uncounts items, tags and links, and purging changes nothing"""
+        # Arrange
+        items = ItemRepositoryImpl(db_session)
+        tags = TagRepositoryImpl(db_session)
+        await tags.create(Tag(name="bug", color="#FF0000"))
+        await tags.create(Tag(name="ui", color="#00FF00"))
+        ids = await items.bulk_create([Item(name="a"), Item(name="b")], [[1, 2], [1]])
+        await items.delete(ids[0])
+        await tags.delete(2)
+        deleted = await read_counters(db_session, NAMES)
+
+        # Act
+        await items.purge_deleted(datetime(9999, 1, 1))
+        await tags.purge_deleted(datetime(9999, 1, 1))
+
+        # Assert
+        assert deleted == {
+            "items": 1,
+            "items:todo": 1,
+            "items:done": 0,
+            "tags": 1,
+            "tag_items:1": 1,
+            "tag_items:2": 0,
+        }
+        assert await read_counters(db_session, NAMES) == deleted
+        links = await db_session.execute(text("SELECT count(*) FROM item_tags"))
+        assert links.scalar() == 1
+
+    @pytest.mark.asyncio
+    async def test_recount_skips_tombstones(self, db_session: AsyncSession):
+        """Test that recounting from the tables leaves deleted items and tags out"""
+        # Arrange
+        await db_session.execute(text("INSERT INTO items (name) VALUES ('a'), ('b')"))
+        await db_session.execute(
+            text("INSERT INTO tags (name, color) VALUES ('t', '#FFFFFF'), ('u', '#FFFFFF')")
+        )
+        await db_session.execute(text("INSERT INTO item_tags VALUES (1, 1), (2, 1), (1, 2)"))
+        await db_session.execute(
+            text("UPDATE items SET deleted_at = CURRENT_TIMESTAMP WHERE id = 1")
+        )
+        await db_session.execute(
+            text("UPDATE tags SET deleted_at = CURRENT_TIMESTAMP WHERE id = 2")
+        )
+        await db_session.execute(text("DELETE FROM counters"))
+        await db_session.commit()
+
+        # Act
+        connection = await db_session.connection()
+        for counter_set in (item_counters, tag_counters, tag_items_counters):
+            for statement in counter_set.recount:
+                await connection.exec_driver_sql(statement)
+        await db_session.commit()
+
+        # Assert
+        counts = await read_counters(db_session, ["items", "tags", "tag_items:1", "tag_items:2"])
+        assert counts == {"items": 1, "tags": 1, "tag_items:1": 1, "tag_items:2": 0}
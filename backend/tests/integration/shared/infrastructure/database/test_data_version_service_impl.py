@@ -0,0 +1,38 @@
+"""Integration tests for DataVersionServiceImpl"""
+
+from sqlalchemy import insert, update
+
+from app.items.infrastructure.orm.item_orm import ItemORM
+from app.shared.infrastructure.database.data_version_service_impl import DataVersionServiceImpl
+from app.tags.infrastructure.orm.tag_orm import TagORM
+
+
+class TestDataVersionServiceImpl:
+    """Test DataVersionServiceImpl"""
+
+    async def test_versions_change_with_writes_to_their_tables(self, db_session):
+        """Test a write changes the version of its table and leaves the others alone"""
+        # Arrange
+        service = DataVersionServiceImpl(db_session)
+        before = await service.get_version(["items", "tags"])
+
+        # Act
+        await db_session.execute(insert(ItemORM).values(name="a"))
+        await db_session.execute(update(ItemORM).values(name="b"))
+        after_items = await service.get_version(["items", "tags"])
+        await db_session.execute(insert(TagORM).values(name="bug", color="#ff0000"))
+        after_tags = await service.get_version(["tags"])
+
+        # Assert
+        assert before == "0.0"
+        assert after_items == "2.0"
+        assert after_tags == "1"
+
+    async def test_version_is_one_counters_query(self, db_session, sql_statements):
+        """Test reading a version loads no ORM row"""
+        # Act
+        await DataVersionServiceImpl(db_session).get_version(["items", "tags", "item_tags"])
+
+        # Assert
+        assert len(sql_statements) == 1
+        assert "FROM counters" in sql_statements[0]
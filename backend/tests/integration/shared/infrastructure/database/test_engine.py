@@ -0,0 +1,63 @@
+"""Integration tests for the settings-driven engine factory"""
+
+import pytest
+from sqlalchemy import text
+
+from app.shared.infrastructure.database import (
+    DatabaseSettings,
+    create_async_db_engine,
+    create_db_engine,
+)
+
+
+@pytest.fixture
+def prod_settings(tmp_path) -> DatabaseSettings:
+    """Settings for a file database using the prod profile"""
+    return DatabaseSettings(url=f"sqlite:///{tmp_path / 'app.db'}", profile="prod")
+
+
+class TestCreateDbEngine:
+    """Test create_db_engine"""
+
+    def test_applies_profile_pragmas_on_connect(self, prod_settings: DatabaseSettings):
+        """Test every connection gets the profile pragmas"""
+        # Arrange
+        engine = create_db_engine(prod_settings)
+
+        # Act
+        with engine.connect() as conn:
+            journal_mode = conn.execute(text("PRAGMA journal_mode")).scalar()
+            synchronous = conn.execute(text("PRAGMA synchronous")).scalar()
+            temp_store = conn.execute(text("PRAGMA temp_store")).scalar()
+            busy_timeout = conn.execute(text("PRAGMA busy_timeout")).scalar()
+            foreign_keys = conn.execute(text("PRAGMA foreign_keys")).scalar()
+        engine.dispose()
+
+        # Assert
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert temp_store == 2  # MEMORY
+        assert busy_timeout == prod_settings.pragmas.busy_timeout
+        assert foreign_keys == 1
+
+
+class TestCreateAsyncDbEngine:
+    """Test create_async_db_engine"""
+
+    @pytest.mark.asyncio
+    async def test_applies_profile_pragmas_on_connect(self, prod_settings: DatabaseSettings):
+        """Test the async engine applies the same pragmas"""
+        # Arrange
+        engine = create_async_db_engine(prod_settings)
+
+        # Act
+        async with engine.connect() as conn:
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+            cache_size = (await conn.execute(text("PRAGMA cache_size"))).scalar()
+            foreign_keys = (await conn.execute(text("PRAGMA foreign_keys"))).scalar()
+        await engine.dispose()
+
+        # Assert
+        assert journal_mode == "wal"
+        assert cache_size == prod_settings.pragmas.cache_size
+        assert foreign_keys == 1
@@ -0,0 +1,145 @@
+"""Integration tests for the group commit writer"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.items.domain.entities.item import Item
+from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl
+from app.items.infrastructure.orm.item_orm import ItemORM
+from app.shared.infrastructure import Base
+from app.shared.infrastructure.database import Database, DatabaseSettings, GroupCommitWriter
+from app.tags.infrastructure.orm.tag_orm import TagORM
+
+
+@pytest.fixture
+async def database():
+    """An in-memory database with the schema created"""
+    db = Database(DatabaseSettings(url="sqlite:///:memory:", profile="test"))
+    async with db.writer_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield db
+    await db.dispose()
+
+
+def count_commits(database: Database) -> list[int]:
+    """Count transactions committed on the writer engine"""
+    commits = [0]
+
+    @event.listens_for(database.writer_engine.sync_engine, "commit")
+    def _on_commit(conn):
+        commits[0] += 1
+
+    return commits
+
+
+def insert_item(name: str):
+    """Build a write operation inserting one item"""
+
+    async def operation(session: AsyncSession) -> int:
+        item = ItemORM(name=name)
+        session.add(item)
+        await session.flush()
+        return item.id
+
+    return operation
+
+
+async def count_items(database: Database) -> int:
+    async with database.session() as session:
+        statement = select(func.count(ItemORM.id)).where(ItemORM.deleted_at.is_(None))
+        return (await session.execute(statement)).scalar_one()
+
+
+class TestGroupCommitWriter:
+    """Test GroupCommitWriter"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_operations_share_one_commit(self, database: Database):
+        """Test operations inside the latency window are committed together"""
+        # Arrange
+        writer = GroupCommitWriter(database.writer_session_factory, max_latency=0.05)
+        commits = count_commits(database)
+
+        # Act
+        ids = await asyncio.gather(*(writer.submit(insert_item(f"Item {i}")) for i in range(10)))
+        await writer.close()
+
+        # Assert
+        assert sorted(ids) == list(range(1, 11))
+        assert commits[0] == 1
+        assert await count_items(database) == 10
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped_at_max_batch_size(self, database: Database):
+        """Test a full batch is committed without waiting for the latency window"""
+        # Arrange
+        writer = GroupCommitWriter(database.writer_session_factory, max_batch_size=2, max_latency=5)
+        commits = count_commits(database)
+
+        # Act
+        await asyncio.wait_for(
+            asyncio.gather(*(writer.submit(insert_item(f"Item {i}")) for i in range(4))),
+            timeout=1,
+        )
+        await writer.close()
+
+        # Assert
+        assert commits[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_failing_operation_only_fails_its_caller(self, database: Database):
+        """Test a failing operation does not roll back the rest of its batch"""
+        # Arrange
+        writer = GroupCommitWriter(database.writer_session_factory, max_latency=0.05)
+
+        async def failing(session: AsyncSession) -> int:
+            raise ValueError("boom")
+
+        # Act
+        results = await asyncio.gather(
+            writer.submit(insert_item("First")),
+            writer.submit(failing),
+            writer.submit(insert_item("Second")),
+            return_exceptions=True,
+        )
+        await writer.close()
+
+        # Assert
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[0], int)
+        assert isinstance(results[2], int)
+        assert await count_items(database) == 2
+
+
+class TestRepositoryWithGroupCommit:
+    """Test repositories routing their mutations through the writer"""
+
+    @pytest.mark.asyncio
+    async def test_item_mutations_go_through_writer(self, database: Database):
+        """Test create, update and delete resolve after the shared commit"""
+        # Arrange
+        async with database.writer_session_factory() as session:
+            tag = TagORM(name="Tag", color="#FF0000")
+            session.add(tag)
+            await session.commit()
+        writer = GroupCommitWriter(database.writer_session_factory, max_latency=0.01)
+
+        async with database.session() as session:
+            repository = ItemRepositoryImpl(session, writer)
+
+            # Act
+            created = await repository.create(Item(name="Grouped"), tag_ids=[tag.id])
+            updated = await repository.update(created.id, Item(name="Renamed"), tag_ids=[])
+            deleted = await repository.delete(created.id)
+
+        await writer.close()
+
+        # Assert
+        assert [t.name for t in created.tags] == ["Tag"]
+        assert updated.name == "Renamed"
+        assert updated.tags == []
+        assert deleted is True
+        assert await count_items(database) == 0
@@ -0,0 +1,277 @@
+"""Integration tests for the versioned schema migrations"""
+
+import re
+
+import pytest
+from sqlalchemy import Connection, Engine, create_engine, event
+from sqlalchemy.exc import OperationalError
+
+from app.items.infrastructure.orm.item_orm import ItemORM  # noqa: F401
+from app.shared.infrastructure.database import Base, DatabaseSettings, create_db_engine
+from app.shared.infrastructure.database.migrations import (
+    Migration,
+    OnlineIndex,
+    current_version,
+    load_migrations,
+    upgrade,
+)
+from app.shared.infrastructure.database.migrations.__main__ import status
+from app.tags.infrastructure.orm.tag_orm import TagORM  # noqa: F401
+
+
+@pytest.fixture
+def file_engine(tmp_path) -> Engine:
+    """Engine on an empty file database"""
+    engine = create_db_engine(
+        DatabaseSettings(url=f"sqlite:///{tmp_path / 'app.db'}", profile="test")
+    )
+    yield engine
+    engine.dispose()
+
+
+def schema(engine: Engine) -> dict[str, object]:
+    """Columns of every table and the SQL of every index and trigger, whitespace normalized"""
+    shape: dict[str, object] = {}
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(
+            "SELECT type, name, sql FROM sqlite_master "
+            "WHERE name NOT LIKE 'sqlite_%' AND name != 'schema_version'"
+        )
+        for kind, name, sql in rows.all():
+            if kind == "table":
+                shape[name] = connection.exec_driver_sql(f"PRAGMA table_xinfo('{name}')").all()
+            elif sql:
+                sql = re.sub(r"\s+", " ", sql.replace("IF NOT EXISTS ", ""))
+                shape[name] = sql.replace("( ", "(").replace(" )", ")")
+    return shape
+
+
+# Latest version without deleted_at
+BEFORE_SOFT_DELETE = 7
+
+# The schema create_all built from the first models, before there were migrations
+ORIGINAL_SCHEMA = [
+    "CREATE TABLE items (id INTEGER NOT NULL, name VARCHAR NOT NULL, description VARCHAR, "
+    "created_at DATETIME DEFAULT (CURRENT_TIMESTAMP), updated_at DATETIME, PRIMARY KEY (id))",
+    "CREATE INDEX ix_items_name ON items (name)",
+    "CREATE INDEX ix_items_id ON items (id)",
+    "CREATE TABLE tags (id INTEGER NOT NULL, name VARCHAR NOT NULL, color VARCHAR NOT NULL, "
+    "created_at DATETIME DEFAULT (CURRENT_TIMESTAMP), updated_at DATETIME, PRIMARY KEY (id))",
+    "CREATE INDEX ix_tags_id ON tags (id)",
+    "CREATE UNIQUE INDEX ix_tags_name ON tags (name)",
+    "CREATE TABLE item_tags (item_id INTEGER NOT NULL, tag_id INTEGER NOT NULL, "
+    "PRIMARY KEY (item_id, tag_id), FOREIGN KEY(item_id) REFERENCES items (id), "
+    "FOREIGN KEY(tag_id) REFERENCES tags (id))",
+]
+
+
+def counts(connection: Connection) -> dict[str, int]:
+    """Every count of the counters table, without the table versions"""
+    rows = connection.exec_driver_sql(
+        "SELECT name, value FROM counters WHERE name NOT LIKE 'version:%'"
+    )
+    return dict(rows.tuples().all())
+
+
+class TestUpgrade:
+    """Test upgrade"""
+
+    def test_migrates_an_empty_database_to_the_orm_schema(self, file_engine: Engine, tmp_path):
+        """Test the migrations build exactly what create_all builds from the models"""
+        # Arrange
+        reference = create_engine(f"sqlite:///{tmp_path / 'reference.db'}")
+        Base.metadata.create_all(reference)
+
+        # Act
+        applied = upgrade(file_engine)
+
+        # Assert
+        assert applied == [migration.version for migration in load_migrations()]
+        assert schema(file_engine) == schema(reference)
+        reference.dispose()
+
+    def test_records_versions_and_skips_applied_migrations(self, file_engine: Engine):
+        """Test a second run applies nothing and status reports no pending migration"""
+        # Arrange
+        before = status(file_engine)
+        upgrade(file_engine)
+
+        # Act
+        applied = upgrade(file_engine)
+
+        # Assert
+        latest = load_migrations()[-1].version
+        assert applied == []
+        assert before[0] == "Current version: 0"
+        assert before[1].startswith("Pending 0001: Baseline")
+        assert status(file_engine) == [f"Current version: {latest}"]
+
+    def test_stops_at_the_target_version(self, file_engine: Engine):
+        """Test migrations above the target are left pending"""
+        # Act
+        applied = upgrade(file_engine, target=1)
+
+        # Assert
+        with file_engine.connect() as connection:
+            version = current_version(connection)
+            columns = {row[1] for row in connection.exec_driver_sql("PRAGMA table_info(items)")}
+        assert applied == [1]
+        assert version == 1
+        assert "deleted_at" not in columns
+
+    def test_brings_a_populated_database_forward(self, file_engine: Engine):
+        """Test soft delete is added to a database holding rows, with its counts kept"""
+        # Arrange
+        upgrade(file_engine, target=BEFORE_SOFT_DELETE)
+        with file_engine.begin() as connection:
+            connection.exec_driver_sql(
+                "INSERT INTO items (name, status) VALUES ('a', 'todo'), ('b', 'done')"
+            )
+            connection.exec_driver_sql("INSERT INTO tags (name, color) VALUES ('bug', '#FF0000')")
+            connection.exec_driver_sql("INSERT INTO item_tags VALUES (1, 1), (2, 1)")
+
+        # Act
+        upgrade(file_engine)
+        with file_engine.begin() as connection:
+            connection.exec_driver_sql(
+                "UPDATE items SET deleted_at = CURRENT_TIMESTAMP WHERE id = 2"
+            )
+            connection.exec_driver_sql("UPDATE tags SET deleted_at = CURRENT_TIMESTAMP")
+            connection.exec_driver_sql("INSERT INTO tags (name, color) VALUES ('bug', '#00FF00')")
+
+        # Assert
+        with file_engine.connect() as connection:
+            assert counts(connection) == {"items": 1, "items:todo": 1, "items:done": 0, "tags": 1}
+
+    def test_brings_an_original_database_to_the_orm_schema(self, file_engine: Engine, tmp_path):
+        """Test a database from before migrations keeps its rows and ends at the ORM schema"""
+        # Arrange
+        reference = create_engine(f"sqlite:///{tmp_path / 'reference.db'}")
+        Base.metadata.create_all(reference)
+        with file_engine.begin() as connection:
+            connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            for statement in ORIGINAL_SCHEMA:
+                connection.exec_driver_sql(statement)
+            connection.exec_driver_sql(
+                "INSERT INTO items (id, name, description) "
+                "VALUES (1, 'Write docs', 'for the API'), (3, 'Fix login', NULL)"
+            )
+            connection.exec_driver_sql(
+                "INSERT INTO tags (id, name, color) "
+                "VALUES (1, 'bug', '#FF0000'), (2, 'Bug', '#00FF00'), (3, 'docs', '#0000FF')"
+            )
+            # Links to item 2 were left behind by a delete without foreign keys
+            connection.exec_driver_sql(
+                "INSERT INTO item_tags VALUES (1, 3), (3, 1), (3, 2), (2, 3)"
+            )
+        with file_engine.begin() as connection:
+            connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+        # Act
+        applied = upgrade(file_engine)
+        with file_engine.begin() as connection:
+            connection.exec_driver_sql("DELETE FROM items WHERE id = 3")
+            connection.exec_driver_sql("INSERT INTO items (name) VALUES ('Plan sprint')")
+
+        # Assert
+        assert applied == [migration.version for migration in load_migrations()]
+        assert schema(file_engine) == schema(reference)
+        with file_engine.connect() as connection:
+            items = connection.exec_driver_sql(
+                "SELECT id, name, status, position FROM items ORDER BY id"
+            ).all()
+            tags = connection.exec_driver_sql("SELECT id, name FROM tags ORDER BY id").all()
+            links = connection.exec_driver_sql("SELECT item_id, tag_id FROM item_tags").all()
+            found = connection.exec_driver_sql(
+                "SELECT rowid FROM items_fts WHERE items_fts MATCH 'docs'"
+            ).scalars()
+            assert items == [(1, "Write docs", "todo", ""), (4, "Plan sprint", "todo", "")]
+            assert tags == [(1, "bug"), (3, "docs")]
+            assert links == [(1, 3)]
+            assert list(found) == [1]
+            assert counts(connection) == {
+                "items": 2,
+                "items:todo": 2,
+                "tags": 2,
+                "tag_items:1": 0,
+                "tag_items:3": 1,
+            }
+        reference.dispose()
+
+    def test_failed_migration_leaves_no_trace(self, file_engine: Engine):
+        """Test a migration that fails midway is rolled back with its version"""
+
+        # Arrange
+        def failing(connection: Connection) -> None:
+            connection.exec_driver_sql("CREATE TABLE half_done (id INTEGER)")
+            connection.exec_driver_sql("SELECT * FROM missing")
+
+        migrations = [Migration(1, "Fails", failing)]
+
+        # Act
+        with pytest.raises(OperationalError):
+            upgrade(file_engine, migrations=migrations)
+
+        # Assert
+        with file_engine.connect() as connection:
+            tables = connection.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE name = 'half_done'"
+            ).all()
+            assert tables == []
+            assert current_version(connection) == 0
+
+    def test_reads_index_tables_before_taking_the_write_lock(self, file_engine: Engine):
+        """Test the table scan of an online index runs before BEGIN IMMEDIATE"""
+        # Arrange
+        upgrade(file_engine)
+        index = OnlineIndex("ix_items_created_at", "items", ["created_at"])
+        migrations = [Migration(99, "Index", lambda connection: None, [index])]
+        statements: list[str] = []
+        event.listen(
+            file_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        # Act
+        upgrade(file_engine, migrations=migrations)
+
+        # Assert
+        scan = statements.index("SELECT count(*) FROM items NOT INDEXED")
+        lock = statements.index("BEGIN IMMEDIATE")
+        build = statements.index(index.ddl())
+        assert scan < lock < build
+
+
+class TestOnlineIndex:
+    """Test OnlineIndex"""
+
+    def test_ddl_of_a_partial_unique_index(self):
+        """Test the CREATE INDEX statement carries UNIQUE and the WHERE clause"""
+        # Arrange
+        index = OnlineIndex(
+            "ix_tags_name", "tags", ["name"], where="deleted_at IS NULL", unique=True
+        )
+
+        # Act
+        ddl = index.ddl()
+
+        # Assert
+        assert ddl == (
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_tags_name ON tags (name) WHERE deleted_at IS NULL"
+        )
+
+
+class TestLoadMigrations:
+    """Test load_migrations"""
+
+    def test_versions_are_numbered_from_one_without_gaps(self):
+        """Test every shipped migration has a version and a description"""
+        # Act
+        migrations = load_migrations()
+
+        # Assert
+        assert [migration.version for migration in migrations] == list(
+            range(1, len(migrations) + 1)
+        )
+        assert all(migration.description for migration in migrations)
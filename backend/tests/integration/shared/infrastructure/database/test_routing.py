@@ -0,0 +1,117 @@
+"""Integration tests for the single-writer / multi-reader database layer"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.exc import OperationalError
+
+from app.items.domain.entities.item import Item
+from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl
+from app.items.infrastructure.orm.item_orm import ItemORM
+from app.shared.infrastructure import Base
+from app.shared.infrastructure.database import Database, DatabaseSettings, create_db_engine
+
+
+@pytest.fixture
+async def database(tmp_path):
+    """A file database with split reader and writer engines"""
+    settings = DatabaseSettings(url=f"sqlite:///{tmp_path / 'app.db'}", profile="dev")
+    schema_engine = create_db_engine(settings)
+    Base.metadata.create_all(bind=schema_engine)
+    schema_engine.dispose()
+    db = Database(settings)
+    yield db
+    await db.dispose()
+
+
+def record_statements(database: Database) -> dict[str, list[str]]:
+    """Capture the SQL sent through each engine"""
+    statements: dict[str, list[str]] = {"reader": [], "writer": []}
+    for name, engine in (("reader", database.reader_engine), ("writer", database.writer_engine)):
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def _record(conn, cursor, statement, parameters, context, executemany, name=name):
+            statements[name].append(statement)
+
+    return statements
+
+
+class TestDatabaseRouting:
+    """Test statement routing between reader and writer engines"""
+
+    @pytest.mark.asyncio
+    async def test_repository_reads_use_reader_and_writes_use_writer(self, database: Database):
+        """Test get_* methods only touch the read-only pool"""
+        # Arrange
+        statements = record_statements(database)
+
+        # Act
+        async with database.session() as session:
+            created = await ItemRepositoryImpl(session).create(Item(name="Routed"))
+        writer_count = len(statements["writer"])
+        async with database.session() as session:
+            items = await ItemRepositoryImpl(session).get_all()
+
+        # Assert
+        assert [item.id for item in items] == [created.id]
+        assert any(sql.startswith("INSERT INTO items") for sql in statements["writer"])
+        assert len(statements["writer"]) == writer_count
+        assert not any(sql.startswith("INSERT") for sql in statements["reader"])
+
+    @pytest.mark.asyncio
+    async def test_reads_inside_a_write_use_the_writer(self, database: Database):
+        """Test a write's reads before its first flush (the next rank key) skip the reader"""
+        # Arrange
+        async with database.session() as session:
+            await ItemRepositoryImpl(session).create(Item(name="First"))
+        statements = record_statements(database)
+
+        # Act
+        async with database.session() as session:
+            created = await ItemRepositoryImpl(session).create(Item(name="Second"))
+            await ItemRepositoryImpl(session).get_all()
+
+        # Assert
+        assert created.position > "V"
+        assert any("max(items.position)" in sql for sql in statements["writer"])
+        assert not any("max(items.position)" in sql for sql in statements["reader"])
+        assert any(sql.startswith("SELECT items.id") for sql in statements["reader"])
+
+    @pytest.mark.asyncio
+    async def test_reader_connections_are_read_only(self, database: Database):
+        """Test the reader pool rejects writes"""
+        # Act & Assert
+        async with database.reader_engine.connect() as conn:
+            with pytest.raises(OperationalError, match="readonly"):
+                await conn.execute(text("INSERT INTO items (name) VALUES ('nope')"))
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_wait_for_open_write_transaction(self, database: Database):
+        """Test readers see committed data while the writer holds the write lock"""
+        # Arrange: commit one item, then leave a second write uncommitted
+        async with database.session() as session:
+            await ItemRepositoryImpl(session).create(Item(name="Committed"))
+        async with database.writer_engine.connect() as writer:
+            await writer.execute(text("INSERT INTO items (name) VALUES ('Pending')"))
+
+            # Act
+            async with database.session() as session:
+                items = await asyncio.wait_for(ItemRepositoryImpl(session).get_all(), timeout=1)
+
+        # Assert
+        assert [item.name for item in items] == ["Committed"]
+
+    @pytest.mark.asyncio
+    async def test_session_reads_its_own_writes_after_flush(self, database: Database):
+        """Test a transaction sticks to the writer once it has written"""
+        # Arrange
+        async with database.session() as session:
+            session.add(ItemORM(name="Flushed"))
+            await session.flush()
+
+            # Act
+            result = await session.execute(select(ItemORM.name))
+
+            # Assert
+            assert result.scalars().all() == ["Flushed"]
@@ -0,0 +1,198 @@
+"""Integration tests for the per-board database router"""
+
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import insert, text
+
+from app.items.infrastructure.orm.item_orm import ItemORM
+from app.shared.infrastructure.database import (
+    Database,
+    DatabaseSettings,
+    ShardRouter,
+    board_path,
+    sharding,
+)
+
+
+@pytest.fixture
+async def shards(tmp_path) -> ShardRouter:
+    """Router over an empty boards directory, keeping two boards open at most"""
+    settings = DatabaseSettings(
+        url=f"sqlite:///{tmp_path / 'app.db'}",
+        profile="test",
+        journal_mode="WAL",
+        boards_dir=str(tmp_path / "boards"),
+        max_open_boards=2,
+    )
+    default = Database(settings)
+    router = ShardRouter(settings, default)
+    yield router
+    await router.dispose()
+    await default.dispose()
+
+
+async def count_items(board: Database) -> int:
+    """Number of rows in a board's items table"""
+    async with board.session() as session:
+        return (await session.execute(text("SELECT count(*) FROM items"))).scalar_one()
+
+
+async def open_board(shards: ShardRouter, board_id: str) -> Database:
+    """Lease a board once, opening it if needed"""
+    async with shards.lease(board_id) as board:
+        return board
+
+
+class TestShardRouter:
+    """Test ShardRouter"""
+
+    @pytest.mark.asyncio
+    async def test_create_makes_a_migrated_database_per_board(self, shards: ShardRouter):
+        """Test every board gets a file with the current schema"""
+        # Act
+        await shards.create("team-b")
+        await shards.create("team-a")
+
+        # Assert
+        assert shards.board_ids() == ["team-a", "team-b"]
+        async with shards.lease("team-a") as board:
+            assert await count_items(board) == 0
+
+    @pytest.mark.asyncio
+    async def test_create_rejects_taken_and_unsafe_ids(self, shards: ShardRouter):
+        """Test an existing board is not recreated and IDs cannot leave the directory"""
+        # Arrange
+        await shards.create("team")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="already exists"):
+            await shards.create("team")
+        with pytest.raises(ValueError, match="Invalid board ID"):
+            await shards.create("../app")
+        assert shards.board_ids() == ["team"]
+
+    @pytest.mark.asyncio
+    async def test_lease_of_an_unknown_board_raises(self, shards: ShardRouter):
+        """Test boards are not created by accident when looked up"""
+        # Act & Assert
+        with pytest.raises(KeyError):
+            async with shards.lease("missing"):
+                pass
+        assert not shards.exists("missing")
+
+    @pytest.mark.asyncio
+    async def test_boards_do_not_share_rows(self, shards: ShardRouter):
+        """Test a write to one board is invisible in another and in the default board"""
+        # Arrange
+        await shards.create("a")
+        await shards.create("b")
+
+        # Act
+        async with shards.lease("a") as board, board.session() as session:
+            await session.execute(insert(ItemORM).values(name="card"))
+            await session.commit()
+
+        # Assert
+        async with shards.lease("a") as a, shards.lease("b") as b:
+            assert (await count_items(a), await count_items(b)) == (1, 0)
+        assert shards.default is not a
+
+    @pytest.mark.asyncio
+    async def test_boards_do_not_share_the_write_lock(self, shards: ShardRouter):
+        """Test a board can commit while another board's write transaction is open"""
+        # Arrange
+        await shards.create("a")
+        await shards.create("b")
+
+        async with shards.lease("a") as a, shards.lease("b") as b:
+            async with a.writer_engine.connect() as blocking:
+                await blocking.exec_driver_sql("BEGIN IMMEDIATE")
+                await blocking.exec_driver_sql("INSERT INTO items (name) VALUES ('held')")
+
+                # Act
+                async with b.session() as session:
+                    await session.execute(insert(ItemORM).values(name="free"))
+                    await session.commit()
+
+                await blocking.rollback()
+
+            # Assert
+            assert await count_items(b) == 1
+
+    @pytest.mark.asyncio
+    async def test_opening_a_board_holds_up_no_other_board(self, shards: ShardRouter, monkeypatch):
+        """Test leases of open boards go on while a board migrates, which happens once"""
+        # Arrange
+        await shards.create("a")
+        await shards.create("slow")
+        await open_board(shards, "a")
+        started, release = threading.Event(), threading.Event()
+        migrated: list[str] = []
+
+        def slow_migrate(settings):
+            migrated.append(settings.url)
+            started.set()
+            release.wait(5)
+            return []
+
+        monkeypatch.setattr(sharding, "migrate", slow_migrate)
+        opening = [asyncio.create_task(open_board(shards, "slow")) for _ in range(2)]
+        await asyncio.to_thread(started.wait, 5)
+
+        # Act
+        async with asyncio.timeout(1):
+            async with shards.lease("a") as a:
+                count = await count_items(a)
+        release.set()
+        boards = await asyncio.gather(*opening)
+
+        # Assert
+        assert count == 0
+        assert len(migrated) == 1
+        assert boards[0] is boards[1]
+
+    @pytest.mark.asyncio
+    async def test_closes_least_recently_used_boards_beyond_the_cap(self, shards: ShardRouter):
+        """Test at most max_open_boards stay open, most recently used kept"""
+        # Arrange
+        for board_id in ("a", "b", "c"):
+            await shards.create(board_id)
+
+        # Act
+        for board_id in ("a", "b", "a", "c"):
+            async with shards.lease(board_id):
+                pass
+
+        # Assert
+        assert shards.open_board_ids() == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_never_closes_a_board_in_use(self, shards: ShardRouter):
+        """Test the least recently used board is kept while held, the next one closed"""
+        # Arrange
+        for board_id in ("a", "b", "c"):
+            await shards.create(board_id)
+
+        # Act
+        async with shards.lease("a"):
+            for board_id in ("b", "c"):
+                async with shards.lease(board_id):
+                    pass
+            held = shards.open_board_ids()
+        released = shards.open_board_ids()
+
+        # Assert
+        assert held == ["a", "c"]
+        assert released == ["a", "c"]
+
+
+class TestBoardPath:
+    """Test board_path"""
+
+    def test_prefixes_paths_of_a_board(self):
+        """Test board paths live under /boards/{board_id}; the default board is unprefixed"""
+        # Act & Assert
+        assert board_path("team", "/items/") == "/boards/team/items/"
+        assert board_path(None, "/items/") == "/items/"
@@ -0,0 +1,45 @@
+"""Integration tests for StatsQueryServiceImpl"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.items.infrastructure.orm.item_orm import ItemORM
+from app.stats.infrastructure.database.stats_query_service_impl import StatsQueryServiceImpl
+from app.tags.infrastructure.orm.tag_orm import TagORM
+
+
+class TestStatsQueryServiceImplGetCounts:
+    """Test get_counts method"""
+
+    @pytest.mark.asyncio
+    async def test_get_counts_reads_counters_in_one_query(
+        self, db_session: AsyncSession, sql_statements: list[str]
+    ):
+        """Test that every count comes from the counters table, never from COUNT(*)"""
+        # Arrange
+        db_session.add_all(
+            [
+                ItemORM(name="a"),
+                ItemORM(name="b", status="done"),
+                TagORM(name="t", color="#FF0000"),
+            ]
+        )
+        await db_session.commit()
+        query_service = StatsQueryServiceImpl(db_session)
+        sql_statements.clear()
+
+        # Act
+        counts = await query_service.get_counts()
+
+        # Assert
+        assert counts == {
+            "items": 2,
+            "tags": 1,
+            "items:todo": 1,
+            "items:inprogress": 0,
+            "items:done": 1,
+        }
+        queries = [s for s in sql_statements if s.startswith("SELECT")]
+        assert len(queries) == 1
+        assert "FROM counters" in queries[0]
+        assert "count(" not in queries[0].lower()
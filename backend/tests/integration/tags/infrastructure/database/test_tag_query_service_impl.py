@@ -0,0 +1,79 @@
+"""Integration tests for TagQueryServiceImpl"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tags.application.dtos.tag_dto import TagDTO
+from app.tags.infrastructure.database.tag_query_service_impl import TagQueryServiceImpl
+from app.tags.infrastructure.database.tag_repository_impl import TagRepositoryImpl
+from app.tags.infrastructure.orm.tag_orm import TagORM
+
+
+class TestTagQueryServiceImplGetPage:
+    """Test get_page method"""
+
+    @pytest.mark.asyncio
+    async def test_get_page_follows_cursor(self, db_session: AsyncSession):
+        """Test walking all tags by name as plain rows"""
+        # Arrange
+        db_session.add_all([TagORM(name=name, color="#FF0000") for name in ["c", "a", "b"]])
+        await db_session.commit()
+        query_service = TagQueryServiceImpl(db_session)
+
+        # Act
+        first = await query_service.get_page(limit=2, sort="name")
+        second = await query_service.get_page(after=first.next_cursor, limit=2, sort="name")
+
+        # Assert
+        assert [row["name"] for row in first.items] == ["a", "b"]
+        assert [row["name"] for row in second.items] == ["c"]
+        assert second.next_cursor is None
+        assert TagDTO.model_validate(second.items[0]).color == "#FF0000"
+
+
+class TestTagQueryServiceImplCount:
+    """Test count method"""
+
+    @pytest.mark.asyncio
+    async def test_count_tracks_created_and_deleted_tags(self, db_session: AsyncSession):
+        """Test that the maintained count follows inserts and deletes"""
+        # Arrange
+        tags = [TagORM(name=name, color="#FF0000") for name in ["a", "b", "c"]]
+        db_session.add_all(tags)
+        await db_session.commit()
+        await db_session.delete(tags[0])
+        await db_session.commit()
+        query_service = TagQueryServiceImpl(db_session)
+
+        # Act
+        count = await query_service.count()
+
+        # Assert
+        assert count == 2
+
+
+class TestTagQueryServiceImplTombstones:
+    """Test that deleted tags are left out, and get_tombstones"""
+
+    @pytest.mark.asyncio
+    async def test_deleted_tags_become_tombstones(self, db_session: AsyncSession):
+        """Test a deleted tag leaves the page and shows up as a tombstone"""
+        # Arrange
+        tags = [TagORM(name=name, color="#FF0000") for name in ["a", "b"]]
+        db_session.add_all(tags)
+        await db_session.commit()
+        await TagRepositoryImpl(db_session).delete(tags[0].id)
+        query_service = TagQueryServiceImpl(db_session)
+
+        # Act
+        page = await query_service.get_page(sort="name")
+        tombstones = await query_service.get_tombstones()
+        later = await query_service.get_tombstones(since=datetime(9999, 1, 1))
+
+        # Assert
+        assert [tag["name"] for tag in page.items] == ["b"]
+        assert [tombstone["id"] for tombstone in tombstones] == [tags[0].id]
+        assert tombstones[0]["deleted_at"] is not None
+        assert later == []
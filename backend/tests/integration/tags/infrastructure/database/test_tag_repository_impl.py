@@ -0,0 +1,313 @@
+"""Integration tests for TagRepositoryImpl"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.items.infrastructure.orm.item_orm import ItemORM
+from app.tags.domain.entities.tag import Tag
+from app.tags.infrastructure.database.tag_repository_impl import TagRepositoryImpl
+from app.tags.infrastructure.orm.tag_orm import TagORM, item_tags
+
+
+class TestTagRepositoryImplCreate:
+    """Test create method"""
+
+    @pytest.mark.asyncio
+    async def test_create_tag(self, db_session: AsyncSession):
+        """Test creating a tag returns the persisted entity"""
+        # Arrange
+        repository = TagRepositoryImpl(db_session)
+
+        # Act
+        result = await repository.create(Tag(name="Bug", color="#FF0000"))
+
+        # Assert
+        assert result.id is not None
+        assert result.name == "Bug"
+        assert result.color == "#FF0000"
+        assert result.created_at is not None
+
+
+class TestTagRepositoryImplUpsert:
+    """Test the single-statement create and upsert paths"""
+
+    @pytest.mark.asyncio
+    async def test_create_rejects_name_differing_only_in_case(
+        self, db_session: AsyncSession, sql_statements: list[str]
+    ):
+        """Test that the NOCASE unique index turns a duplicate into ValueError"""
+        # Arrange
+        repository = TagRepositoryImpl(db_session)
+        await repository.create(Tag(name="Bug", color="#FF0000"))
+        sql_statements.clear()
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="already exists"):
+            await repository.create(Tag(name="BUG", color="#00FF00"))
+        assert [s for s in sql_statements if "tags" in s] == sql_statements[:1]
+        assert "ON CONFLICT" in sql_statements[0]
+
+    @pytest.mark.asyncio
+    async def test_get_by_name_ignores_case(self, db_session: AsyncSession):
+        """Test that lookups by name use the same collation as the index"""
+        # Arrange
+        repository = TagRepositoryImpl(db_session)
+        created = await repository.create(Tag(name="Feature", color="#FF0000"))
+
+        # Act
+        result = await repository.get_by_name("feature")
+
+        # Assert
+        assert result.id == created.id
+
+    @pytest.mark.asyncio
+    async def test_upsert_creates_then_updates(self, db_session: AsyncSession):
+        """Test that upserting an existing name changes its color in place"""
+        # Arrange
+        repository = TagRepositoryImpl(db_session)
+
+        # Act
+        first, first_created = await repository.upsert(Tag(name="Bug", color="#FF0000"))
+        second, second_created = await repository.upsert(Tag(name="bug", color="#00FF00"))
+
+        # Assert
+        assert first_created is True
+        assert second_created is False
+        assert second.id == first.id
+        assert second.name == "Bug"
+        assert second.color == "#00FF00"
+        assert second.updated_at is not None
+        assert len(await repository.get_all()) == 1
+
+
+class TestTagRepositoryImplQueries:
+    """Test read methods"""
+
+    @pytest.mark.asyncio
+    async def test_get_by_name_and_ids(self, db_session: AsyncSession):
+        """Test looking tags up by name and by a list of IDs"""
+        # Arrange
+        tag1 = TagORM(name="Tag1", color="#FF0000")
+        tag2 = TagORM(name="Tag2", color="#00FF00")
+        db_session.add_all([tag1, tag2])
+        await db_session.commit()
+        repository = TagRepositoryImpl(db_session)
+
+        # Act
+        by_name = await repository.get_by_name("Tag2")
+        by_ids = await repository.get_by_ids([tag1.id, tag2.id, 999])
+        missing = await repository.get_by_name("Missing")
+
+        # Assert
+        assert by_name is not None
+        assert by_name.id == tag2.id
+        assert {tag.name for tag in by_ids} == {"Tag1", "Tag2"}
+        assert missing is None
+
+    @pytest.mark.asyncio
+    async def test_get_all_with_pagination(self, db_session: AsyncSession):
+        """Test pagination with skip and limit parameters"""
+        # Arrange
+        db_session.add_all([TagORM(name=f"Tag {i}", color="#000000") for i in range(5)])
+        await db_session.commit()
+        repository = TagRepositoryImpl(db_session)
+
+        # Act
+        result = await repository.get_all(skip=1, limit=2)
+
+        # Assert
+        assert len(result) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_page_follows_cursor(self, db_session: AsyncSession):
+        """Test keyset pagination by name across pages"""
+        # Arrange
+        db_session.add_all([TagORM(name=name, color="#000000") for name in "edcba"])
+        await db_session.commit()
+        repository = TagRepositoryImpl(db_session)
+
+        # Act
+        first = await repository.get_page(limit=3, sort="name")
+        second = await repository.get_page(after=first.next_cursor, limit=3, sort="name")
+
+        # Assert
+        assert [tag.name for tag in first.items] == ["a", "b", "c"]
+        assert [tag.name for tag in second.items] == ["d", "e"]
+        assert second.next_cursor is None
+
+
+class TestTagRepositoryImplUpdateDelete:
+    """Test update and delete methods"""
+
+    @pytest.mark.asyncio
+    async def test_update_tag(self, db_session: AsyncSession):
+        """Test updating a tag's color"""
+        # Arrange
+        tag = TagORM(name="Tag", color="#FF0000")
+        db_session.add(tag)
+        await db_session.commit()
+        repository = TagRepositoryImpl(db_session)
+
+        # Act
+        result = await repository.update(tag.id, Tag(name="Tag", color="#0000FF"))
+
+        # Assert
+        assert result is not None
+        assert result.color == "#0000FF"
+
+    @pytest.mark.asyncio
+    async def test_update_nonexistent_tag(self, db_session: AsyncSession):
+        """Test updating a non-existent tag returns None"""
+        # Arrange
+        repository = TagRepositoryImpl(db_session)
+
+        # Act
+        result = await repository.update(999, Tag(name="Tag", color="#0000FF"))
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_patch_tag_in_one_statement(
+        self, db_session: AsyncSession, sql_statements: list[str]
+    ):
+        """Test patching a tag's color with a single UPDATE ... RETURNING"""
+        # Arrange
+        tag = TagORM(name="Tag", color="#FF0000")
+        db_session.add(tag)
+        await db_session.commit()
+        repository = TagRepositoryImpl(db_session)
+        sql_statements.clear()
+
+        # Act
+        result = await repository.patch(tag.id, {"color": "#0000FF"})
+
+        # Assert
+        assert result.name == "Tag"
+        assert result.color == "#0000FF"
+        assert [s for s in sql_statements if "tags" in s] == sql_statements[1:2]
+        assert "RETURNING" in sql_statements[1]
+
+    @pytest.mark.asyncio
+    async def test_patch_rejects_duplicate_name(self, db_session: AsyncSession):
+        """Test that renaming onto an existing name raises ValueError"""
+        # Arrange
+        db_session.add_all(
+            [TagORM(name="Taken", color="#FF0000"), TagORM(name="Other", color="#FF0000")]
+        )
+        await db_session.commit()
+        other = (await TagRepositoryImpl(db_session).get_by_name("Other")).id
+        repository = TagRepositoryImpl(db_session)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="already exists"):
+            await repository.patch(other, {"name": "Taken"})
+
+    @pytest.mark.asyncio
+    async def test_patch_nonexistent_tag(self, db_session: AsyncSession):
+        """Test patching a non-existent tag returns None"""
+        # Act
+        result = await TagRepositoryImpl(db_session).patch(999, {"color": "#0000FF"})
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_delete_tag(self, db_session: AsyncSession):
+        """Test deleting an existing and a non-existent tag"""
+        # Arrange
+        tag = TagORM(name="Tag", color="#FF0000")
+        db_session.add(tag)
+        await db_session.commit()
+        repository = TagRepositoryImpl(db_session)
+
+        # Act
+        deleted = await repository.delete(tag.id)
+        missing = await repository.delete(tag.id)
+
+        # Assert
+        assert deleted is True
+        assert missing is False
+        assert await repository.get_by_id(tag.id) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_tag_with_many_items_never_loads_them(
+        self, db_session: AsyncSession, sql_statements: list[str]
+    ):
+        """Test that deleting a widely used tag is one UPDATE, whatever its links"""
+        # Arrange
+        tag = TagORM(name="Popular", color="#FF0000")
+        db_session.add(tag)
+        await db_session.flush()
+        await db_session.execute(insert(ItemORM), [{"name": f"Item {i}"} for i in range(500)])
+        await db_session.execute(
+            insert(item_tags).from_select(["item_id", "tag_id"], select(ItemORM.id, tag.id))
+        )
+        await db_session.commit()
+        repository = TagRepositoryImpl(db_session)
+        sql_statements.clear()
+
+        # Act
+        deleted = await repository.delete(tag.id)
+
+        # Assert
+        assert deleted is True
+        assert [s for s in sql_statements if "tags" in s or "items" in s] == [
+            "UPDATE tags SET updated_at=CURRENT_TIMESTAMP, deleted_at=CURRENT_TIMESTAMP "
+            "WHERE tags.id = ? AND tags.deleted_at IS NULL RETURNING id"
+        ]
+        links = await db_session.execute(select(func.count()).select_from(item_tags))
+        items = await db_session.execute(select(func.count()).select_from(ItemORM))
+        assert links.scalar_one() == 500
+        assert items.scalar_one() == 500
+
+
+class TestTagRepositoryImplSoftDelete:
+    """Test tombstones and their purge"""
+
+    @pytest.mark.asyncio
+    async def test_deleted_tag_name_can_be_reused(self, db_session: AsyncSession):
+        """Test that names are unique among live tags only"""
+        # Arrange
+        repository = TagRepositoryImpl(db_session)
+        first = await repository.create(Tag(name="Bug", color="#FF0000"))
+        await repository.delete(first.id)
+
+        # Act
+        second = await repository.create(Tag(name="bug", color="#00FF00"))
+        await repository.delete(second.id)
+        third, created = await repository.upsert(Tag(name="BUG", color="#0000FF"))
+
+        # Assert
+        assert len({first.id, second.id, third.id}) == 3
+        assert created is True
+        assert (await repository.get_by_name("bug")).id == third.id
+        assert [tag.id for tag in await repository.get_all()] == [third.id]
+
+    @pytest.mark.asyncio
+    async def test_purge_deleted_removes_tags_and_their_links(self, db_session: AsyncSession):
+        """Test that purged tags take their links along, live and recent tags stay"""
+        # Arrange
+        tags = [TagORM(name=f"Tag {i}", color="#000000") for i in range(3)]
+        db_session.add(ItemORM(name="Item", tags=tags))
+        await db_session.commit()
+        repository = TagRepositoryImpl(db_session)
+        await repository.delete(tags[0].id)
+        await repository.delete(tags[1].id)
+        await db_session.execute(
+            update(TagORM).where(TagORM.id == tags[0].id).values(deleted_at=datetime(2020, 1, 1))
+        )
+        await db_session.commit()
+
+        # Act
+        purged = await repository.purge_deleted(datetime(2021, 1, 1))
+
+        # Assert
+        assert purged == 1
+        rows = await db_session.execute(select(TagORM.id).order_by(TagORM.id))
+        assert rows.scalars().all() == [tags[1].id, tags[2].id]
+        links = await db_session.execute(select(item_tags.c.tag_id).order_by(item_tags.c.tag_id))
+        assert links.scalars().all() == [tags[1].id, tags[2].id]
@@ -1,16 +1,44 @@
 """Unit tests for item use cases"""
 
+from datetime import UTC, datetime, timedelta, timezone
 from unittest.mock import AsyncMock
 
 import pytest
 
+from app.items.application.dtos.item_dto import (
+    BulkItemCreateDTO,
+    BulkItemDeleteDTO,
+    BulkItemPatchDTO,
+    BulkItemUpdateDTO,
+    BulkTagAssignmentDTO,
+    ItemMoveDTO,
+    ItemUpdateDTO,
+)
 from app.items.application.use_cases.item_use_cases import (
+    ArchiveItemsUseCase,
+    AttachTagsUseCase,
+    BulkCreateItemsUseCase,
+    BulkDeleteItemsUseCase,
+    BulkUpdateItemsUseCase,
+    CountItemsUseCase,
     CreateItemUseCase,
     DeleteItemUseCase,
+    DetachTagsUseCase,
     GetAllItemsUseCase,
+    GetItemsPageUseCase,
+    GetItemTombstonesUseCase,
     GetItemUseCase,
+    MoveItemUseCase,
+    PurgeDeletedItemsUseCase,
+    RebalanceColumnUseCase,
+    RestoreItemUseCase,
+    SearchItemsUseCase,
     UpdateItemUseCase,
 )
+from app.items.domain.entities.archive_policy import ArchivePolicy
+from app.items.domain.entities.item_search_hit import ItemSearchHit
+from app.shared.domain.pagination import Page, PageCursor
+from app.tags.domain.entities.tag import Tag
 from tests.items.application.fixtures import (
     create_item_create_dto,
     create_item_entity,
@@ -54,6 +82,121 @@ class TestGetItemUseCase:
         assert result is None
         mock_repo.get_by_id.assert_called_once_with(999)
 
+    @pytest.mark.asyncio
+    async def test_execute_falls_back_to_archive_when_asked(self):
+        """Test that archived items are found only with include_archived"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.get_by_id.return_value = None
+        mock_archive_repo = AsyncMock()
+        mock_archive_repo.get_by_id.return_value = {
+            "id": 5,
+            "name": "Old",
+            "created_at": datetime(2024, 1, 1),
+            "status": "done",
+            "tags": [],
+            "archived_at": datetime(2024, 6, 1),
+        }
+        use_case = GetItemUseCase(mock_repo, mock_archive_repo)
+
+        # Act
+        hidden = await use_case.execute(item_id=5)
+        archived = await use_case.execute(item_id=5, include_archived=True)
+
+        # Assert
+        assert hidden is None
+        assert archived.archived_at == datetime(2024, 6, 1)
+        mock_archive_repo.get_by_id.assert_called_once_with(5)
+
+
+class TestArchiveItemsUseCase:
+    """Test ArchiveItemsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_runs_batches_until_a_short_one(self):
+        """Test that each batch resumes after the last archived ID"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.archive_batch.side_effect = [[1, 4], [7, 9], [12]]
+        use_case = ArchiveItemsUseCase(mock_repo)
+        policy = ArchivePolicy(timedelta(days=30))
+
+        # Act
+        result = await use_case.execute(policy, batch_size=2)
+
+        # Assert
+        assert result == 5
+        calls = mock_repo.archive_batch.call_args_list
+        assert [call.kwargs["after_id"] for call in calls] == [0, 4, 9]
+        assert {call.args[1] for call in calls} == {calls[0].args[1]}
+        assert calls[0].args[0] == "done"
+
+
+class TestGetItemTombstonesUseCase:
+    """Test GetItemTombstonesUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_reads_tombstones_since_utc(self):
+        """Test that ``since`` is turned into naive UTC before querying"""
+        # Arrange
+        mock_query_service = AsyncMock()
+        deleted_at = datetime(2026, 1, 1, 10, 0)
+        mock_query_service.get_tombstones.return_value = [{"id": 4, "deleted_at": deleted_at}]
+        use_case = GetItemTombstonesUseCase(mock_query_service)
+        since = datetime(2026, 1, 1, 11, 0, tzinfo=timezone(timedelta(hours=2)))
+
+        # Act
+        result = await use_case.execute(since=since, limit=10)
+
+        # Assert
+        assert [(t.id, t.deleted_at) for t in result] == [(4, deleted_at)]
+        mock_query_service.get_tombstones.assert_called_once_with(
+            since=datetime(2026, 1, 1, 9, 0), limit=10
+        )
+
+
+class TestPurgeDeletedItemsUseCase:
+    """Test PurgeDeletedItemsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_purges_batches_until_a_short_one(self):
+        """Test that batches share one cutoff, a retention window before now"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.purge_deleted.side_effect = [2, 2, 1]
+        use_case = PurgeDeletedItemsUseCase(mock_repo)
+        started = datetime.now(UTC).replace(tzinfo=None)
+
+        # Act
+        result = await use_case.execute(timedelta(days=30), batch_size=2)
+
+        # Assert
+        assert result == 5
+        calls = mock_repo.purge_deleted.call_args_list
+        assert len(calls) == 3
+        assert {call.args[0] for call in calls} == {calls[0].args[0]}
+        assert calls[0].args[0] - (started - timedelta(days=30)) < timedelta(seconds=5)
+        assert calls[0].kwargs == {"limit": 2}
+
+
+class TestRestoreItemUseCase:
+    """Test RestoreItemUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_restored_item(self):
+        """Test that the restored item is returned as a DTO"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.restore.return_value = create_item_entity(id=5, name="Old")
+        use_case = RestoreItemUseCase(mock_repo)
+
+        # Act
+        result = await use_case.execute(5)
+
+        # Assert
+        assert result.name == "Old"
+        mock_repo.restore.assert_called_once_with(5)
+
 
 class TestGetAllItemsUseCase:
     """Test GetAllItemsUseCase"""
@@ -77,7 +220,7 @@ class TestGetAllItemsUseCase:
         assert len(result) == 2
         assert result[0].name == "Item 1"
         assert result[1].name == "Item 2"
-        mock_repo.get_all.assert_called_once_with(skip=0, limit=100)
+        mock_repo.get_all.assert_called_once_with(skip=0, limit=100, tag_id=None)
 
     @pytest.mark.asyncio
     async def test_execute_with_pagination(self):
@@ -91,7 +234,7 @@ class TestGetAllItemsUseCase:
         await use_case.execute(skip=10, limit=50)
 
         # Assert
-        mock_repo.get_all.assert_called_once_with(skip=10, limit=50)
+        mock_repo.get_all.assert_called_once_with(skip=10, limit=50, tag_id=None)
 
     @pytest.mark.asyncio
     async def test_execute_returns_empty_list_when_no_items(self):
@@ -109,6 +252,117 @@ class TestGetAllItemsUseCase:
         mock_repo.get_all.assert_called_once()
 
 
+class TestCountItemsUseCase:
+    """Test CountItemsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_reads_count_of_filter(self):
+        """Test that the filter is passed to the query service and its count returned"""
+        # Arrange
+        mock_query_service = AsyncMock()
+        mock_query_service.count.return_value = 3
+        use_case = CountItemsUseCase(mock_query_service)
+
+        # Act
+        result = await use_case.execute(tag_id=2)
+
+        # Assert
+        assert result == 3
+        mock_query_service.count.assert_called_once_with(tag_id=2, status=None)
+
+
+class TestGetItemsPageUseCase:
+    """Test GetItemsPageUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_page_with_next_cursor(self):
+        """Test that the next cursor is encoded into an opaque token"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.get_page.return_value = Page(
+            [create_item_entity(id=1, name="Item 1")], PageCursor(sort="id", value=1, id=1)
+        )
+        mock_repo.count.return_value = 7
+        use_case = GetItemsPageUseCase(mock_repo)
+
+        # Act
+        result = await use_case.execute(limit=1)
+
+        # Assert
+        assert [item.name for item in result.items] == ["Item 1"]
+        assert PageCursor.decode(result.next_cursor).id == 1
+        assert result.total == 7
+        mock_repo.get_page.assert_called_once_with(
+            after=None, limit=1, sort="id", tag_id=None, status=None
+        )
+        mock_repo.count.assert_called_once_with(tag_id=None, status=None)
+
+    @pytest.mark.asyncio
+    async def test_execute_decodes_after_cursor(self):
+        """Test that the after token is decoded before reaching the repository"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.get_page.return_value = Page([])
+        use_case = GetItemsPageUseCase(mock_repo)
+        token = PageCursor(sort="name", value="Item 5", id=5).encode()
+
+        # Act
+        result = await use_case.execute(after=token, sort="name")
+
+        # Assert
+        assert result.next_cursor is None
+        cursor = mock_repo.get_page.call_args.kwargs["after"]
+        assert (cursor.value, cursor.id) == ("Item 5", 5)
+
+    @pytest.mark.asyncio
+    async def test_execute_raises_error_for_invalid_cursor(self):
+        """Test that a malformed cursor is rejected without querying"""
+        # Arrange
+        mock_repo = AsyncMock()
+        use_case = GetItemsPageUseCase(mock_repo)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await use_case.execute(after="garbage")
+        mock_repo.get_page.assert_not_called()
+
+
+class TestSearchItemsUseCase:
+    """Test SearchItemsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_hits_in_repository_order(self):
+        """Test that hits are mapped to DTOs keeping rank and snippet"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.search.return_value = [
+            ItemSearchHit(create_item_entity(id=2, name="Login bug"), -2.5, "<mark>Login</mark>"),
+            ItemSearchHit(create_item_entity(id=1, name="Docs"), -0.5, "the <mark>login</mark>"),
+        ]
+        use_case = SearchItemsUseCase(mock_repo)
+
+        # Act
+        result = await use_case.execute("login", limit=5)
+
+        # Assert
+        assert [hit.item.id for hit in result] == [2, 1]
+        assert result[0].rank == -2.5
+        assert result[0].snippet == "<mark>Login</mark>"
+        mock_repo.search.assert_called_once_with("login", limit=5)
+
+    @pytest.mark.asyncio
+    async def test_execute_raises_error_for_blank_query(self):
+        """Test that a blank query is rejected without searching"""
+        # Arrange
+        mock_repo = AsyncMock()
+        use_case = SearchItemsUseCase(mock_repo)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await use_case.execute("   ")
+        mock_repo.search.assert_not_called()
+
+
 class TestCreateItemUseCase:
     """Test CreateItemUseCase"""
 
@@ -155,19 +409,35 @@ class TestCreateItemUseCase:
         call_args = mock_repo.create.call_args
         assert call_args[1]["tag_ids"] == [1, 2]
 
+    @pytest.mark.asyncio
+    async def test_execute_resolves_tags_through_the_tag_repository(self):
+        """Test unknown and repeated tag IDs are dropped before the item is written"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.create.return_value = create_item_entity(id=1)
+        tag_repo = AsyncMock()
+        tag_repo.get_by_ids.return_value = [Tag(name="bug", color="#ff0000", id=2)]
+        dto = create_item_create_dto(tag_ids=[2, 999, 2])
+        use_case = CreateItemUseCase(mock_repo, tag_repo)
+
+        # Act
+        await use_case.execute(dto)
+
+        # Assert
+        tag_repo.get_by_ids.assert_awaited_once_with([2, 999, 2])
+        assert mock_repo.create.call_args[1]["tag_ids"] == [2]
+
 
 class TestUpdateItemUseCase:
     """Test UpdateItemUseCase"""
 
     @pytest.mark.asyncio
     async def test_execute_updates_item(self):
-        """Test updating an existing item"""
+        """Test updating an existing item in a single repository call"""
         # Arrange
         mock_repo = AsyncMock()
-        current_item = create_item_entity(id=1, name="Old Name", description="Old Description")
         updated_item = create_item_entity(id=1, name="New Name", description="New Description")
-        mock_repo.get_by_id.return_value = current_item
-        mock_repo.update.return_value = updated_item
+        mock_repo.patch.return_value = updated_item
         dto = create_item_update_dto(name="New Name", description="New Description")
         use_case = UpdateItemUseCase(mock_repo)
 
@@ -178,18 +448,19 @@ class TestUpdateItemUseCase:
         assert result is not None
         assert result.name == "New Name"
         assert result.description == "New Description"
-        mock_repo.get_by_id.assert_called_once_with(1)
-        mock_repo.update.assert_called_once()
+        changes = mock_repo.patch.call_args.args[0]
+        assert changes.item_id == 1
+        assert changes.fields == {"name": "New Name", "description": "New Description"}
+        assert changes.tag_ids is None
+        mock_repo.get_by_id.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_execute_partial_update(self):
-        """Test updating only some fields of an item"""
+        """Test that fields left as None are not sent to the repository"""
         # Arrange
         mock_repo = AsyncMock()
-        current_item = create_item_entity(id=1, name="Old Name", description="Old Description")
         updated_item = create_item_entity(id=1, name="New Name", description="Old Description")
-        mock_repo.get_by_id.return_value = current_item
-        mock_repo.update.return_value = updated_item
+        mock_repo.patch.return_value = updated_item
         dto = create_item_update_dto(name="New Name", description=None)
         use_case = UpdateItemUseCase(mock_repo)
 
@@ -199,15 +470,64 @@ class TestUpdateItemUseCase:
         # Assert
         assert result is not None
         assert result.name == "New Name"
-        # Description should remain unchanged since we passed None
-        mock_repo.update.assert_called_once()
+        assert mock_repo.patch.call_args.args[0].fields == {"name": "New Name"}
+
+    @pytest.mark.asyncio
+    async def test_execute_passes_tag_ids(self):
+        """Test that tag_ids replace the item's tags"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.patch.return_value = create_item_entity(id=1)
+        dto = ItemUpdateDTO(tag_ids=[2, 3])
+        use_case = UpdateItemUseCase(mock_repo)
+
+        # Act
+        await use_case.execute(item_id=1, dto=dto)
+
+        # Assert
+        changes = mock_repo.patch.call_args.args[0]
+        assert changes.fields == {}
+        assert changes.tag_ids == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_execute_resolves_tags_through_the_tag_repository(self):
+        """Test tag IDs no tag answers to are left out of the replacement"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.patch.return_value = create_item_entity(id=1)
+        tag_repo = AsyncMock()
+        tag_repo.get_by_ids.return_value = [Tag(name="bug", color="#ff0000", id=3)]
+        dto = ItemUpdateDTO(tag_ids=[2, 3])
+        use_case = UpdateItemUseCase(mock_repo, tag_repo)
+
+        # Act
+        await use_case.execute(item_id=1, dto=dto)
+
+        # Assert
+        assert mock_repo.patch.call_args.args[0].tag_ids == [3]
+
+    @pytest.mark.asyncio
+    async def test_execute_without_tag_ids_skips_the_tag_repository(self):
+        """Test an update leaving the tags alone does not look any up"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.patch.return_value = create_item_entity(id=1)
+        tag_repo = AsyncMock()
+        use_case = UpdateItemUseCase(mock_repo, tag_repo)
+
+        # Act
+        await use_case.execute(item_id=1, dto=create_item_update_dto(name="Renamed"))
+
+        # Assert
+        tag_repo.get_by_ids.assert_not_called()
+        assert mock_repo.patch.call_args.args[0].tag_ids is None
 
     @pytest.mark.asyncio
     async def test_execute_returns_none_when_item_not_found(self):
         """Test updating a non-existent item"""
         # Arrange
         mock_repo = AsyncMock()
-        mock_repo.get_by_id.return_value = None
+        mock_repo.patch.return_value = None
         dto = create_item_update_dto()
         use_case = UpdateItemUseCase(mock_repo)
 
@@ -216,8 +536,73 @@ class TestUpdateItemUseCase:
 
         # Assert
         assert result is None
-        mock_repo.get_by_id.assert_called_once_with(999)
-        mock_repo.update.assert_not_called()
+        assert mock_repo.patch.call_args.args[0].item_id == 999
+
+
+class TestMoveItemUseCase:
+    """Test MoveItemUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_moves_item(self):
+        """Test moving an item between two cards of another column"""
+        # Arrange
+        mock_repo = AsyncMock()
+        moved = create_item_entity(id=1)
+        moved.status, moved.position = "done", "V"
+        mock_repo.move.return_value = moved
+        use_case = MoveItemUseCase(mock_repo)
+
+        # Act
+        result = await use_case.execute(1, ItemMoveDTO(status="done", after_id=2, before_id=3))
+
+        # Assert
+        assert (result.status, result.position) == ("done", "V")
+        mock_repo.move.assert_called_once_with(1, "done", after_id=2, before_id=3)
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_none_when_item_not_found(self):
+        """Test moving a non-existent item"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.move.return_value = None
+        use_case = MoveItemUseCase(mock_repo)
+
+        # Act
+        result = await use_case.execute(999, ItemMoveDTO(status="todo"))
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_execute_rejects_itself_as_neighbour(self):
+        """Test that an item cannot be placed next to itself"""
+        # Arrange
+        mock_repo = AsyncMock()
+        use_case = MoveItemUseCase(mock_repo)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await use_case.execute(1, ItemMoveDTO(status="todo", after_id=1))
+        mock_repo.move.assert_not_called()
+
+
+class TestRebalanceColumnUseCase:
+    """Test RebalanceColumnUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_rebalances_column(self):
+        """Test that the column is rebalanced by the repository"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.rebalance.return_value = 12
+        use_case = RebalanceColumnUseCase(mock_repo)
+
+        # Act
+        result = await use_case.execute("inprogress")
+
+        # Assert
+        assert result == 12
+        mock_repo.rebalance.assert_called_once_with("inprogress")
 
 
 class TestDeleteItemUseCase:
@@ -252,3 +637,112 @@ class TestDeleteItemUseCase:
         # Assert
         assert result is False
         mock_repo.delete.assert_called_once_with(999)
+
+
+class TestBulkCreateItemsUseCase:
+    """Test BulkCreateItemsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_reports_created_ids_in_order(self):
+        """Test that every row is reported with its new ID"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.bulk_create.return_value = [10, 11]
+        use_case = BulkCreateItemsUseCase(mock_repo)
+        dto = BulkItemCreateDTO(
+            items=[create_item_create_dto(name="A", tag_ids=[1]), create_item_create_dto(name="B")]
+        )
+
+        # Act
+        result = await use_case.execute(dto)
+
+        # Assert
+        assert [(r.index, r.id, r.status) for r in result.results] == [
+            (0, 10, "created"),
+            (1, 11, "created"),
+        ]
+        items, tag_ids = mock_repo.bulk_create.call_args.args
+        assert [item.name for item in items] == ["A", "B"]
+        assert tag_ids == [[1], []]
+
+
+class TestBulkUpdateItemsUseCase:
+    """Test BulkUpdateItemsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_passes_only_given_fields(self):
+        """Test partial changes and per-row not_found reporting"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.bulk_update.return_value = {1}
+        use_case = BulkUpdateItemsUseCase(mock_repo)
+        dto = BulkItemUpdateDTO(
+            items=[
+                BulkItemPatchDTO(id=1, name="Renamed"),
+                BulkItemPatchDTO(id=2, description="Gone", tag_ids=[3]),
+            ]
+        )
+
+        # Act
+        result = await use_case.execute(dto)
+
+        # Assert
+        assert [r.status for r in result.results] == ["updated", "not_found"]
+        changes = mock_repo.bulk_update.call_args.args[0]
+        assert [(c.item_id, c.fields, c.tag_ids) for c in changes] == [
+            (1, {"name": "Renamed"}, None),
+            (2, {"description": "Gone"}, [3]),
+        ]
+
+
+class TestBulkDeleteItemsUseCase:
+    """Test BulkDeleteItemsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_reports_missing_ids(self):
+        """Test that IDs which were not deleted are reported as not_found"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.bulk_delete.return_value = {1, 3}
+        use_case = BulkDeleteItemsUseCase(mock_repo)
+
+        # Act
+        result = await use_case.execute(BulkItemDeleteDTO(ids=[1, 2, 3]))
+
+        # Assert
+        assert [r.status for r in result.results] == ["deleted", "not_found", "deleted"]
+        mock_repo.bulk_delete.assert_called_once_with([1, 2, 3])
+
+
+class TestTagAssignmentUseCases:
+    """Test AttachTagsUseCase and DetachTagsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_attach_returns_affected_count(self):
+        """Test attaching tags reports the number of new links"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.attach_tags.return_value = 4
+        use_case = AttachTagsUseCase(mock_repo)
+
+        # Act
+        result = await use_case.execute(BulkTagAssignmentDTO(item_ids=[1, 2], tag_ids=[3, 4]))
+
+        # Assert
+        assert result.affected == 4
+        mock_repo.attach_tags.assert_called_once_with([1, 2], [3, 4])
+
+    @pytest.mark.asyncio
+    async def test_detach_returns_affected_count(self):
+        """Test detaching tags reports the number of removed links"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.detach_tags.return_value = 1
+        use_case = DetachTagsUseCase(mock_repo)
+
+        # Act
+        result = await use_case.execute(BulkTagAssignmentDTO(item_ids=[1, 2], tag_ids=[3]))
+
+        # Assert
+        assert result.affected == 1
+        mock_repo.detach_tags.assert_called_once_with([1, 2], [3])
@@ -0,0 +1,22 @@
+"""Unit tests for ArchivePolicy"""
+
+from datetime import UTC, datetime, timedelta
+
+from app.items.domain.entities.archive_policy import ArchivePolicy
+
+
+class TestArchivePolicy:
+    """Test ArchivePolicy"""
+
+    def test_cutoff_is_naive_utc(self):
+        """Test that the cutoff is comparable with the UTC timestamps SQLite stores"""
+        # Arrange
+        policy = ArchivePolicy(timedelta(days=30))
+        now = datetime(2024, 3, 31, 12, 0, tzinfo=UTC)
+
+        # Act
+        cutoff = policy.cutoff(now)
+
+        # Assert
+        assert cutoff == datetime(2024, 3, 1, 12, 0)
+        assert policy.status == "done"
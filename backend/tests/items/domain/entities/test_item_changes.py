@@ -0,0 +1,26 @@
+"""Unit tests for merging item changes"""
+
+from app.items.domain.entities.item_changes import ItemChanges, merge_changes
+
+
+class TestMergeChanges:
+    """Test merge_changes"""
+
+    def test_merges_changes_of_one_item_in_input_order(self):
+        """Test later fields win, earlier ones stay and a later tag list replaces"""
+        # Arrange
+        changes = [
+            ItemChanges(5, {"name": "B1"}, tag_ids=[1]),
+            ItemChanges(6, {"name": "other"}),
+            ItemChanges(5, {"description": "dd"}),
+            ItemChanges(5, {"name": "B2"}, tag_ids=[2]),
+        ]
+
+        # Act
+        merged = merge_changes(changes)
+
+        # Assert
+        assert [change.item_id for change in merged] == [5, 6]
+        assert merged[0].fields == {"name": "B2", "description": "dd"}
+        assert merged[0].tag_ids == [2]
+        assert changes[0].fields == {"name": "B1"}
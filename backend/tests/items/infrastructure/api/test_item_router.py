@@ -1,17 +1,57 @@
 """Unit tests for item router"""
 
+import base64
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock
 
 import pytest
-from fastapi import HTTPException
-
+from fastapi import BackgroundTasks, HTTPException, Response
+
+from app.items.application.dtos.item_dto import (
+    BulkItemCreateDTO,
+    BulkItemDeleteDTO,
+    BulkItemPatchDTO,
+    BulkItemResponseDTO,
+    BulkItemResultDTO,
+    BulkItemUpdateDTO,
+    BulkTagAssignmentDTO,
+    BulkTagAssignmentResultDTO,
+    ItemArchiveDTO,
+    ItemMoveDTO,
+    ItemPageDTO,
+    ItemSearchResultDTO,
+    ItemTombstoneDTO,
+)
 from app.items.infrastructure.api.item_router import (
+    archive_items,
+    archive_old_items,
+    attach_tags,
+    bulk_create_items,
+    bulk_delete_items,
+    bulk_update_items,
     create_item,
     delete_item,
+    detach_tags,
     get_item,
+    get_item_query_service,
+    get_item_repository,
+    get_item_tombstones,
     get_items,
+    move_item,
+    rebalance_column,
+    restore_item,
+    search_items,
     update_item,
 )
+from app.items.infrastructure.cache.caching_item_repository import CachingItemRepository
+from app.items.infrastructure.database.item_query_service_impl import ItemQueryServiceImpl
+from app.items.infrastructure.database.item_repository_impl import ItemRepositoryImpl
+from app.items.infrastructure.memory.in_memory_item_query_service import (
+    InMemoryItemQueryService,
+)
+from app.items.infrastructure.memory.in_memory_item_repository import InMemoryItemRepository
+from app.shared.infrastructure.cache import BoardCaches
+from app.shared.infrastructure.memory import MemoryStore
 from tests.items.application.fixtures import (
     create_item_create_dto,
     create_item_dto,
@@ -38,16 +78,31 @@ class TestGetItemsEndpoint:
             "app.items.infrastructure.api.item_router.GetAllItemsUseCase",
             return_value=mock_use_case,
         )
+        mock_count_use_case = AsyncMock()
+        mock_count_use_case.execute = AsyncMock(return_value=2)
+        mocker.patch(
+            "app.items.infrastructure.api.item_router.CountItemsUseCase",
+            return_value=mock_count_use_case,
+        )
+        response = Response()
 
         # Act
-        result = await get_items(skip=0, limit=100, repository=mock_repo)
+        result = await get_items(
+            response=response,
+            skip=0,
+            limit=100,
+            repository=mock_repo,
+            query_service=AsyncMock(),
+            board_id=None,
+        )
 
         # Assert
         assert len(result) == 2
         assert result[0].name == "Item 1"
         assert result[1].name == "Item 2"
+        assert response.headers["X-Total-Count"] == "2"
         mock_use_case_class.assert_called_once_with(mock_repo)
-        mock_use_case.execute.assert_called_once_with(skip=0, limit=100)
+        mock_use_case.execute.assert_called_once_with(skip=0, limit=100, tag_id=None)
 
     @pytest.mark.asyncio
     async def test_get_items_with_pagination(self, mocker):
@@ -61,12 +116,263 @@ class TestGetItemsEndpoint:
             "app.items.infrastructure.api.item_router.GetAllItemsUseCase",
             return_value=mock_use_case,
         )
+        mocker.patch(
+            "app.items.infrastructure.api.item_router.CountItemsUseCase", return_value=AsyncMock()
+        )
+
+        # Act
+        await get_items(
+            response=Response(),
+            skip=10,
+            limit=50,
+            repository=mock_repo,
+            query_service=AsyncMock(),
+            board_id=None,
+        )
+
+        # Assert
+        mock_use_case.execute.assert_called_once_with(skip=10, limit=50, tag_id=None)
+
+    @pytest.mark.asyncio
+    async def test_get_items_without_skip_uses_cursor_pagination(self, mocker):
+        """Test that the next page is advertised in the Link and X-Next-Cursor headers"""
+        # Arrange
+        mock_query_service = AsyncMock()
+        page = ItemPageDTO(items=[create_item_dto(id=1)], next_cursor="abc", total=7)
+
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=page)
+        mock_use_case_class = mocker.patch(
+            "app.items.infrastructure.api.item_router.GetItemsPageUseCase",
+            return_value=mock_use_case,
+        )
+        response = Response()
 
         # Act
-        await get_items(skip=10, limit=50, repository=mock_repo)
+        result = await get_items(
+            response=response,
+            after=None,
+            limit=1,
+            sort="name",
+            skip=None,
+            repository=AsyncMock(),
+            query_service=mock_query_service,
+            board_id=None,
+        )
 
         # Assert
-        mock_use_case.execute.assert_called_once_with(skip=10, limit=50)
+        assert result == page.items
+        mock_use_case_class.assert_called_once_with(mock_query_service)
+        assert response.headers["X-Next-Cursor"] == "abc"
+        assert response.headers["Link"] == '</items/?after=abc&limit=1&sort=name>; rel="next"'
+        assert response.headers["X-Total-Count"] == "7"
+        mock_use_case.execute.assert_called_once_with(
+            after=None, limit=1, sort="name", tag_id=None, status=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_items_of_a_board_links_within_the_board(self, mocker):
+        """Test that the next page link of a board's items stays under /boards/{board_id}"""
+        # Arrange
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=ItemPageDTO(items=[], next_cursor="abc"))
+        mocker.patch(
+            "app.items.infrastructure.api.item_router.GetItemsPageUseCase",
+            return_value=mock_use_case,
+        )
+        response = Response()
+
+        # Act
+        await get_items(
+            response=response,
+            after=None,
+            limit=1,
+            sort="id",
+            skip=None,
+            repository=AsyncMock(),
+            query_service=AsyncMock(),
+            board_id="ops",
+        )
+
+        # Assert
+        assert response.headers["Link"] == (
+            '</boards/ops/items/?after=abc&limit=1&sort=id>; rel="next"'
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_items_last_page_has_no_link(self, mocker):
+        """Test that no Link header is sent once the last page is reached"""
+        # Arrange
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=ItemPageDTO(items=[]))
+        mocker.patch(
+            "app.items.infrastructure.api.item_router.GetItemsPageUseCase",
+            return_value=mock_use_case,
+        )
+        response = Response()
+
+        # Act
+        await get_items(
+            response=response,
+            after="abc",
+            limit=100,
+            sort="id",
+            skip=None,
+            repository=AsyncMock(),
+            board_id=None,
+        )
+
+        # Assert
+        assert "Link" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_get_items_invalid_cursor_raises_400(self, mocker):
+        """Test that a malformed cursor is reported as a bad request"""
+        # Arrange
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(side_effect=ValueError("Invalid pagination cursor"))
+        mocker.patch(
+            "app.items.infrastructure.api.item_router.GetItemsPageUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await get_items(
+                response=Response(),
+                after="garbage",
+                limit=100,
+                sort="id",
+                skip=None,
+                repository=AsyncMock(),
+                board_id=None,
+            )
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("raw", ['["name",[1,2],1]', '["id",1,true]', '["id",true,1]'])
+    async def test_get_items_malformed_cursor_raises_400(self, raw):
+        """Test a cursor whose value or id the query cannot bind is a bad request"""
+        # Arrange
+        query_service = AsyncMock()
+        token = base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+        sort = "id" if raw.startswith('["id"') else "name"
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await get_items(
+                response=Response(),
+                after=token,
+                limit=100,
+                sort=sort,
+                skip=None,
+                repository=AsyncMock(),
+                query_service=query_service,
+                board_id=None,
+            )
+        assert exc_info.value.status_code == 400
+        query_service.get_page.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_items_filtered_by_tag_keeps_filter_in_link(self, mocker):
+        """Test that the tag filter reaches the use case and the next link"""
+        # Arrange
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(
+            return_value=ItemPageDTO(items=[create_item_dto(id=1)], next_cursor="abc")
+        )
+        mocker.patch(
+            "app.items.infrastructure.api.item_router.GetItemsPageUseCase",
+            return_value=mock_use_case,
+        )
+        response = Response()
+
+        # Act
+        await get_items(
+            response=response,
+            after=None,
+            limit=1,
+            sort="id",
+            skip=None,
+            tag_id=7,
+            repository=AsyncMock(),
+            board_id=None,
+        )
+
+        # Assert
+        mock_use_case.execute.assert_called_once_with(
+            after=None, limit=1, sort="id", tag_id=7, status=None
+        )
+        assert (
+            response.headers["Link"] == '</items/?tag_id=7&after=abc&limit=1&sort=id>; rel="next"'
+        )
+
+
+class TestGetItemTombstonesEndpoint:
+    """Test GET /items/tombstones endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_get_item_tombstones(self, mocker):
+        """Test listing deleted items since a point in time"""
+        # Arrange
+        mock_query_service = AsyncMock()
+        since = datetime(2026, 1, 1)
+        tombstones = [ItemTombstoneDTO(id=3, deleted_at=since)]
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=tombstones)
+        mock_use_case_class = mocker.patch(
+            "app.items.infrastructure.api.item_router.GetItemTombstonesUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act
+        result = await get_item_tombstones(since=since, limit=50, query_service=mock_query_service)
+
+        # Assert
+        assert result == tombstones
+        mock_use_case_class.assert_called_once_with(mock_query_service)
+        mock_use_case.execute.assert_called_once_with(since=since, limit=50)
+
+
+class TestSearchItemsEndpoint:
+    """Test GET /items/search endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_search_items_returns_hits(self, mocker):
+        """Test searching items"""
+        # Arrange
+        mock_repo = AsyncMock()
+        hits = [ItemSearchResultDTO(item=create_item_dto(id=1), rank=-1.0, snippet="x")]
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=hits)
+        mock_use_case_class = mocker.patch(
+            "app.items.infrastructure.api.item_router.SearchItemsUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act
+        result = await search_items(q="login", limit=20, repository=mock_repo)
+
+        # Assert
+        assert result == hits
+        mock_use_case_class.assert_called_once_with(mock_repo)
+        mock_use_case.execute.assert_called_once_with("login", limit=20)
+
+    @pytest.mark.asyncio
+    async def test_search_items_blank_query_raises_400(self, mocker):
+        """Test that a query without words is a bad request"""
+        # Arrange
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(side_effect=ValueError("Search query must not be empty"))
+        mocker.patch(
+            "app.items.infrastructure.api.item_router.SearchItemsUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await search_items(q=" ", limit=20, repository=AsyncMock())
+        assert exc_info.value.status_code == 400
 
 
 class TestGetItemEndpoint:
@@ -86,13 +392,23 @@ class TestGetItemEndpoint:
             return_value=mock_use_case,
         )
 
+        mock_archive_repo = AsyncMock()
+
         # Act
-        result = await get_item(item_id=1, repository=mock_repo)
+        result = await get_item(
+            item_id=1,
+            include_archived=True,
+            if_none_match=None,
+            etag='"1.1"',
+            repository=mock_repo,
+            archive_repository=mock_archive_repo,
+        )
 
         # Assert
         assert result.id == 1
         assert result.name == "Test Item"
-        mock_use_case_class.assert_called_once_with(mock_repo)
+        mock_use_case_class.assert_called_once_with(mock_repo, mock_archive_repo)
+        mock_use_case.execute.assert_called_once_with(1, include_archived=True)
 
     @pytest.mark.asyncio
     async def test_get_item_raises_404_when_not_found(self, mocker):
@@ -114,6 +430,24 @@ class TestGetItemEndpoint:
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == "Item not found"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("found", "status_code"), [(True, 304), (False, 404)])
+    async def test_get_item_matching_etag_is_not_modified_only_if_found(
+        self, mocker, found, status_code
+    ):
+        """Test a matching If-None-Match gets a 304 for an item, but a 404 for a missing one"""
+        # Arrange
+        item = create_item_dto(id=1) if found else None
+        mocker.patch(
+            "app.items.infrastructure.api.item_router.GetItemUseCase",
+            return_value=AsyncMock(execute=AsyncMock(return_value=item)),
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await get_item(item_id=1, if_none_match='"1.1"', etag='"1.1"', repository=AsyncMock())
+        assert exc_info.value.status_code == status_code
+
 
 class TestCreateItemEndpoint:
     """Test POST /items/ endpoint"""
@@ -134,12 +468,12 @@ class TestCreateItemEndpoint:
         )
 
         # Act
-        result = await create_item(item=dto, repository=mock_repo)
+        result = await create_item(item=dto, repository=mock_repo, tag_repository=None)
 
         # Assert
         assert result.id == 1
         assert result.name == "New Item"
-        mock_use_case_class.assert_called_once_with(mock_repo)
+        mock_use_case_class.assert_called_once_with(mock_repo, None)
         mock_use_case.execute.assert_called_once_with(dto)
 
 
@@ -162,12 +496,12 @@ class TestUpdateItemEndpoint:
         )
 
         # Act
-        result = await update_item(item_id=1, item=dto, repository=mock_repo)
+        result = await update_item(item_id=1, item=dto, repository=mock_repo, tag_repository=None)
 
         # Assert
         assert result.id == 1
         assert result.name == "Updated Item"
-        mock_use_case_class.assert_called_once_with(mock_repo)
+        mock_use_case_class.assert_called_once_with(mock_repo, None)
         mock_use_case.execute.assert_called_once_with(1, dto)
 
     @pytest.mark.asyncio
@@ -186,12 +520,101 @@ class TestUpdateItemEndpoint:
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
-            await update_item(item_id=999, item=dto, repository=mock_repo)
+            await update_item(item_id=999, item=dto, repository=mock_repo, tag_repository=None)
 
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == "Item not found"
 
 
+class TestMoveItemEndpoint:
+    """Test POST /items/{item_id}/move endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_move_item_returns_moved_item(self, mocker):
+        """Test moving an item without scheduling a rebalance"""
+        # Arrange
+        mock_repo = AsyncMock()
+        dto = ItemMoveDTO(status="done", after_id=2)
+        moved = create_item_dto(id=1).model_copy(update={"status": "done", "position": "W"})
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=moved)
+        mock_use_case_class = mocker.patch(
+            "app.items.infrastructure.api.item_router.MoveItemUseCase",
+            return_value=mock_use_case,
+        )
+        background_tasks = BackgroundTasks()
+
+        # Act
+        result = await move_item(
+            item_id=1,
+            move=dto,
+            background_tasks=background_tasks,
+            repository=mock_repo,
+            board_id=None,
+        )
+
+        # Assert
+        assert result.status == "done"
+        assert background_tasks.tasks == []
+        mock_use_case_class.assert_called_once_with(mock_repo)
+        mock_use_case.execute.assert_called_once_with(1, dto)
+
+    @pytest.mark.asyncio
+    async def test_move_item_schedules_rebalance_for_long_keys(self, mocker):
+        """Test that a long rank key queues a rebalance of the target column"""
+        # Arrange
+        moved = create_item_dto(id=1).model_copy(
+            update={"status": "todo", "position": "V" + "0" * 20 + "1"}
+        )
+        mocker.patch(
+            "app.items.infrastructure.api.item_router.MoveItemUseCase",
+            return_value=AsyncMock(execute=AsyncMock(return_value=moved)),
+        )
+        background_tasks = BackgroundTasks()
+
+        # Act
+        await move_item(
+            item_id=1,
+            move=ItemMoveDTO(status="todo"),
+            background_tasks=background_tasks,
+            repository=AsyncMock(),
+            board_id=None,
+        )
+
+        # Assert
+        assert len(background_tasks.tasks) == 1
+        assert background_tasks.tasks[0].func is rebalance_column
+        assert background_tasks.tasks[0].args == ("todo", None)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("outcome", "status_code"), [(None, 404), (ValueError("not in column"), 400)]
+    )
+    async def test_move_item_errors(self, mocker, outcome, status_code):
+        """Test a missing item (404) and an invalid neighbour (400)"""
+        # Arrange
+        execute = (
+            AsyncMock(side_effect=outcome)
+            if isinstance(outcome, Exception)
+            else AsyncMock(return_value=outcome)
+        )
+        mocker.patch(
+            "app.items.infrastructure.api.item_router.MoveItemUseCase",
+            return_value=AsyncMock(execute=execute),
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await move_item(
+                item_id=1,
+                move=ItemMoveDTO(status="todo", after_id=5),
+                background_tasks=BackgroundTasks(),
+                repository=AsyncMock(),
+                board_id=None,
+            )
+        assert exc_info.value.status_code == status_code
+
+
 class TestDeleteItemEndpoint:
     """Test DELETE /items/{item_id} endpoint"""
 
@@ -235,3 +658,190 @@ class TestDeleteItemEndpoint:
 
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == "Item not found"
+
+
+class TestBulkItemsEndpoints:
+    """Test POST, PATCH and DELETE /items/bulk endpoints"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("endpoint", "use_case_name", "dto"),
+        [
+            (
+                bulk_create_items,
+                "BulkCreateItemsUseCase",
+                BulkItemCreateDTO(items=[create_item_create_dto()]),
+            ),
+            (
+                bulk_update_items,
+                "BulkUpdateItemsUseCase",
+                BulkItemUpdateDTO(items=[BulkItemPatchDTO(id=1, name="New")]),
+            ),
+            (bulk_delete_items, "BulkDeleteItemsUseCase", BulkItemDeleteDTO(ids=[1])),
+        ],
+    )
+    async def test_bulk_endpoint_returns_per_row_results(
+        self, mocker, endpoint, use_case_name, dto
+    ):
+        """Test each bulk endpoint delegates to its use case"""
+        # Arrange
+        mock_repo = AsyncMock()
+        response = BulkItemResponseDTO(
+            results=[BulkItemResultDTO(index=0, id=1, status="not_found")]
+        )
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=response)
+        mock_use_case_class = mocker.patch(
+            f"app.items.infrastructure.api.item_router.{use_case_name}",
+            return_value=mock_use_case,
+        )
+
+        # Act
+        result = await endpoint(items=dto, repository=mock_repo)
+
+        # Assert
+        assert result == response
+        mock_use_case_class.assert_called_once_with(mock_repo)
+        mock_use_case.execute.assert_called_once_with(dto)
+
+
+class TestBulkTagsEndpoints:
+    """Test POST and DELETE /items/bulk/tags endpoints"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("endpoint", "use_case_name"),
+        [(attach_tags, "AttachTagsUseCase"), (detach_tags, "DetachTagsUseCase")],
+    )
+    async def test_endpoint_returns_affected_count(self, mocker, endpoint, use_case_name):
+        """Test attach and detach delegate to their use cases"""
+        # Arrange
+        mock_repo = AsyncMock()
+        assignment = BulkTagAssignmentDTO(item_ids=[1, 2], tag_ids=[3])
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=BulkTagAssignmentResultDTO(affected=2))
+        mocker.patch(
+            f"app.items.infrastructure.api.item_router.{use_case_name}",
+            return_value=mock_use_case,
+        )
+
+        # Act
+        result = await endpoint(assignment=assignment, repository=mock_repo)
+
+        # Assert
+        assert result.affected == 2
+        mock_use_case.execute.assert_called_once_with(assignment)
+
+
+class TestArchiveItemsEndpoint:
+    """Test POST /items/archive endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_archive_items_schedules_background_run(self):
+        """Test that archiving runs after the response with the requested policy"""
+        # Arrange
+        background_tasks = BackgroundTasks()
+
+        # Act
+        await archive_items(
+            archive=ItemArchiveDTO(older_than_days=30, batch_size=100),
+            background_tasks=background_tasks,
+            board_id=None,
+        )
+
+        # Assert
+        assert len(background_tasks.tasks) == 1
+        task = background_tasks.tasks[0]
+        assert task.func is archive_old_items
+        policy, batch_size, board_id = task.args
+        assert (policy.older_than, policy.status, batch_size) == (timedelta(days=30), "done", 100)
+        assert board_id is None
+
+
+class TestRestoreItemEndpoint:
+    """Test POST /items/{item_id}/restore endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_restore_item_returns_item(self, mocker):
+        """Test restoring an archived item"""
+        # Arrange
+        mock_archive_repo = AsyncMock()
+        item = create_item_dto(id=3)
+        mock_use_case_class = mocker.patch(
+            "app.items.infrastructure.api.item_router.RestoreItemUseCase",
+            return_value=AsyncMock(execute=AsyncMock(return_value=item)),
+        )
+
+        # Act
+        result = await restore_item(item_id=3, archive_repository=mock_archive_repo, caches=None)
+
+        # Assert
+        assert result == item
+        mock_use_case_class.assert_called_once_with(mock_archive_repo)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("outcome", "status_code"), [(None, 404), (ValueError("Item ID 3 is in use"), 400)]
+    )
+    async def test_restore_item_errors(self, mocker, outcome, status_code):
+        """Test an item missing from the archive (404) and a taken ID (400)"""
+        # Arrange
+        execute = (
+            AsyncMock(side_effect=outcome)
+            if isinstance(outcome, Exception)
+            else AsyncMock(return_value=outcome)
+        )
+        mocker.patch(
+            "app.items.infrastructure.api.item_router.RestoreItemUseCase",
+            return_value=AsyncMock(execute=execute),
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await restore_item(item_id=3, archive_repository=AsyncMock(), caches=None)
+        assert exc_info.value.status_code == status_code
+
+
+class TestItemDependencies:
+    """Test the adapters chosen by the repository backend"""
+
+    def test_sqlite_backend_uses_the_session(self):
+        """Test the SQLAlchemy adapters are used when there is no in-memory store"""
+        # Arrange
+        db = AsyncMock()
+
+        # Act
+        repository = get_item_repository(db=db, writer=None, store=None, caches=None)
+        query_service = get_item_query_service(db=db, store=None)
+
+        # Assert
+        assert isinstance(repository, ItemRepositoryImpl)
+        assert isinstance(query_service, ItemQueryServiceImpl)
+        assert repository.db is db
+
+    def test_memory_backend_uses_the_store(self):
+        """Test the in-memory adapters share the board's store"""
+        # Arrange
+        store = MemoryStore()
+
+        # Act
+        repository = get_item_repository(db=AsyncMock(), writer=None, store=store, caches=None)
+        query_service = get_item_query_service(db=AsyncMock(), store=store)
+
+        # Assert
+        assert isinstance(repository, InMemoryItemRepository)
+        assert isinstance(query_service, InMemoryItemQueryService)
+        assert repository.store is query_service.store is store
+
+    def test_caches_wrap_the_sqlite_repository(self):
+        """Test the repository is decorated with the board's item cache when caching is on"""
+        # Arrange
+        caches = BoardCaches()
+
+        # Act
+        repository = get_item_repository(db=AsyncMock(), writer=None, store=None, caches=caches)
+
+        # Assert
+        assert isinstance(repository, CachingItemRepository)
+        assert isinstance(repository.repository, ItemRepositoryImpl)
+        assert repository.cache is caches.items
@@ -0,0 +1,113 @@
+"""Unit tests for CachingItemRepository"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.items.domain.entities.item import Item
+from app.items.domain.entities.item_changes import ItemChanges
+from app.items.infrastructure.cache.caching_item_repository import CachingItemRepository
+from app.shared.infrastructure.cache import MISSING, LRUCache
+from app.shared.infrastructure.memory import TaggedItem
+from app.tags.domain.entities.tag import Tag
+
+
+def create_item(id: int, name: str = "Item") -> TaggedItem:
+    """A stored item with one tag"""
+    return TaggedItem(Item(name=name, id=id), [Tag(name="bug", color="#ff0000", id=1)])
+
+
+class TestCachingItemRepository:
+    """Test CachingItemRepository"""
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_returns_a_detached_copy(self):
+        """Test the cached item is a copy with its tags, read once"""
+        # Arrange
+        repository = AsyncMock()
+        row = create_item(1)
+        repository.get_by_id.return_value = row
+        cache = LRUCache()
+        caching = CachingItemRepository(repository, cache)
+
+        # Act
+        first = await caching.get_by_id(1)
+        second = await caching.get_by_id(1)
+
+        # Assert
+        assert first is second
+        assert first is not row
+        assert [tag.name for tag in first.tags] == ["bug"]
+        assert first.tags[0] is not row.tags[0]
+        repository.get_by_id.assert_awaited_once_with(1)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_get_all_is_cached_per_arguments(self):
+        """Test offset pages are cached per skip, limit and tag"""
+        # Arrange
+        repository = AsyncMock()
+        repository.get_all.return_value = [create_item(1), create_item(2)]
+        caching = CachingItemRepository(repository, LRUCache())
+
+        # Act
+        await caching.get_all(limit=10)
+        items = await caching.get_all(limit=10)
+        await caching.get_all(limit=10, tag_id=1)
+
+        # Assert
+        assert [item.id for item in items] == [1, 2]
+        assert repository.get_all.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_patch_clears_lists_and_writes_through(self):
+        """Test a patched item is served from the cache and the lists are read again"""
+        # Arrange
+        repository = AsyncMock()
+        repository.get_all.return_value = [create_item(1)]
+        repository.patch.return_value = create_item(1, "Renamed")
+        cache = LRUCache()
+        caching = CachingItemRepository(repository, cache)
+        await caching.get_all()
+
+        # Act
+        await caching.patch(ItemChanges(1, {"name": "Renamed"}))
+
+        # Assert
+        assert cache.get(("all", 0, 100, None)) is MISSING
+        assert (await caching.get_by_id(1)).name == "Renamed"
+        repository.get_by_id.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_bulk_writes_clear_the_cache(self):
+        """Test bulk writes forget every cached item"""
+        # Arrange
+        repository = AsyncMock()
+        repository.get_by_id.return_value = create_item(1)
+        repository.bulk_delete.return_value = {1}
+        caching = CachingItemRepository(repository, LRUCache())
+        await caching.get_by_id(1)
+
+        # Act
+        await caching.bulk_delete([1])
+        repository.get_by_id.return_value = None
+
+        # Assert
+        assert await caching.get_by_id(1) is None
+        assert repository.get_by_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reads_bypassing_the_cache(self):
+        """Test keyset pages and search always go to the repository"""
+        # Arrange
+        repository = AsyncMock()
+        caching = CachingItemRepository(repository, LRUCache())
+
+        # Act
+        await caching.get_page(limit=5)
+        await caching.get_page(limit=5)
+        await caching.search("bug")
+
+        # Assert
+        assert repository.get_page.await_count == 2
+        repository.search.assert_awaited_once_with("bug", limit=20)
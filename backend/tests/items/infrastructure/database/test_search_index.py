@@ -0,0 +1,22 @@
+"""Unit tests for the full-text search query builder"""
+
+import pytest
+
+from app.items.infrastructure.database.search_index import build_match_query
+
+
+class TestBuildMatchQuery:
+    """Test build_match_query"""
+
+    def test_quotes_words_and_prefixes_the_last(self):
+        """Test words are ANDed as literal phrases with a trailing prefix match"""
+        assert build_match_query("fix log") == '"fix" "log"*'
+
+    def test_escapes_quotes_and_operators(self):
+        """Test FTS5 syntax in user input is neutralized"""
+        assert build_match_query('a"b OR') == '"a""b" "OR"*'
+
+    def test_rejects_blank_query(self):
+        """Test a query without words is rejected"""
+        with pytest.raises(ValueError):
+            build_match_query("   ")
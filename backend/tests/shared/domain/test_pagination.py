@@ -0,0 +1,74 @@
+"""Unit tests for keyset pagination cursors"""
+
+import base64
+
+import pytest
+
+from app.shared.domain.pagination import PageCursor, parse_cursor
+
+
+class TestPageCursor:
+    """Test PageCursor encoding"""
+
+    def test_encode_decode_round_trip(self):
+        """Test that a decoded cursor matches the encoded one"""
+        # Arrange
+        cursor = PageCursor(sort="name", value="Ünïcode & spaces", id=42)
+
+        # Act
+        decoded = PageCursor.decode(cursor.encode())
+
+        # Assert
+        assert (decoded.sort, decoded.value, decoded.id) == ("name", "Ünïcode & spaces", 42)
+
+    def test_encoded_cursor_is_url_safe(self):
+        """Test that the token needs no escaping in a query string"""
+        # Act
+        token = PageCursor(sort="name", value="a/b+c?=", id=1).encode()
+
+        # Assert
+        assert all(c.isalnum() or c in "-_" for c in token)
+
+    @pytest.mark.parametrize("token", ["not-a-cursor", "", "W10", "eyJhIjoxfQ"])
+    def test_decode_rejects_malformed_tokens(self, token):
+        """Test that garbage tokens raise ValueError"""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            PageCursor.decode(token)
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            '["name",[1,2],1]',
+            '["name",3,1]',
+            '["id","3",1]',
+            '["id",true,1]',
+            '["id",1,true]',
+            '["id",1,1.5]',
+            '["name","a",null]',
+        ],
+    )
+    def test_decode_rejects_values_the_sort_column_cannot_take(self, raw):
+        """Test the value must match the sort column and the id must be an integer"""
+        # Arrange
+        token = base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            PageCursor.decode(token)
+
+
+class TestParseCursor:
+    """Test parse_cursor"""
+
+    def test_returns_none_without_token(self):
+        """Test that the first page has no cursor"""
+        assert parse_cursor(None, "id") is None
+
+    def test_rejects_cursor_of_another_sort(self):
+        """Test that a cursor cannot be replayed with a different sort"""
+        # Arrange
+        token = PageCursor(sort="id", value=3, id=3).encode()
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="does not match"):
+            parse_cursor(token, "name")
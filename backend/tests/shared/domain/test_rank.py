@@ -0,0 +1,115 @@
+"""Unit tests for fractional rank keys"""
+
+import random
+
+import pytest
+
+from app.shared.domain.rank import MAX_RANK_LENGTH, needs_rebalance, rank_between, spread_ranks
+
+
+class TestRankBetween:
+    """Test rank_between"""
+
+    def test_first_key_is_the_middle(self):
+        """Test the key of an empty list"""
+        assert rank_between(None, None) == "V"
+
+    @pytest.mark.parametrize(
+        ("before", "after"), [("V", "W"), ("V", "V1"), ("", "1"), ("0z", "1"), ("zz", None)]
+    )
+    def test_key_sorts_strictly_between(self, before, after):
+        """Test neighbours that are adjacent, prefixes of each other or open-ended"""
+        # Act
+        key = rank_between(before, after)
+
+        # Assert
+        assert before < key
+        assert after is None or key < after
+        assert not key.endswith("0")
+
+    def test_random_inserts_keep_order_and_short_keys(self):
+        """Test that keys stay unique, ordered and short under random inserts"""
+        # Arrange
+        keys: list[str] = []
+        rng = random.Random(7)
+
+        # Act
+        for _ in range(2000):
+            i = rng.randint(0, len(keys))
+            before = keys[i - 1] if i > 0 else None
+            after = keys[i] if i < len(keys) else None
+            keys.insert(i, rank_between(before, after))
+
+        # Assert
+        assert keys == sorted(keys)
+        assert len(set(keys)) == len(keys)
+        assert max(map(len, keys)) <= MAX_RANK_LENGTH
+
+    def test_appending_grows_keys_logarithmically(self):
+        """Test that 20,000 appends to the end stay far below the rebalance length"""
+        # Arrange
+        keys = [rank_between(None, None)]
+
+        # Act
+        for _ in range(20_000):
+            keys.append(rank_between(keys[-1], None))
+
+        # Assert
+        assert keys == sorted(keys)
+        assert len(set(keys)) == len(keys)
+        assert max(map(len, keys)) <= 6
+
+    @pytest.mark.parametrize(
+        ("before", "expected"),
+        [("V3k", "W"), ("z3k", "z4"), ("z", "z1"), ("zz", "zz01"), ("zz1", "zz11")],
+    )
+    def test_appending_counts_after_the_leading_z_run(self, before, expected):
+        """Test that appends step a digit after a run of "z"s twice the run's length"""
+        assert rank_between(before, None) == expected
+
+    def test_repeated_inserts_in_one_gap_eventually_need_rebalance(self):
+        """Test that always inserting below the same card grows keys"""
+        # Arrange
+        low, high = "V", "W"
+
+        # Act
+        for _ in range(100):
+            high = rank_between(low, high)
+
+        # Assert
+        assert low < high
+        assert needs_rebalance(high)
+
+    @pytest.mark.parametrize(
+        ("before", "after"), [("W", "V"), ("V", "V"), ("V0", None), ("a-b", None)]
+    )
+    def test_rejects_unordered_or_malformed_keys(self, before, after):
+        """Test that invalid neighbours raise ValueError"""
+        with pytest.raises(ValueError):
+            rank_between(before, after)
+
+
+class TestSpreadRanks:
+    """Test spread_ranks"""
+
+    @pytest.mark.parametrize("count", [0, 1, 61, 62, 5000])
+    def test_keys_are_ordered_unique_and_short(self, count):
+        """Test evenly spaced keys for lists of several sizes"""
+        # Act
+        keys = spread_ranks(count)
+
+        # Assert
+        assert len(keys) == count
+        assert keys == sorted(keys)
+        assert len(set(keys)) == count
+        assert all(key and not key.endswith("0") for key in keys)
+        assert all(len(key) <= 3 for key in keys)
+
+    def test_keys_leave_room_at_both_ends(self):
+        """Test that cards can still be put above the first and below the last key"""
+        # Arrange
+        keys = spread_ranks(10)
+
+        # Act & Assert
+        assert rank_between(None, keys[0]) < keys[0]
+        assert rank_between(keys[-1], None) > keys[-1]
@@ -0,0 +1,31 @@
+"""Unit tests for the tombstone time helpers"""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+from app.shared.domain.tombstones import retention_cutoff, to_naive_utc
+
+
+class TestToNaiveUtc:
+    """Test to_naive_utc"""
+
+    def test_aware_time_is_converted_to_utc(self):
+        """Test an offset is applied and then dropped"""
+        moment = datetime(2026, 3, 1, 1, 30, tzinfo=timezone(timedelta(hours=2)))
+        assert to_naive_utc(moment) == datetime(2026, 2, 28, 23, 30)
+
+    def test_naive_time_is_kept(self):
+        """Test naive times are taken to be UTC already"""
+        assert to_naive_utc(datetime(2026, 3, 1)) == datetime(2026, 3, 1)
+
+
+class TestRetentionCutoff:
+    """Test retention_cutoff"""
+
+    def test_cutoff_is_retention_before_now(self):
+        """Test the cutoff is a naive UTC time one retention window back"""
+        # Act
+        cutoff = retention_cutoff(timedelta(days=30), now=datetime(2026, 3, 31, tzinfo=UTC))
+
+        # Assert
+        assert cutoff == datetime(2026, 3, 1)
+        assert cutoff.tzinfo is None
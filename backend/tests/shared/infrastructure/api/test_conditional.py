@@ -0,0 +1,112 @@
+"""Unit tests for conditional GETs"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException, Request, Response
+
+from app.shared.domain.data_version import ITEM_TABLES
+from app.shared.infrastructure.api.conditional import (
+    conditional_get,
+    etag_matches,
+    raise_if_not_modified,
+)
+from app.shared.infrastructure.cache import BoardCaches
+
+
+def create_request(if_none_match: str | None = None) -> Request:
+    """A GET request, with an If-None-Match header if given"""
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+class TestEtagMatches:
+    """Test etag_matches"""
+
+    @pytest.mark.parametrize(
+        ("header", "matches"),
+        [
+            (None, False),
+            ('"1.2.3"', True),
+            ('W/"1.2.3"', True),
+            ('"0.0.1", "1.2.3"', True),
+            ('"1.2.4"', False),
+            ("1.2.3", False),
+        ],
+    )
+    def test_lists_of_tags_compare_weakly(self, header, matches):
+        """Test any listed tag, weak or strong, matches the current one"""
+        # Act & Assert
+        assert etag_matches(header, '"1.2.3"') is matches
+
+
+class TestConditionalGet:
+    """Test the conditional_get dependency"""
+
+    @pytest.mark.asyncio
+    async def test_sets_the_etag_of_the_current_version(self):
+        """Test a request without a matching tag gets the version as its ETag"""
+        # Arrange
+        versions = AsyncMock(get_version=AsyncMock(return_value="4.1.2"))
+        response = Response()
+
+        # Act
+        etag = await conditional_get(*ITEM_TABLES)(
+            create_request('"4.1.1"'), response, versions=versions, caches=None
+        )
+
+        # Assert
+        assert etag == '"4.1.2"'
+        assert response.headers["ETag"] == '"4.1.2"'
+        versions.get_version.assert_awaited_once_with(ITEM_TABLES)
+
+    @pytest.mark.asyncio
+    async def test_matching_tag_is_not_modified(self):
+        """Test a client holding the current version gets a 304 with the ETag"""
+        # Arrange
+        versions = AsyncMock(get_version=AsyncMock(return_value="4.1.2"))
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await conditional_get(*ITEM_TABLES)(
+                create_request('"4.1.2"'), Response(), versions=versions, caches=None
+            )
+        assert exc_info.value.status_code == 304
+        assert exc_info.value.headers == {"ETag": '"4.1.2"'}
+
+    @pytest.mark.asyncio
+    async def test_after_lookup_leaves_the_304_to_the_endpoint(self):
+        """Test a single-resource endpoint gets the ETag even when it matches"""
+        # Arrange
+        versions = AsyncMock(get_version=AsyncMock(return_value="4.1.2"))
+        response = Response()
+
+        # Act
+        etag = await conditional_get(*ITEM_TABLES, after_lookup=True)(
+            create_request('"4.1.2"'), response, versions=versions, caches=None
+        )
+
+        # Assert
+        assert etag == response.headers["ETag"] == '"4.1.2"'
+        with pytest.raises(HTTPException) as exc_info:
+            raise_if_not_modified('"4.1.2"', etag)
+        assert exc_info.value.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_new_version_clears_the_repository_cache(self):
+        """Test a version written by another process drops the rows cached before it"""
+        # Arrange
+        caches = BoardCaches()
+        caches.items.sync("4.1.2")
+        caches.items.put(("id", 1), "old item")
+        caches.tags.put(("id", 1), "tag")
+        versions = AsyncMock(get_version=AsyncMock(return_value="5.1.2"))
+
+        # Act
+        await conditional_get(*ITEM_TABLES)(
+            create_request(), Response(), versions=versions, caches=caches
+        )
+
+        # Assert
+        assert len(caches.items) == 0
+        assert len(caches.tags) == 1
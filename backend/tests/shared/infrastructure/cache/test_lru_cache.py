@@ -0,0 +1,96 @@
+"""Unit tests for LRUCache"""
+
+from app.shared.infrastructure.cache import MISSING, LRUCache
+
+
+class FakeClock:
+    """A clock that only moves when told to"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    """Test LRUCache"""
+
+    def test_counts_hits_and_misses(self):
+        """Test a stored value is a hit and an absent key a miss"""
+        # Arrange
+        cache = LRUCache()
+        cache.put("a", None)
+
+        # Act
+        hit = cache.get("a")
+        miss = cache.get("b")
+
+        # Assert
+        assert hit is None
+        assert miss is MISSING
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_evicts_the_least_recently_used(self):
+        """Test reading a key keeps it over keys stored after it"""
+        # Arrange
+        cache = LRUCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        # Act
+        cache.put("c", 3)
+
+        # Assert
+        assert cache.get("b") is MISSING
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    def test_entries_expire_after_the_ttl(self):
+        """Test an entry is dropped once it has lived ttl seconds"""
+        # Arrange
+        clock = FakeClock()
+        cache = LRUCache(ttl=10, clock=clock)
+        cache.put("a", 1)
+
+        # Act
+        clock.now = 9.9
+        fresh = cache.get("a")
+        clock.now = 10.0
+        expired = cache.get("a")
+
+        # Assert
+        assert fresh == 1
+        assert expired is MISSING
+        assert len(cache) == 0
+
+    def test_values_read_before_a_clear_are_not_stored(self):
+        """Test a read racing with a write cannot put back what the write replaced"""
+        # Arrange
+        cache = LRUCache()
+        generation = cache.generation
+
+        # Act
+        cache.clear()
+        cache.put("a", "stale", generation)
+        cache.put("b", "fresh", cache.generation)
+
+        # Assert
+        assert cache.get("a") is MISSING
+        assert cache.get("b") == "fresh"
+
+    def test_sync_clears_only_on_a_new_version(self):
+        """Test the entries survive as long as the data version stays the same"""
+        # Arrange
+        cache = LRUCache()
+        cache.sync("1")
+        cache.put("a", 1)
+
+        # Act
+        cache.sync("1")
+        kept = cache.get("a")
+        cache.sync("2")
+
+        # Assert
+        assert kept == 1
+        assert cache.get("a") is MISSING
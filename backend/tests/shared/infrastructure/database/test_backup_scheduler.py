@@ -0,0 +1,43 @@
+"""Unit tests for BackupScheduler"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.shared.infrastructure.database.backup import BackupScheduler
+
+
+class TestBackupScheduler:
+    """Test BackupScheduler"""
+
+    @pytest.mark.asyncio
+    async def test_background_task_backs_up_every_interval_despite_failures(self):
+        """Test that a failing run is logged and the next round still runs"""
+        # Arrange
+        job = AsyncMock(side_effect=[RuntimeError("disk full"), 2, 2, 2, 2, 2, 2, 2, 2])
+        scheduler = BackupScheduler(job, interval=0.01)
+
+        # Act
+        scheduler.start()
+        await asyncio.sleep(0.05)
+        await scheduler.close()
+        calls = job.await_count
+        await asyncio.sleep(0.03)
+
+        # Assert
+        assert calls >= 2
+        assert job.await_count == calls
+
+    @pytest.mark.asyncio
+    async def test_zero_interval_disables_the_task(self):
+        """Test that no task is started when scheduled backups are disabled"""
+        # Arrange
+        scheduler = BackupScheduler(AsyncMock())
+
+        # Act
+        scheduler.start()
+
+        # Assert
+        assert scheduler._task is None
+        await scheduler.close()
@@ -0,0 +1,60 @@
+"""Unit tests for TombstonePurger"""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.shared.infrastructure.database.purger import TombstonePurger
+
+
+class TestTombstonePurger:
+    """Test TombstonePurger"""
+
+    @pytest.mark.asyncio
+    async def test_purge_runs_every_job_and_survives_failures(self):
+        """Test that a failing job is logged and the others still run"""
+        # Arrange
+        failing = AsyncMock(side_effect=RuntimeError("locked"), __name__="failing")
+        working = AsyncMock(return_value=3, __name__="working")
+        purger = TombstonePurger([failing, working], retention=timedelta(days=7), batch_size=50)
+
+        # Act
+        purged = await purger.purge()
+
+        # Assert
+        assert purged == 3
+        failing.assert_awaited_once_with(timedelta(days=7), 50)
+        working.assert_awaited_once_with(timedelta(days=7), 50)
+
+    @pytest.mark.asyncio
+    async def test_background_task_purges_every_interval(self):
+        """Test that the started task keeps purging until closed"""
+        # Arrange
+        job = AsyncMock(return_value=0, __name__="job")
+        purger = TombstonePurger([job], retention=timedelta(days=1), interval=0.01)
+
+        # Act
+        purger.start()
+        await asyncio.sleep(0.05)
+        await purger.close()
+        calls = job.await_count
+        await asyncio.sleep(0.03)
+
+        # Assert
+        assert calls >= 2
+        assert job.await_count == calls
+
+    @pytest.mark.asyncio
+    async def test_zero_interval_disables_the_task(self):
+        """Test that no task is started when purging is disabled"""
+        # Arrange
+        purger = TombstonePurger([AsyncMock()], retention=timedelta(days=1), interval=0)
+
+        # Act
+        purger.start()
+
+        # Assert
+        assert purger._task is None
+        await purger.close()
@@ -0,0 +1,47 @@
+"""Unit tests for database settings"""
+
+from app.shared.infrastructure.database.settings import PROFILES, DatabaseSettings
+
+
+class TestDatabaseSettings:
+    """Test DatabaseSettings"""
+
+    def test_defaults_to_dev_profile(self):
+        """Test the default settings use the dev profile"""
+        # Act
+        settings = DatabaseSettings()
+
+        # Assert
+        assert settings.profile == "dev"
+        assert settings.pragmas == PROFILES["dev"]
+
+    def test_profile_is_read_from_environment(self, monkeypatch):
+        """Test DATABASE_* environment variables configure the settings"""
+        # Arrange
+        monkeypatch.setenv("DATABASE_PROFILE", "prod")
+        monkeypatch.setenv("DATABASE_BUSY_TIMEOUT", "250")
+
+        # Act
+        settings = DatabaseSettings()
+
+        # Assert
+        assert settings.pragmas.journal_mode == "WAL"
+        assert settings.pragmas.mmap_size == PROFILES["prod"].mmap_size
+        assert settings.pragmas.busy_timeout == 250
+
+    def test_overrides_apply_on_top_of_profile(self):
+        """Test explicit pragma values override the profile"""
+        # Act
+        settings = DatabaseSettings(profile="test", synchronous="FULL")
+
+        # Assert
+        assert settings.pragmas.synchronous == "FULL"
+        assert settings.pragmas.journal_mode == PROFILES["test"].journal_mode
+
+    def test_async_url_uses_aiosqlite_driver(self):
+        """Test the async URL swaps in the aiosqlite driver"""
+        # Act
+        settings = DatabaseSettings(url="sqlite:///./board.db")
+
+        # Assert
+        assert settings.async_url == "sqlite+aiosqlite:///./board.db"
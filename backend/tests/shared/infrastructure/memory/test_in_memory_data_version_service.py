@@ -0,0 +1,31 @@
+"""Unit tests for InMemoryDataVersionService"""
+
+import pytest
+
+from app.items.domain.entities.item import Item
+from app.shared.infrastructure.memory import MemoryStore
+from app.shared.infrastructure.memory.in_memory_data_version_service import (
+    InMemoryDataVersionService,
+)
+
+
+class TestInMemoryDataVersionService:
+    """Test InMemoryDataVersionService"""
+
+    @pytest.mark.asyncio
+    async def test_version_follows_writes_and_differs_per_store(self):
+        """Test writes change the version and a new store never repeats an old one"""
+        # Arrange
+        store = MemoryStore()
+        service = InMemoryDataVersionService(store)
+        before = await service.get_version(["items", "tags"])
+
+        # Act
+        store.add_item(Item(name="a"))
+        after = await service.get_version(["items", "tags"])
+        fresh = await InMemoryDataVersionService(MemoryStore()).get_version(["items", "tags"])
+
+        # Assert
+        assert before == f"{store.epoch}.0.0"
+        assert after == f"{store.epoch}.1.0"
+        assert fresh != before
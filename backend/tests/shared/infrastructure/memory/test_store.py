@@ -0,0 +1,81 @@
+"""Unit tests for the in-memory store and its indexes"""
+
+from app.items.domain.entities.item import Item
+from app.shared.domain.pagination import PageCursor
+from app.shared.infrastructure.memory.store import MemoryStore, SortedIndex, name_key, take
+from app.tags.domain.entities.tag import Tag
+
+
+class TestSortedIndex:
+    """Test the sorted key list"""
+
+    def test_keeps_keys_sorted_and_seeks_past_a_key(self):
+        """Test keys come back in order, starting after the given key"""
+        # Arrange
+        index = SortedIndex()
+        for key in [("b", 2), ("a", 3), ("b", 1), ("c", 4)]:
+            index.add(key)
+
+        # Act
+        index.remove(("c", 4))
+        index.remove(("z", 9))
+
+        # Assert
+        assert list(index.after()) == [("a", 3), ("b", 1), ("b", 2)]
+        assert list(index.after(("b", 1))) == [("b", 2)]
+        assert index.last() == ("b", 2)
+        assert len(index) == 3
+
+    def test_take_tells_whether_more_keys_follow(self):
+        """Test take returns at most limit keys and whether there are more"""
+        assert take(iter([1, 2, 3]), 2) == ([1, 2], True)
+        assert take(iter([1, 2]), 2) == ([1, 2], False)
+
+
+class TestMemoryStoreIndexes:
+    """Test the secondary indexes follow the rows"""
+
+    def test_name_key_folds_ascii_letters_only(self):
+        """Test names compare like SQLite's NOCASE collation"""
+        assert name_key("Bug") == name_key("BUG") == "bug"
+        assert name_key("Élan") != name_key("élan")
+
+    def test_links_and_columns_follow_changes_and_deletes(self):
+        """Test moving, tagging and deleting an item updates every index"""
+        # Arrange
+        store = MemoryStore()
+        tag = store.add_tag(Tag(name="Bug", color="#f00"))
+        item = store.add_item(Item(name="a", position="m"))
+        store.link(item.id, tag.id)
+
+        # Act
+        store.change_item(item.id, status="done")
+        moved_columns = (len(store.columns["todo"]), len(store.columns["done"]))
+        store.delete_tag(tag.id)
+        unlinked = store.tag_ids_by_item[item.id] == set()
+        store.delete_item(item.id)
+
+        # Assert
+        assert moved_columns == (0, 1)
+        assert unlinked
+        assert store.tag_by_name("bug") is None
+        assert item.id in store.item_tombstones
+        assert len(store.item_ids) == len(store.columns["done"]) == 0
+        assert store.versions["items"] == 3
+
+    def test_position_order_merges_the_columns(self):
+        """Test sorting by position without a status walks all columns in key order"""
+        # Arrange
+        store = MemoryStore()
+        first = store.add_item(Item(name="a", status="done", position="a"))
+        second = store.add_item(Item(name="b", status="todo", position="b"))
+        third = store.add_item(Item(name="c", status="done", position="c"))
+
+        # Act
+        after_first = list(
+            store.ordered_item_ids("position", PageCursor("position", "a", first.id))
+        )
+
+        # Assert
+        assert list(store.ordered_item_ids("position")) == [first.id, second.id, third.id]
+        assert after_first == [second.id, third.id]
@@ -0,0 +1,33 @@
+"""Unit tests for stats use cases"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.stats.application.use_cases.stats_use_cases import GetStatsUseCase
+
+
+class TestGetStatsUseCase:
+    """Test GetStatsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_groups_status_counts(self):
+        """Test that per-status counters are reported under items_by_status"""
+        # Arrange
+        mock_query_service = AsyncMock()
+        mock_query_service.get_counts.return_value = {
+            "items": 6,
+            "tags": 2,
+            "items:todo": 3,
+            "items:inprogress": 1,
+            "items:done": 2,
+        }
+        use_case = GetStatsUseCase(mock_query_service)
+
+        # Act
+        result = await use_case.execute()
+
+        # Assert
+        assert result.items == 6
+        assert result.tags == 2
+        assert result.items_by_status == {"todo": 3, "inprogress": 1, "done": 2}
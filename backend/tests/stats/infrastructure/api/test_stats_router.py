@@ -0,0 +1,32 @@
+"""Unit tests for stats router"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.stats.application.dtos.stats_dto import StatsDTO
+from app.stats.infrastructure.api.stats_router import get_stats
+
+
+class TestGetStatsEndpoint:
+    """Test GET /stats endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_get_stats_returns_counts(self, mocker):
+        """Test that the use case result is returned"""
+        # Arrange
+        mock_query_service = AsyncMock()
+        stats = StatsDTO(items=1, tags=0, items_by_status={"todo": 1, "inprogress": 0, "done": 0})
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=stats)
+        mock_use_case_class = mocker.patch(
+            "app.stats.infrastructure.api.stats_router.GetStatsUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act
+        result = await get_stats(query_service=mock_query_service)
+
+        # Assert
+        assert result == stats
+        mock_use_case_class.assert_called_once_with(mock_query_service)
@@ -1,15 +1,23 @@
 """Unit tests for tag use cases"""
 
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock
 
 import pytest
 
+from app.shared.domain.pagination import Page, PageCursor
+from app.tags.application.dtos.tag_dto import TagUpsertDTO
 from app.tags.application.use_cases.tag_use_cases import (
+    CountTagsUseCase,
     CreateTagUseCase,
     DeleteTagUseCase,
     GetAllTagsUseCase,
+    GetTagsPageUseCase,
+    GetTagTombstonesUseCase,
     GetTagUseCase,
+    PurgeDeletedTagsUseCase,
     UpdateTagUseCase,
+    UpsertTagUseCase,
 )
 from tests.tags.application.fixtures import (
     create_tag_create_dto,
@@ -23,12 +31,11 @@ class TestCreateTagUseCase:
 
     @pytest.mark.asyncio
     async def test_execute_creates_tag(self):
-        """Test creating a tag"""
+        """Test creating a tag without looking the name up first"""
         # Arrange
         mock_repo = AsyncMock()
         dto = create_tag_create_dto(name="New Tag", color="#FF0000")
         created_entity = create_tag_entity(id=1, name="New Tag", color="#FF0000")
-        mock_repo.get_by_name.return_value = None
         mock_repo.create.return_value = created_entity
         use_case = CreateTagUseCase(mock_repo)
 
@@ -39,17 +46,16 @@ class TestCreateTagUseCase:
         assert result.id == 1
         assert result.name == "New Tag"
         assert result.color == "#FF0000"
-        mock_repo.get_by_name.assert_called_once_with("New Tag")
+        mock_repo.get_by_name.assert_not_called()
         mock_repo.create.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_execute_raises_error_when_duplicate_name(self):
-        """Test creating a tag with duplicate name"""
+        """Test that a duplicate name reported by the repository propagates"""
         # Arrange
         mock_repo = AsyncMock()
         dto = create_tag_create_dto(name="Existing Tag")
-        existing_tag = create_tag_entity(id=1, name="Existing Tag")
-        mock_repo.get_by_name.return_value = existing_tag
+        mock_repo.create.side_effect = ValueError("Tag with name 'Existing Tag' already exists")
         use_case = CreateTagUseCase(mock_repo)
 
         # Act & Assert
@@ -57,8 +63,27 @@ class TestCreateTagUseCase:
             await use_case.execute(dto)
 
         assert "already exists" in str(exc_info.value)
-        mock_repo.get_by_name.assert_called_once_with("Existing Tag")
-        mock_repo.create.assert_not_called()
+
+
+class TestUpsertTagUseCase:
+    """Test UpsertTagUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_tag_and_created_flag(self):
+        """Test upserting a tag by name"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.upsert.return_value = (create_tag_entity(id=1, name="Bug"), True)
+        use_case = UpsertTagUseCase(mock_repo)
+
+        # Act
+        result, created = await use_case.execute("Bug", TagUpsertDTO(color="#FF0000"))
+
+        # Assert
+        assert result.id == 1
+        assert created is True
+        tag = mock_repo.upsert.call_args.args[0]
+        assert (tag.name, tag.color) == ("Bug", "#FF0000")
 
 
 class TestGetTagUseCase:
@@ -152,19 +177,87 @@ class TestGetAllTagsUseCase:
         mock_repo.get_all.assert_called_once()
 
 
+class TestCountTagsUseCase:
+    """Test CountTagsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_tag_count(self):
+        """Test that the maintained count is returned as is"""
+        # Arrange
+        mock_query_service = AsyncMock()
+        mock_query_service.count.return_value = 12
+        use_case = CountTagsUseCase(mock_query_service)
+
+        # Act
+        result = await use_case.execute()
+
+        # Assert
+        assert result == 12
+
+
+class TestGetTagsPageUseCase:
+    """Test GetTagsPageUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_page_with_next_cursor(self):
+        """Test that the next cursor is encoded into an opaque token"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.get_page.return_value = Page(
+            [create_tag_entity(id=1, name="Tag 1")], PageCursor(sort="id", value=1, id=1)
+        )
+        mock_repo.count.return_value = 4
+        use_case = GetTagsPageUseCase(mock_repo)
+
+        # Act
+        result = await use_case.execute(limit=1)
+
+        # Assert
+        assert [tag.name for tag in result.items] == ["Tag 1"]
+        assert PageCursor.decode(result.next_cursor).id == 1
+        assert result.total == 4
+        mock_repo.get_page.assert_called_once_with(after=None, limit=1, sort="id")
+
+    @pytest.mark.asyncio
+    async def test_execute_decodes_after_cursor(self):
+        """Test that the after token is decoded before reaching the repository"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.get_page.return_value = Page([])
+        use_case = GetTagsPageUseCase(mock_repo)
+        token = PageCursor(sort="name", value="Tag 5", id=5).encode()
+
+        # Act
+        result = await use_case.execute(after=token, sort="name")
+
+        # Assert
+        assert result.next_cursor is None
+        cursor = mock_repo.get_page.call_args.kwargs["after"]
+        assert (cursor.value, cursor.id) == ("Tag 5", 5)
+
+    @pytest.mark.asyncio
+    async def test_execute_raises_error_for_invalid_cursor(self):
+        """Test that a malformed cursor is rejected without querying"""
+        # Arrange
+        mock_repo = AsyncMock()
+        use_case = GetTagsPageUseCase(mock_repo)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await use_case.execute(after="garbage")
+        mock_repo.get_page.assert_not_called()
+
+
 class TestUpdateTagUseCase:
     """Test UpdateTagUseCase"""
 
     @pytest.mark.asyncio
     async def test_execute_updates_tag(self):
-        """Test updating an existing tag"""
+        """Test updating an existing tag in a single repository call"""
         # Arrange
         mock_repo = AsyncMock()
-        current_tag = create_tag_entity(id=1, name="Old Name", color="#FF0000")
         updated_tag = create_tag_entity(id=1, name="New Name", color="#00FF00")
-        mock_repo.get_by_id.return_value = current_tag
-        mock_repo.get_by_name.return_value = None
-        mock_repo.update.return_value = updated_tag
+        mock_repo.patch.return_value = updated_tag
         dto = create_tag_update_dto(name="New Name", color="#00FF00")
         use_case = UpdateTagUseCase(mock_repo)
 
@@ -175,15 +268,31 @@ class TestUpdateTagUseCase:
         assert result is not None
         assert result.name == "New Name"
         assert result.color == "#00FF00"
-        mock_repo.get_by_id.assert_called_once_with(1)
-        mock_repo.update.assert_called_once()
+        mock_repo.patch.assert_called_once_with(1, {"name": "New Name", "color": "#00FF00"})
+        mock_repo.get_by_id.assert_not_called()
+        mock_repo.get_by_name.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_partial_update(self):
+        """Test that fields left as None are not sent to the repository"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.patch.return_value = create_tag_entity(id=1, color="#00FF00")
+        dto = create_tag_update_dto(name=None, color="#00FF00")
+        use_case = UpdateTagUseCase(mock_repo)
+
+        # Act
+        await use_case.execute(tag_id=1, tag_dto=dto)
+
+        # Assert
+        mock_repo.patch.assert_called_once_with(1, {"color": "#00FF00"})
 
     @pytest.mark.asyncio
     async def test_execute_returns_none_when_tag_not_found(self):
         """Test updating a non-existent tag"""
         # Arrange
         mock_repo = AsyncMock()
-        mock_repo.get_by_id.return_value = None
+        mock_repo.patch.return_value = None
         dto = create_tag_update_dto()
         use_case = UpdateTagUseCase(mock_repo)
 
@@ -192,18 +301,13 @@ class TestUpdateTagUseCase:
 
         # Assert
         assert result is None
-        mock_repo.get_by_id.assert_called_once_with(999)
-        mock_repo.update.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_execute_raises_error_when_name_conflicts(self):
-        """Test updating tag with a name that already exists"""
+        """Test that a name conflict reported by the repository propagates"""
         # Arrange
         mock_repo = AsyncMock()
-        current_tag = create_tag_entity(id=1, name="Tag 1", color="#FF0000")
-        conflicting_tag = create_tag_entity(id=2, name="Tag 2", color="#00FF00")
-        mock_repo.get_by_id.return_value = current_tag
-        mock_repo.get_by_name.return_value = conflicting_tag
+        mock_repo.patch.side_effect = ValueError("Tag with name 'Tag 2' already exists")
         dto = create_tag_update_dto(name="Tag 2")
         use_case = UpdateTagUseCase(mock_repo)
 
@@ -212,29 +316,6 @@ class TestUpdateTagUseCase:
             await use_case.execute(tag_id=1, tag_dto=dto)
 
         assert "already exists" in str(exc_info.value)
-        mock_repo.update.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_execute_allows_same_name(self):
-        """Test updating tag with the same name it already has"""
-        # Arrange
-        mock_repo = AsyncMock()
-        current_tag = create_tag_entity(id=1, name="Same Name", color="#FF0000")
-        updated_tag = create_tag_entity(id=1, name="Same Name", color="#00FF00")
-        mock_repo.get_by_id.return_value = current_tag
-        mock_repo.update.return_value = updated_tag
-        dto = create_tag_update_dto(name="Same Name", color="#00FF00")
-        use_case = UpdateTagUseCase(mock_repo)
-
-        # Act
-        result = await use_case.execute(tag_id=1, tag_dto=dto)
-
-        # Assert
-        assert result is not None
-        mock_repo.get_by_id.assert_called_once_with(1)
-        # Should not check for name conflict since name hasn't changed
-        mock_repo.get_by_name.assert_not_called()
-        mock_repo.update.assert_called_once()
 
 
 class TestDeleteTagUseCase:
@@ -269,3 +350,42 @@ class TestDeleteTagUseCase:
         # Assert
         assert result is False
         mock_repo.delete.assert_called_once_with(999)
+
+
+class TestGetTagTombstonesUseCase:
+    """Test GetTagTombstonesUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_tombstones(self):
+        """Test that tombstones are read from the query service"""
+        # Arrange
+        mock_query_service = AsyncMock()
+        deleted_at = datetime(2026, 1, 1)
+        mock_query_service.get_tombstones.return_value = [{"id": 2, "deleted_at": deleted_at}]
+        use_case = GetTagTombstonesUseCase(mock_query_service)
+
+        # Act
+        result = await use_case.execute(since=deleted_at)
+
+        # Assert
+        assert [(t.id, t.deleted_at) for t in result] == [(2, deleted_at)]
+        mock_query_service.get_tombstones.assert_called_once_with(since=deleted_at, limit=1000)
+
+
+class TestPurgeDeletedTagsUseCase:
+    """Test PurgeDeletedTagsUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_execute_purges_batches_until_a_short_one(self):
+        """Test that purging stops after the first batch smaller than batch_size"""
+        # Arrange
+        mock_repo = AsyncMock()
+        mock_repo.purge_deleted.side_effect = [3, 0]
+        use_case = PurgeDeletedTagsUseCase(mock_repo)
+
+        # Act
+        result = await use_case.execute(timedelta(days=7), batch_size=3)
+
+        # Assert
+        assert result == 3
+        assert mock_repo.purge_deleted.await_count == 2
@@ -1,17 +1,25 @@
 """Unit tests for tag router"""
 
+import base64
+from datetime import datetime
 from unittest.mock import AsyncMock
 
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 
+from app.items.application.dtos.item_dto import ItemPageDTO
+from app.tags.application.dtos.tag_dto import TagPageDTO, TagTombstoneDTO, TagUpsertDTO
 from app.tags.infrastructure.api.tag_router import (
     create_tag,
     delete_tag,
     get_tag,
+    get_tag_items,
+    get_tag_tombstones,
     get_tags,
     update_tag,
+    upsert_tag,
 )
+from tests.items.application.fixtures import create_item_dto
 from tests.tags.application.fixtures import (
     create_tag_create_dto,
     create_tag_dto,
@@ -38,14 +46,29 @@ class TestGetTagsEndpoint:
             "app.tags.infrastructure.api.tag_router.GetAllTagsUseCase",
             return_value=mock_use_case,
         )
+        mock_count_use_case = AsyncMock()
+        mock_count_use_case.execute = AsyncMock(return_value=2)
+        mocker.patch(
+            "app.tags.infrastructure.api.tag_router.CountTagsUseCase",
+            return_value=mock_count_use_case,
+        )
+        response = Response()
 
         # Act
-        result = await get_tags(skip=0, limit=100, repository=mock_repo)
+        result = await get_tags(
+            response=response,
+            skip=0,
+            limit=100,
+            repository=mock_repo,
+            query_service=AsyncMock(),
+            board_id=None,
+        )
 
         # Assert
         assert len(result) == 2
         assert result[0].name == "Tag 1"
         assert result[1].name == "Tag 2"
+        assert response.headers["X-Total-Count"] == "2"
         mock_use_case_class.assert_called_once_with(mock_repo)
         mock_use_case.execute.assert_called_once_with(skip=0, limit=100)
 
@@ -61,13 +84,156 @@ class TestGetTagsEndpoint:
             "app.tags.infrastructure.api.tag_router.GetAllTagsUseCase",
             return_value=mock_use_case,
         )
+        mocker.patch(
+            "app.tags.infrastructure.api.tag_router.CountTagsUseCase", return_value=AsyncMock()
+        )
 
         # Act
-        await get_tags(skip=10, limit=50, repository=mock_repo)
+        await get_tags(
+            response=Response(),
+            skip=10,
+            limit=50,
+            repository=mock_repo,
+            query_service=AsyncMock(),
+            board_id=None,
+        )
 
         # Assert
         mock_use_case.execute.assert_called_once_with(skip=10, limit=50)
 
+    @pytest.mark.asyncio
+    async def test_get_tags_without_skip_uses_cursor_pagination(self, mocker):
+        """Test that the next page is advertised in the Link and X-Next-Cursor headers"""
+        # Arrange
+        mock_query_service = AsyncMock()
+        page = TagPageDTO(items=[create_tag_dto(id=1)], next_cursor="abc", total=7)
+
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=page)
+        mock_use_case_class = mocker.patch(
+            "app.tags.infrastructure.api.tag_router.GetTagsPageUseCase",
+            return_value=mock_use_case,
+        )
+        response = Response()
+
+        # Act
+        result = await get_tags(
+            response=response,
+            after=None,
+            limit=1,
+            sort="name",
+            skip=None,
+            repository=AsyncMock(),
+            query_service=mock_query_service,
+            board_id=None,
+        )
+
+        # Assert
+        assert result == page.items
+        mock_use_case_class.assert_called_once_with(mock_query_service)
+        assert response.headers["X-Next-Cursor"] == "abc"
+        assert response.headers["Link"] == '</tags/?after=abc&limit=1&sort=name>; rel="next"'
+        assert response.headers["X-Total-Count"] == "7"
+        mock_use_case.execute.assert_called_once_with(after=None, limit=1, sort="name")
+
+    @pytest.mark.asyncio
+    async def test_get_tags_last_page_has_no_link(self, mocker):
+        """Test that no Link header is sent once the last page is reached"""
+        # Arrange
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=TagPageDTO(items=[]))
+        mocker.patch(
+            "app.tags.infrastructure.api.tag_router.GetTagsPageUseCase",
+            return_value=mock_use_case,
+        )
+        response = Response()
+
+        # Act
+        await get_tags(
+            response=response,
+            after="abc",
+            limit=100,
+            sort="id",
+            skip=None,
+            repository=AsyncMock(),
+            board_id=None,
+        )
+
+        # Assert
+        assert "Link" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_get_tags_invalid_cursor_raises_400(self, mocker):
+        """Test that a malformed cursor is reported as a bad request"""
+        # Arrange
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(side_effect=ValueError("Invalid pagination cursor"))
+        mocker.patch(
+            "app.tags.infrastructure.api.tag_router.GetTagsPageUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await get_tags(
+                response=Response(),
+                after="garbage",
+                limit=100,
+                sort="id",
+                skip=None,
+                repository=AsyncMock(),
+                board_id=None,
+            )
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("raw", ['["name",[1,2],1]', '["id",1,true]', '["id",true,1]'])
+    async def test_get_tags_malformed_cursor_raises_400(self, raw):
+        """Test a cursor whose value or id the query cannot bind is a bad request"""
+        # Arrange
+        query_service = AsyncMock()
+        token = base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+        sort = "id" if raw.startswith('["id"') else "name"
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await get_tags(
+                response=Response(),
+                after=token,
+                limit=100,
+                sort=sort,
+                skip=None,
+                repository=AsyncMock(),
+                query_service=query_service,
+                board_id=None,
+            )
+        assert exc_info.value.status_code == 400
+        query_service.get_page.assert_not_called()
+
+
+class TestGetTagTombstonesEndpoint:
+    """Test GET /tags/tombstones endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_get_tag_tombstones(self, mocker):
+        """Test listing every deleted tag"""
+        # Arrange
+        mock_query_service = AsyncMock()
+        tombstones = [TagTombstoneDTO(id=1, deleted_at=datetime(2026, 1, 1))]
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=tombstones)
+        mocker.patch(
+            "app.tags.infrastructure.api.tag_router.GetTagTombstonesUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act
+        result = await get_tag_tombstones(since=None, limit=1000, query_service=mock_query_service)
+
+        # Assert
+        assert result == tombstones
+        mock_use_case.execute.assert_called_once_with(since=None, limit=1000)
+
 
 class TestGetTagEndpoint:
     """Test GET /tags/{tag_id} endpoint"""
@@ -87,7 +253,7 @@ class TestGetTagEndpoint:
         )
 
         # Act
-        result = await get_tag(tag_id=1, repository=mock_repo)
+        result = await get_tag(tag_id=1, if_none_match=None, etag='"1"', repository=mock_repo)
 
         # Assert
         assert result.id == 1
@@ -114,6 +280,85 @@ class TestGetTagEndpoint:
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == "Tag not found"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("found", "status_code"), [(True, 304), (False, 404)])
+    async def test_get_tag_matching_etag_is_not_modified_only_if_found(
+        self, mocker, found, status_code
+    ):
+        """Test a matching If-None-Match gets a 304 for a tag, but a 404 for a missing one"""
+        # Arrange
+        tag = create_tag_dto(id=1) if found else None
+        mocker.patch(
+            "app.tags.infrastructure.api.tag_router.GetTagUseCase",
+            return_value=AsyncMock(execute=AsyncMock(return_value=tag)),
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await get_tag(tag_id=1, if_none_match='"1"', etag='"1"', repository=AsyncMock())
+        assert exc_info.value.status_code == status_code
+
+
+class TestGetTagItemsEndpoint:
+    """Test GET /tags/{tag_id}/items endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_get_tag_items_returns_items_having_tag(self, mocker):
+        """Test listing the items of an existing tag"""
+        # Arrange
+        mocker.patch(
+            "app.tags.infrastructure.api.tag_router.GetTagUseCase",
+            return_value=AsyncMock(execute=AsyncMock(return_value=create_tag_dto(id=3))),
+        )
+        items = [create_item_dto(id=1), create_item_dto(id=2)]
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=ItemPageDTO(items=items))
+        mocker.patch(
+            "app.tags.infrastructure.api.tag_router.GetItemsPageUseCase",
+            return_value=mock_use_case,
+        )
+
+        # Act
+        result = await get_tag_items(
+            tag_id=3,
+            response=Response(),
+            after=None,
+            limit=100,
+            sort="id",
+            if_none_match=None,
+            etag='"1.1"',
+            repository=AsyncMock(),
+            item_query_service=AsyncMock(),
+            board_id=None,
+        )
+
+        # Assert
+        assert result == items
+        mock_use_case.execute.assert_called_once_with(after=None, limit=100, sort="id", tag_id=3)
+
+    @pytest.mark.asyncio
+    async def test_get_tag_items_raises_404_when_tag_not_found(self, mocker):
+        """Test listing the items of a missing tag"""
+        # Arrange
+        mocker.patch(
+            "app.tags.infrastructure.api.tag_router.GetTagUseCase",
+            return_value=AsyncMock(execute=AsyncMock(return_value=None)),
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await get_tag_items(
+                tag_id=999,
+                response=Response(),
+                after=None,
+                limit=100,
+                sort="id",
+                repository=AsyncMock(),
+                item_query_service=AsyncMock(),
+                board_id=None,
+            )
+        assert exc_info.value.status_code == 404
+
 
 class TestCreateTagEndpoint:
     """Test POST /tags/ endpoint"""
@@ -164,6 +409,33 @@ class TestCreateTagEndpoint:
         assert "already exists" in exc_info.value.detail
 
 
+class TestUpsertTagEndpoint:
+    """Test PUT /tags/by-name/{name} endpoint"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("created", "status_code"), [(True, 201), (False, 200)])
+    async def test_upsert_tag_status_tells_created_from_updated(self, mocker, created, status_code):
+        """Test that a new tag answers 201 and an existing one 200"""
+        # Arrange
+        mock_repo = AsyncMock()
+        dto = TagUpsertDTO(color="#00FF00")
+        mock_use_case = AsyncMock()
+        mock_use_case.execute = AsyncMock(return_value=(create_tag_dto(id=1, name="Bug"), created))
+        mocker.patch(
+            "app.tags.infrastructure.api.tag_router.UpsertTagUseCase",
+            return_value=mock_use_case,
+        )
+        response = Response()
+
+        # Act
+        result = await upsert_tag(tag=dto, response=response, name="Bug", repository=mock_repo)
+
+        # Assert
+        assert result.name == "Bug"
+        assert response.status_code == status_code
+        mock_use_case.execute.assert_called_once_with("Bug", dto)
+
+
 class TestUpdateTagEndpoint:
     """Test PUT /tags/{tag_id} endpoint"""
 
@@ -0,0 +1,66 @@
+"""Unit tests for CachingTagQueryService"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.shared.domain.pagination import Page, PageCursor
+from app.shared.infrastructure.cache import LRUCache
+from app.tags.infrastructure.cache.caching_tag_query_service import CachingTagQueryService
+
+
+class TestCachingTagQueryService:
+    """Test CachingTagQueryService"""
+
+    @pytest.mark.asyncio
+    async def test_first_page_and_count_are_cached(self):
+        """Test a repeated first page and count read the query service once"""
+        # Arrange
+        query_service = AsyncMock()
+        query_service.get_page.return_value = Page(items=[{"id": 1}], next_cursor=None)
+        query_service.count.return_value = 1
+        caching = CachingTagQueryService(query_service, LRUCache())
+
+        # Act
+        first = await caching.get_page(limit=10, sort="name")
+        second = await caching.get_page(limit=10, sort="name")
+        counts = [await caching.count(), await caching.count()]
+
+        # Assert
+        assert first is second
+        assert counts == [1, 1]
+        query_service.get_page.assert_awaited_once_with(limit=10, sort="name")
+        query_service.count.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_pages_after_a_cursor_are_not_cached(self):
+        """Test a page following a cursor always reads the query service"""
+        # Arrange
+        query_service = AsyncMock()
+        query_service.get_page.return_value = Page(items=[], next_cursor=None)
+        caching = CachingTagQueryService(query_service, LRUCache())
+        cursor = PageCursor(sort="id", value=1, id=1)
+
+        # Act
+        await caching.get_page(after=cursor, limit=10)
+        await caching.get_page(after=cursor, limit=10)
+
+        # Assert
+        assert query_service.get_page.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cleared_cache_reads_again(self):
+        """Test a tag write clearing the shared cache makes the next first page a miss"""
+        # Arrange
+        query_service = AsyncMock()
+        query_service.get_page.return_value = Page(items=[], next_cursor=None)
+        cache = LRUCache()
+        caching = CachingTagQueryService(query_service, cache)
+        await caching.get_page()
+
+        # Act
+        cache.clear()
+        await caching.get_page()
+
+        # Assert
+        assert query_service.get_page.await_count == 2
@@ -0,0 +1,133 @@
+"""Unit tests for CachingTagRepository"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.shared.infrastructure.cache import MISSING, LRUCache
+from app.tags.domain.entities.tag import Tag
+from app.tags.infrastructure.cache.caching_tag_repository import CachingTagRepository
+
+
+def create_tag(id: int, name: str = "bug") -> Tag:
+    """A stored tag"""
+    return Tag(name=name, color="#ff0000", id=id)
+
+
+class TestCachingTagRepositoryReads:
+    """Test the cached lookups"""
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_queries_once(self):
+        """Test a second lookup of the same ID, found or not, is a hit"""
+        # Arrange
+        repository = AsyncMock()
+        repository.get_by_id.side_effect = lambda tag_id: create_tag(1) if tag_id == 1 else None
+        cache = LRUCache()
+        caching = CachingTagRepository(repository, cache)
+
+        # Act
+        first = await caching.get_by_id(1)
+        second = await caching.get_by_id(1)
+        missing = [await caching.get_by_id(2), await caching.get_by_id(2)]
+
+        # Assert
+        assert first is second
+        assert missing == [None, None]
+        assert repository.get_by_id.await_count == 2
+        assert (cache.hits, cache.misses) == (2, 2)
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_queries_only_uncached_ids(self):
+        """Test tags already cached by ID are not read again"""
+        # Arrange
+        repository = AsyncMock()
+        repository.get_by_id.return_value = create_tag(1)
+        repository.get_by_ids.return_value = [create_tag(3, "c")]
+        caching = CachingTagRepository(repository, LRUCache())
+        await caching.get_by_id(1)
+
+        # Act
+        tags = await caching.get_by_ids([3, 1, 4, 3])
+        again = await caching.get_by_ids([4, 3, 1])
+
+        # Assert
+        assert [tag.id for tag in tags] == [1, 3]
+        assert [tag.id for tag in again] == [1, 3]
+        repository.get_by_ids.assert_awaited_once_with([3, 4])
+
+    @pytest.mark.asyncio
+    async def test_get_all_and_get_by_name_are_cached_per_arguments(self):
+        """Test every argument combination has its own entry"""
+        # Arrange
+        repository = AsyncMock()
+        repository.get_all.return_value = [create_tag(1)]
+        repository.get_by_name.return_value = create_tag(1)
+        caching = CachingTagRepository(repository, LRUCache())
+
+        # Act
+        await caching.get_all(skip=0, limit=10)
+        await caching.get_all(skip=0, limit=10)
+        await caching.get_all(skip=10, limit=10)
+        await caching.get_by_name("bug")
+        await caching.get_by_name("bug")
+
+        # Assert
+        assert repository.get_all.await_count == 2
+        assert repository.get_by_name.await_count == 1
+
+
+class TestCachingTagRepositoryWrites:
+    """Test the invalidation by writes"""
+
+    @pytest.mark.asyncio
+    async def test_write_clears_both_caches_and_caches_the_result(self):
+        """Test a rename drops the cached lists and items, and the renamed tag is a hit"""
+        # Arrange
+        repository = AsyncMock()
+        repository.get_all.return_value = [create_tag(1)]
+        repository.patch.return_value = create_tag(1, "defect")
+        cache, item_cache = LRUCache(), LRUCache()
+        item_cache.put(("id", 7), "item with tag 1")
+        caching = CachingTagRepository(repository, cache, item_cache)
+        await caching.get_all()
+
+        # Act
+        patched = await caching.patch(1, {"name": "defect"})
+
+        # Assert
+        assert cache.get(("all", 0, 100)) is MISSING
+        assert item_cache.get(("id", 7)) is MISSING
+        assert await caching.get_by_id(1) is patched
+        repository.get_by_id.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_write_still_clears_the_cache(self):
+        """Test a write raising ValueError leaves nothing stale behind"""
+        # Arrange
+        repository = AsyncMock()
+        repository.create.side_effect = ValueError("Tag with name 'bug' already exists")
+        cache = LRUCache()
+        cache.put(("name", "bug"), None)
+        caching = CachingTagRepository(repository, cache)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await caching.create(Tag(name="bug", color="#ff0000"))
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_caches_the_tag_as_gone(self):
+        """Test a deleted tag is answered as missing without a query"""
+        # Arrange
+        repository = AsyncMock()
+        repository.delete.return_value = True
+        caching = CachingTagRepository(repository, LRUCache())
+
+        # Act
+        deleted = await caching.delete(1)
+
+        # Assert
+        assert deleted is True
+        assert await caching.get_by_id(1) is None
+        repository.get_by_id.assert_not_awaited()